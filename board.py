@@ -17,27 +17,42 @@
 # You should have received a copy of the GNU General Public License
 # along with board.py.  If not, see <http://www.gnu.org/licenses/>.
 
-import random, socket, threading, json, math
+import random, socket, threading, json, math, functools, hashlib, struct, zlib, time, argparse, heapq, select, base64, multiprocessing, array, bisect, collections, csv
 import tkinter as tk
 import tkinter.font as tkfont
 
+try:
+    import numpy as np          # Optional: vectorized thermal model (ThermalBank)
+except ImportError:
+    np = None
+
 # ----------------------------------------------------------------
 # Main board object holding all components
 class Board(object):
-    def __init__(self, master):
-        # Top-level Tk object
-        self.master   = master
+    def __init__(self, master=None, run=True, thermal=None):
+        # Top-level Tk object. Without one the board runs headless, with nothing drawn.
+        # With run=False the board only displays state set from elsewhere and does not simulate.
+        # If thermal is a ThermalBank, the heater is stepped by the bank instead of the board.
+        self.headless = master is None
+        self.master   = Headless() if self.headless else master
         
         # Board is drawn to a Canvas
-        self.cvs      = tk.Canvas(self.master, bg='white', width=1150, height=250) # width=770
-        self.cvs.pack()
-        self._bg      = tk.PhotoImage(data=board_b64)
+        if self.headless:
+            self.cvs  = NullCanvas()
+        else:
+            self.cvs  = tk.Canvas(self.master, bg='white', width=1150, height=250) # width=770
+            self.cvs.pack()
+        self._bg      = self.image(board_b64)
         self._bgImg   = self.cvs.create_image(0, 0, image=self._bg, anchor=tk.NW)
-        self._proc    = tk.PhotoImage(data=arduino_b64)
+        self._proc    = self.image(arduino_b64)
         self._procImg = self.cvs.create_image(300, 80, image=self._proc, anchor=tk.NW)
         
         self.vcc      = 3300   # 3300 mvolt supply
+        self.cost     = BusCost()
+        self.sched    = Scheduler()
+        self.trace    = PinTrace()
         self.heater   = Heater(self, 10000, 550, 50)
+        if thermal is not None: thermal.add(self.heater)
         
         # Digital components attached to each pin.
         # Index is pin number. 
@@ -49,16 +64,334 @@ class Board(object):
         self.pin[29]  = self.heater.tmp36
         self.oled     = SSD1306_I2C(self, 600, 135)
         self.lsm6dsox = LSM6DSOX(self, 800, 50)
+        self.i2c      = I2CBus(self)
+        self.i2c.attach(0x3c, self.oled)
+        self.i2c.attach(0x6a, self.lsm6dsox)
+        self.control  = Control(self)
+        self.readings = Readings(self)
+        self.comms    = FairQueue()     # Per-client request queues for the comms loop
+
+        # Waveform strip of pin activity below the board
+        self.strip    = None
+        if run and not self.headless:
+            self.strip = WaveformStrip(self, 10, 255, 1130)
+            self.cvs.config(height=260 + self.strip.height)
         
-        self.simulate()
+        if run: self.simulate()
 
         # b = tk.Button(self.master, text='Draw', command=self.draw)
         # b.pack()
         
-    # Simulate components that change over time
+    # Simulate components that change over time, each at its own rate
     def simulate(self):
-        self.heater.tick()
-        self.master.after(1000, lambda: self.simulate())
+        if self.heater.bank is None: self.sched.every(1.0, self.heater.tick, 0)
+        if self.strip is not None:   self.sched.every(0.1, self.strip.draw, 0)
+        self.oled.pace(self.sched)
+        self.sched.start(self.master)
+
+    # Simulated inputs that can be set directly, bypassing the GUI.
+    #   button: 0 (pressed) or 1    fsr: grams on FSR    tilt: [ax, ay] or ax, ay: IMU tilt
+    #   ambient: room temperature   heater: heater temperature (°C)
+    #   gyro_noise: [sigma (°/s), seed] for seeded gyroscope noise, or 0 for none
+    INPUTS = {'button', 'fsr', 'tilt', 'ax', 'ay', 'ambient', 'heater', 'gyro_noise'}
+
+    # Check simulated input settings, raising ValueError for unknown names or bad values
+    def check_inputs(self, inputs):
+        unknown = set(inputs) - self.INPUTS
+        if unknown:
+            raise ValueError(f"Unknown inputs: {', '.join(sorted(unknown))}")
+        number = lambda v: isinstance(v, (int, float))
+        for name, v in inputs.items():
+            if name == 'tilt':
+                ok = isinstance(v, (list, tuple)) and len(v) == 2 and all(map(number, v))
+            elif name == 'gyro_noise':
+                ok = number(v) or (isinstance(v, (list, tuple)) and 1 <= len(v) <= 2 and number(v[0]))
+            else:
+                ok = number(v)
+            if not ok:
+                raise ValueError(f"Bad value for input '{name}': {v!r}")
+
+    # Set simulated inputs directly
+    def set_inputs(self, inputs):
+        self.check_inputs(inputs)
+        if 'button'  in inputs: self.pin[26].set_value(inputs['button'])
+        if 'fsr'     in inputs: self.pin[28].slider.set_value(inputs['fsr'])
+        if 'tilt' in inputs or 'ax' in inputs or 'ay' in inputs:
+            ax, ay = inputs.get('tilt', (inputs.get('ax', self.lsm6dsox._ax), inputs.get('ay', self.lsm6dsox._ay)))
+            self.lsm6dsox.set_tilt(ax, ay)
+        if 'gyro_noise' in inputs:
+            noise = inputs['gyro_noise']
+            if not isinstance(noise, (list, tuple)): noise = [noise]
+            self.lsm6dsox.set_noise(*noise)
+        if 'ambient' in inputs: self.heater.set_ambient(inputs['ambient'])
+        if 'heater'  in inputs: self.heater.set_temperature(inputs['heater'])
+
+    # Drive the analog component on pin num from a Waveform of kind, or from its
+    # own slider or model again when kind is None
+    def set_waveform(self, num, kind=None, **params):
+        comp = self.pin[num] if 0 <= num < len(self.pin) else None
+        if not isinstance(comp, AnalogOut):
+            raise ValueError(f"No analog component at Pin {num}")
+        comp.source = None if kind is None else Waveform(kind, comp.to_uv, **params)
+
+    def clear_waveforms(self):
+        for comp in self.pin:
+            if isinstance(comp, AnalogOut): comp.source = None
+
+    # Snapshot of all simulation state in a compact binary format:
+    #   header, resistor on/temperature/filter value/ambient, TMP36 temperature,
+    #   FSR weight, IMU ax/ay/az, LED and button, OLED display registers (on,
+    #   inverted, entire on, contrast, addressing mode, column and page windows,
+    #   RAM position), IMU register pointer and gyro noise (sigma, pending gauss),
+    #   then the IMU register map, the gyro noise generator state, the OLED
+    #   frame buffer and shown frame. The whole snapshot is zlib compressed.
+    SNAPSHOT = struct.Struct('<4sB?ddddddddBB???BBBBBBBBBd?d')
+    SNAPSHOT_MAGIC   = b'BSNP'
+    SNAPSHOT_VERSION = 2
+    RNG_STATE = struct.Struct('<625I')      # Mersenne Twister state of random.Random
+
+    def snapshot(self):
+        self.heater.pull()
+        r, imu, oled = self.heater.resistor, self.lsm6dsox, self.oled
+        version, mt, gauss = imu._rng.getstate()
+        data = self.SNAPSHOT.pack(self.SNAPSHOT_MAGIC, self.SNAPSHOT_VERSION, r._on, r.temperature, r.lpf.value, r.ambient,
+                                  self.heater.tmp36.temperature, self.pin[28].weight,
+                                  imu._ax, imu._ay, imu._az, int(self.pin[6]._on), self.pin[26].value,
+                                  oled.display, oled.inverted, oled.entire_on, oled.level, oled.mode,
+                                  *oled.cols, *oled.rows, oled._col, oled._page,
+                                  imu._reg, imu.noise, gauss is not None, gauss or 0.0)
+        return zlib.compress(data + imu.regs + self.RNG_STATE.pack(*mt) + oled.buffer + oled.shown, 1)
+
+    # Restore a snapshot taken by snapshot()
+    def restore(self, snap):
+        data = zlib.decompress(snap)
+        (magic, ver, on, rtemp, lpf, ambient, ttemp, fsr, ax, ay, az, led, button,
+         display, inverted, entire_on, level, mode, c0, c1, p0, p1, col, page,
+         reg, noise, has_gauss, gauss) = self.SNAPSHOT.unpack_from(data)
+        if magic != self.SNAPSHOT_MAGIC or ver != self.SNAPSHOT_VERSION:
+            raise ValueError("Not a board snapshot of this version")
+
+        oled, imu = self.oled, self.lsm6dsox
+        oled.display, oled.inverted, oled.entire_on, oled.level, oled.mode = display, inverted, entire_on, level, mode
+        oled.cols, oled.rows, oled._col, oled._page, oled._cmd = [c0, c1], [p0, p1], col, page, []
+        start = self.SNAPSHOT.size
+        imu.regs[:] = data[start:start+len(imu.regs)]
+        start += len(imu.regs)
+        mt = self.RNG_STATE.unpack_from(data, start)
+        start += self.RNG_STATE.size
+        imu._reg, imu.noise = reg, noise
+        imu._rng.setstate((3, mt, gauss if has_gauss else None))
+
+        r = self.heater.resistor
+        r._on, r.temperature, r.lpf.value, r.ambient = on, rtemp, lpf, ambient
+        self.heater.tmp36.temperature = ttemp
+        self.heater.push()
+        self.pin[28].slider.set_value(fsr)
+        self.lsm6dsox.set_tilt(ax, ay)
+        self.lsm6dsox._az = az
+        self.lsm6dsox.hold()                            # Restored, not moved: no rotation
+        if led: self.pin[6].on()
+        else:   self.pin[6].off()
+        self.pin[26].set_value(button)
+
+        n = len(self.oled.buffer)
+        self.oled.buffer[:] = data[start:start+n]         # Frame being drawn
+        self.oled.shown     = data[start+n:start+2*n]     # Redisplay the shown frame, not captured
+        self.oled.present()
+
+    # Observable board state, as published to viewers
+    def get_state(self):
+        return {'led':     int(self.pin[6]._on),
+                'button':  self.pin[26].value,
+                'fsr':     self.pin[28].weight,
+                'tilt':    [self.lsm6dsox._ax, self.lsm6dsox._ay],
+                'heater':  self.heater.tmp36.temperature,
+                'oled':    self.oled.shown}
+
+    # Display state received from another board (any subset of get_state)
+    def apply_state(self, state):
+        if 'led' in state:
+            if state['led']: self.pin[6].on()
+            else:            self.pin[6].off()
+        inputs = {k: state[k] for k in ('button', 'fsr', 'tilt', 'heater') if k in state}
+        if inputs: self.set_inputs(inputs)
+        if 'oled' in state:
+            self.oled.shown = bytes(state['oled'])      # Mirrored, not shown: bypasses frame capture
+            self.oled.present()
+
+    # Create an image from base64 data (None when headless)
+    def image(self, data):
+        return None if self.headless else tk.PhotoImage(data=data)
+
+    # Create a font (None when headless)
+    def font(self, **kw):
+        return None if self.headless else tkfont.Font(**kw)
+
+# ----------------------------------------------------------------
+# Stand-ins for the Tk root and Canvas when running headless.
+# Components draw to the NullCanvas as usual and the drawing is discarded.
+class Headless(object):
+    def __init__(self):
+        self.alive = True
+
+    # Schedule func to run after ms milliseconds on a timer thread
+    def after(self, ms, func):
+        if not self.alive: return None
+        t = threading.Timer(ms/1000, func)
+        t.daemon = True
+        t.start()
+        return t
+
+    def after_cancel(self, t):
+        if t is not None: t.cancel()
+
+    # Stop scheduling callbacks
+    def destroy(self):
+        self.alive = False
+
+class NullCanvas(object):
+    def __init__(self):
+        self._ids = 0
+
+    def _create(self, *args, **kw):
+        self._ids += 1
+        return self._ids
+    create_image = create_text = create_line = create_rectangle = create_window = _create
+
+    def _ignore(self, *args, **kw):
+        pass
+    itemconfig = tag_bind = moveto = delete = update_idletasks = _ignore
+
+    def coords(self, item):
+        return [0.0, 0.0]
+
+# ----------------------------------------------------------------
+# Timed event scheduler for components that change over time.
+# Events are kept in a heap ordered by due time (time.monotonic()). Components
+# register one-shot events with at() or after(), or periodic ones at their own
+# rate with every(). run_due() runs what is due and returns the time until the
+# next event, so whatever drives the scheduler can sleep until then. start()
+# drives it with master.after(), waking only when the next event is due.
+# Periodic events that fall more than a period behind skip the missed periods
+# rather than running in a burst. lag and max_lag show how late events ran.
+class Scheduler(object):
+    def __init__(self):
+        self._heap   = []           # [due time, sequence number, period or None, func or None when cancelled]
+        self._seq    = 0            # Keeps events with equal times in order
+        self._lock   = threading.Lock()
+        self.pending = 0            # Events not yet run or cancelled
+        self.ran     = 0            # Events run
+        self.skipped = 0            # Periods skipped by periodic events that fell behind
+        self.lag     = 0.0          # Seconds the last event ran after it was due
+        self.max_lag = 0.0
+        self.errors  = 0            # Events that raised an exception
+        self.error   = None         # The last such exception
+        self.master  = None         # Set by start()
+        self._timer  = None         # (wake time, after id) while started
+        self._maxwait = 1.0
+
+    # Run func at monotonic time when, and then every period seconds if period is given.
+    # Returns the event, which can be passed to cancel().
+    def at(self, when, func, period=None):
+        with self._lock:
+            event = [when, self._seq, period, func]
+            heapq.heappush(self._heap, event)
+            self._seq    += 1
+            self.pending += 1
+            first = self._heap[0] is event
+        if first: self._rearm(when)
+        return event
+
+    # Run func once after delay seconds
+    def after(self, delay, func):
+        return self.at(time.monotonic() + delay, func)
+
+    # Run func every period seconds, first after delay (default one period)
+    def every(self, period, func, delay=None):
+        return self.at(time.monotonic() + (period if delay is None else delay), func, period)
+
+    def cancel(self, event):
+        with self._lock:
+            if event[3] is not None:
+                event[3] = None
+                self.pending -= 1
+
+    # Drop all events
+    def clear(self):
+        with self._lock:
+            for event in self._heap: event[3] = None
+            self._heap.clear()
+            self.pending = 0
+
+    # Monotonic time of the next event, or None
+    def next_due(self):
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][3] is None: heapq.heappop(heap)
+            return heap[0][0] if heap else None
+
+    # Run all events that are due. Returns seconds until the next one, at most maxwait.
+    def run_due(self, maxwait=0.1):
+        heap = self._heap
+        now  = time.monotonic()
+        while True:
+            with self._lock:
+                while heap and heap[0][3] is None: heapq.heappop(heap)
+                if not heap or heap[0][0] > now: break
+                event = heap[0]
+                due, _, period, func = event
+                if period is None:
+                    heapq.heappop(heap)
+                    event[3] = None
+                    self.pending -= 1
+                else:
+                    behind = int((now - due) // period)     # Whole periods missed
+                    self.skipped += behind
+                    event[0] = due + (behind + 1)*period
+                    event[1] = self._seq
+                    self._seq += 1
+                    heapq.heapreplace(heap, event)
+            self.lag     = now - due
+            self.max_lag = max(self.max_lag, self.lag)
+            self.ran    += 1
+            try:
+                func()
+            except Exception as e:  # One failing event must not stop the rest
+                self.errors += 1
+                self.error   = f"{getattr(func, '__name__', 'event')}: {e}"
+                print(f"Scheduled event failed: {self.error}")
+        due = self.next_due()
+        return maxwait if due is None else max(0.0, min(maxwait, due - time.monotonic()))
+
+    # Drive the scheduler from master's after(), waking when the next event is due
+    # or at least every maxwait seconds
+    def start(self, master, maxwait=1.0):
+        self.master, self._maxwait = master, maxwait
+        self._wake()
+
+    def _wake(self):
+        self._timer = None
+        wait = self._maxwait
+        try:
+            wait = self.run_due(self._maxwait)
+        finally:
+            self._arm(time.monotonic() + wait)     # Keep waking, whatever happened
+
+    def _arm(self, when):
+        ms = max(1, int((when - time.monotonic())*1000))
+        self._timer = (when, self.master.after(ms, self._wake))
+
+    # Wake earlier than planned for a new first event
+    def _rearm(self, when):
+        timer = self._timer
+        if timer is None or timer[0] <= when: return
+        self.master.after_cancel(timer[1])
+        self._arm(when)
+
+    # Timing summary
+    def summary(self):
+        return {'pending': self.pending, 'ran': self.ran, 'skipped': self.skipped,
+                'lag': self.lag, 'max_lag': self.max_lag, 'errors': self.errors, 'error': self.error}
 
 # ----------------------------------------------------------------
 # A simple "leaky integrator" low-pass filter (author JDG)
@@ -77,10 +410,13 @@ class LPF(object):
 class AnalogOut(object):
     def __init__(self):
         object.__init__(self)
+        self.source = None      # Waveform driving readings, if any
     def read_u16(self):
         raise NotImplementedError
     def read_uv(self):
         raise NotImplementedError
+    def to_uv(self, x):         # Microvolts output for input x (grams, °C, ...)
+        raise NotImplementedError
 
 class DigitalOut(object):
     def __init__(self):
@@ -97,6 +433,112 @@ class DigitalIn(object):
     def value(self):
         raise NotImplementedError
 
+# ----------------------------------------------------------------
+# Waveform generators for analog inputs
+# A Waveform stands in for an analog component's slider or model, as a function
+# of time on the monotonic clock since start. Samples are computed BLOCK at a
+# time, at rate per second, when a read first reaches their block. They are kept
+# in the component's units and converted to its microvolts, so a read is an
+# index into the current block.
+#   constant  value
+#   step      before, after, at (s)
+#   ramp      begin, end, at (s), duration (s); holds end afterwards
+#   sine      offset, amplitude, freq (Hz), phase (degrees)
+#   square    low, high, freq (Hz), duty (0-1)
+#   noise     mean, sigma, seed; the same seed gives the same samples
+#   table     points [[t, value], ...] or path of a CSV file of t,value rows,
+#             interpolated linearly; repeat=True loops it
+# Values are in the component's own units: grams for the FSR, °C for the TMP36.
+class Waveform(object):
+    RATE  = 1000        # Samples per second
+    BLOCK = 1024        # Samples computed at a time
+
+    def __init__(self, kind, convert=float, start=None, rate=RATE, **params):
+        self.wave = getattr(self, '_' + kind, None) if kind in self.KINDS else None
+        if self.wave is None:
+            raise ValueError(f"Unknown waveform '{kind}'")
+        self.kind    = kind
+        self.convert = convert
+        self.start   = time.monotonic() if start is None else start
+        self.rate    = rate
+        self.params  = params
+        if kind == 'table': self.params = self._load(**params)
+        self._n      = None         # Block number in _buf
+        self._buf    = None         # Block in microvolts
+        self._raw    = None         # Block in the component's units
+        self._fill(0)               # Computed now so bad parameters fail on attach
+
+    KINDS = ('constant', 'step', 'ramp', 'sine', 'square', 'noise', 'table')
+
+    # Microvolts at time now
+    def sample(self, now=None):
+        return self._buf[self._index(now)]
+
+    # Value in the component's units (grams, °C, ...) at time now
+    def value(self, now=None):
+        return self._raw[self._index(now)]
+
+    # Index of the sample at time now in the current block, computing the block if needed
+    def _index(self, now):
+        now = time.monotonic() if now is None else now
+        n, i = divmod(max(int((now - self.start) * self.rate), 0), self.BLOCK)
+        if n != self._n: self._fill(n)
+        return i
+
+    # Compute block n
+    def _fill(self, n):
+        n0 = n * self.BLOCK
+        ts = [(n0 + i) / self.rate for i in range(self.BLOCK)]
+        self._raw = self.wave(ts, n, **self.params)
+        self._buf = [self.convert(v) for v in self._raw]
+        self._n   = n
+
+    def _constant(self, ts, n, value=0.0):
+        return [value] * len(ts)
+
+    def _step(self, ts, n, before=0.0, after=1.0, at=0.0):
+        return [after if t >= at else before for t in ts]
+
+    def _ramp(self, ts, n, begin=0.0, end=1.0, at=0.0, duration=1.0):
+        slope = (end - begin) / duration
+        return [begin if t < at else end if t >= at + duration else begin + (t - at)*slope for t in ts]
+
+    def _sine(self, ts, n, offset=0.0, amplitude=1.0, freq=1.0, phase=0.0):
+        w, p = 2*math.pi*freq, math.radians(phase)
+        return [offset + amplitude*math.sin(w*t + p) for t in ts]
+
+    def _square(self, ts, n, low=0.0, high=1.0, freq=1.0, duty=0.5):
+        return [high if (t*freq) % 1.0 < duty else low for t in ts]
+
+    def _noise(self, ts, n, mean=0.0, sigma=1.0, seed=0):
+        rng = random.Random(f"{seed}/{n}")      # Seeded per block, so blocks can be recomputed
+        return [rng.gauss(mean, sigma) for _ in ts]
+
+    def _table(self, ts, n, times=(), values=(), repeat=False):
+        last, out = times[-1], []
+        for t in ts:
+            if repeat and last > 0: t %= last
+            i = bisect.bisect_right(times, t)
+            if i == 0:             out.append(values[0])
+            elif i == len(times):  out.append(values[-1])
+            else:
+                t0, t1 = times[i-1], times[i]
+                out.append(values[i-1] + (t - t0)/(t1 - t0)*(values[i] - values[i-1]))
+        return out
+
+    # Table points from a list or a CSV file, sorted by time. CSV rows that are not two numbers are skipped.
+    def _load(self, points=None, path=None, repeat=False):
+        if path is not None:
+            points = []
+            with open(path, newline='') as f:
+                for row in csv.reader(f):
+                    try:    points.append((float(row[0]), float(row[1])))
+                    except (ValueError, IndexError): pass
+        if not points:
+            raise ValueError("Waveform table has no points")
+        points = sorted((float(t), float(v)) for t, v in points)
+        return {'times': [t for t, v in points], 'values': [v for t, v in points], 'repeat': repeat}
+
 # ----------------------------------------------------------------
 # TMP36 Voltage Output Temperature Sensor
 # Specified from −40°C to +125°C, provides a 750 mV output at 25°C and an output scale factor of 10 mV/°C.
@@ -109,20 +551,34 @@ class TMP36(AnalogOut):
         self.x, self.y = x, y
         self._temp  = 25        # internal temperature
         self._value = 750*1000  # internal value is in μvolts
-        self._img   = tk.PhotoImage(data=tmp36_b64)
+        self.bank   = None      # ThermalBank holding the temperature, if any
+        self.index  = 0
+        self._seen  = -1        # Bank version last read
+        self._img   = board.image(tmp36_b64)
         self.img    = self.board.cvs.create_image(x, y, image=self._img, anchor=tk.NW)
         self.title  = board.cvs.create_text(x+21, y+17, font=("Courier", 8, "bold"), fill='white', text="TMP36")
 
     @property
     def temperature(self):
+        if self.source is not None: return self.source.value()
+        if self.bank is not None: self._pull()
         return self._temp
     
+    # Take the temperature from the ThermalBank, once per bank tick
+    def _pull(self):
+        if self._seen != self.bank.version:
+            self._seen = self.bank.version
+            self.temperature = float(self.bank.value[self.index])
+
     # Convert temperature (°C) to μV
     # 750 mV output at 25°C and an output scale factor of 10 mV/°C
     @temperature.setter
     def temperature(self, temp):
         self._temp = temp
-        self._value = 1000 * ((temp - 25)*10 + 750)
+        self._value = self.to_uv(temp)
+
+    def to_uv(self, temp):
+        return 1000 * ((temp - 25)*10 + 750)
 
     # Read a raw analog value in the range 0-65535
     def read_u16(self):
@@ -131,13 +587,17 @@ class TMP36(AnalogOut):
 
     # Read an analog value in microvolts
     def read_uv(self):
+        if self.source is not None: return self.source.sample()
+        if self.bank is not None: self._pull()
         return self._value
 
     # Process command sent to FSR
     def process(self, cmd):
         if cmd == 'read_u16':
+            self.board.cost.adc()
             return {'success':True, 'msg':self.read_u16()}
         elif cmd == 'read_uv':
+            self.board.cost.adc()
             return {'success':True, 'msg':self.read_uv()}
         else:
             return {'success':False, 'msg':f"Command {cmd} not understood by TMP36 at Pin {self.num}"}
@@ -157,14 +617,19 @@ class Resistor(object):
         self._temp      = 25            # Start temperature is room temperature
         self.lpf        = LPF(25, 0.1)  # Low pass filter for temperature dynamics
         self.tauW       = 80            # Thermal resistance constant - from thin air
+        self.ambient    = 25.0          # Room temperature
+        self.bank       = None          # ThermalBank stepping this resistor, if any
+        self.index      = 0
     
     # Current on 
     def on(self):
         self._on = True
+        if self.bank is not None: self.bank.on[self.index] = True
     
     # Current off
     def off(self):
         self._on = False
+        if self.bank is not None: self.bank.on[self.index] = False
     
     @property
     def temperature(self):
@@ -181,7 +646,7 @@ class Resistor(object):
             # Compute current and estimate new target from current. 40°C = 104°F
             target = self.board.vcc / self.ohms / self.tauW
         else:
-            target = 25.0   # 25°C = 77°F, drive back to room temperature
+            target = self.ambient   # 25°C = 77°F, drive back to room temperature
 
         # Move toward target temperature using low pass filter
         self.temperature = self.lpf.filter(target)
@@ -203,14 +668,92 @@ class Heater(object):
     def __init__(self, board, ohms, x, y):
         self.tmp36    = TMP36(board, x, y)
         self.resistor = Resistor(board, ohms, x, y)
+        self.bank     = None    # ThermalBank stepping this heater, if any
+        self.index    = 0
         
     # Simulate
     def tick(self):
+        if self.bank is not None: return    # Stepped by its bank
+
         # Update resistor state
         self.resistor.tick()
         # Copy resistor temperature to tmp36
         self.tmp36.temperature = self.resistor.temperature
 
+    # Set heater temperature directly, including the filter state driving it
+    def set_temperature(self, temp):
+        self.resistor.temperature = temp
+        self.resistor.lpf.value   = temp
+        self.tmp36.temperature    = temp
+        if self.bank is not None: self.bank.value[self.index] = temp
+
+    # Set room temperature the heater cools to
+    def set_ambient(self, temp):
+        self.resistor.ambient = temp
+        if self.bank is not None: self.bank.ambient[self.index] = temp
+
+    # Let bank step this heater from now on
+    def bind(self, bank, index):
+        self.bank  = self.resistor.bank  = self.tmp36.bank  = bank
+        self.index = self.resistor.index = self.tmp36.index = index
+        self.push()
+
+    # Copy state and parameters to the bank
+    def push(self):
+        if self.bank is None: return
+        b, i, r = self.bank, self.index, self.resistor
+        b.on[i], b.vcc[i], b.ohms[i], b.tauW[i] = r._on, r.board.vcc, r.ohms, r.tauW
+        b.a[i], b.value[i], b.ambient[i]        = r.lpf.a, r.lpf.value, r.ambient
+
+    # Copy the latest temperature from the bank
+    def pull(self):
+        if self.bank is None: return
+        temp = float(self.bank.value[self.index])
+        self.resistor.temperature = temp
+        self.resistor.lpf.value   = temp
+        self.tmp36.temperature    = temp
+
+# ----------------------------------------------------------------
+# Vectorized thermal model for many heaters (requires NumPy)
+# Holds the state of every added Heater in arrays and advances them all with a
+# few array operations per tick: the same model as Resistor.tick and LPF.filter.
+# Sensors copy their temperature out of the arrays only when read.
+# Call tick() once a second in place of each Heater.tick(), or start(sched).
+# Resistor parameters (ohms, tauW, lpf.a) changed after add() need Heater.push().
+class ThermalBank(object):
+    def __init__(self):
+        if np is None:
+            raise RuntimeError("ThermalBank requires NumPy")
+        self.heaters = []
+        self.version = 0                    # Incremented every tick
+        self.on      = np.zeros(0, dtype=bool)
+        self.vcc     = np.zeros(0)
+        self.ohms    = np.zeros(0)
+        self.tauW    = np.zeros(0)
+        self.a       = np.zeros(0)          # Filter coefficient
+        self.value   = np.zeros(0)          # Temperature
+        self.ambient = np.zeros(0)
+
+    # Add a heater. Returns its index.
+    def add(self, heater):
+        index = len(self.heaters)
+        self.heaters.append(heater)
+        self.on = np.append(self.on, False)
+        for name in ('vcc', 'ohms', 'tauW', 'a', 'value', 'ambient'):
+            setattr(self, name, np.append(getattr(self, name), 0.0))
+        heater.bind(self, index)
+        return index
+
+    # Advance every heater one step
+    def tick(self):
+        target     = np.where(self.on, self.vcc / self.ohms / self.tauW, self.ambient)
+        self.value = ((1 - self.a) * self.value) + (self.a * target)
+        self.version += 1
+
+    # Tick every period seconds on a Scheduler. Returns the scheduled event.
+    def start(self, sched, period=1.0):
+        return sched.every(period, self.tick, 0)
+
 # ----------------------------------------------------------------
 # Force Sensing Resistor, Ohmite FSR01DE
 # 0-5000g range. 20g min to actuate. Near linear on log-log scale.
@@ -228,17 +771,27 @@ class FSR(AnalogOut):
         self.ohmsatmax = 0          # Resistance (ohms) at max weight
         self.pulldown  = 10000      # Resistance (ohms) of pulldown resistor
 
-        self._img      = tk.PhotoImage(data=fsr2_b64)
+        self._img      = board.image(fsr2_b64)
         self.img       = self.board.cvs.create_image(x+55, y+100, image=self._img)
         self.slider    = Slider(board, x, y, 180, 0.0, self.maxweight, expo=5, clr='blue')
-        self._font     = tkfont.Font(size=12)
+        self._font     = board.font(size=12)
         self.title     = self.board.cvs.create_text(x+75, y+100, font=self._font, text="FSR")        
+
+    # Weight on the FSR (grams): from the waveform when one is attached, else the slider
+    @property
+    def weight(self):
+        return self.source.value() if self.source is not None else self.slider.value
         
     # Compute analog value in microvolts (μv)
     def read_uv(self):
-        # Read weight from slider 
-        gms = self.slider.value
-        
+        if self.source is not None: return self.source.sample()
+
+        # Read weight from slider, and cache value as microvolts
+        self._value = self.to_uv(self.slider.value)
+        return self._value
+
+    # Microvolts output for gms grams on the FSR
+    def to_uv(self, gms):
         # If below minimum actuation weight, return 0.0 (i.e. infinite resistance = 0.0 microvolts)
         if gms < self.actweight: return 0
         
@@ -246,13 +799,7 @@ class FSR(AnalogOut):
         fsrres = ((gms - self.actweight) / (self.maxweight - self.actweight)) * (self.ohmsatmax - self.ohmsatact) + self.ohmsatact
         
         # Compute voltage (microvolts) with given pulldown resistor (Supply is in millivolts)
-        uvolts = int(round(1000 * self.board.vcc * (self.pulldown / (fsrres + self.pulldown))))
-        
-        # Cache value as microvolts
-        self._value = uvolts
-        
-        # Return microvolts
-        return uvolts
+        return int(round(1000 * self.board.vcc * (self.pulldown / (fsrres + self.pulldown))))
     
     # Read a raw analog value in the range 0-65535 (16-bit)
     def read_u16(self):
@@ -264,8 +811,10 @@ class FSR(AnalogOut):
     # Process command sent to FSR
     def process(self, cmd):
         if cmd == 'read_u16':
+            self.board.cost.adc()
             return {'success':True, 'msg':self.read_u16()}
         elif cmd == 'read_uv':
+            self.board.cost.adc()
             return {'success':True, 'msg':self.read_uv()}
         else:
             return {'success':False, 'msg':f"Command {cmd} not understood by FSR at Pin {self.num}"}
@@ -279,8 +828,8 @@ class PushButton(DigitalIn):
         self.cvs = board.cvs
         self.x, self.y = x, y
         self._value = 1
-        self._up   = tk.PhotoImage(data=button_up_b64)      # file="button_up.png")
-        self._down = tk.PhotoImage(data=button_down_b64)    # file="button_down.png")
+        self._up   = board.image(button_up_b64)         # file="button_up.png")
+        self._down = board.image(button_down_b64)       # file="button_down.png")
         self._img  = self.cvs.create_image(x, y, image=self._up, anchor=tk.NW)
 
         self.cvs.tag_bind(self._img, '<ButtonPress>', self.press)
@@ -299,6 +848,11 @@ class PushButton(DigitalIn):
         self._value = 1
         self.cvs.itemconfig(self._img, image=self._up)
     
+    # Set button state directly (0 = pressed, 1 = released)
+    def set_value(self, value):
+        if value: self.release(None)
+        else:     self.press(None)
+
     # Test if button is pressed
     def is_pressed(self):
         return self._value == 0
@@ -319,9 +873,9 @@ class Slider(object):
         self.x, self.y, self.h, self.min, self.max = x, y, h, min, max
         self._value  = self.min
         self.stem    = self.cvs.create_line(x-5, y, x-5, y+h, fill=clr, width=10)
-        self._btn    = tk.PhotoImage(data=lsm_button_b64)     # file="lsm_button.png")
+        self._btn    = board.image(lsm_button_b64)        # file="lsm_button.png")
         self.btn     = self.cvs.create_image(x-5, y+h, image=self._btn, anchor=tk.CENTER)
-        self._font   = tkfont.Font(size=12)
+        self._font   = board.font(size=12)
         self._lbl    = self.cvs.create_text(x-5, y+h+25, font=self._font)
         self._drag   = False    # True if currently dragging button
         self._startx = 0.0
@@ -367,6 +921,14 @@ class Slider(object):
             # Compute new value based on button position and redraw
             self.update_value()
     
+    # Set value directly and move button to match
+    def set_value(self, value):
+        value = max(self.min, min(self.max, value))
+        frac  = math.pow((value-self.min)/(self.max-self.min), 1.0/self.expo)
+        self.cvs.moveto(self.btn, self.x-15, self.y + (1.0-frac)*self.h - 10)
+        self._value = value
+        self.redraw()
+
     # Recompute value based on position of button and draw
     def update_value(self):
         _, by = self.cvs.coords(self.btn)
@@ -383,8 +945,8 @@ class LED(DigitalOut):
         self.cvs       = board.cvs
         self.x, self.y = x, y
         self._on       = False
-        self._onImg    = tk.PhotoImage(data=led_on_b64)     # file="led_on.png")
-        self._offImg   = tk.PhotoImage(data=led_off_b64)    # file="led_off.png")
+        self._onImg    = board.image(led_on_b64)        # file="led_on.png")
+        self._offImg   = board.image(led_off_b64)       # file="led_off.png")
         self.image     = self.cvs.create_image(x, y, image=self._offImg, anchor=tk.NW)
         self.off()
 
@@ -411,96 +973,424 @@ class LED(DigitalOut):
         else:
             return {'success':False, 'msg':f"Command {cmd} not understood by LED"}
 
+# ----------------------------------------------------------------
+# MicroPython built-in 8x8 font (extmod/font_petme128_8x8.h), ASCII 32-127.
+# Each glyph is 8 column bytes with the LSB at the top, the same layout as
+# an SSD1306 display page, so glyphs can be blitted byte-wise.
+FONT_8X8 = bytes((
+    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # 32=
+    0x00,0x00,0x00,0x4f,0x4f,0x00,0x00,0x00, # 33=!
+    0x00,0x07,0x07,0x00,0x00,0x07,0x07,0x00, # 34="
+    0x14,0x7f,0x7f,0x14,0x14,0x7f,0x7f,0x14, # 35=#
+    0x00,0x24,0x2e,0x6b,0x6b,0x3a,0x12,0x00, # 36=$
+    0x00,0x63,0x33,0x18,0x0c,0x66,0x63,0x00, # 37=%
+    0x00,0x32,0x7f,0x4d,0x4d,0x77,0x72,0x50, # 38=&
+    0x00,0x00,0x00,0x04,0x06,0x03,0x01,0x00, # 39='
+    0x00,0x00,0x1c,0x3e,0x63,0x41,0x00,0x00, # 40=(
+    0x00,0x00,0x41,0x63,0x3e,0x1c,0x00,0x00, # 41=)
+    0x08,0x2a,0x3e,0x1c,0x1c,0x3e,0x2a,0x08, # 42=*
+    0x00,0x08,0x08,0x3e,0x3e,0x08,0x08,0x00, # 43=+
+    0x00,0x00,0x80,0xe0,0x60,0x00,0x00,0x00, # 44=,
+    0x00,0x08,0x08,0x08,0x08,0x08,0x08,0x00, # 45=-
+    0x00,0x00,0x00,0x60,0x60,0x00,0x00,0x00, # 46=.
+    0x00,0x40,0x60,0x30,0x18,0x0c,0x06,0x02, # 47=/
+    0x00,0x3e,0x7f,0x49,0x45,0x7f,0x3e,0x00, # 48=0
+    0x00,0x40,0x44,0x7f,0x7f,0x40,0x40,0x00, # 49=1
+    0x00,0x62,0x73,0x51,0x49,0x4f,0x46,0x00, # 50=2
+    0x00,0x22,0x63,0x49,0x49,0x7f,0x36,0x00, # 51=3
+    0x00,0x18,0x18,0x14,0x16,0x7f,0x7f,0x10, # 52=4
+    0x00,0x27,0x67,0x45,0x45,0x7d,0x39,0x00, # 53=5
+    0x00,0x3e,0x7f,0x49,0x49,0x7b,0x32,0x00, # 54=6
+    0x00,0x03,0x03,0x79,0x7d,0x07,0x03,0x00, # 55=7
+    0x00,0x36,0x7f,0x49,0x49,0x7f,0x36,0x00, # 56=8
+    0x00,0x26,0x6f,0x49,0x49,0x7f,0x3e,0x00, # 57=9
+    0x00,0x00,0x00,0x24,0x24,0x00,0x00,0x00, # 58=:
+    0x00,0x00,0x80,0xe4,0x64,0x00,0x00,0x00, # 59=;
+    0x00,0x08,0x1c,0x36,0x63,0x41,0x41,0x00, # 60=<
+    0x00,0x14,0x14,0x14,0x14,0x14,0x14,0x00, # 61==
+    0x00,0x41,0x41,0x63,0x36,0x1c,0x08,0x00, # 62=>
+    0x00,0x02,0x03,0x51,0x59,0x0f,0x06,0x00, # 63=?
+    0x00,0x3e,0x7f,0x41,0x4d,0x4f,0x2e,0x00, # 64=@
+    0x00,0x7c,0x7e,0x0b,0x0b,0x7e,0x7c,0x00, # 65=A
+    0x00,0x7f,0x7f,0x49,0x49,0x7f,0x36,0x00, # 66=B
+    0x00,0x3e,0x7f,0x41,0x41,0x63,0x22,0x00, # 67=C
+    0x00,0x7f,0x7f,0x41,0x63,0x3e,0x1c,0x00, # 68=D
+    0x00,0x7f,0x7f,0x49,0x49,0x41,0x41,0x00, # 69=E
+    0x00,0x7f,0x7f,0x09,0x09,0x01,0x01,0x00, # 70=F
+    0x00,0x3e,0x7f,0x41,0x49,0x7b,0x3a,0x00, # 71=G
+    0x00,0x7f,0x7f,0x08,0x08,0x7f,0x7f,0x00, # 72=H
+    0x00,0x00,0x41,0x7f,0x7f,0x41,0x00,0x00, # 73=I
+    0x00,0x20,0x60,0x41,0x7f,0x3f,0x01,0x00, # 74=J
+    0x00,0x7f,0x7f,0x1c,0x36,0x63,0x41,0x00, # 75=K
+    0x00,0x7f,0x7f,0x40,0x40,0x40,0x40,0x00, # 76=L
+    0x00,0x7f,0x7f,0x06,0x0c,0x06,0x7f,0x7f, # 77=M
+    0x00,0x7f,0x7f,0x0e,0x1c,0x7f,0x7f,0x00, # 78=N
+    0x00,0x3e,0x7f,0x41,0x41,0x7f,0x3e,0x00, # 79=O
+    0x00,0x7f,0x7f,0x09,0x09,0x0f,0x06,0x00, # 80=P
+    0x00,0x1e,0x3f,0x21,0x61,0x7f,0x5e,0x00, # 81=Q
+    0x00,0x7f,0x7f,0x19,0x39,0x6f,0x46,0x00, # 82=R
+    0x00,0x26,0x6f,0x49,0x49,0x7b,0x32,0x00, # 83=S
+    0x00,0x01,0x01,0x7f,0x7f,0x01,0x01,0x00, # 84=T
+    0x00,0x3f,0x7f,0x40,0x40,0x7f,0x3f,0x00, # 85=U
+    0x00,0x1f,0x3f,0x60,0x60,0x3f,0x1f,0x00, # 86=V
+    0x00,0x7f,0x7f,0x30,0x18,0x30,0x7f,0x7f, # 87=W
+    0x00,0x63,0x77,0x1c,0x1c,0x77,0x63,0x00, # 88=X
+    0x00,0x07,0x0f,0x78,0x78,0x0f,0x07,0x00, # 89=Y
+    0x00,0x61,0x71,0x59,0x4d,0x47,0x43,0x00, # 90=Z
+    0x00,0x00,0x7f,0x7f,0x41,0x41,0x00,0x00, # 91=[
+    0x00,0x02,0x06,0x0c,0x18,0x30,0x60,0x40, # 92=\
+    0x00,0x00,0x41,0x41,0x7f,0x7f,0x00,0x00, # 93=]
+    0x00,0x08,0x0c,0x06,0x06,0x0c,0x08,0x00, # 94=^
+    0xc0,0xc0,0xc0,0xc0,0xc0,0xc0,0xc0,0xc0, # 95=_
+    0x00,0x00,0x01,0x03,0x06,0x04,0x00,0x00, # 96=`
+    0x00,0x20,0x74,0x54,0x54,0x7c,0x78,0x00, # 97=a
+    0x00,0x7f,0x7f,0x44,0x44,0x7c,0x38,0x00, # 98=b
+    0x00,0x38,0x7c,0x44,0x44,0x6c,0x28,0x00, # 99=c
+    0x00,0x38,0x7c,0x44,0x44,0x7f,0x7f,0x00, # 100=d
+    0x00,0x38,0x7c,0x54,0x54,0x5c,0x58,0x00, # 101=e
+    0x00,0x08,0x7e,0x7f,0x09,0x03,0x02,0x00, # 102=f
+    0x00,0x98,0xbc,0xa4,0xa4,0xfc,0x7c,0x00, # 103=g
+    0x00,0x7f,0x7f,0x04,0x04,0x7c,0x78,0x00, # 104=h
+    0x00,0x00,0x00,0x7d,0x7d,0x00,0x00,0x00, # 105=i
+    0x00,0x40,0xc0,0x80,0x80,0xfd,0x7d,0x00, # 106=j
+    0x00,0x7f,0x7f,0x30,0x38,0x6c,0x44,0x00, # 107=k
+    0x00,0x00,0x41,0x7f,0x7f,0x40,0x00,0x00, # 108=l
+    0x00,0x7c,0x7c,0x18,0x30,0x18,0x7c,0x7c, # 109=m
+    0x00,0x7c,0x7c,0x04,0x04,0x7c,0x78,0x00, # 110=n
+    0x00,0x38,0x7c,0x44,0x44,0x7c,0x38,0x00, # 111=o
+    0x00,0xfc,0xfc,0x24,0x24,0x3c,0x18,0x00, # 112=p
+    0x00,0x18,0x3c,0x24,0x24,0xfc,0xfc,0x00, # 113=q
+    0x00,0x7c,0x7c,0x04,0x04,0x0c,0x08,0x00, # 114=r
+    0x00,0x48,0x5c,0x54,0x54,0x74,0x24,0x00, # 115=s
+    0x00,0x04,0x04,0x3f,0x7f,0x44,0x64,0x00, # 116=t
+    0x00,0x3c,0x7c,0x40,0x40,0x7c,0x7c,0x00, # 117=u
+    0x00,0x1c,0x3c,0x60,0x60,0x3c,0x1c,0x00, # 118=v
+    0x00,0x1c,0x7c,0x30,0x18,0x30,0x7c,0x1c, # 119=w
+    0x00,0x44,0x6c,0x38,0x38,0x6c,0x44,0x00, # 120=x
+    0x00,0x9c,0xbc,0xa0,0xa0,0xfc,0x7c,0x00, # 121=y
+    0x00,0x44,0x64,0x74,0x5c,0x4c,0x44,0x00, # 122=z
+    0x00,0x08,0x08,0x3e,0x77,0x41,0x41,0x00, # 123={
+    0x00,0x00,0x00,0xff,0xff,0x00,0x00,0x00, # 124=|
+    0x00,0x41,0x41,0x77,0x3e,0x08,0x08,0x00, # 125=}
+    0x00,0x02,0x03,0x01,0x03,0x02,0x03,0x01, # 126=~
+    0xaa,0x55,0xaa,0x55,0xaa,0x55,0xaa,0x55, # 127
+))
+
+# Render a string to a row of glyph column bytes, 8 columns per glyph.
+# As in MicroPython framebuf, there is one glyph per UTF-8 byte, bytes outside
+# 32-127 are drawn as glyph 127 (so '°' takes two cells), and a NUL ends the text.
+# Results are cached since programs tend to redraw the same strings every frame.
+@functools.lru_cache(maxsize=512)
+def render_text(text):
+    cols = bytearray()
+    for c in text.encode('utf-8'):
+        if c == 0: break
+        if c < 32 or c > 127: c = 127
+        i = (c - 32) * 8
+        cols += FONT_8X8[i:i+8]
+    return bytes(cols)
+
+# Translation tables that expand one bit of every framebuffer byte to a gray pixel (0 or 255)
+_BIT_ROWS = [bytes(255 if b & (1 << bit) else 0 for b in range(256)) for bit in range(8)]
+
+# Expand a MONO_VLSB frame buffer to row-major 8-bit gray pixels
+def vlsb_to_gray(buf, width, height):
+    rows = []
+    for p in range(height // 8):
+        seg = buf[p*width:(p+1)*width]
+        for bit in range(8):
+            rows.append(seg.translate(_BIT_ROWS[bit]))
+    return b''.join(rows)
+
 # ----------------------------------------------------------------
 # SSD1306 OLED display
 # https://docs.micropython.org/en/latest/esp8266/tutorial/ssd1306.html
+# https://github.com/micropython/micropython/blob/master/extmod/modframebuf.c
+# Pixels are held in a MONO_VLSB frame buffer, the same layout as the SSD1306 display RAM:
+# one byte per column per 8-pixel page, LSB at the top.
+# The display is also an I2C device (see I2CBus). Each write starts with a control byte:
+# 0x00 commands follow, 0x40 display RAM data follows, 0x80 one command byte then another control byte.
+# Commands are interpreted for addressing, contrast, inversion and display on/off.
+# SSD1306_ARGS gives the argument bytes of each command that has any. Scroll setup
+# (0x26/0x27, 0x29/0x2a, 0xa3) is consumed with its arguments but not rendered.
+SSD1306_ARGS = {0x20:1, 0x21:2, 0x22:2, 0x81:1, 0xa8:1, 0xd3:1, 0xd5:1, 0xd9:1, 0xda:1, 0xdb:1, 0x8d:1,
+                0x26:6, 0x27:6, 0x29:5, 0x2a:5, 0xa3:2}
+
 class SSD1306_I2C(object):
-    def __init__(self, board, x, y):
-        self.cvs  = board.cvs
-        self.x    = x
-        self.y    = y       # Double-buffer with two Canvases to prevent flicker
-        self.back = tk.Canvas(self.cvs, width=130, height=66, bg="black")
-        self.buf  = tk.Canvas(self.cvs, width=130, height=66, bg="black")
-        self.win2 = self.cvs.create_window(x, y, anchor=tk.NW, window=self.back)
-        self.win1 = self.cvs.create_window(x, y, anchor=tk.NW, window=self.buf)
-        self.obs  = []     # A list of objects to draw on OLED
+    def __init__(self, board, x, y, width=128, height=64):
+        self.board  = board
+        self.cvs    = board.cvs
+        self.x      = x
+        self.y      = y
+        self.width  = width
+        self.height = height
+        self.pages  = height // 8
+        self.buffer = bytearray(width * self.pages)     # Frame buffer
+        if board.headless:
+            self.scr = self._img = None
+        else:
+            self.scr  = tk.Canvas(self.cvs, width=width+2, height=height+2, bg="black")
+            self.win  = self.cvs.create_window(x, y, anchor=tk.NW, window=self.scr)
+            self._img = tk.PhotoImage(width=width, height=height)
+            self.img  = self.scr.create_image(1, 1, image=self._img, anchor=tk.NW)
+        self.capture = None     # Optional FrameCapture that records every presented frame
+        self.shown   = bytes(self.buffer)   # Frame most recently presented by show()
+
+        # Panel refresh. Once paced, show() marks the panel dirty and schedules
+        # one refresh, no sooner than 1/rate seconds after the last one, which
+        # draws the newest frame. Nothing is scheduled while no frame is waiting.
+        self.rate      = 60         # Panel refreshes per second, or 0 to draw every frame at once
+        self.presented = 0          # Frames drawn on the panel
+        self.dropped   = 0          # Frames replaced by a newer one before they were drawn
+        self._queued   = 0          # Frames shown since the panel was last drawn
+        self._dirty    = False      # Panel needs drawing, and a refresh is scheduled
+        self._drawn    = 0.0        # When the panel was last drawn
+        self._sched    = None       # Scheduler pacing the panel, set by pace()
+
+        # Display registers
+        self.display   = True       # Display on (SET_DISP)
+        self.inverted  = False      # SET_NORM_INV
+        self.entire_on = False      # SET_ENTIRE_ON: all pixels lit regardless of RAM
+        self.level     = 0xff       # Contrast (SET_CONTRAST)
+        self.mode      = 0          # Memory addressing: 0 horizontal, 1 vertical, 2 page
+        self.cols      = [0, width-1]           # Column address window
+        self.rows      = [0, self.pages-1]      # Page address window
+        self._col = self._page = 0              # Display RAM write position
+        self._cmd      = []         # Command waiting for its arguments
 
     # Write the contents of the FrameBuffer to display memory
     def show(self):
-        self.back.delete("all")
-        
-        # Re-draw all objects on buf canvas
-        for o in self.obs:
-            if o['type'] == 'text':
-                o['id'] = self.back.create_text(o['x']+2, o['y'], text=o['text'], font=("Courier", 8, "bold"), fill=o['clr'], anchor=tk.NW)
-            elif o['type'] == 'rect':
-                o['id'] = self.back.create_rectangle(o['x0'], o['y0'], o['x1'], o['y1'], outline=o['clr'], fill='')
-            elif o['type'] == 'fill_rect':
-                o['id'] = self.back.create_rectangle(o['x0'], o['y0'], o['x1'], o['y1'], outline=o['clr'], fill=o['clr'])
-            elif o['type'] == 'line':
-                o['id'] = self.back.create_line(o['x0'], o['y0'], o['x1'], o['y1'], fill='white')
-        
-        # Swap buffer references and lift
-        tk.Misc.lift(self.back, aboveThis=self.buf)
-        self.cvs.update_idletasks()
-        self.buf, self.back = self.back, self.buf
+        self.shown = bytes(self.buffer)
+        if self.capture is not None: self.capture.add(self.buffer)
+        if self._img is not None: self._queued += 1
+        self.present()
+
+    # Draw the shown frame as the panel displays it: now, or at the next refresh once paced
+    def present(self):
+        if self._img is None: return
+        if self._sched is None or not self.rate:
+            self.draw()
+            self.cvs.update_idletasks()
+        elif not self._dirty:
+            self._dirty = True
+            self._sched.at(max(time.monotonic(), self._drawn + 1/self.rate), self.refresh)
+
+    # Cleared before the frame is read, so a frame shown meanwhile schedules another refresh
+    def draw(self):
+        queued, self._queued, self._dirty = self._queued, 0, False
+        if queued > 1: self.dropped += queued - 1
+        self.presented += 1
+        self._drawn     = time.monotonic()
+        self._img.configure(data=self.to_pgm(self.shown), format='PPM')
+
+    # Scheduled refresh: draw the newest frame
+    def refresh(self):
+        if self._dirty: self.draw()
+
+    # Refresh the panel from sched instead of drawing every frame as it is shown
+    def pace(self, sched):
+        self._sched = sched
+
+    def set_rate(self, hz):
+        if hz < 0: raise ValueError(f"OLED refresh rate must not be negative: {hz}")
+        self.rate = hz
+
+    # Frame counters, for the 'timing' control message
+    def frames(self):
+        return {'rate': self.rate, 'presented': self.presented, 'dropped': self.dropped}
+
+    # Expand a frame (default the frame buffer) to row-major 8-bit gray pixels, as the panel displays it
+    def to_gray(self, frame=None):
+        gray = vlsb_to_gray(self.buffer if frame is None else frame, self.width, self.height)
+        if not self.display: return bytes(len(gray))
+        if self.entire_on:   gray = b'\xff' * len(gray)
+        lit = 64 + self.level*191//255      # Dimmer at low contrast, but never dark
+        if self.inverted:    return gray.translate(bytes([lit] + [0]*255))
+        if lit < 255:        return gray.translate(bytes([0]*255 + [lit]))
+        return gray
+
+    # Frame as a binary PGM image
+    def to_pgm(self, frame=None):
+        return b'P5 %d %d 255\n' % (self.width, self.height) + self.to_gray(frame)
+
+    # Interpret one command byte, or an argument of the command before it
+    def command(self, byte):
+        cmd = self._cmd
+        if cmd:
+            cmd.append(byte)
+        elif byte in SSD1306_ARGS:
+            self._cmd = [byte]
+            return
+        else:
+            cmd = [byte]
+        if len(cmd) <= SSD1306_ARGS.get(cmd[0], 0): return
+        self._cmd = []
+
+        op, args = cmd[0], cmd[1:]
+        if   op in (0xae, 0xaf): self.display   = bool(op & 1)
+        elif op in (0xa6, 0xa7): self.inverted  = bool(op & 1)
+        elif op in (0xa4, 0xa5): self.entire_on = bool(op & 1)
+        elif op == 0x81:         self.level     = args[0]
+        elif op == 0x20:         self.mode      = args[0] & 3
+        elif op == 0x21:
+            self.cols = [args[0] % self.width, args[1] % self.width]
+            self._col = self.cols[0]
+        elif op == 0x22:
+            self.rows  = [args[0] % self.pages, args[1] % self.pages]
+            self._page = self.rows[0]
+        elif 0xb0 <= op <= 0xb7: self._page = op & 7                                # Page mode start page
+        elif op <= 0x0f:         self._col  = (self._col & 0xf0) | op               # Page mode start column, low nibble
+        elif op <= 0x1f:         self._col  = (self._col & 0x0f) | (op & 0xf) << 4  # and high nibble
+        else:                    return     # Layout, timing and charge pump: nothing to simulate
+        if op in (0xae, 0xaf, 0xa6, 0xa7, 0xa4, 0xa5, 0x81): self.present()
+
+    # Write display RAM at the current position, advancing it as the addressing mode does.
+    # The panel shows RAM as it is written, so the result is presented like show().
+    def write_ram(self, data):
+        buf, w = self.buffer, self.width
+        (c0, c1), (p0, p1) = self.cols, self.rows
+        if (self.mode == 0 and (c0, c1, p0, p1) == (0, w-1, 0, self.pages-1)
+                and (self._col, self._page) == (0, 0) and len(data) == len(buf)):
+            buf[:] = data                   # Whole frame, as the driver's show() sends it
+        else:
+            for b in data:
+                buf[self._page*w + self._col] = b
+                if self.mode == 1:          # Vertical: down the pages, then across
+                    self._page += 1
+                    if self._page > p1:
+                        self._page = p0
+                        self._col  = self._col + 1 if self._col < c1 else c0
+                else:                       # Horizontal and page: across the columns
+                    self._col += 1
+                    if self._col > c1:
+                        self._col = c0
+                        if self.mode == 0: self._page = self._page + 1 if self._page < p1 else p0
+        self.show()
+
+    # Handle an I2C write addressed to the display
+    def i2c_write(self, data):
+        i = 0
+        while i < len(data):
+            ctrl, i = data[i], i + 1
+            if ctrl & 0x80:                 # Co set: one byte, then another control byte
+                if i < len(data):
+                    if ctrl & 0x40: self.write_ram(data[i:i+1])
+                    else:           self.command(data[i])
+                i += 1
+            else:                           # Co clear: the rest of the transfer
+                if ctrl & 0x40: self.write_ram(data[i:])
+                else:
+                    for b in data[i:]: self.command(b)
+                break
+
+    # I2C reads return the status byte: bit 6 set while the display is off
+    def i2c_read(self, n):
+        return bytes([0 if self.display else 0x40]) * n
+
+    # Test a single pixel
+    def get_pixel(self, x, y):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return (self.buffer[(y >> 3)*self.width + x] >> (y & 7)) & 1
+        return 0
 
     def fill(self, clr):
         # Fill OLED pixels with clr (0 clears)
-        if clr == 0:
-            self.obs.clear()
-        elif clr == 1:
-            print("fill(1) not implemented")
-    
-    # Sched text to render at pixel row, col with val
+        self.buffer[:] = (b'\xff' if clr else b'\x00') * len(self.buffer)
+
+    # Render text at pixel row, col with clr. Glyph columns are OR'ed (or cleared)
+    # byte-wise into the one or two pages spanned by the text.
     def text(self, text, col, row, clr=1):
-        clr = 'white' if clr == 1 else 'black'
-        self.obs.append( {'type':'text', 'text':text, 'y':row, 'x':col, 'clr':clr, 'id':None} )
-    
+        cols = render_text(text)
+        x0, x1 = max(col, 0), min(col + len(cols), self.width)
+        if x0 >= x1 or row <= -8 or row >= self.height: return
+
+        w, buf = self.width, self.buffer
+        page, shift = row >> 3, row & 7
+        glyphs = cols[x0-col:x1-col]
+        for p, sh in ((page, shift), (page+1, shift-8)):
+            if not 0 <= p < self.pages or (sh == -8): continue
+            base = p*w
+            for i, b in enumerate(glyphs, base+x0):
+                b = (b << sh if sh >= 0 else b >> -sh) & 0xff
+                if b:
+                    if clr: buf[i] |= b
+                    else:   buf[i] &= b ^ 0xff
+
     # Render pixel at x, y with clr (0, 1)
     def pixel(self, x, y, clr):
-        self.obs.append( {'type':'fill_rect', 'x0':x, 'y0':y, 'x1':x, 'y1':y, 'clr':'', 'id':None} )        
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i, b = (y >> 3)*self.width + x, 1 << (y & 7)
+            if clr: self.buffer[i] |= b
+            else:   self.buffer[i] &= b ^ 0xff
 
     # Render rectangle outline from x, y with width, height h, clr in [0, 1]
     def rect(self, x, y, w, h, clr):
-        self.obs.append( {'type':'rect', 'x0':x, 'y0':y, 'x1':x+w, 'y1':y+h, 'clr':'white', 'id':None} )
+        self.fill_rect(x, y, w, 1, clr)
+        self.fill_rect(x, y+h-1, w, 1, clr)
+        self.fill_rect(x, y, 1, h, clr)
+        self.fill_rect(x+w-1, y, 1, h, clr)
 
     # Render filled rectangle from x, y with width, height h, clr in [0, 1]
     def fill_rect(self, x, y, w, h, clr):
-        clr = 'black' if clr == 0 else 'white'
-        self.obs.append( {'type':'fill_rect', 'x0':x, 'y0':y, 'x1':x+w, 'y1':y+h, 'clr':clr, 'id':None} )
-    
-    # draw a line from from x0, y0 to x1, y1 with clr in [0, 1]
+        x0, x1 = max(x, 0), min(x+w, self.width)
+        y0, y1 = max(y, 0), min(y+h, self.height)
+        if x0 >= x1 or y0 >= y1: return
+
+        # Fill a column span of each page with a bit mask covering rows [y0, y1)
+        for p in range(y0 >> 3, ((y1-1) >> 3) + 1):
+            top, bot = max(y0 - p*8, 0), min(y1 - p*8, 8)
+            mask = ((1 << bot) - 1) & ~((1 << top) - 1)
+            base = p*self.width
+            for i in range(base+x0, base+x1):
+                if clr: self.buffer[i] |= mask
+                else:   self.buffer[i] &= mask ^ 0xff
+
+    # draw a line from from x0, y0 to x1, y1 with clr in [0, 1] (Bresenham, as MicroPython framebuf)
     def line(self, x0, y0, x1, y1, clr=1):
-        self.obs.append( {'type':'line', 'x0':x0, 'y0':y0, 'x1':x1, 'y1':y1, 'clr':clr, 'id':None} )        
-    
+        dx, sx = (x1-x0, 1) if x1 > x0 else (x0-x1, -1)
+        dy, sy = (y1-y0, 1) if y1 > y0 else (y0-y1, -1)
+        steep = dy > dx
+        if steep:
+            x0, y0, dx, dy, sx, sy = y0, x0, dy, dx, sy, sx
+        e = 2*dy - dx
+        for _ in range(dx):
+            if steep: self.pixel(y0, x0, clr)
+            else:     self.pixel(x0, y0, clr)
+            while e >= 0:
+                y0 += sy
+                e  -= 2*dx
+            x0 += sx
+            e  += 2*dy
+        self.pixel(x1, y1, clr)
+
     # draw horizontal line at x, y with width w and clr in [0, 1]
     def hline(self, x, y, w, clr=1):
-        self.obs.append( {'type':'line', 'x0':x, 'y0':y, 'x1':x+w, 'y1':y, 'clr':clr, 'id':None} )        
-    
+        self.fill_rect(x, y, w, 1, clr)
+
     # draw vertical line at x, y with height h and clr in [0, 1]
     def vline(self, x, y, h, clr=1):
-        self.obs.append( {'type':'line', 'x0':x, 'y0':y, 'x1':x, 'y1':y+h, 'clr':clr, 'id':None} )        
-    
+        self.fill_rect(x, y, 1, h, clr)
+
     def scroll(self, dx, dy):
         # self.framebuf.scroll(dx, dy)
         pass
 
     # power off the display, pixels persist in memory
     def poweroff(self):
-        pass
+        self.command(0xae)
 
     # power on the display, pixels redrawn
     def poweron(self):
-        pass
+        self.command(0xaf)
 
     # contrast=0: dim. contrast=255: bright
     def contrast(self, contrast):
-        pass
+        self.command(0x81)
+        self.command(contrast & 0xff)
 
     # clr=1: display inverted. clr=0: display normal
     def invert(self, clr):
-        pass
+        self.command(0xa6 | (clr & 1))
     
     # bln=True: rotate 180 degrees. bln=False: rotate 0 degrees
     def rotate(self, bln):
@@ -534,25 +1424,155 @@ class SSD1306_I2C(object):
                 self.pixel( cmd['x'], cmd['y'], cmd['clr'] )
                 return {'success':True, 'msg':''}
             elif cmd['msg'] == 'show':
+                # The driver sends 6 address commands, then the frame buffer with a control byte
+                freq = cmd.get('freq', 400_000)
+                self.board.cost.i2c(6*2, freq, 6)
+                self.board.cost.i2c(1 + len(self.buffer), freq)
                 self.show()
                 return {'success':True, 'msg':''}
         except Exception as e:
             return {'success':False, 'msg':f"{e}"}
 
+# ----------------------------------------------------------------
+# OLED frame capture
+# Records every frame presented by SSD1306_I2C.show() to two files:
+#   <path>.frames  Raw packed 1-bit MONO_VLSB frames, each stored once
+#   <path>.index   Header, then one run-length entry per run of identical frames:
+#                  (seconds since capture start, frame number, repeat count)
+# Frames are identified by content hash, so a frame that was seen before is
+# never written twice, and repeated show() calls only bump the run count.
+class FrameCapture(object):
+    MAGIC  = b'OLEDCAP1'
+    HEADER = struct.Struct('<8sHH')     # magic, width, height
+    ENTRY  = struct.Struct('<dII')      # time, frame number, repeat count
+
+    def __init__(self, path, width=128, height=64):
+        self.path   = path
+        self.width  = width
+        self.height = height
+        self.frames = open(path + '.frames', 'wb')
+        self.index  = open(path + '.index', 'wb')
+        self.index.write(self.HEADER.pack(self.MAGIC, width, height))
+        self._seen  = {}                # Frame hash -> frame number
+        self._run   = None              # Current run [time, frame number, count, hash]
+        self._start = time.monotonic()
+        self.shown  = 0                 # Total frames presented
+
+    # Record a presented frame buffer
+    def add(self, buf):
+        self.shown += 1
+        h = hashlib.blake2b(buf, digest_size=16).digest()
+        run = self._run
+        if run is not None and run[3] == h:
+            run[2] += 1
+            return
+        self._end_run()
+
+        n = self._seen.get(h)
+        if n is None:
+            n = self._seen[h] = len(self._seen)
+            self.frames.write(buf)
+        self._run = [time.monotonic() - self._start, n, 1, h]
+
+    # Number of distinct frames stored
+    @property
+    def unique(self):
+        return len(self._seen)
+
+    # Write the current run to the index
+    def _end_run(self):
+        if self._run is not None:
+            t, n, count, _ = self._run
+            self.index.write(self.ENTRY.pack(t, n, count))
+            self._run = None
+
+    def flush(self):
+        self._end_run()
+        self.frames.flush()
+        self.index.flush()
+
+    def close(self):
+        if not self.frames.closed:
+            self.flush()
+            self.frames.close()
+            self.index.close()
+
+    # Read a capture back. Returns (width, height, frames, runs) where frames
+    # is a list of frame buffers and runs a list of (time, frame number, count).
+    @classmethod
+    def load(cls, path):
+        with open(path + '.index', 'rb') as f:
+            data = f.read()
+        magic, width, height = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError(f"{path}.index is not an OLED capture")
+        runs = list(cls.ENTRY.iter_unpack(data[cls.HEADER.size:]))
+
+        size = width * height // 8
+        with open(path + '.frames', 'rb') as f:
+            data = f.read()
+        frames = [data[i:i+size] for i in range(0, len(data), size)]
+        return width, height, frames, runs
+
+    # Export every stored frame of a capture as <prefix>NNNNN.png. Returns the file names.
+    @classmethod
+    def export_png(cls, path, prefix=None):
+        width, height, frames, _ = cls.load(path)
+        prefix = path + '_' if prefix is None else prefix
+        names = []
+        for n, buf in enumerate(frames):
+            name = f"{prefix}{n:05d}.png"
+            write_png(name, vlsb_to_gray(buf, width, height), width, height)
+            names.append(name)
+        return names
+
+# Write 8-bit grayscale pixels as a PNG file
+def write_png(path, gray, width, height):
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    # Each scanline is prefixed with filter type 0 (None)
+    raw = b''.join(b'\x00' + gray[y*width:(y+1)*width] for y in range(height))
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 0, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(raw, 9)))
+        f.write(chunk(b'IEND', b''))
+
 # ----------------------------------------------------------------
 # LSM6DSOX 6 DoF Accelerometer and Gyroscope 
+# Gyroscope rates come from the tilt history: every change of tilt is recorded
+# with its time in a small ring buffer, and read_gyro() differentiates the
+# piecewise-linear path through those positions over the last GYRO_WINDOW
+# seconds. Tilt maps to degrees as shown on the board (1.0 = 90°). Rotation
+# about x changes ay, and rotation about y changes ax. Optional Gaussian noise
+# comes from a seeded generator, so runs are repeatable.
 class LSM6DSOX(object):
+    HISTORY     = 16            # Tilt positions kept
+    GYRO_WINDOW = 0.05          # Seconds over which rates are measured
+    FRAME       = 1/60          # Assumed time to move after being still
+
     def __init__(self, board, x, y):
         self._ax = self._ay = self._az = 0.0    # Acceleration
+        self.board = board
+        self.reset_registers()
+
+        self._ht   = array.array('d', [0.0]) * self.HISTORY    # Tilt history: time,
+        self._hx   = array.array('d', [0.0]) * self.HISTORY    # ax,
+        self._hy   = array.array('d', [0.0]) * self.HISTORY    # ay
+        self._hn   = 0                                          # Positions recorded
+        self.noise = 0.0                                        # Gyro noise sigma (°/s)
+        self._rng  = random.Random()
+        self.hold()
         self.cvs = board.cvs
         self.x, self.y = x, y
         
-        self._back   = tk.PhotoImage(data=lsm_circle_b64)
+        self._back   = board.image(lsm_circle_b64)
         self.back    = self.cvs.create_image(x, y, image=self._back, anchor=tk.NW)
-        self._btn    = tk.PhotoImage(data=lsm_button_b64)     # file="lsm_button.png")
+        self._btn    = board.image(lsm_button_b64)        # file="lsm_button.png")
         self.btn     = self.cvs.create_image(x+65, y+65, image=self._btn, anchor=tk.NW)
         
-        self._font   = tkfont.Font(size=12)
+        self._font   = board.font(size=12)
         self.title   = self.cvs.create_text(x+75,  y-10, font=self._font, text="LSM6DSOX")
         self._rlbl   = self.cvs.create_text(x+50,  y+160, font=self._font, text="Roll:")
         self._plbl   = self.cvs.create_text(x+50,  y+180, font=self._font, text="Pitch:")
@@ -617,8 +1637,58 @@ class LSM6DSOX(object):
         self._ax =  max(-1, min(1, (bcx - cx)/65))              # Button center goes only up to 65 pixels from center
         self._ay = -max(-1, min(1, (bcy - cy)/65))
         self._az = 1 - math.sqrt(self._ax*self._ax + self._ay*self._ay)
+        self.record()
+        self.redraw()
+
+    # Set tilt directly and move button to match. (ax, ay) is limited to the unit circle.
+    def set_tilt(self, ax, ay):
+        mag = math.sqrt(ax*ax + ay*ay)
+        if mag > 1: ax, ay = ax/mag, ay/mag
+        self._ax, self._ay = ax, ay
+        self._az = 1 - math.sqrt(ax*ax + ay*ay)
+        cx,  cy  = self.x+75, self.y+75                         # Center of red circle
+        self.cvs.moveto(self.btn, cx + ax*65 - 10, cy - ay*65 - 10)
+        self.record()
         self.redraw()
 
+    # Record the current tilt in the history. After a still spell, the move is
+    # taken to have started one FRAME ago rather than at the previous position.
+    def record(self, now=None):
+        now = time.monotonic() if now is None else now
+        if self._hn:
+            last = (self._hn - 1) % self.HISTORY
+            if now - self._ht[last] > self.FRAME:
+                self._push(now - self.FRAME, self._hx[last], self._hy[last])
+        self._push(now, self._ax, self._ay)
+
+    def _push(self, t, ax, ay):
+        i = self._hn % self.HISTORY
+        self._ht[i], self._hx[i], self._hy[i] = t, ax, ay
+        self._hn += 1
+
+    # Forget past motion: the current tilt has been held
+    def hold(self):
+        self._hn = 0
+        self._push(time.monotonic(), self._ax, self._ay)
+
+    # Tilt (ax, ay) at time t, interpolated between recorded positions
+    def tilt_at(self, t):
+        n, H = self._hn, self.HISTORY
+        j = (n - 1) % H                         # Newest
+        if t >= self._ht[j]: return self._hx[j], self._hy[j]
+        for k in range(2, min(n, H) + 1):
+            i = (n - k) % H
+            if t >= self._ht[i]:
+                f = (t - self._ht[i]) / (self._ht[j] - self._ht[i])
+                return self._hx[i] + f*(self._hx[j] - self._hx[i]), self._hy[i] + f*(self._hy[j] - self._hy[i])
+            j = i
+        return self._hx[j], self._hy[j]         # Older than the history: oldest kept
+
+    # Gaussian gyro noise of sigma °/s from a generator seeded with seed
+    def set_noise(self, sigma=0.0, seed=None):
+        self.noise = sigma
+        self._rng.seed(seed)
+
     def redraw(self):
         self.cvs.itemconfig(self._roll,  text=f"{self._ax*90:.2f}°")
         self.cvs.itemconfig(self._pitch, text=f"{self._ay*90:.2f}°")
@@ -635,104 +1705,1040 @@ class LSM6DSOX(object):
     
     def read_gyro(self):
         """Returns gyroscope vector in degrees/sec."""
-        x = random.random()*10.0
-        y = random.random()*10.0
-        z = random.random()*10.0
-        return x, y, z
+        now = time.monotonic()
+        x0, y0 = self.tilt_at(now - self.GYRO_WINDOW)
+        x1, y1 = self.tilt_at(now)
+        k = 90 / self.GYRO_WINDOW
+        g = [(y1 - y0)*k, -(x1 - x0)*k, 0.0]
+        if self.noise:
+            g = [v + self._rng.gauss(0.0, self.noise) for v in g]
+        return tuple(g)
     
-    # Process command sent to LSM6DSOX
+    # Register map for I2C access (see I2CBus). Reading the output registers samples
+    # the sensor at the full scale set in CTRL1_XL and CTRL2_G; outputs stay zero
+    # while the accelerometer or gyroscope is powered down (ODR 0). With CTRL3_C
+    # IF_INC (set at reset) the register address advances after each byte.
+    WHO_AM_I, CTRL1_XL, CTRL2_G, CTRL3_C, STATUS_REG = 0x0f, 0x10, 0x11, 0x12, 0x1e
+    OUT_TEMP_L, OUTX_L_G, OUTX_L_A = 0x20, 0x22, 0x28
+    ACCEL_FS = (2, 16, 4, 8)                # g, by CTRL1_XL FS_XL bits
+    GYRO_FS  = (250, 500, 1000, 2000)       # dps, by CTRL2_G FS_G bits
+
+    def reset_registers(self):
+        self.regs = bytearray(0x80)
+        self.regs[self.WHO_AM_I] = 0x6c
+        self.regs[self.CTRL3_C]  = 0x04     # IF_INC
+        self._reg = 0
+
+    # Handle an I2C write: a register address, then bytes to write from there
+    def i2c_write(self, data):
+        if len(data) == 0: return
+        self._reg = data[0] & 0x7f
+        for b in data[1:]:
+            r = self._reg
+            if r == self.CTRL3_C and b & 0x81:          # BOOT or SW_RESET
+                self.reset_registers()
+                return
+            if r != self.WHO_AM_I and not self.STATUS_REG <= r <= 0x2d:
+                self.regs[r] = b
+            self._step()
+
+    # Handle an I2C read of n bytes from the current register address
+    def i2c_read(self, n):
+        start = self._reg
+        if start <= 0x2d and start + n > self.STATUS_REG: self._sample()
+        if self.regs[self.CTRL3_C] & 0x04 and start + n <= len(self.regs):
+            self._reg = (start + n) & 0x7f
+            return bytes(memoryview(self.regs)[start:start+n])
+        out = bytearray(n)
+        for i in range(n):
+            out[i] = self.regs[self._reg]
+            self._step()
+        return bytes(out)
+
+    def _step(self):
+        if self.regs[self.CTRL3_C] & 0x04: self._reg = (self._reg + 1) & 0x7f
+
+    # Fill the output and status registers from the simulated sensor
+    def _sample(self):
+        regs   = self.regs
+        status = 0x04                       # Temperature available (25°C reads as 0)
+        if regs[self.CTRL1_XL] >> 4:
+            fs = self.ACCEL_FS[(regs[self.CTRL1_XL] >> 2) & 3]
+            struct.pack_into('<hhh', regs, self.OUTX_L_A, *(_int16(v*32768/fs) for v in self.read_accel()))
+            status |= 0x01
+        if regs[self.CTRL2_G] >> 4:
+            fs = 125 if regs[self.CTRL2_G] & 0x02 else self.GYRO_FS[(regs[self.CTRL2_G] >> 2) & 3]
+            struct.pack_into('<hhh', regs, self.OUTX_L_G, *(_int16(v*32768/fs) for v in self.read_gyro()))
+            status |= 0x02
+        regs[self.STATUS_REG] = status
+
+def _int16(v):
+    return max(-32768, min(32767, round(v)))
+
+# ----------------------------------------------------------------
+# I2C bus shared by the devices on the board, each at its own 7-bit address.
+# The machine.I2C proxy sends each transaction as one message, with any data
+# base64 encoded, and each is charged to BusCost at the client's bus frequency:
+#   {'msg':'scan'}                                          Addresses that acknowledge
+#   {'msg':'writeto', 'addr':a, 'data':b64}                 Returns the number of bytes written
+#   {'msg':'readfrom', 'addr':a, 'n':n}                     Returns n bytes (b64)
+#   {'msg':'writeto_mem', 'addr':a, 'mem':m, 'addrsize':8, 'data':b64}
+#   {'msg':'readfrom_mem', 'addr':a, 'mem':m, 'addrsize':8, 'n':n}
+# Devices implement i2c_write(data) and i2c_read(n). A transaction to an absent
+# device fails with 'errno' 19 (ENODEV), as MicroPython raises OSError.
+class I2CBus(object):
+    ENODEV = 19
+
+    def __init__(self, board):
+        self.board   = board
+        self.devices = {}           # Address -> device
+
+    def attach(self, addr, device):
+        self.devices[addr] = device
+
+    def process(self, cmd):
+        try:
+            msg  = cmd['msg']
+            freq = cmd.get('freq', 400_000)
+            cost = self.board.cost
+            if msg == 'scan':
+                cost.i2c(0, freq, 0x78 - 0x08)      # Probe each address once
+                return {'success':True, 'msg':sorted(self.devices)}
+
+            dev = self.devices.get(cmd['addr'])
+            if dev is None:
+                return {'success':False, 'msg':f"No I2C device at address {cmd['addr']:#04x}", 'errno':self.ENODEV}
+            mem = cmd.get('mem', 0).to_bytes(cmd.get('addrsize', 8) // 8, 'big')
+
+            if msg == 'writeto':
+                data = base64.b64decode(cmd['data'])
+                cost.i2c(len(data), freq)
+                dev.i2c_write(memoryview(data))
+                return {'success':True, 'msg':len(data)}
+            elif msg == 'readfrom':
+                cost.i2c(cmd['n'], freq)
+                return {'success':True, 'msg':base64.b64encode(dev.i2c_read(cmd['n'])).decode('ascii')}
+            elif msg == 'writeto_mem':
+                data = mem + base64.b64decode(cmd['data'])
+                cost.i2c(len(data), freq)
+                dev.i2c_write(memoryview(data))
+                return {'success':True, 'msg':''}
+            elif msg == 'readfrom_mem':
+                cost.i2c(len(mem) + cmd['n'], freq, 2)  # Address write, then a read after a repeated start
+                dev.i2c_write(memoryview(mem))
+                return {'success':True, 'msg':base64.b64encode(dev.i2c_read(cmd['n'])).decode('ascii')}
+            else:
+                return {'success':False, 'msg':f"Command {msg} not understood by I2C"}
+        except Exception as e:
+            return {'success':False, 'msg':f"{e}"}
+
+# ----------------------------------------------------------------
+# Logic-analyzer trace of digital pin activity.
+# Every on/off written to a pin and every value read from one is recorded with
+# its time (seconds since the trace started) in a ring buffer per pin, so
+# recording is a few array stores. Buffers grow by doubling up to capacity,
+# after which the oldest records are dropped. Export with write_vcd() for waveform viewers
+# such as GTKWave, or show it live with a WaveformStrip.
+TRACE_WRITE = 0
+TRACE_READ  = 1
+
+class PinChannel(object):
+    def __init__(self, capacity, size=1024):
+        size = min(size, capacity)
+        self.capacity = capacity
+        self.count    = 0                                   # Total records
+        self.t        = array.array('d', bytes(8*size))     # Seconds since trace start
+        self.value    = bytearray(size)                     # Pin level, 0 or 1
+        self.kind     = bytearray(size)                     # TRACE_WRITE or TRACE_READ
+        self.run      = array.array('q', bytes(8*size))     # Record number where the record's level began
+        self.level    = None                                # Level of the newest record,
+        self.since    = 0                                   #   held since this record number
+
+    # Double the buffers, up to capacity
+    def grow(self):
+        n = min(self.capacity, 2*len(self.value)) - len(self.value)
+        self.t.frombytes(bytes(8*n))
+        self.run.frombytes(bytes(8*n))
+        self.value += bytes(n)
+        self.kind  += bytes(n)
+
+    # Number of the first record at or after time x, searching records lo to n
+    # (counted since the trace started) where they sit in the ring, without copying
+    def find(self, x, lo, n):
+        cap, t = self.capacity, self.t
+        if n <= cap: return bisect.bisect_left(t, x, lo, n)
+        first, s = n - cap, n % cap     # Oldest kept record, at index s: [s, cap) then [0, s)
+        if lo < n - s:
+            p = bisect.bisect_left(t, x, lo - first + s, cap)
+            if p < cap: return first + p - s
+            lo = n - s
+        return n - s + bisect.bisect_left(t, x, lo - (n - s), s)
+
+    # Copies of the records in time order as (t, value, kind). Copies rather than
+    # views, so that the buffers can still grow while they are in use.
+    def ordered(self):
+        n = self.count
+        if n <= self.capacity:
+            return self.t[:n], self.value[:n], self.kind[:n]
+        i = n % self.capacity
+        return self.t[i:] + self.t[:i], self.value[i:] + self.value[:i], self.kind[i:] + self.kind[:i]
+
+class PinTrace(object):
+    def __init__(self, capacity=1 << 20):
+        self.capacity = capacity        # Records kept per pin
+        self.enabled  = True
+        self.channels = {}              # Pin number -> PinChannel
+        self.start    = time.monotonic()
+
+    def clear(self):
+        self.channels = {}
+        self.start    = time.monotonic()
+
+    def channel(self, num):
+        ch = self.channels.get(num)
+        if ch is None: ch = self.channels[num] = PinChannel(self.capacity)
+        return ch
+
+    # Record a pin command and its response, if it is a digital write or read
+    def record(self, num, cmd, resp):
+        if   cmd == 'on':    kind, value = TRACE_WRITE, 1
+        elif cmd == 'off':   kind, value = TRACE_WRITE, 0
+        elif cmd == 'value': kind, value = TRACE_READ, resp['msg']
+        else:                return
+        if not self.enabled or not resp['success']: return
+
+        ch = self.channels.get(num) or self.channel(num)
+        i  = ch.count % ch.capacity
+        if i == len(ch.value): ch.grow()
+        if value != ch.level: ch.level, ch.since = value, ch.count
+        ch.t[i], ch.value[i], ch.kind[i], ch.run[i] = time.monotonic() - self.start, value, kind, ch.since
+        ch.count += 1
+
+    # Decimate one pin's records in [t0, t1) to width columns.
+    # Returns a list of (level, busy) per column, where level is the level at the
+    # end of the column (None before the first record) and busy is True if the
+    # level changed within the column. Each column takes one search of the ring
+    # and looks at one record: the level changed within a column if the run
+    # holding its last record began inside it, or differs from the level before.
+    def decimate(self, num, t0, t1, width):
+        ch = self.channels.get(num)
+        if ch is None or ch.count == 0: return [(None, False)]*width
+        n, cap   = ch.count, ch.capacity
+        v, run   = ch.value, ch.run
+        i        = ch.find(t0, max(0, n - cap), n)
+        level    = v[(i-1) % cap] if i > max(0, n - cap) else None
+        dt       = (t1 - t0) / width
+        cols     = []
+        for c in range(width):
+            j = ch.find(t0 + (c+1)*dt, i, n)
+            if j == i:
+                cols.append((level, False))
+                continue
+            last = (j-1) % cap
+            busy = run[last] > i or (level is not None and level != v[last])
+            i, level = j, v[last]
+            cols.append((level, busy))
+        return cols
+
+    # Write the trace as a Value Change Dump. Each pin is a wire holding the
+    # level last written or read; pins that were read also get an event per read.
+    # timescale is the time unit in seconds: 1e-9, 1e-6 or 1e-3.
+    def write_vcd(self, path, timescale=1e-6):
+        units   = {1e-9: '1ns', 1e-6: '1us', 1e-3: '1ms'}
+        if timescale not in units:
+            raise ValueError(f"Unsupported VCD timescale {timescale!r}, use one of {sorted(units)}")
+        pins    = sorted(self.channels)
+        ids     = {}
+        records = []
+        for k, num in enumerate(pins):
+            t, v, kind = self.channels[num].ordered()
+            ids[num] = (chr(33 + 2*k), chr(34 + 2*k) if TRACE_READ in bytes(kind) else None)
+            records.append([(round(ti/timescale), num, vi, ki) for ti, vi, ki in zip(t, v, kind)])
+
+        with open(path, 'w') as f:
+            f.write(f"$date {time.ctime()} $end\n$version Breadboard Simulator pin trace $end\n")
+            f.write(f"$timescale {units[timescale]} $end\n$scope module board $end\n")
+            for num in pins:
+                wire, event = ids[num]
+                f.write(f"$var wire 1 {wire} pin{num} $end\n")
+                if event is not None: f.write(f"$var event 1 {event} pin{num}_read $end\n")
+            f.write("$upscope $end\n$enddefinitions $end\n#0\n$dumpvars\n")
+            for num in pins: f.write(f"x{ids[num][0]}\n")
+            f.write("$end\n")
+
+            last, now = {}, 0
+            for tick, num, value, kind in heapq.merge(*records):
+                wire, event = ids[num]
+                if kind == TRACE_READ or last.get(num) != value:
+                    if tick != now:
+                        f.write(f"#{tick}\n")
+                        now = tick
+                    if last.get(num) != value:
+                        f.write(f"{value}{wire}\n")
+                        last[num] = value
+                    if kind == TRACE_READ: f.write(f"1{event}\n")
+
+# Scrolling waveform view of a PinTrace on the board canvas.
+# Each pin's record is decimated to one column per pixel, so the cost of a
+# redraw depends on the strip width, not on how many edges are in view.
+class WaveformStrip(object):
+    def __init__(self, board, x, y, width, pins=(6, 26, 27), window=10.0, row=16):
+        self.board  = board
+        self.cvs    = board.cvs
+        self.x, self.y, self.width, self.row = x, y, width, row
+        self.pins   = pins
+        self.window = window        # Seconds in view
+        self._font  = board.font(size=9)
+        self._lines = {}
+        for k, num in enumerate(pins):
+            top = y + k*row
+            self.cvs.create_text(x, top + row//2, text=f"GP{num}", anchor=tk.W, font=self._font)
+            self._lines[num] = self.cvs.create_line(0, 0, 0, 0, fill='green')
+
+    @property
+    def height(self):
+        return len(self.pins) * self.row
+
+    def draw(self):
+        trace = self.board.trace
+        t1    = time.monotonic() - trace.start
+        x0    = self.x + 40                 # Leave room for labels
+        cols  = self.width - 40
+        for k, num in enumerate(self.pins):
+            hi = self.y + k*self.row + 3
+            lo = hi + self.row - 6
+            pts = []
+            for c, (level, busy) in enumerate(trace.decimate(num, t1 - self.window, t1, cols)):
+                if level is None: continue
+                x = x0 + c
+                if busy: pts += [x, lo, x, hi]
+                pts += [x, hi if level else lo]
+            if len(pts) < 4: pts = [0, 0, 0, 0]
+            self.cvs.coords(self._lines[num], *pts)
+
+# ----------------------------------------------------------------
+# Estimated on-device execution time of bus transfers and ADC conversions.
+# When enabled, components charge each I2C transfer the time it would take on
+# the wire at the client's bus frequency, and each ADC read one conversion.
+# With delay set, replies are held back so the client runs at device speed.
+# Delays shorter than min_sleep are carried over until they add up.
+class BusCost(object):
+    ADC_CONVERSION = 2e-6       # RP2040 ADC: 96 cycles of a 48 MHz clock
+
+    def __init__(self, enabled=False, delay=False, min_sleep=0.001):
+        self.enabled   = enabled
+        self.delay     = delay
+        self.min_sleep = min_sleep
+        self.reset()
+
+    def reset(self):
+        self.i2c_time  = 0.0    # Seconds on the I2C bus
+        self.i2c_bytes = 0
+        self.adc_time  = 0.0    # Seconds converting
+        self.adc_reads = 0
+        self._owed     = 0.0    # Delay not yet slept
+
+    @property
+    def total(self):
+        return self.i2c_time + self.adc_time
+
+    # Charge an I2C transfer of nbytes data bytes plus one address byte per start.
+    # Each byte takes 9 clocks (8 bits and ACK); each start and stop condition about one.
+    def i2c(self, nbytes, freq, starts=1):
+        if not self.enabled: return
+        nbytes += starts
+        t = (9*nbytes + 2*starts) / freq
+        self.i2c_time  += t
+        self.i2c_bytes += nbytes
+        if self.delay: self._wait(t)
+
+    # Charge one ADC conversion
+    def adc(self):
+        if not self.enabled: return
+        self.adc_time  += self.ADC_CONVERSION
+        self.adc_reads += 1
+        if self.delay: self._wait(self.ADC_CONVERSION)
+
+    # Sleep off owed device time once enough has accumulated
+    def _wait(self, t):
+        self._owed += t
+        if self._owed >= self.min_sleep:
+            start = time.perf_counter()
+            time.sleep(self._owed)
+            self._owed -= time.perf_counter() - start
+
+    def summary(self):
+        return {'total':self.total, 'i2c_time':self.i2c_time, 'i2c_bytes':self.i2c_bytes,
+                'adc_time':self.adc_time, 'adc_reads':self.adc_reads}
+
+# ----------------------------------------------------------------
+# Privileged control channel for setting simulated inputs without the GUI.
+# Control messages are sent 'to':'control' and are refused unless control is enabled.
+# If a token is set, every message must carry it as 'token'.
+#   {'msg':'set', <inputs>}                          Apply inputs now (see Board.set_inputs)
+#   {'msg':'schedule', 'events':[[t, {inputs}], ...]} Apply inputs t seconds after receipt. Replies with
+#                                                    [pending events, start time]; pass 'start' back
+#                                                    to continue the same timeline in another message.
+#   {'msg':'clear'}                                  Drop all pending events
+#   {'msg':'status'}                                 Return the number of pending events
+#   {'msg':'cost'}                                   Return estimated device time (see BusCost)
+#   {'msg':'timing'}                                 Return scheduler timing and lag (see Scheduler.summary)
+#                                                    and OLED frames presented and dropped
+#   {'msg':'waveform', 'pin':num, 'kind':kind, 'params':{...}}
+#                                                    Drive an analog pin from a Waveform (kind None detaches)
+#   {'msg':'clients'}                                Return backlog and drop counts of recent clients (see FairQueue.stats)
+#   {'msg':'snapshot', ['name':name]}                Return a snapshot of all state (base64), or keep it as name
+#   {'msg':'restore', 'data':base64 | 'name':name}   Restore a snapshot, drop pending events and waveforms
+# Scheduled events are applied by the comms loop from the control's own Scheduler,
+# waking up when the next one is due.
+class Control(object):
+    def __init__(self, board, enabled=False, token=None):
+        self.board   = board
+        self.enabled = enabled
+        self.token   = token
+        self.sched   = Scheduler()  # Scheduled inputs, run by the comms loop
+        self.snaps   = {}       # Snapshots kept by name
+
+    # Queue inputs to apply at times (seconds) relative to start (default now)
+    def schedule(self, events, start=None):
+        start = time.monotonic() if start is None else start
+        for t, inputs in events:
+            self.board.check_inputs(inputs)
+            self.sched.at(start + t, functools.partial(self.board.set_inputs, inputs))
+
+    # Process command sent to control channel
+    def process(self, cmd):
+        if not self.enabled:
+            return {'success':False, 'msg':"Control channel is not enabled"}
+        if self.token is not None and cmd.get('token') != self.token:
+            return {'success':False, 'msg':"Control token not accepted"}
+        try:
+            if cmd['msg'] == 'set':
+                self.board.set_inputs({k:v for k, v in cmd.items() if k not in ('to', 'msg', 'token')})
+                return {'success':True, 'msg':''}
+            elif cmd['msg'] == 'schedule':
+                start = cmd.get('start', time.monotonic())
+                self.schedule(cmd['events'], start)
+                return {'success':True, 'msg':[self.sched.pending, start]}
+            elif cmd['msg'] == 'clear':
+                self.sched.clear()
+                return {'success':True, 'msg':''}
+            elif cmd['msg'] == 'status':
+                return {'success':True, 'msg':self.sched.pending}
+            elif cmd['msg'] == 'cost':
+                return {'success':True, 'msg':self.board.cost.summary()}
+            elif cmd['msg'] == 'waveform':
+                self.board.set_waveform(cmd['pin'], cmd.get('kind'), **cmd.get('params', {}))
+                return {'success':True, 'msg':''}
+            elif cmd['msg'] == 'clients':
+                return {'success':True, 'msg':self.board.comms.stats()}
+            elif cmd['msg'] == 'timing':
+                return {'success':True, 'msg':{'board':self.board.sched.summary(), 'control':self.sched.summary(),
+                                               'oled':self.board.oled.frames()}}
+            elif cmd['msg'] == 'snapshot':
+                snap = self.board.snapshot()
+                if 'name' in cmd:
+                    self.snaps[cmd['name']] = snap
+                    return {'success':True, 'msg':''}
+                return {'success':True, 'msg':base64.b64encode(snap).decode('ascii')}
+            elif cmd['msg'] == 'restore':
+                snap = self.snaps[cmd['name']] if 'name' in cmd else base64.b64decode(cmd['data'])
+                self.sched.clear()
+                self.board.clear_waveforms()
+                self.board.restore(snap)
+                return {'success':True, 'msg':''}
+            else:
+                return {'success':False, 'msg':f"Command {cmd['msg']} not understood by Control"}
+        except Exception as e:
+            return {'success':False, 'msg':f"{e}"}
+
+# ----------------------------------------------------------------
+# Versioned readings of every input, for clients that poll the whole board
+# in one request. Each query samples the inputs and, if any field differs from
+# the last sample, moves the version on and notes it as the version at which
+# that field changed. changed_since(v) then returns only the fields changed
+# after version v.
+#   {'to':'board', 'msg':'read_all'}                     All fields
+#   {'to':'board', 'msg':'changed_since', 'version':v}   Fields changed after v
+# with 'freq', the I2C bus frequency the IMU is read at (default 400 kHz).
+# Both reply {'version':v, 'state':{field: value}} with fields
+#   button: pin 26 value   fsr, tmp36: pins 28 and 29 read_u16()
+#   accel: IMU [x, y, z] in g   gyro: [x, y, z] in °/s
+class Readings(object):
+    def __init__(self, board):
+        self.board   = board
+        self.version = 0
+        self.values  = {}
+        self.changed = {}       # Field -> version at which it last changed
+        self._lock   = threading.Lock()
+
+    # Read every input now, at the cost of the ADC conversions and IMU transfers it takes
+    def sample(self, freq=400_000):
+        b, imu = self.board, self.board.lsm6dsox
+        b.cost.adc()
+        b.cost.adc()
+        b.cost.i2c(2*(1 + 6), freq, 4)
+        return {'button': b.pin[26].value,
+                'fsr':    b.pin[28].read_u16(),
+                'tmp36':  b.pin[29].read_u16(),
+                'accel':  [round(v, 4) + 0.0 for v in imu.read_accel()],    # + 0.0: no -0.0
+                'gyro':   [round(v, 2) + 0.0 for v in imu.read_gyro()]}
+
+    # Sample, and return the fields changed after version (all if version is None)
+    def query(self, version=None, freq=400_000):
+        with self._lock:
+            values  = self.sample(freq)
+            changed = [k for k, v in values.items() if self.values.get(k) != v]
+            if changed:
+                self.version += 1
+                for k in changed: self.changed[k] = self.version
+                self.values = values
+            if version is None or version > self.version:      # Unknown version: everything
+                return {'version': self.version, 'state': dict(values)}
+            return {'version': self.version, 'state': {k: values[k] for k, v in self.changed.items() if v > version}}
+
     def process(self, cmd):
-        if cmd['msg'] == 'read_accel':
-            ax, ay, az = self.read_accel()
-            return {'success':True, 'msg':(ax, ay, az)}
-        elif cmd['msg'] == 'read_gyro':
-            gx, gy, gz = self.read_gyro()
-            return {'success':True, 'msg':(gx, gy, gz)}
+        if cmd['msg'] == 'read_all':
+            return {'success':True, 'msg':self.query(None, cmd.get('freq', 400_000))}
+        elif cmd['msg'] == 'changed_since':
+            return {'success':True, 'msg':self.query(cmd.get('version'), cmd.get('freq', 400_000))}
         else:
-            return {'success':False, 'msg':f"Command {cmd} not understood by LSM6DSOX"}
+            return {'success':False, 'msg':f"Command {cmd['msg']} not understood by board"}
+
+# ----------------------------------------------------------------
+# Board state publication
+# Streams board state to any number of viewers over TCP as versioned deltas.
+# Each message is a u32 length followed by
+#   u32 version, u8 flags (1 = full state), u16 JSON length,
+#   JSON object with the changed fields other than the OLED,
+#   then (u8 page, page bytes) for each changed page of the shown OLED frame.
+# A delta is encoded once and sent to every viewer. A viewer that cannot keep
+# up misses deltas and is sent the full state once it has caught up.
+STATE_LENGTH = struct.Struct('<I')
+STATE_HEADER = struct.Struct('<IBH')        # version, flags, JSON length
+
+def encode_state(version, fields, pages, full=False):
+    js   = json.dumps(fields, separators=(',', ':')).encode('utf-8')
+    body = b''.join(bytes((p,)) + data for p, data in pages)
+    msg  = STATE_HEADER.pack(version, int(full), len(js)) + js + body
+    return STATE_LENGTH.pack(len(msg)) + msg
+
+# Decode a message without its length. Returns (version, full, fields, pages).
+def decode_state(msg, page_size=128):
+    version, flags, jlen = STATE_HEADER.unpack_from(msg)
+    start  = STATE_HEADER.size
+    fields = json.loads(msg[start:start+jlen])
+    body   = msg[start+jlen:]
+    pages  = [(body[i], body[i+1:i+1+page_size]) for i in range(0, len(body), page_size+1)]
+    return version, bool(flags & 1), fields, pages
+
+# Merges received messages into the latest state, so a reader that falls
+# behind only draws the newest one. Messages are taken without their length.
+class StateMerger(object):
+    def __init__(self, oled_size=128*64//8, page_size=128):
+        self.version   = None
+        self.pending   = {}         # State received but not yet taken
+        self.lock      = threading.Lock()
+        self.oled      = bytearray(oled_size)
+        self.page_size = page_size
+
+    def add(self, msg):
+        version, full, fields, pages = decode_state(msg, self.page_size)
+        with self.lock:
+            if full: self.oled[:] = bytes(len(self.oled))
+            for p, data in pages:
+                self.oled[p*len(data):(p+1)*len(data)] = data
+            if pages: fields['oled'] = bytes(self.oled)
+            self.pending.update(fields)
+            self.version = version
+
+    # Take the state received since the last call
+    def take(self):
+        with self.lock:
+            state, self.pending = self.pending, {}
+        return state
+
+# Viewers subscribe over TCP when ipport is given. Local readers such as the
+# --split GUI are attached with add_pipe and get every delta.
+class StatePublisher(object):
+    def __init__(self, board, ipport=('127.0.0.1', 0), rate=30):
+        self.board   = board
+        self.rate    = rate                 # Maximum deltas per second
+        self.version = 0
+        self.subs    = {}                   # socket -> [unsent bytes, missed a delta]
+        self._last   = {}                   # Last published state
+        self._full   = None                 # (version, encoded full state)
+        self.pipes   = []                   # multiprocessing connections
+        self.lsock   = None
+        self.port    = None
+        if ipport is not None:
+            self.lsock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.lsock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.lsock.bind(ipport)
+            self.lsock.listen()
+            self.lsock.setblocking(False)
+            self.port = self.lsock.getsockname()[1]
+
+    # Split the shown OLED frame into pages
+    def _pages(self, frame):
+        w = self.board.oled.width
+        return [(p, frame[p*w:(p+1)*w]) for p in range(len(frame) // w)]
+
+    # Collect changes since the last publication. Returns (fields, pages) or None.
+    def _changes(self):
+        state  = self.board.get_state()
+        last   = self._last
+        fields = {k: v for k, v in state.items() if k != 'oled' and last.get(k) != v}
+        pages  = []
+        if state['oled'] is not last.get('oled'):
+            old   = last.get('oled')
+            pages = self._pages(state['oled'])
+            if old is not None:
+                pages = [pg for pg, was in zip(pages, self._pages(old)) if pg[1] != was[1]]
+        self._last = state
+        return (fields, pages) if fields or pages else None
+
+    # Full current state, encoded once per version
+    def _full_state(self):
+        if self._full is None or self._full[0] != self.version:
+            fields = {k: v for k, v in self._last.items() if k != 'oled'}
+            self._full = (self.version, encode_state(self.version, fields, self._pages(self._last['oled']), True))
+        return self._full[1]
+
+    # Send as much of a subscriber's unsent bytes as the socket will take
+    def _flush(self, sock, sub):
+        try:
+            n = sock.send(sub[0])
+            sub[0] = sub[0][n:]
+        except BlockingIOError:
+            pass
+
+    def publish(self):
+        change = self._changes()
+        delta  = None
+        if change is not None:
+            self.version += 1
+            delta = encode_state(self.version, *change)
+
+        for sock, sub in list(self.subs.items()):
+            try:
+                if sub[0]:
+                    self._flush(sock, sub)
+                    if delta is not None: sub[1] = True     # Busy: skip this delta
+                elif sub[1]:
+                    sub[0], sub[1] = self._full_state(), False
+                    self._flush(sock, sub)
+                elif delta is not None:
+                    sub[0] = delta
+                    self._flush(sock, sub)
+            except OSError:
+                sock.close()
+                del self.subs[sock]
+
+        if delta is not None:
+            for conn in list(self.pipes):
+                try:
+                    conn.send_bytes(delta, STATE_LENGTH.size)
+                except OSError:
+                    self.pipes.remove(conn)
+
+    # Attach a pipe. It starts with the full state and then gets every delta.
+    def add_pipe(self, conn):
+        if not self._last: self._changes()
+        conn.send_bytes(self._full_state(), STATE_LENGTH.size)
+        self.pipes.append(conn)
+
+    # Accept new viewers. Each starts with the full state.
+    def accept(self):
+        if self.lsock is None: return
+        while True:
+            try:
+                sock, addr = self.lsock.accept()
+            except BlockingIOError:
+                return
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.subs[sock] = [b'', True]
+
+    # Publish until running is cleared
+    def run(self, running):
+        if not self._last: self._changes()
+        while running.is_set():
+            if self.lsock is None:
+                time.sleep(1.0/self.rate)
+            else:
+                select.select([self.lsock], [], [], 1.0/self.rate)
+            self.accept()
+            self.publish()
+        for sock in self.subs: sock.close()
+        if self.lsock is not None: self.lsock.close()
 
 # ----------------------------------------------------------------    
 # Communications
-def do_comms():
-    # Network address on which to receive remote commands over UDP
-    ipport = ('127.0.0.1', 9999)
+# Requests queued for one client (source address) of the comms loop
+class ClientQueue(object):
+    def __init__(self, rate, burst):
+        self.queue   = collections.deque()
+        self.rate    = rate             # Requests per second, or None for no limit
+        self.burst   = burst            # Most requests served back to back after an idle spell
+        self.tokens  = burst
+        self.stamp   = time.monotonic() # When tokens was last refilled
+        self.last    = self.stamp       # When a request last arrived
+        self.served  = 0
+        self.dropped = 0
+        self.peak    = 0                # Largest backlog seen
+        self.seq     = None             # Sequence number of the client's last numbered write
+        self.lost    = 0                # Numbered writes never received, in total
+        self._lost   = 0                #   and not yet reported
+        self._failed = []               # Errors of unacknowledged writes not yet reported
+
+    # Note a numbered write (see machine.unacked): count the writes missing
+    # before it and keep any error until the client's next acknowledged write.
+    def write(self, seq, resp):
+        if self.seq is not None and seq > self.seq + 1:
+            self.lost  += seq - self.seq - 1
+            self._lost += seq - self.seq - 1
+        self.seq = seq
+        if not resp['success'] and len(self._failed) < 8:
+            self._failed.append(f"#{seq} {resp['msg']}")
+
+    # Add what has happened since the last report to resp
+    def report(self, resp):
+        if self._lost:   resp['lost'], self._lost     = self._lost, 0
+        if self._failed: resp['failed'], self._failed = self._failed, []
+        return resp
+
+    # Refill the token bucket. Returns True if a request may be served now.
+    def ready(self, now):
+        if self.rate is None: return True
+        self.tokens = min(self.burst, self.tokens + (now - self.stamp)*self.rate)
+        self.stamp  = now
+        return self.tokens >= 1
+
+# Fair servicing of requests from many clients on one socket.
+# Each client has its own queue. Clients with queued requests are served
+# round-robin, one request per turn, so a client flooding the simulator only
+# lengthens its own queue. With a rate set, each client also has a token
+# bucket allowing rate requests per second in bursts of up to burst. Requests
+# arriving at a full queue are dropped without reply: a client that waits for
+# each reply never has more than one queued, so only a flood fills a queue.
+# Every proxy object has its own port, so clients come and go constantly:
+# a client with nothing queued is forgotten after idle seconds without a request.
+class FairQueue(object):
+    def __init__(self, rate=None, burst=20, max_queue=64, idle=60.0):
+        self.rate      = rate
+        self.burst     = burst
+        self.max_queue = max_queue
+        self.idle      = idle
+        self.clients   = {}                     # Source address -> ClientQueue
+        self.active    = collections.deque()    # Addresses of clients with queued requests
+        self.evicted   = 0                      # Idle clients forgotten
+        self._swept    = time.monotonic()
+
+    # Queue a request. Returns False if it was dropped.
+    def put(self, addr, data):
+        client = self.clients.get(addr)
+        if client is None: client = self.clients[addr] = ClientQueue(self.rate, self.burst)
+        client.last = now = time.monotonic()
+        if now - self._swept > self.idle / 4: self.evict(now)
+        if len(client.queue) >= self.max_queue:
+            client.dropped += 1
+            return False
+        if not client.queue: self.active.append(addr)
+        client.queue.append(data)
+        client.peak = max(client.peak, len(client.queue))
+        return True
+
+    # Take one request from each client that may be served now, in turn.
+    # Returns a list of (address, request).
+    def round(self, now):
+        served = []
+        for _ in range(len(self.active)):
+            addr   = self.active.popleft()
+            client = self.clients[addr]
+            if client.ready(now):
+                served.append((addr, client.queue.popleft()))
+                client.served += 1
+                if client.rate is not None: client.tokens -= 1
+            if client.queue: self.active.append(addr)
+        return served
+
+    # Seconds until a queued request may be served: 0 if one can be now, None if none are queued
+    def wait(self, now):
+        waits = [0.0 if c.ready(now) else (1 - c.tokens)/c.rate
+                 for c in (self.clients[a] for a in self.active)]
+        return min(waits) if waits else None
+
+    # Forget clients with nothing queued that have been idle too long
+    def evict(self, now):
+        self._swept = now
+        for addr in [a for a, c in self.clients.items() if not c.queue and now - c.last > self.idle]:
+            del self.clients[addr]
+            self.evicted += 1
+
+    # Backlog, peak backlog, served, dropped and lost counts of the limit most
+    # recently active clients, with the number of clients known and forgotten.
+    # Limited so that the reply fits in one datagram.
+    def stats(self, limit=32):
+        recent = sorted(self.clients.items(), key=lambda item: item[1].last, reverse=True)[:limit]
+        return {'total': len(self.clients), 'evicted': self.evicted,
+                'clients': {f"{addr[0]}:{addr[1]}": {'backlog': len(c.queue), 'peak': c.peak, 'served': c.served,
+                                                     'dropped': c.dropped, 'lost': c.lost}
+                            for addr, c in recent}}
+
+# Open the socket on which to receive remote commands over UDP.
+# Port 0 lets the OS pick a free port; read it back with rsock.getsockname()[1].
+def open_comms(ipport=('127.0.0.1', 9999)):
     # ipport = ('159.91.184.21', 9999)
     
     # Use UDP to send messages. Avoids the complications of stream oriented TCP socket connections.
     rsock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     rsock.bind(ipport)
-    rsock.setblocking(0)
+    rsock.settimeout(0.1)       # Wake up periodically to check whether to keep running
+    return rsock
 
+# Route a command to the component it is addressed to and return the response.
+# Used by the comms loop, and called directly by proxies over the loopback transport.
+def dispatch(board, cmd):
+    try:
+        to = cmd['to']
+        if to == 'pin':
+            num  = int(cmd['num'])                      # Get Pin number
+            resp = board.pin[num].process(cmd['msg'])   # Ask Pin to process message and get response
+            board.trace.record(num, cmd['msg'], resp)   # Log digital writes and reads
+            return resp
+        elif to == 'oled':
+            return board.oled.process(cmd)
+        elif to == 'i2c':
+            return board.i2c.process(cmd)
+        elif to == 'control':
+            return board.control.process(cmd)
+        elif to == 'board':
+            return board.readings.process(cmd)
+        else:
+            return {'success':False, 'msg':f"No component '{to}' on board"}
+    except Exception as e:
+        return {'success':False, 'msg':str(e)}
+
+# Serve commands for board received on rsock until running is cleared.
+# Datagrams waiting on the socket are sorted into per-client queues in
+# board.comms (a FairQueue) and served a round at a time, a few rounds per wakeup.
+def do_comms(board, rsock, running):
     # === Main loop
-    global keep_running
-    keep_running = True
-    while keep_running:
+    while running.is_set():
         
-        # == Handle messages sent over network
+        # == Apply scheduled inputs, waking up again in time for the next one
         try:
-            bytes, addr = rsock.recvfrom(1024)          # Receive buffer size is 1024 bytes
-            cmd = json.loads(bytes.decode())            # Decode message
-            # print(cmd)
-            
-            if cmd['to'] == 'pin':                      # Route message
-                try:
-                    num   = int(cmd['num'])             # Get Pin number
-                    msg   = g_board.pin[num].process(cmd['msg'])# Ask Pin to process message and get response
-                    resp  = json.dumps(msg)             # Serialize response
-                    bytes = resp.encode('utf-8')        # Encode as bytes
-                    rsock.sendto(bytes, addr)           # Encode and send response
-                except Exception as e:
-                    msg   = {'to':addr, 'success':False, 'msg':str(e)}
-                    resp  = json.dumps(msg)             # Serialize response
-                    bytes = resp.encode('utf-8')        # Encode as bytes
-                    rsock.sendto(bytes, addr)           # Encode and send response
+            wait = board.control.sched.run_due()
+        except Exception as e:                          # A bad event must not end the comms loop
+            print(f"Scheduled input failed: {e}")
+            wait = 0.0
+        fair  = board.comms
+        ready = fair.wait(time.monotonic())
+        rsock.settimeout(wait if ready is None else min(wait, ready))
 
-            elif cmd['to'] == 'oled':
-                try:
-                    msg   = g_board.oled.process(cmd)
-                    resp  = json.dumps(msg)             # Serialize response
-                    bytes = resp.encode('utf-8')        # Encode as bytes
-                    rsock.sendto(bytes, addr)           # Encode and send response
-                except Exception as e:
-                    msg   = {'to':addr, 'success':False, 'msg':str(e)}
-                    resp  = json.dumps(msg)             # Serialize response
-                    bytes = resp.encode('utf-8')        # Encode as bytes
-                    rsock.sendto(bytes, addr)           # Encode and send response
+        # == Queue messages sent over network: wait for one, then take all that are waiting
+        try:
+            bytes, addr = rsock.recvfrom(65535)         # Receive buffer fits any datagram
+            fair.put(addr, bytes)                       # Dropped if the client's queue is full
+            rsock.settimeout(0)
+            for _ in range(255):                        # Every datagram taken is queued or counted
+                bytes, addr = rsock.recvfrom(65535)
+                fair.put(addr, bytes)
+        except socket.error:
+            ...    # meh
 
-            elif cmd['to'] == 'lsm6dsox':
+        # == Serve one request from each client in turn, for a few rounds while requests are queued
+        for _ in range(32):
+            served = fair.round(time.monotonic())
+            if not served: break
+            for addr, bytes in served:
                 try:
-                    msg   = g_board.lsm6dsox.process(cmd)
-                    resp  = json.dumps(msg)             # Serialize response
-                    bytes = resp.encode('utf-8')        # Encode as bytes
-                    rsock.sendto(bytes, addr)           # Encode and send response
+                    cmd   = json.loads(bytes.decode())      # Decode message
+                    msg   = dispatch(board, cmd)            # Route message
+                    if 'seq' in cmd:                        # Numbered write: track it, and reply only if asked
+                        client = fair.clients[addr]
+                        client.write(cmd['seq'], msg)
+                        if cmd.get('ack') is False: continue
+                        msg = client.report(msg)
+                    resp  = json.dumps(msg)                 # Serialize response
+                    bytes = resp.encode('utf-8')            # Encode as bytes
+                    rsock.sendto(bytes, addr)               # Send response
+                except socket.error:
+                    ...
                 except Exception as e:
-                    msg   = {'to':addr, 'success':False, 'msg':str(e)}
-                    resp  = json.dumps(msg)             # Serialize response
-                    bytes = resp.encode('utf-8')        # Encode as bytes
-                    rsock.sendto(bytes, addr)           # Encode and send response
-        
-        except socket.error:
-            ...    # meh
-        except Exception as e:
-            print(str(e))
+                    print(str(e))
+
+# ----------------------------------------------------------------
+# Apply command line options to a board
+def setup(board, args):
+    if args.capture:
+        board.oled.capture = FrameCapture(args.capture, board.oled.width, board.oled.height)
+    board.control.enabled = args.control or args.control_token is not None
+    board.control.token   = args.control_token
+    board.cost.enabled    = args.bus_cost or args.bus_delay
+    board.cost.delay      = args.bus_delay
+    board.comms           = FairQueue(args.client_rate, args.client_burst, args.client_queue)
+    board.oled.set_rate(args.oled_rate)
+
+# Start the comms thread and, if requested, the state publisher.
+# A pipe to a --split GUI is attached to the publisher before it starts.
+def start_services(board, args, running, pipe=None):
+    # Set up UDP socket on separate thread
+    thd = threading.Thread(target=do_comms, args=(board, open_comms(('127.0.0.1', args.port)), running))
+    thd.daemon = True      # terminate thread when main program ends
+    thd.start()
+
+    # Publish board state to remote viewers (and the GUI process) on another thread
+    pub = None
+    if args.publish is not None or args.split:
+        pub = StatePublisher(board, None if args.publish is None else (args.publish_host, args.publish),
+                             rate=60 if args.split else 30)   # Faster for the local GUI
+        if pub.lsock is not None:
+            print(f"Publishing board state on TCP port {pub.port}")
+        if pipe is not None: pub.add_pipe(pipe)
+        thd = threading.Thread(target=pub.run, args=(running,))
+        thd.daemon = True
+        thd.start()
+
+# Finish up outputs when the simulator exits
+def teardown(board, args):
+    if board.oled.capture is not None: board.oled.capture.close()
+    if args.vcd: board.trace.write_vcd(args.vcd)
+    if board.cost.enabled:
+        print(f"Estimated device time: {board.cost.total:.3f}s "
+              f"(I2C {board.cost.i2c_time:.3f}s, {board.cost.i2c_bytes} bytes; "
+              f"ADC {board.cost.adc_time:.6f}s, {board.cost.adc_reads} reads)")
+
+# ----------------------------------------------------------------
+# Simulator process for --split. Owns the network endpoint and the component
+# models on a headless board, streams state to the GUI over conn, and applies
+# inputs the GUI sends back. Exits when the GUI sends None or the pipe closes.
+def serve(conn, args):
+    board   = Board()
+    setup(board, args)
+    running = threading.Event()
+    running.set()
+    start_services(board, args, running, conn)
+    try:
+        inputs = conn.recv()
+        while inputs is not None:
+            board.set_inputs(inputs)
+            inputs = conn.recv()
+    except (EOFError, OSError):
+        pass
+    finally:
+        running.clear()
+        conn.close()
+        board.master.destroy()
+        teardown(board, args)
+
+# GUI side of --split. Draws state received from the simulator process on a
+# display-only board, and sends changes the user makes with the mouse back.
+class GuiLink(object):
+    def __init__(self, board, conn, rate=60):
+        self.board  = board
+        self.conn   = conn
+        self.rate   = rate
+        self.merger = StateMerger(len(board.oled.buffer), board.oled.width)
+        self.known  = self._inputs()        # Inputs as last known to the simulator
+
+        thd = threading.Thread(target=self.receive)
+        thd.daemon = True
+        thd.start()
+        self.update()
+
+    def _inputs(self):
+        b = self.board
+        return {'button': b.pin[26].value, 'fsr': b.pin[28].slider.value, 'tilt': [b.lsm6dsox._ax, b.lsm6dsox._ay]}
+
+    def receive(self):
+        try:
+            while True:
+                self.merger.add(self.conn.recv_bytes())
+        except (EOFError, OSError):
+            pass
+
+    def update(self):
+        state = self.merger.take()
+        if state:
+            self.board.apply_state(state)
+            self.known.update({k: v for k, v in self._inputs().items() if k in state})
+
+        changed = {k: v for k, v in self._inputs().items() if self.known[k] != v}
+        if changed:
+            self.known.update(changed)
+            try:
+                self.conn.send(changed)
+            except OSError:
+                pass
+        self.board.master.after(int(1000/self.rate), self.update)
+
+    # Ask the simulator process to stop
+    def close(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.conn.close()
 
 # ----------------------------------------------------------------
 def main():
+    parser = argparse.ArgumentParser(description="TCNJ Engineering Breadboard Simulator")
+    parser.add_argument('--port', type=int, default=9999, help="UDP port on which to receive commands")
+    parser.add_argument('--capture', metavar='PATH', help="record OLED frames to PATH.frames and PATH.index")
+    parser.add_argument('--publish', type=int, metavar='PORT', help="stream board state to viewers on TCP PORT (0 picks a free port)")
+    parser.add_argument('--publish-host', default='127.0.0.1', metavar='HOST', help="address on which to accept viewers")
+    parser.add_argument('--bus-cost', action='store_true', help="estimate on-device time of I2C transfers and ADC reads")
+    parser.add_argument('--bus-delay', action='store_true', help="delay replies to match estimated device time (implies --bus-cost)")
+    parser.add_argument('--control', action='store_true', help="accept control messages that set inputs directly")
+    parser.add_argument('--control-token', metavar='TOKEN', help="accept control messages carrying TOKEN (implies --control)")
+    parser.add_argument('--client-rate', type=float, metavar='N', help="serve each client at most N requests per second")
+    parser.add_argument('--client-burst', type=int, default=20, metavar='N', help="requests a client may send back to back under --client-rate")
+    parser.add_argument('--client-queue', type=int, default=64, metavar='N', help="requests queued per client before more are refused")
+    parser.add_argument('--oled-rate', type=float, default=60, metavar='HZ', help="redraw the OLED at most HZ times a second (0: draw every frame)")
+    parser.add_argument('--vcd', metavar='PATH', help="write the pin activity trace to PATH as a VCD file on exit")
+    parser.add_argument('--split', action='store_true', help="handle commands in a separate process from the GUI")
+    args = parser.parse_args()
+    if args.oled_rate < 0: parser.error("--oled-rate must not be negative")
+
+    # Start the simulator process before Tk. Spawned, so it inherits no GUI
+    # state or open descriptors and sees EOF when the GUI closes its end.
+    if args.split:
+        ctx  = multiprocessing.get_context('spawn')
+        conn, child = ctx.Pipe()
+        proc = ctx.Process(target=serve, args=(child, args))
+        proc.start()
+        child.close()
+
     root = tk.Tk()
     root.title("TCNJ Engineering Breadboard Simulator")
     root.resizable(False, False)
     
     # Create top-level Board object and save in global
     global g_board
+    if args.split:
+        # Simulator runs in the child process; this board only draws
+        g_board = Board(root, run=False)
+        link = GuiLink(g_board, conn)
+        try:
+            root.mainloop()
+        finally:
+            link.close()
+            proc.join()
+        return
+
     g_board = Board(root)
-    
-    # Set up UDP socket on separate thread
-    thd = threading.Thread(target=do_comms)
-    thd.daemon = True      # terminate thread when main program ends
-    thd.start()
+    setup(g_board, args)
+    running = threading.Event()
+    running.set()
+    start_services(g_board, args, running)
     
     # Let'er rip
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        teardown(g_board, args)
 
 # === Images encoded in base64
 board_b64       = b"iVBORw0KGgoAAAANSUhEUgAAAwgAAAD8CAYAAADT7oOFAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsEAAA7BAbiRa+0AAP+lSURBVHhe7P33uy1Vme/9T/cGxIQ559jBbmMbAUEEc5u1czz/xnPO8XzPj891PX9AS1CiBEFRwQAoijm12t12tzliThgIG/jWa8BnOxxU1axae01Ye+26r2vuOWfVp+5x3+9xj1Gj5lx71p1uuunmm+90p1Wv3XDjzd2/N68O37vnlg1r7Pp9N6327rlTeUyxa2+4cXXnw/eupqk7/fU3ro48Yu+t79bbJvU3d2iu33dL/FNs3003rzrWqyMOm8byhhtvWq26jjl8Ikux7N27d7V3Iswdx76L58iJLBf247bj6r476IiJcwj2d+rYHzaR/XVdLIcdIuw7lB2fLv7DFvZ9trAftjnzK9skyw7l6roZesuQfTPZ39yxn7xu6djvmcn+8I79RPnCfsRms+9YHtHF0h0yyQ5u9jd37G/u2E+cQ0xS28RerP6502+vu/7mfV3B//qaX5aODXn/7uscsMO6BssBIxa9w/fumaY34dIKcp2eKVR6E+laA/emm7rkO1gT9HK/kb4b+OuMNwvOG2++qUwUU3LlG945LL0Q/zT9jV2ae8rF2RR92E9i2dnW2HcsJ8kX9mN2qLGXpnx3Cvupc8h+9hNYsoX9uC3s++0W/XT2jH6nsZ/O0qLzFv/T9JtlX+q4Y79nYf97dov+IGYflhPZz5lD2Hz2M1l2esIDYt81eKfu/T2OOqpj3HHrJr6br732t6tvffObJaAa5C0vu44Q5QS75VgFdcv7dbZJ/S2hd/924inu5+da/t2g3gE7gyUr+k48RX5LqjP0txzQyacFs3m9Axb2fbZ5vQMW9n22eb0DFvZ9tnm9Aw5u9juHZfl3ht4BC/s+27zeATuD/S2hd/924inuo99N7B172GF7V495zGNXe/cetrpTt6G7QLh29Z3vfHt1U3OBsNhiiy222GKLLbbYYovtbnOB4M+lH/WoR5fncoFw/fXXrn70o28uFwiLLbbYYosttthiiy12iFkuEB70oMeu9uy59QLhG9+4YfX//X/XrPbtu3m5QFhsscUWW2yxxRZbbLFDyFwg3PWue1b/+3/fc3WPe+y55QLhJz+5bnXZZT9c3XjjcoGw2GKLLbbYYosttthih5K5QLjznfesXv7yB3fP1Z8Y/eAH31r+xGixxRZbbLHFFltsscUOMXOB4E+MHvKQx/zuT4z8J+Vvf3vn/idlMdVxScJjyHa6HuftND9HFdt07He0fq61/texn8OS7ST2c23T8bT6O5L9XDvQXHeafplzfmdz9XOt9b/MOb+zA41nHcu5+k2ynGtz/d/e+u1mP8da35vO9Y7W31EmJhcIj3509Z+Ud/IFgnhuvPHG1W9+85vybEAfeeSRqyOOOKIXMP0NN9ywklP0d73rXVeHHXbYoP76668vevmDQu95SH/dddeVBz2/9Npp9WHJN7394hZ/n36u8c8HNnL2/s53vnPxPxS7mOn37dtX3tM6Zkh/oOzvcpe7rA4//PBBfc0eS/oh9nON/5Y9/7a3/rONXkws+qHYbf/tb39b9N7PYY8N/Rz2YyznGv9z2NPjSG+/OOiH6ph+K+zpvY+e9enFjP2Uup9r/Okj8aSvxtjTi0M84sKQfuqcc0eyn2vxMWfOUb/YhOW6OWQnsZ9r/GdO4G9K3Ufv/dy6x3LdHDKXPf1OmXPqOp5S9wfCfl0dz2E/1/gLe8+p46l1P4XlXPZT5xxaNpX9XONjJ9U9fcuef89D+pol3dCa8Y428aiJXCDsfWNn4Pzyl7fcKE0yO8XEouB+8pOflI4Tn1h//etfF7g6vDbbdNrPfvaz0nG1Xqe0BcK/fT//+c/Ldg8dbxutY2qjx8mDaUPHO1kqEEBro+f7mmuuKe9T5AqFXrxbNb4x+elPf1r8Mf7F7pn/2uixwBJTFj0z2GqjH2Ivzynsw9JAm8Jee7b1sd+K/eIXv7gNe/0l15q9WLQvdn3JopcDljQxr7fKnj9thSWbyv5Xv/pVL/u5xn8fe7mLpa+O++p+rI6H2Ld6vu1v2Xst5zH2/DH6IfZzjf+w1/469ql78YRlXfftSYZ/vg6UvTb79Gwq+7kW9ti07OXRsqfHoo8la+tebPxiOYU9/3IbmnOG2NPb7jHGfiuGffIbYy8W+8VCw7yv6742+qG6l8dU9vT2jbHvm3PobduqaXMOe/q5c44x1bLXxhB7udbssRlibzuW/LEx9nOtZc/Cvm/dQo9byzJ137du4auec7Q3xl4dT2FPy99U9nNtLnt6ur66F0ff/D1U99vF3lyMZ63ng+/tmHO22+R473vfuzzv2AuEFJ6OUxBf+tKXVu9///sL6Ic85CFl8lPc6ZAUko6j/9znPrf6wAc+UDrjgQ98YCmCXAFHb5/CdtzHP/7x1Yc//OGy/373u1/Z5yovPGw3QLRv35VXXrn6xCc+UTT3vOc9Szz8x+gVjULzfNlll60+//nPr+51r3sVnRhr/VwTV2K5+uqrV+95z3tW3/zmN1cPetCDyn7tt4MBG7l+7WtfW733ve9d/eAHPygsDQza+oTax16NPPjBDy5t9rGnd9xnP/vZ1RVXXFGY1OzDsmX/sY99bHXVVVeVwXLf+973NuznmuMMwJa9ojehiLGeWLCSm2PkgM1//dd/rR7wgAeUmPjLccz7sP/e9753G/aOCXtax7Xsf/jDHxb2tvWxN8F5/vd///cSv0km7MWy1YlFPHyIR79/9KMfXX3kIx8pfXmf+9yn9FVb9yZ7fOz74Ac/uPrkJz+5uvvd7766xz3uUfqYPkaPex7q5gtf+ELxLW711LKXmzbkHPbqZh377373u0X/rW99q7ChqdlvxfrYy0PftuzFkrqX12c+85nCxza1M1T3qQXs1b2+72PvuWZvPvvUpz61nz0fNXv6zDk1e2PKeG3ZzzX+jVl9jr26980zNi17WtuwUWdf+cpXVu973/tWP/7xjwfrni5zyL/9278V9vLpq3v+a/a4mJP5uP/9779fTxd9zV7N4x/29h3InFPXvXrGXg5897HXjn7Vv5io4y9/+cul7vmy33Ex78Mec3rP2PBt/Mol2po9vzV7Pur5m9Xsv/jFL64uv/zyMh+m7unDfq7JR/1mvlfz2PNpTm7Ze07dO+c6lxhbRx11VKl9PupzJz3uaqVmn7qXE33qjN4cIqYf/ehHpY7VZ9h7tOxTN5jTq38sw14tx/9cC3u+nKfkK3/sxdjWvf7L/J2617a6b+eQsJev41r2trVzlH7PnBz21jh3u9vdbsOef1rs9Zc6M29aQ4VJzX6u1ezN8y17NZ92aD2H5X//93+XeLwfq3vzfc1ezU1h7zz4oQ99qOwbY59xa31prcOndWDLfqeYuPdfIPyv//W/33hDB/+arnMDeSeYOMDVWQrj5JNPLgtVxaczHvnIRxYd2OKWjIJWSDSnnXZamRi9fsQjHlE6nCYThteKWmFY6J955pll8WZx8gd/8AdlQCikFJN4TEL0Tlxve9vbiv7rX//66k//9E9LR/NdT6IGDv3b3/721SWXXFImIYv5pz71qUXnGHHMNbEo0AxMuSpWfLT3xCc+seSYxQO9YjTwnSSwtHDAhubxj3980Wcgiwl3/L/xjW+sTjnllOLbpGvhgydr2YuJ5tRTTy25/sd//MfqUY961P6Jt4+9AXP22WevvvrVr5b++sM//MNyIqjZzzX5YiOeiy66aHXppZfehr3Yw14cJjeM1IFBb3Lh48lPfnLR0PNbs1cP2Jik8ZHbH//xHxc9lqxm72RUszfhPuEJTxhkr7bo//M//7PosW/rfq7xL27HOlFgr47l+0d/9EeFvUm3rnu50ptsL7zwwqJ3QfSkJz2p9Glf3WNEm5Pv97///dns+Wc1y5b9pz/96cKeiZ9FP9dq9nLkH3s1rYb76l6/ikmfGodyFY+vaHOBWdd92FugYq+P1b3YLfpb9plzLAjVsnFSsxdL2NNjKZ4LLrigHCMeHwRgbz82YT/HHGtuFQ/+6tLCwRjnT/zyauvevKB9egtPdSzPxz3ucfv1YRP2csTeXExv7n7Ywx5WfPax/9d//dfVW97ylv3sH/vYx5YFyhB7J+pzzjmn9LFjjFkLz5r9XOMXF4ywN1b0qw8CsNe+2OVQ6+V7+umnl4WbfPFyPmE1y7DXv9hgL1c59rG36ObLnIe9GsbSeQ0fNSUeFvaOwaNmb2H10Ic+9PfYzzXHhr3x/da3vnWUffRifPe73726+OKLi946wHxMW9c9C/vzzjuvXCBg71xX171nxm/N3liULwZD7J2vLLKx9AGYuhev8xULy7mGvX4yVsx7zp2escc97Os6Fou6VwPq3ngxT+lXF0W41ItmuXrtw4tzzz23sHSMdYJzEG09h9Dzj/073/nOondh1Mee38w52Fsbhf1TnvKU4q9mP8ccE/YW2TV7cVinaZ//5KqG9aMP7t70pjcVjh4W5I95zGN+T1+z1/9hb6yYb9Q+n33snXfUTtibz3wYoCbG2Jvvw97aq2a/U0ye97znvUr8e67fd2PXCbd8rbWTDFQdo1N1oCI0kRjUisV2ixmDnXkG3CDRiTrGichE473t9td6+53I+VNU/GtHUdqewojeVZXCyRWnwWUgKAoLN8/Re3YhY2HhBKmgtW+hJG5+dET0c8wxjn34wx9ecuCfb4XmtROqtutYtC9Gx4lf7HLwmh+51WzkjgH2JkZsMAp77db6sMfbYx17DFr2Xvexn2uOG2Nv0q3ZGwgmA5OricUEqH0nVwsNn9LRMMeEPYYWAJ6x95rWMfHtWfsulPho2asDk5dJh9neV/cmMv2AjfdhOdccZ5EgHp+EmFDDXgz8Z4KL3sSHjwscRq/u5WXR3Ff3Fsd4hz2W2h1irw2fDJm8tU/Pj1qOOSbs+cTbs2197OeaXPU99uYZ7NUx9l5j09a9vnRyMN+odfu9dgw/8qn1GBiHPtXSv2PsPeOCWc3eazWCvbqr9Wq+Zq99LNVYy36OOUZb2uSzj73xU8eSumfyFbvx7bU+FFPNJuzNB2HvIsBrc0jLnj/ba/bmHMdjOcZeHI43BsQqzpr9Vizs8eZL++YTeapxrGKpe/NuX93zFavZ63e81R0faqGPPV9y8lqONXt++thjhl3OnZiac9S346Ofa2Gv3SnsPat7eclPnmrNa5zUTlvHeOHWsscXZz5ijjUWMKAJe2NG/42xF0PY64fMXXUscwwb7at7c0bNPnWf80X09tPb7xjvHWfO0of6stbLE7OWPcPeOK3ZqyV5yQ8r7J1Hw76ec1jWGy37nDdq9nOsZi9G7MXOvNaH2kiu9NrHwHxqXqV3jvPa2FeHNZuwN8+07NV9y56/sHcMvdfY216zF0PY12tG/YBJy34n2fVdnbg22HPkEd0Vz+Fb+9Rkk5biAPy5z31uubI3GBTFC17wgtJRbWF7r8OPO+648smsjvZ8/PHHl+2t3oDXwSeeeGLxy792nvOc5xR9PRCiN3hOOumk0vEm02c961nlUwr6etLyLHaT3Atf+MJSuBYEz3/+80vh0W914DDH8iE/+fLt/Yte9KIyYMVaxyI2+5/2tKetnvGMZ5TYTZ5yMchavUUfPfZ/8id/UgaDQg97+dR6bOWLdc1ebLa37B0f9iYR7H0q+uxnP7u0205Cc8xx2uQXD23jc8IJJwyypzcR6SvH2++1nO2rzT6Tpk+Pnve855UJKOydXPrY8/H0pz999Wd/9meFPeb8qyf6GH3N3icN2Iutj/1cc5zjXSjpe7WCvU+H1HLL3rP4nADE6zjx6yfH0MsvRt+yd1LSz052LfvUscmb3qTKn9cunsbYH3vssfvZi62t+7nmuLA/5phj9rMXG/Ym97aOU/fGtfzUvU+21AU/7cUT9uaOmr1P2rDnZ4y98eJElPmQ/3Xs8RS7kxd9zX6uOZZ/n/riU7NX9/bVsWfOUfPmHbm6gJO7uacdJzV7bYS9cavP+9jbjr38sE9d2D7G3kJQPOZu86F2t2POcR7Bni/stZWLlZa9bRYJ+NE6pq77OpawNxfjow7U4xB7vvh/5jOfuZ+9OhIPBljE6LHCDDvfSGApbrXDz4HOOfpau+YBcYgn56KWvWf5yEt+8lRrRx99dKkL+rruGT1uL37xi3+Pvfqhrw1L2+QnnrDXlv5r2aeOsTf2sDcP6yt11OrnmONS9+YM9Yu9eh6re0zsl59xkjHJT1v32Dvf4GH8hb1xST/EXn72Y68uwr6t47BP3VsIY6m26Q/Ewt7awLoMe/OgttRRO4doXzzmU/OqXM2z+jl1X+tr9uZt7M3j2PLTsnc89saF/LB3nlCb/NTsmfjqdZZzJ+7WAvzX7HeSHXlEd17rrg12/K8YgWgwumL01Y8BYfDoeJ3TwtVJOvA73/lO+dpIp1vk+WTJMbXJ1QB0jK/RfHVvElB4+SSqNvos0Hyt5ApbEVo00SvemLgUi1gUga/XFZ+B6Xh6A2+rvPnnRzza9dWbgWPhYEHGv4mv9k9P41Mhf29ncnMykKfYapZe48K/PLE3oXrgjmXLHkv5qiVf1WFv4ljH3lduvj4Wuwks+gNhg73YTTD+/EPMQ+zpTQT0xoD/v+K4fEXqkwVMa33YY0ePq9rBvGVPnzrG3p9EmLScDNax98mNr0jDfqju55i4wt7X/PrLBOxiRa5iSuwMC/0qZ1/v+jQEGznnk6s617C3DXv+sMd4HXt1bLzMYW/8YT9U93MNF/mGvfkmJ4Oxujd/4KlfLdLFIsbaxBX2voo3Tw2x1w4WfGPkT0qwt6i1jf8DYT/X+HfC0za/+soncti7AFfHQ3XvEzxzDi4+OOirY6/D0qe5aq1m71GbdnB0DPbmEfOZD2XEMjbnYO+Te+ydwNNXB8KmZi9XrPWV7eIZqnvMsPQ+f9Ionr66N+ZwUPcWPBYnfXVPH/Y+LVYLFr/+nHRoDkndh72FUhagLfu5Jq6wd27wCfMQe3HVdW8Mqp98EIflWN2bX9Vj2PPvfa0Pe+ywV9fY29eyZ5lzwt5iT6311f1WLH3lU3jj3AdZ2PPdstdO6t6fAFu7qAOL+qG6x1IbYS9X9TPEXizYhb05xPEtexY9U/fYYW97y36uiUff8K9t7M2VLlaMJ9ucN2qL3if16t76D891dY9L/lxoK+zlqo06V6/D3npU/zq3mTdb9jvB0v/WGp4PivsggKtTPGdAKtJ2UErOYoZOBxrUikgny7HNLzCiNyD41cn0rdHTiMXDsXT0jmst+kyM2q7128FajolHfsl1aFAaPLRyxi+Dpo+l9/HtOD7jf4x99DXLA2W/Fav7Stvr2DtpRM/kSm/Ca038YemxCfZh6XmM/Vyby56eJvqt1D2tR71IitHXdcymsOdfTFPYz7XkKi4xDLEXSzvnTKn75HpHs59rQ+z5bxdVsbbuw7LV1yzzyPwt1z72qWP+t8KeLo/tMD75xoeNsRfPpuu+Zs9n4hmrY3rHiZmW/+2Yc/rqeIh99GEpNrrUQl8s0XvYn1ynsPc++j72rK3jWn+gbPrYz6371EJrYdmyF7vjWqN3LoxebMl1Lnt1uR3Wsk+uQ+xrljTRD9U9nVxr9vRDc0jNPiw929/q57C/oy35HVQXCEwnekhAJ6+zklyXi5w8how/ujn6xDJHzz8TO/12cd6K/8Tv2MQ/VX9Hsp9rc9lsWs9qlsl3qn4K+6nGn3Y31Vdz2WxFT+sYNoX9XJvLfqre/rks5+rFMZXlXOM/7L1OPEP+W714PI/FM5VlbFMs5xr/c9jP1bOaTeKfqt8E+6mWduf0VWKZo99J7Oda7X8K+zks6bbKfhMs51rLJjkN2ab1m2J/R5pYxXnQXSAIPDYlxttLP5XXXP1c22Q8W2XDNqGfa5tkwzapv73YsDnx7AQ2bK5+jm2VDZujPxjZsE3GEy3bpP5gZMM2qY+WbYLPwcyGzdXPsfhmU/xvVX8wsmFz/G+VDdukflNstsPEeFBeICy22GKLLbbYYosttthi22/tBcLv/xTADjUXLb76yet1FzG1ZhN6sURTvx6yufo5xlfNJq+HjCbtT9XX/nPskNWaTejnWnh75PWQ1Zq8HrOt6tvXQ9bqPbbTap/JY8xqzRy9xzp9rcnrMZurn2u1T89T4vFoXw/ZXH1ybV8P2Vz9HOMrPOrXQ7YVvUf7esgORL/dbFjtc51/+6LJ6zGrNZvSe7Svt8tqn2JZ57/WbLfePpr29ZDN1c81Pj3a10N2IPp1bFitmaP3mKKfY/HZvh6yVr8ullozVz8l11ozRb9TbMd/gyAe/9El/1vd+/wHEVc7rdmf/7Bjv/f5zydD+vo/mOg8ev/5pNXTsvo/A7nKovefevr8M/r8hxT/YcX/anfckH6qicffymGT/1glbv7t64ufjt5xLP95hvXpW/b5j0J9sdsvTzyjn8te7GMspxrffNTs+RVPH3t6Mcs1/7GKXjzi6tNjyH/+gyD2/Kft2myjo3ec9/mPUX252p//LDWF/Vzjb2rdM3qx1HWPjXruy9W2TbOv6z4st8P4n1v3uOBpv/diWVf3Hmwde1aznMJe7OqHbfeck//01845fUa/ybq3Hxd6+7GknzPnrGM/1fjmYyp7+raO19V9zd77Tc85tEMs5xp/NXtM+JfzkH+xiCn6sboXc/Rs3ZzTsk8d29enp6N3HAvLPv1c46M9d86Zc9bVMT2tBxtjn3ywnDrn9LEfquO5xn/LHhfxs7542vmbHs++WOwXN7393m83e2wcw6bU/R1l4hFfvkHY+8bOwHezBzsls1MMeJ3g56rElokCbM86sDax6+TcBCTFbRtfOrA2ej8tKHeFpKj4pdd5bYfT+8kvP09le/TioTV4YuEodvv5x1mBey92HbBV458/P3vo2UMbcsaJ/8TAvLYvN+wIS0UrppZly96xyZWZHGvjP+zjn42xxz11t479HONbDGKRg/zCyHu5iilGTyNXedJ5LyZ8TBatngZLGo+w97qvLu3jv489/7X1sWfYsJb9XGvZ1301xN7Ps7Z1T99X91thj6U46ByvDXn36e1L3ScWLL1uWc61Pvaex+oeF/MCXc3S+G4XV/S4m3dsr1kOsefb/ujxGZpz7BN7agsjz33s51rNns/Uceq+r47t65tzvG/HScs++u1kr46xTzxsjP1UG2Lv4f121n3Nnm/H9rGcyx7ntu6x0fZ2zDk1e7nEP+74e1+bOURM0Xv2Xiz1uXOMvXrq0/ex93oK+8Q+xH6u8S8v+dbsbbOvr+5xxJNO3MxYWFf3ts9hH/1c9o7ZrjlHflPZa8u+vjlEnOvqPiyH6n6IPb25uG8OMd8PnTv72N/RhomfH/ZcLhBu7ED/4tbFAgA7wcShINJxH//4x1fvete7ym+T+41a+wDOCZIefIVtn1tbv/e97y2d43dw7VMcKW7JG4hOLp7f8573rK644opSdH4v2rZ6YZhCUhw62y3I3bJfB7ufgEJxVRh+9LSOUdxvf/vbV5/4xCfKb7aDr51cAW/FtCNXfvy28UUXXVR+Z1fsYrJfvulTz2Hpt4rf8Y53lHsPYGN/Xdze1+w/9rGPFfbuReGGXevYf+ADHyjs5T/G3iCr2TvW76S37Oda2JugxIzNpz71qcLebz9jVi9mxK9OtOt36S+88MLy+8nuh+FTEAzqiYU+7DHXt/pA7Nhrv4+9CcpvdE9lT4+9W97X7E1aYT/XxGYCDftLL7209Je2wl5dhr141LCax/Tiiy9efeQjHynxqnt921f32nD/DGywx91vP/exF4vxg0nY883vEHscavbqHpOa/Vxr2X/0ox8t7I1ffdWypxd3agHH973vfWXyp7evrfuw9xz2YvXb/fTtnMMX9uoz7MWgNqew//SnP12497HfioW93ws3rtz3Qd207MXkGTss/da8uje+sGFjdS/PSy65pByv7sU+xB6Hyy+/fPX+97+/1Kp7rwyxx9G8wLdzBBN/y36uiSdzjnMUNtib68fqXuzu4aDu/eZ8fdMzz7WFjXsUhL26l2PLno7e+8985jOldtz3AXvbWvbii/6qq64qfLClb9nPtSH22nU/mL66V/NqHyN1Yx5U6+6Tg1nLsmaPpZyxd98ILIbY+y37KewzxrE3rtxzo4/9XAv7jCtrCvOCdYm6F2Nf3dtvn5q/7LLLCl91HzY1S1ywNzbC3nZzTnuu9Rz22gh750H3H+hjz7f23T9DXRrr7hPRx34rhg0/7sWEvXsPhL0HPqljOnOG98471mnub5C6d37uq3vH1ezpx9h7xt0DQ/H01XHN3rnkyiuvLDH31f1OMfHcpxs7d+qe9/7P//m/3nj9vhvKAAu0nWCCBN6gMRG++c1v3n8jCwPfTbhYBmY6gynQs846qyyq3HRE57nZjtzqYjIIPOs0kwS9RYebyZgsdGR9hUfPdLQFML3Y3PDF4lPhOSZGL/7zzz+/TLomL4sgd9ITh8dWikPM/MpXv73pTW8qN/75+te/XpjlJlMZmF4rdgXpRh2nnHJKicPCSn5uUMbEw2r2NNgb/Fga+GPsTcw1ewPNBZ0YavYGjGcLJJNK2LuJksUhjls9IWmDf/Gfd955ZbEhb39Gh71+qtlHj89pp51WLqBoTTTueCiWmmXYG/gnn3xyYW/ScrwbxNDkBON1zZ4+7MXgJlOsZmmyNWHh0bLHh+5ATkhh76LMhBv2+hV73OtJkZ5ZZDghWXzKV525IU1d9zX7c889tyyyw95dU8fYn3rqqeWGgrROCtjTtezxcYKv2WOcug/7uVazx/v000/fz97CxLxQs6dXB9r85Cc/uTr77LNXP/7xj4tezTth09QnpLC0oMWeXi1gb9Ffs2f0jsXeyQh749yNjpy0+1hiJBYfqpgzLQyxN9Zr/Ryr2esb7M19FkpOsuKp2XutTzz0p771rM70pxsdsb66twgLe69xwZ6Jv2UvT7WGpfODud6cP8bewifs3djO4qdlP9f4xyLs1T3+5pyavVjkSS9nbCxQXSio66G6NydbzGCv5rHnJzdXq9kbT9iba/jPjUPVjBt8sZa91+LA3rkKe/OBG0exsJ9r4sm51vyhlrE3dsViXmvZ02vLucE8JR51b4yn7vvOtc49PojDXt27kzS/cg17OuzVT83efJ75vmaZunc+qNmLr637uVazN/dhb4xjbxHpZnWsr+7Nrc5vqXt/FuJil6au+7D34YUFc9gbg9ZSarNlWbMXjwspN0tzkdbHXt2feeaZZR5U8/i37OeamPlt2Zt32FDd6y/x6ls1gI2LlaG6Zz6UOuOMM/azd/HkJo2sZq9uPFtT1OxpHTPE3oeg1o1h7+ZqPjRr2e8Ek8M9jrrnqstgteeGDua+G3feb7Ka+EyQBogONSh0lEnPPpMWwF5HrwicSAA3mdJ79t72XNEyReR4fmzjl1472tPh2o9eh1skOPnQeq8QFIyLA4NTZ9sevQFugZyist/VuUnXpwO2RT/HHONYixAxKUK+bdOWNrVdxyJWOWFA433ylpMTZPS2hz0mBhF98sbMp2Jh49lCEWODIewdhz29/dG37E0C6SvtilMfRL8Va9mLf4i9mC0oTK4uuLA0sdHb7hFzjJywx4wm7OWrTReX8e1Z2+oDA/VVs7edH0yY7SZh7Okw8Wzis69lP9e046TAPx9hL3bttuzFb4EmXzEkH1zF0dY9M1FaHKtLrMbqHntax9BkoeC1/vCIOaaPPR+48q2NOpY5FvYY13WfvPvq3tjP4jV95VkOtlvMRB/2qXvvtSP2dez59J5/XPnBXjt1vjiq13rOUdNq8kDnHG3V7MXCcGrZy8F+Oan7ds6xva/usaGr2TMssQ4bz2GfOYfes5z56WOv7tW89/TY04lHX0S/FUvdyzV1j33morD3EHPm6dSxY/Rt5qJY2JunLaZpxM7kq09a9nKRk9wy58hZ7hjwU7Onw0wcYYm9OFv2c0072hOP9vkJe7Vhe1v38kndM3p5qxkc2rrHC7d2zgl7edB76Iewz3zvGP2WuShGH/bqJ3XM8BGjMVrHMsdq9tqp65iN1b02xRC9Z36Mo+ixxwxj4852Onn01T2fmSuMQazocdWH8h1jb58H9hkPYT/XHKNvzHPm3bru+9jLoV67qS+5YWCfuteHfXUv5ilzjjhsZ2Gf44bYi79mX9e991ths2nb18XusefIIw5feew0CzTF9ZznPGd13HHHlfc+7X7JS15SOrQ+2XmmZS94wQtWz3rWs8o2z96ztlAzkfCXT3K1oz2+We2fXse+4hWvKMXp/Yte9KISU/QxetsMqte+9rWlkBXrq171qjLZtPqtGB+K7JWvfGXxbVJ9zWteUwaBfXWuTP6uusUsdsfKxSCp9Z5pPY4++ujV8573vLLdNyUvfvGLy7EetT75nHjiieWTA9ue/exnr57//OcXP2083mP/0pe+dP+nidjrL/scs1VLPAZn2Js4sMkiqTX5OGG84Q1vKH1sYnj9619fmPbpbTPhYG+Qm1Rf/epX97JP/j79Oumkk/az//M///MyodT+c5xjjjnmmPJg+k2dtuy3YtoTc83++OOPL+xb7mHpwlKu+Ok3deDYIb0LV+z1gcl6Cnu81aJJuGbf5mqbyVjtysOJiH8XnQfCJse17PVbxkwdT3Klf+ELX1g+pWeZr2z3qOOhF/PLXvay8sm1/SeccEIZM17XFv9qEXsnW+wd69Mw+2qLHvvXve51Ze7BXj84ttVvxfjwLZbaFYvFwRB7+dD7VNYc7LV+c6zxWMfjuPA69thjy7zDfGqJfXzFf3K1HXuf0rPnPve5Zb6KrzoeevPky1/+8vKNjffY67f42qolntQ99sa21xZP9rVmm300tOYO/Wa+sq+OndkmbvFj71jnE/UxxB6XsNdvameMPXYYMuyxja82njnmeO2K3QLLe3Hl25LawtI8YE5VY/J1rByG9LjhhyOeXo+xNyawN0ZyntZ/9rW52ma84tey79NPNcel7swZYa/fnCta9snVwxzsG2tmvBg36cc6HlrsjTvjz3vnaezTdiz+jWfsza3r2Ks9czXejjOHe+1Y+w7UtOlck3WffjMfOifZV+fK5GQ+zdpDvznXmXfr+B0XXs5/c9gbF84LzHlijL36cq7CHg/sja3od6IdeecjynXBjv4VI6AVtoJzhewrRgsxiw5Xk+KuO4PRW+D5utDXqorJIHZFS9+aicTDV1i+xnS15yQS/zUPr6P39bev2i30dDr/riijF5fttGISiytHevvoXVVulTcfBq5c+fDVm0L0yYh2xF/3J728sHRlS28itTDzaYJHy5Kef/58ZUdrIuXbttbC3tfk+XtXg7iPvbjSt1PYz7Gw55s/ta1++B9iH70JSK4GtotAOvHkUwfWsvd1s2OdNMS9jj29GlbLfey9DsuavWPE3sd+rqkV8fjK09eq6tIEyj9WNRuv1bFjfHVsbNFjRN9X92HvTxzsp8ekZU+PuVw9G+M1e3rMan3YM3Vcs8ey1s+1mj1f/vTAic5YmVP33ou9bw4Je3/aVbPvq3uv+9jbTj/Enj91j6G6xyQst2p97L22gFtX9z45prcAs5gIS5rYgbD3d8H+tMFFqPbWsccd/7G6n2NbYU8vds/qXv2Lf0rdm0PMrdjjgtcU9hbRtFPY823BF5YHYmGvlnE372AvZ307NOd4GFM+6feBDOure35osTfnyHkOe2yNW375b9nziyULe3MOVh41y7lWs9e2+MN+Xd1bg5gXzJfyT1+1LFP3zrPOt2FP37I0/9Jqw5iioWd97Ou6Fzt2PgQNe31RxzPHavZeq2PrOfNC6t72mNfiphcnvflG3YudvrbosRSrcatfXZyGZWthuVX26hgz8RzInLMJw0Nsxo7ng+JGaQpEJ3pWbOIFdiheE6NOMegVSfStgWEwRA8IPe2QnoZePAYY3x4m9dai55terNHLYztMDPyLCY/4rye42jARS/QGGf0QS8zDcg57cWESfWtD7Ok9H6iFvVzDXhz897GnD0t672mj78t1Dnv+wtLzVPZimVr3Uy3swwYnfSUe/vtiT92L37FhOVb38c/fGHuGZfRT2Ld1HP1Q3c+1uq/qOm7Zi9X7xD51zol+Xd1vlT0t/2Kj9RhiP9fmsBdPzZKGVg5DfcUv/zV7j7CO5X1YZs5Rx0Ms57Cfa/zXdTyF/Sbrnr+a5RT26at6vvcI662a41PH4gn79FVf7DRhM6Xuh9jT9/mnzzjxnlY8Q2xa9pkvh/Rzra37sBFbbd7jEb24wqavjun72NM7bip78fTVcfS355yzjj2G9Kn76Nv5O9bHnr617WKfvt2OutlOS7wH1QVCOkVsXnuMWaufkhc9W+ffPr7in+8x/7We0WbbdhhfiYWt838geq/Hco3ZP0cfNlP1Uy15TWW/Ff1WWbI5eq+3k00sua7znzi3qp+Sq30mpfhep5/Dcq7V/r32GDP7xZ7XY2xiU1nGEg/tmJ4/+6J3gsy27TC+5rDv04/ZVvSbZj/V+ONrqn/7D5TlXP2YzdVvxeawsW+r+ils5uppPbzebjbxr32vPdZZYk88Q7HHpurtDxvPtFP1jDbbtsP6/I8ZfWJnc/Rej+Uas3+OPrFP1d8RJraD7gIhJvg58R3s+jm2sNk+EwubGs/BzmYnxcM3m+r/YGez0/RzbGEzbHyzqf63oj9Y2bBNxkPLNqk/WNmwTepp2Sb5zLGDmeUdYeK77QXCddetvnX11Tv+AmGxxRZbbLHFFltsscUW217LBcJjHvaw6gLhmmtWV3/hC6ub/D3XrV+DLLbYYosttthiiy222GK7326+6abV3sMPXz38z/6sPJcLhBu++tXVr/7v/12t/Oef7qphscUWW2yxxRZbbLHFFjtEbN++1Z573GN11P/7/67udNRRt1wgXPfb366+841v3PINwvInRosttthiiy222GKLLXbIWHc5sNp72GGrRz7+lhsOlwsEP7n01a9/ffk/CIsttthiiy222GKLLXaIWS4Q/jAXCDfsu/HmX/7yF6v//I//WC4QFltsscUWW2yxxRZb7BAz/wfhsMMPXz3pKU9dHX74Eas7XXf9vpuvu+7a1Q++v/yK0WKLLbbYYosttthiix1qVr5B2Lt39ZCHPvx3f2LkTnBukb1cICy22GKLLbbYYostttihZblAeMxjHlNu7FZ+09TGxRZbbLHFFltsscUWW+zQtVwTLDc9WGyxxRZbbLHFFltsscX223KBsNhiiy222GKLLbbYYovtt+UC4RA0f1vm78w89viPKLv0/53IK7kl5918p3C56s/9fbvLc71N3976fjea3NKvh0Lf5rnk2j12s9Xzscdur+PyfGvOu7mOWd23h9y5dpfXcfq19O0urePyn5Svvfba1be//e3lPykfInbNL3+5+s2vfrW6qXt95JFHru55r3uVIt9t/xdFPbv53+FHHLH69TXXrH7961+v7nHPe67ucte7lp/z2k1m3N7Y5frzn/1sdf1115X3d73b3Vb3OOqoWxW7y/bt27d/kv7Fz3++uuGGG1b3vs99Vocddtiuq2N56tPkKeejUse78P+PybH0YzdGf9bVs3zvde9737p3d5m+/XU3F/+qm5+MX3PVvbr52PNu61v57Ov6Vm7XdWuOX3bnobt2NXz3e9xjV9axnH75i1+sfvub35T3R97lLuVcWz6k2mX5Os/e1OV0+OGHl/WFnOV65259sdv61ph1/vlFNzddd/31qz3d+7vd/e7lXHuw5yp+8+2jH/3o8ry7L98X+z1zlfvTn/509eMf/UiVr/Z276/pJrAffv/7K2Wt8HeLydWJ90ddrn6l6/tXX736TXeB8P3vfW91Qzeod1OucjGwf9DlZqGRb0l+9MMfrn7e9fdu+3TDxPXTn/xk9ctuwSzfH/3gB+X5B10f47Db+la9fu+73y0XCXK3kFTHTsK7qW9LHXfP5qNrf/vbMk85Cf/0xz8u/b3b6lg+FlPq1ocZ+lbeV3d9bcG12+rYourqrm49q1/z8w+6vvbBzW7sW3X7s1vr1sMFvrlqt30EW+q4m3/lq37V82+6uSl9vdvq2Dnm+90YVbfWUOYs/ap/jeHdZLtrVC621q7tBu5d73KX1f0f+MDyOKq7yreA3m2fqMcsqiySfZLxqMc+dnX4YYeVhdVumrSYBYZvAn3Sev8HPKD0rW+HbNttucachHxC55uDRz3mMeVTSSek3WT6zifqFoz3vf/9S7/er+tfF4HXdxcOneBW5e4w2ahlCw7j9CEPf/jqAQ960Oq33cn4YP90rjV9q2bdmKjMx12/3ud+9yv9va/r791oxqcLe3356G4+vvvd716+3d1tc5T8ftstlu/a5We86lvflOjvUse7cE52rvENtm+uzcc+WZfvbutbH9Bc260rnHf07QO6sXvEne9cLo52my0XCJ2lgD27Gt7Nf6d+n/vetwzkr3/1q6uvf+Ur5RMOJyVXvrvpBCwXX2XrT58uH3HrV/b61gl5N5m89J8FpE9av/n1r5f+NZHdt+vb3dSvTD6+rr+xW2y4AHTxJ1fP+ns3mcWyPyWyuPjud76z+sbXvrb6zre+VXK1zf7dYqlT+ZY/y+jmY3+yYF4+rBu/u8303T27C3o1+82uX/XtD6++uiw8Ml/tJpOnDy1c1Gdu9ii53qrZNdbVrPnYt9b61ZzsPGRbWW/ssr69c7dAltevfvWrMjd5vfeww3blusKfPzqv+qZTv36rezDjdjfNx+yWG6V1C8ZvfXvr/wfBMe2JWUn41OtgMIsLne7TDV97KnYLkN02QbMMWJ8+ejY527bbPnllqcvSj+q6e5Zn+U+Pu6xv5SpPf7JQTsRd/frTFLYb/1bdLOUTOnn5+0+5yj0Lrt2Ur75Vty7sfaVd/i9Nd3Ggj3fbCck49W2mc5KFhmePux911K78/yXJ13zs7/Pleu/73nfX1XBMTh5q2mLSOHahu1vN+DQ3lYVzt67wf4d23ZjtLP2qbs1T6tj85IJwN9Zx6cMur1//5jflGzD//8DjYO9bfWU9+JjHPLrry72rO113/b6br7vu2tX3r/5eSc7AnWM+kbWoBomVUri1EZ9M7+SJrpx4u0nZ38o95GEPu+XvIm/9u7IHP/ShZeGxmwazfMt/IOoWVqWfu36Rn09zXP3atlsGs1z86ZRPq+QpLw/1aBG5mz6hS7+pX59S+YbkwQ95SPkU1lehD+1q20XwbjEXeP423Sc4XfKre3YnXX3qb7cf+vCH76qFpL51cfCdb36zzK1OuPkTOblaRO+qOaobn/r15z/5SflBAd8QWTz7E5zd9gmduejnP//56ic/+tHqiG7M3tjl5s8Ujuwu6B/W9e1u+vQ1dfzdb3+7vJe7Ovb8oAc/uPT1bjvX+lt8F/I3dHmradtc/N3v/vffdXXs7+9dFJiHv22u6vJzgWBdZf9uqmN/AuhcK7fvfec7ZX1hm369pznqID7X6ifzzkMfZv45TN/97ueptmIFWDeB+w9lFmQW3GAZFOxgKAwnIRc5Cvwxj3tc+bTKLywcCJedaAaqq/sf//CHJVcnXg9/qsF2yyCOmYSdfH164+SkLvPNyW4zFwBOuA97xCPK37uawPw9qIvd3WZGpQshn9j4fyVq2sWBiXq3jVn5WDQauw980IPKnyw8/FGPKidfdd0JblUe/CbXm7pxKkf/98C8ZOH4oO5iV3/vpkVV7Mhb/zTDvOSTdH/L7FeMdtOiimXh4VN05x4Xtv5WXc5e78Y52fnmN93Y9aGc/0fz4G5BqY7N1bttnpJT+UCuu1DwIcZjHv/4ss3ctdtyVcfmIv3KHvTQh5Zf4/J/4nZLpv7/iGuDPYft3bM6vHts1Vwt+Y+R/rbd12dOXhYpPsE8GApDjP5WzhW+Sdmnj+Aogt1milo/+fkxzw975CNXD+8ePp3bbeaEY9DKzX+EU5MePnXdbX/fKxd1a9FooeGT1gd2489F+u477d7at93iwtzjk1f9ary6CNxtVvrW3+FbXHUn3gc++MG3fEPS7SsXf7usjn2DYHyal/0HQJ/A2m5u3m0LDfOxMfuoRz+6nEN9SCVX59HdlmvMN/PmYB8qWjzu5gsE38z/7Kc/LXmmps1TnndbtuZhF37ylbdxLM/dVsdlLur60PrJB3Dq2P9B8CGVMbxb6vjww/euXBtsy30QHOPYwOte3Lrn4DCxl6v67rWTsSthA7n8Z9ZdNnHpK7kyJ91DweS7Gy/4atOvWSAf5iTU9W1+neqI7gS82+rYXOMCwcV9mX+699d1J2KLja3MYTvdfBrpP+was+Yrn1b5NHa31bW+k6tn+bLyH5Y7s5jeLSfg2uTq4dNlY9ZCw/vdamo2nzbv5gsEOTn3mIPVcvnAxnzcjdvdaOZj+VoDmqfyTdFurGX5lb/AcI7t+tm3JtaLB3sdi9/4zH0Qtu1GaTnuYARU5yz+gzmXKSa/3Zpbnx0q+bZ1eyjVsdce5rDdaHWuzAnK+93Yt23d7va+jeUDm92eJyt9qoa7XHdjDReT460v5VjqunvIeTdaxi2Tbz7M2K2WeYnJdzfUsRzqC4Rt+wj5YAaU2BP/wZzLFNvNufXZoZJvW7ft+91mba67+WTU9qNcd2vfyutQ6tuYHA+FPFnpU5+u79IaLnZrHSfH8nqXz1F1vru9luWZMZucd5sdGn9jsthiiy222GKLLbbYYotNsm27QMjXLfXXTGN2KOlr7ab1U+xQ0tfaTeun2KGkr7Wb1k+xQ0lfazetn2KHkr7Wblo/xQ4lfa3dtH6KHUr6Wrtp/RQ7mPW1dhP6qbZt/0nZf07Jf37N3S/7vnaJf/+hsvyHlj23/HLQduv9Rzf50Oc/uw3pbeef3t9d8c/G9Pwzeo8+LaPnl3+a/EfDKXomljG9fWHDxtgz++ayrPXrWLKwn8qS/02zZ+tYztVvhT2th9cL+9/ZVvRhycbY2852A3vPtDuBPb3XU9jXLPmfo1/q/ndGj4sHW9j/zui3wpLe64ONve1zWc7VT2Uv3rBkU1geSF8dzOxpx1jS12zWsW/161iOmWO0tW3/SZne73GX34C9FYTno446qvzKRl+Q11xzTflZqOgl42ZHOqXW2y8m9yTwP8bzHgC/Fd1Cy343n1HY/HrvJ8b4b6HRg/qLX/yiFEaO9z/Sxd+a/eKg58d7z3e5y132/xxfbfbLU761/m53u1t59OlxLHeYvFXLxKINsdVG48ZuHtF7HmJvH5ZulBYWc9nT0fexxzD6sC93j+ziGWPvOfqtsPczpq3ZH/Yx+qnsGc0Y+7bu5UDf9zOqNLcHe3Uf/RT2W617ej8ju67uYzT6yTF9+pY943uIPd+54V9iwmboJ2yjDwsM5TrG3i+t0Hu/jj02mXPsF8cQe7qwj/+57NUwnrVvZj/24s97mu2s+7nsxSKm5Gr+3hR7+rH5Puzp0p481Vpr9pdf2+niSZ6e1fAc9mN13zd/i0U9tHqmn+ayl0P0GNLrg1pv/4Gyt39K3W+VPf1Q3WtPHWfOoadZxx5Px8aG2NPzrY3kZts69ql7+7d7zrHOybnT/jns7ZfndtW9msTHa0Yzxr49dzKxb5L9UN1jSY+R9xjxS9/Hsl232L8V9vS1ltnfx37q/J39+tXYavXrjB6rXCDsfWNnEq0DYp7bR2u2GWSSB/mb3/xmKRRF4RkEjcTodbRknPS+8Y1vFMgWMjpTQgDH6A0CvkDg3zYDB8RWz372s58V3/Jx0UNLo5PEFeNHh/3kJz8pMfz0pz9dffe73y0+bcdC/DF6Onr7f/SjH62+//3vF5+2M3nE6MXBLzbf+973yrE6WewKtV7EixED8dOLHSt6+SvAemLhH8cU6hT2mBwoe3GLXzve1ybXsP/Wt761n8cQ+x//+MeT2fNBZ/8Pf/jD1Q9+8IPCJoOavmbTx96EFfb1xCJveco37HEdYk8f9nXdix9Lea9j77gp7I2vMfaexdWyFzPDl/8Yvbbn1P1W2Gec8O3Yuu7H2Itd3csRG9wdE6Ov5xws+V3H3jF0WDpODPTaadkbg/Y5hn/+prAX01T2eZ7DHvcx9vIQY/RbZZ+6x7Jlr4bxlBs28g57sYyxpxfXWN1jX9e99vkcYo8hFtgbt1PZm3uuvvrq4tP7KezVfliKex17uUxhL1bs5Zy6H2Kvf8Q1hT0m5m776bW9ru772Kcdmmhr9nL4zne+U2K2Hc857Fkfe3osnWedb1P34k4/M+/lNMTeHNKyxwUferliO8Yed7Wsffqp7LU/hb3YacWxjr2Y6Q+EPc1c9uITUx97vOnFIqaxusclc45c1Rt9H3vxYJ+6p/cs5nXs7ceeqQHxyLtlL/Y+9tppWcoRG2PWceacdewxr9nrf8c7Zip7dTCHve1t3ce0Uz9a4/fe9753eS4XCO5Y+Yuu+DnqOyDWghWU4CT/jne8Y3XuueeuPv3pT5dP9x/84AeX/QFGD4oEdMZb3/rW1UUXXbT613/916K9733vW9qnTxx0BqXieMtb3rJ697vfvfqP//iPcnVjsSeedI7XikKxmchPOeWU1fve977V1772tdUTnvCEAgowD0avILShiN70pjetrrjiitKBf/RHf1Q0dfHRZ4L4t3/7t6L/0Ic+VPL5wz/8w8KgHvjizyD4+Mc/vjrttNNWH/nIRwqDxz/+8eWZPrzlEJaXXXbZ6swzzyzHye+Rj3zkfv+sZf/2t799df75568+9alPlY4dY69wsHcM9g95yENG2Xu8+c1vLuy/9KUvFfYKEJch9ieffPLq/e9//yT2NFh+4AMfKAMCS1ZPFDX7L37xi/vZ2/YHf/AH+3Nt2cv5Yx/7WGHvGavHPvaxo+zFjf0nPvGJ4rOPvffpWzV83nnnrT7zmc+s7nOf+6we9KAH3Ya9uMP+7LPPLmPl85///OqhD31oOYaptZa9iQ77Sy65ZPWf//mfq8c85jGj7C1iwl5NY4PhFPaOVfd8tnUvDszEzD/2xmTqvo+97R/96EdL/J4xqdnHavbG61lnnbWf/SMe8YiyvWXv5MjPhRdeWOrenHO/+92vsE/80dfs+Q77hz/84WWssJo9ndzkrG4uvfTSwl7s4hhir3axMXbH2PNtsv/KV76yn70xg+UYe2OV/6uuuqr0H/8texb25pqw51f8WLTssaR/73vfW2oTezWGT91XYa+vbH/b2962uuCCC0rdY//ABz6w9DF9WIa9RWfYG78Pe9jDRtlrQ+zY/9d//dd+9njmhCdn3PE3Z6funeDXsf/yl79c2H/wgx8s7PvqXjyZc7B3Pvnwhz9c2lzHns75Cnt+jNu+ug97eZ5zzjn72Q/VPS7iwT3s73//+xf2/IknLOnUDvbms4svvriw59v5mWaIvbp/z3ves/rv//7vwp7fPvZ8W4yn7l3kqGMMaR3DavZ8Yn/llVeWBVPqXhste8w++9nPrk499dTCVF9jH5Y1e3GrP3NT2Nvfsudbe/SYmlux/+QnP1k+dVWbU9iL6wEPeEB5JP6wDHvxnnHGGYW9NcMQexyNafUgV+zV6OMe97iia9nz61Gzt1DF0v6WPZbYG0s1+9R9yz5zjhzVvblEjM7lfexT98bT6aefXtjzZ60wxt6awlpkKntzvXlHXGq+j708xa8+sX/nO99Z2DuP+0aApo+9RTn25kFzM/bmefNHW/fGilrH/vLLLy8L8yH2qXtrp7DX1lDdh71zGvbme+dq7DGo2TuevmZvnSPmRz3qUWU7/+tMu3zyx7y+z33ci2XPas911+9bXXfDLZ+AMzvd0fEbX/3q6ptf//r+xze6xcR3OiiS5ZAzDwUvAYtZx4KdiS4dV5vFqOLUyRJxhWSi40eHGOQx7SgCk74LA/u9NtEpEMfHv2egLRKc0A0whWBQmJToA5bRO148TgAGG/9863ATb23i4s/XQhbiilYhiF0nZaFXx6MzHaPTFKJ8DDa++PFc623j02SocxUEvaJzQRQ2tB6Y8Ys332FPO8Qeb/nK3clRPzhZD7G32Al7rw02LMVZxx72BoIBRq8fvKbnL0Zfs/cJvxy/8IUvlNfY1/qwN4mYTExI2tcPJr8sNup41J9jTFYGtG0Gm+d8tVfrbVMf2GuvZs9XzZ5hb7LA23EmArFhr9+jY3KxiLIItziVu9dhr40+9l/vxh2eWHr97//+76Ps9dNXu3Fbs+enj716/dznPvd77C20+upeLYW9Wg97Oa9jb26wDXtxhH3Ma9vsC3vH1HVf+2Zix148clcDqXvt1v4Z9hbwcgx7ufPTsteXmOEY9l6re4z72OsTfRP2jnPxxU8952hHe2EvJu/VhNfirC3s5SVXeWpPrsZ6y54eezHgh6NtYe8E2bLJSTNjI+xxHGKv3/W/WIxFsakPsdYsmXpSV9jL1euafR0PVljiqH7DXl1jr706Hn1Br29q9sbKEHvMjDs1oBbMP15j346TsMcbe/68tjgz/qNjQ+wtWB3XV/fpD3rP5innCj74ij7PmIkDe7lj7zX2+quPvfOac5rcjXX5mndb9nLH0pwR9l7jOcQeY77VOr1+CvuaZcveeQd7deB8JJ7a+JcPBtYV6g1Dr53vsKdJPPxjoA0szd22mU/EXbP3bJ9tnunFyi/2abfWM+zNfRZucnf+x56fdeyx8Trs5R6/TIzYW7NYr9B7rR/G6p5v5+Sw97qv7u3HTOx4p+6tw/rYO3+pe7zNM/hgo6b72NPy2bIXZx97dW9908e+PXd6LUa1HvYupLzuY88f9tZwYe/iyRxrjPexxzjs+bNexB5jLOv4tc+/OcdalH9zvwuGobrHzDoRb+0bAy4Shtin7p3jtJ/zaMveM/Ziwht7XMPemNhvt8b1w+488/Vurty/tu/GrrX9j7u6YIn/t9d11wXdtcGeww7bW+68GtOoJO7ZBeOW73kY3G4r/ZPOUZyA69NqVzfgKCad7ardowYQWPR//Md/XIrEwJeU411tBkD0YPmUld5kTa9tV18+4QIgxeEZLFehrozlYDLVpuP54a/Wi8GVpU8lvOefht4n623xYSBOV5c6LCdp8chLp9SmkHwC4xgnFXo63yB4xi8mLwzp5aY4PMSnPb7q4gt7sds3hb2c5IZb2IvF1eZU9tgOsafHAgd6gyfsFX2tb9mLnybsHRs9w1leNXuTtnj62JsMWvb8hn09iYY93+qnZs/HEHu51uxpPcQVk0Mfe58SyH0dezVIL96huvde3PaLrWZvex977Rp3JhTx678+9uKq2eeTRjmm7us6ZtjTa6Nm73iTcc3eaxNxzd4xjrWtXTRriw9tq3GxiIlWmy17uYS9HMM+dY9Fy14cNXu1pc5s56Nmib0+EU/q3nGOb+cc7ejrsBcH/RB7Jh95qauwx0R7WTzE1GjmHG2kjsWND851HXsd9mLVT2GvzZa9/FL3YW8sOt44G2L/xCc+8ffYyz3sa5Z13TuWXn7r2Nufup/Lno+wN06jZ/LJmMYeH0yM27buw76ue+zFh0+7cEvdq8OaPY7aG2IvV3HV7LVpjNZ1XLM3/vm3XezmtSyQo6cRB/9hP6Xua/bOE2Ps5SbfKezVV+re3Cp+DMfY0/qUPnVfs6/r3rF8qANti0Ub+m0de5zFUtf9EHu54cC/7WE/VPf840Bv/WKc2T4258iLPnWvXa+jr9nL1zmfXv9rT1597Onxr9k7fog9FnILe/2AZR9781bOw23d8xUTOw6Z78Peh9RDdS93zLBQ03Jl2IupZU+DGf84WDNq0/F9dY8bP/wx/lP3/HgdfdhnzhE3vRjG2OPgEfbmCcf3zff41uzpxXebur+V0V27fMWUdf09O35y/Gl38aIfoj/8MP+xe+9q7//5P298o0UCMAHtltF36w7iLA/v3ULbzU28Z/QcSlhC/DzrWc9a/c3f/E0peg3aRuMRvQEoIWBOOOGE1ete97oyYQJiW61nwIND8/KXv3z1spe9rEwyJu1oaj3fQIP/+te/fnX88ceXAU3fGp9iN+g8/vZv/3b1Z3/2Z0XrmFh8Kx7FbRLQAf/0T/9UikXsCiAWvYKl145C+R//43+UfKIXN4tewSoG3P7kT/5k9Q//8A/lhKDzbWtNZ7fsFWkfe2YAKiCcTzzxxMLe/iH2BpsCFf8rXvGK1Utf+tIyyQyxl6N48Ql72jH2CtTA+7u/+7vV0572tP3s+WXxHfb6VUzYez/GHkt+TEDYG5TYyKH1Lw56HLD/x3/8xzIB0au36GPYm6Rwfs5znrP6q7/6q0H2ntWLiT3sX/Oa15Tt9H3sTVA1+5e85CUlbvnGan3Yy/sNb3jD6nnPe94oe5OIejN+sX/qU59afNfsYzV7YxF7x9OLqTUcsGT6GHvHDbGv6/5JT3pSqXt8+9h7bZ8+xe25z31uYS/vdey9P+mkk1avfvWry/Ypdf+qV71q9eIXv3h/3cdq/2JRK2L4i7/4i9Uxxxyzds6Rszz+/u//fvWUpzzlNuwTC+bYZ6ES9mEZi76PvVz62Hs9lX30dd0fffTRq7/8y78s4138LXumbbWM84te9KLC3r4h9rT6y8mQ1jHGd8s+pu6xl3fYD9U9n2HvGOyf/OQn97L3SN1jryb++Z//uRxPX8/fsZq9PlrH3pzDP27Gn3jMhZnvW72Y1Zp9xx57bGGvPvjvY6ltcXuvhl/5yleW10PsjRHnCPli/8IXvvA2dUwfE4t6kLdY1ENYtpa6tzaQhzr70z/90172rK57NYG9vpZre+70Ouy990yvjrBs65jV7J13zIHYD9W9uVW+9plb1doYe/Nd2Ju7sadr2cecl8PeucE8NVb3Ya+WzX/OQTj2sVf36tH8ZG2EvXNcH0tmPGPjODWx3exx5t8+6y3srb/WsddXxx13XDm/GZtj7K2zmDWL82cfe68Z9talfL72ta8t5+e27mOOE4vzphr667/+69Wzn/3swbrXn+oee21g78J9rO4xDHtziDXtUF8ZT1jKxYWH84M6wr6ec9iRXT/93tq+O9b7fZ1Oux709+147927Z3t+xUhxKFIBmwR0sOD6YNkvKA/teS+J6Ov2+QOXVhuKAzSQ6GtYjF4Hi0VniMPxOgLcFha9gcC/Z3r+o68LNQagouA3vGhTeK3xS89v9GKn135t9olb/GmXxlUhNn16XPgPy62wz1V52mTaatl7r1baQmX0Q+zF07Kkx5K+j732WpvLPizlqT36dez5j9GMsceG/yns5Ybj7cVee9H31f3Bzr6v7sOyNfux9Mgcso59WE5hjw3fLfuxuhe7Pkv8YTmFPT3fjuljo0/DPiZXMfXpW/ba4J++NT5Tx3x5L8ehure/Zi8HDIfYYxKWNXv+h+q4ZZ867mMfNtpJLdB69NVx9GHPn1iG6pgey7rdKeztw0pMYdnqw148qQM58k9ft8nkhk09h9DxP1b39PxOZS/nsJzKPvHPYU8v1z72LGzSLo3Y57APy9bCXr7Rhz2WrQ2xl2vbV/yF/Zy6p8dIHNqLfrvYY8Ov/fzxPcQ+LNMuzXazF39iD/shljV7OeijIfZbmXNa9uvqXq78bjd7+8QtnrRLM8R+ndFr1wWQ5wO+QOBQwiAD4D2oQPVZn17n6Zg+s1+g9AHG/5CexX/08T+UW/w7ji7+h/TiprdfnvRj7Gg95BL/Y3oFGDbx32d9LGnH2MuVdo6e/5ql5z6LXvye5boT2DsmevGIs9Vn2+3Jfm7dz2FfsxkycYTlpth7MFoPcbb6bNs0e3rPc/T8YzLGnomnZT+VZe1/in4ue/opdS92Fv99Rn8g7MUcNkNW+5/D3jP9TmDvmOj577OWvdd8e/TZdrGn74s9+sQTNmMs438q+/i3XxweY/oDYU/r0Wc1e3q2Tr8d7OXaZ336KezDcivs6efU8VQ9i77P+ljO1dMOsWfRT2HPWv0dzV6e4olePPIe0ocNE8fQnLPOtCHWbbtAiCV4z2ydnzn6WnN76Me07PbQRzNHX7czZpvU15qt6Me0bCv6aDap98y2U19rbg/9mJbdHvpo5ujrdsZsjr7W3B76MS27PfTRzNHX7YzZHH2tuT30Y1q2FX00c/R1O2O2SX2tuT30Y1q2FX00c/R1O2O2SX2tuT30Y1q2FX00c/R1O2O2SX2t2Yp+TMtuD300U/RD5tiNXCAstthiiy222GKLLbbYYgefbewCoT1OQ2NG7xHdJvVTtHnepD62E/SJnW1SP0Wb5zn62KGg94hujn4TsdR2MOo9opujX6dlc/R0eZ6jjx2Meo/otlOfWKKf4jvPc/Sxg1HvEd0c/dRYNq2P7QR9Ymeb1E/R5nmT+tjBqPeIbo5+aiyb1se2Wz9kjtvWC4To/U2Vh/f+1orzviCj9zdS9P72y3/K8Dykt53e32Lxy/86vf+M4m+x/F1W/vZrSC/v/M2Zv+WiZ0P6/I2X42gdw4b0+Zsz+2k9+rQs+vwNGf/5u7vWaNlOZU/Pf7a3ZnvL3mNMH/b2R8+m6MdYMvrbg702MJzCMvqt1D32bEgf9p7pt5v9VJas1nvN9ybY009lSS8mcdBne2vZPnfOoQ/7dfoDYR99n5a1erFsJ3vbo59bx1P09Rwyl33YjOk3Xfdhw8b0tCx67+m3kz3DRg70c+bvg5m913xPYc8/huvYM9qp7G2nv73Y07Mh/e3JfipLbczR7xT2YbkT2I+ZY+S/rd8g+IlU/8M6QfHjJ6vyP/5jfNvnhiMKld575mev/G/sVg+Um2To6Oht9xNTQLR6oNzEhE6Cjvfs58BaaPSg8s8UEL3O4N9xrV6e8qVNfOKg97427/1PdfoCu3svPlzkW/tm9vudXP8DnZ7x73+053/8txaWiXUKeznTT2WfQbOOvT6i3yp77fBL3w5m+rD3Onpxi9+22rzH0S8dpK/Wsedbf4mZrWNPb+zQ2y9vvv16Qhv7EHssTUatXqzYhGHYY6M+W/1c9mpGPGwO+5ol9uJvzX4c1fJc9olV/OrYrzO0eiZ27KNfxx6bnCzCXq59dazt3O0zLOVxsLBX8x5iYOKZU/fyUPPbyV7d04f91LrfKns/o+m51Ytbvoxfen7vaPY1y+1ir236lr1ct6vu6W2v2dMnvhj9XPbtHEKf+b41+/vY42geqX0z+rCkt59+aM7xXuw512Jp2xh7daleomdD7OfWfXvuzHF9dW+/PNs5x/hTx963eufOdv6eW/fr2BtbU+tervWakUYs2Ict43u72GPZV8d97On472MvT/k61vsx9jR95055zqn7sXXLmNHzkwuEvW/sTACK304NMs8JMNtas18iglOA7s4HHLA6EwTgYvykMBznTopeA+t4BZgkGb0JSIe4ex7/KST+QRNDtPa5Qx1A7tjpTnoGFx0frZ6O3nHuiueukSZzx6RTYvSJAyd33nOnSZ1mn23ij2lHTplw+Xa3PWy8dww+MXqDUj+YeMXuDp9+/9d7HOvidjyGjsFwCnv7abVBLz5FSj/G3h0AW/Y4teyxkZs7dopfvPzyQU8Xfc3eHSDxMTmIeSr7TFZD7DPo3WXSBfA69nhqx11f3e1zKnt1jKk6nsqeTvx9dc+w13bYaxt7+jH27tjpLo8t+xg9vvRh766R2IuBj3Xs3bW2nqz62Kfu3WVyKntMsHe3T3rtjrE3kWKD6bq6t8/zFPZyxV4c7sDJx9ic07IXA798tCz72PMt5iH2WNK7wyf2qXvWsldj5ljtYC+msLcfyxj/NXtjVs7qXrvmwZY91riHvWP5x3KIvX1ioudX7QyxT93X7NXmEPvM92HPpzi008eeXj7u+OvOqdivq3vt0Lpj8Dr2mXPmssdGW2N1H/aOo3fezblzHXtzFK597Gm1gw1GzjvGoZjXsXecu9bW7Pvq3rbUMY5z2Bsj+gv78KDP67BP3YvFOUgde2+/uGqWWVTJTZ3JJezH6h57LD2vY8+XnPWVOMbYy7Vmb795u489XmFjblVrNft2vrctevOHecTCnc8+9tpMX4W9XMOjr+6H2MtjjH1b90PsteEYev1Qsw9LRi/21E/LvmVZs8/d9sOej3XsrS3wEPNc9rbVLOnH2Nsv3xgfWGCvHeyte7Nusb9mH7Odrzz69usPz7e5QADnmu71r7qHG6O5e7LHz7oBBEIGAsdgSUYw55xzzurd7353uaU0SK5AJJnio6fTjsH15je/eXXZZZeVDpSQm1ponz4wdKiisEg6+eSTyy2kncTcPMIxNADTB5ZjLPbf9KY3ldt3m4jcRMJEVxcfvclZERhgp5xyyuqTn/xkmbzcFS8TdPKlF7uc3W5f/HJVVG56kdjrYs3J4vLLL1+dddZZ5RbbOpN/23HilzkeS9vf/va3ry688MKixzA3c6lZep9J6Oyzz15dcsklRc+nG5rEf/Rhj6fYxWSic0MNNxVJ/J5r9k7U2GCvAN1QBHtxp/hq9hY92LtVuAIP+/CMPuz55N9t6x0b9nzXtRb2/L7lLW/Zz97NXhJ7zT6D7P3vf3+pTXr5jLE3DrC/6KKLil67bnDS1nHN/swzz1y95z3vKezlmRsA1vqwl/Npp522uuKKK36PPavZmyTCHsurrrpqP/sM3D72ajfsTUQ1e7XPwl5MJkPs3bY+7DFs2WfyN55S9y6gUvc1S5Y6xv6tb31rYWPMu4kLNtHz7T2W/OOOf9i7sQ8/fewxmsJeH8kX/1NPPXX1gQ98oLB3AykP1rIXq9oKe/MD9ibqqezd6IZf3Kewx3KIvZw/8pGPrE4//fRR9t6nr973vvftZy9Gdwrlp2WfujffvOMd7yj+7Vf30bOavXyxf+9731v8O+GZk/vY416zN98PsedXrNj/y7/8S8kZe/NZH3v9pL98WIC9eTnsnReG2Ish7J0rwt4xmUNq9moAe7k6FxknfeyxoVeT5557btHLyY00+9in7i+44ILVxRdfXPTa72NPF/ZnnHHGfvYWzdhrv2aPi3zlINcPfvCDZSFsvnEDKxb2YrIAw94Cw7k27J3HtZHaHGPvwwO5ZsFUs1cD2Bt74lFnPjBbV/cf+tCHSr70FvH0qbM+9pdeeunqvPPOK3o5iYe+Zpm6F8/555+/n732h9iLB3t1YGy17Ok91+zFFPbGu5scmvNp6nVL2LugDHsLTzcjtLBt2Ts3aEOt02OvH+RK19Z92GPi/KPuXdRhaf9Q3Ye9XC1y1X1Y1uwzh1iD4Kkd8dV1z1r2+uld73pXiUe95OaLLXscMXLed04Rj/Ngbr7Yx14b5pywt77EntXscecbe3X80Y9+tHxYKRbzWsueb/OadSX21ozY507MfezlgIl4PGsL+9RBH/srr7xyP3u5jNU9/9be5hH+xdfWfee8PP24W1Pwb5/jft3Vkkdufsz4zzpjz7XX3bC67vrq92dv7ZQfdpP0d7rJ87vdVdJ3usfPugKprzPSIVngWMAAqXGvNaC46VgA6yiQQRW8iQZsJwyfKAg8ZsA6MTshmkwsAiyaXIkZmJngmGftWySY9F3F8mcguNKj13G1XvvudCgWneC9Y50E6HVc9OJSMIrM4DVZ6Fyxey0vPGr/GJhEFCjTvteeM0lHz/gWgxOY3PEyqcvDojzmmLD3Wjxy129hX3/a4pkvuSpY/MLeIn6MvU80MMFeP7iixSaDjHmu2TvJ0BsIHi37FC5mTiqK3Hu+TUQGfs3es1pyF8KWvQmhjz1ejgl7gxdLz3PY8zHEXq2bTORuUDqh0vaxF2PYq1tjwATPD1Y1e6ywx1H92q8fLEJt72NvO/YWV/Rq3hgI+5h27A97E5J4sNcPfezlg73akqf21Y1J3kkvujyHPX5M+2GfEyRdjrGNTxpa+8fYa1OtiyHs1UXarWORi7qXG35y1Q/Y89PHHrOaPaYW8X3svbcdv7B3nONt72OvXbUb9uIy/4izr+7d+VRtyVO+ai7s67pnmXfxsy/sxYkzo88xxoJ96j6xGjNhX8cS9trG3nFhrz7aupeLepJb2Mt5HXtzxlT29NgbH/Tq3jFD7I037I2/sBcT9sZp7T8MsJcz9nLli5+WPa1zRNibRyyItdPH3jZjAm/Ptoe9fozOc+YQ813YmwfDXru1XtvYm0/xM7cZA8Y8P1jU+j72atix5nW51/qwN585L9A7Rw+xd34Je+cdTBxrLA7VPQbmHGNd+/rBvnXssZK/mpa38RPLMepejDV7Hz6q4ZZ96h5v8Ye9cRj2qWN6bWPjgibsjQHs5ep97V/7mOHugZW523zexx47/tWu9VDYGwP8aD8W9s7xYa99a56wb+seAzyxd45bxx7fIfb4xHKMWPQ39vrAdm35EKCPvXq1iDdv1OyNn5o9S91bw2GPjTEg3zH25o2Wve1D7NUu9vzRGgO2D7E3Zl2MOF4d6Ad5tezDQC06XvvY4MBPH3tt4M0XrvpB3nXdx37TXQx8r8vTuv67Xc1c3b3GtjXXBR577nzEYasjDv9dUhoH7cEd5Ed2V1EPf9SjVo989KNX9+8GlOBqE5BCcvXk0z4TrQnsKU95SoGr0GL8KgZ6t7YHx4QFgtuc6zyJJvnAobffs45WIE9/+tPLANc5KQ7P4IPi1t0KxwAVA71CdWytB1HB869jDWJFl/ba4uBT8dlv0hK/ovApNn1dHEzbPv3CQ3EYkFj5ZJcev9oUhytXt593AvNJwZOe9KTyKY59tdXsfeqBvYHjdv3Ym2BjYa/wsJez2G2fwx5f78fYY80XfdjbXrPXTs1eUYuHX6y0l0k7euyxrtmbPF1Z009h7xMQrHCo2atr27DXl7RT2PtE3DHYWyiFvVhjYsceg7BXZ0wuxkHLXu5hKS4s8VbX6riPve30mRDFPMbeCa9mb/IJ+0za0ctHXvTyDHs8xcdHbdjjJt+wx8ocQV/PI1japl/4C3vH5pPj2rRFT2t/2GfO6at7OdXstbmOvf3aDnssh9ibM+y3bx177WmXf3GIR1xD7OWj7tWWPOWLbeq+jz0u8sVxrO5r9vzR6q+w56u2sKfV/+qgrfs69rCXm7EtVz6wwUAdRo8RVqn7sKdJ3WO9jr34vNeuOayPvf1qMOzl27Jn2MtL/GFvvKvlPvZi1jfmjbA3n4yxNyb4a9n31b02a/bmQezVxxB7+7GnD3s541qzDHt1qd+xxIve9pY93vzqG/votbeOvXi8x94cJF8cxFtb2NNbU2CPo09Gh9jjFvbOn86j+ov/2sLeedj5c13dO7eEvZjCHqs+9uaQsFefcuVjiD1WqXttW7fwuY699h0b9t4PsXeOt9928euLdezVfdirU6z4r+uY1exxr9m3dRz2vuXTl9hboIpFXQ+x569mj621WM1ebpm/7TdnYCM/uY/Vfct+aM5xPPb0Ye94/j1PYe89VvR97HEQv/Uc9uo0dd/HPnNOzd6236v7Wxkd1eX4iK6vHtHt97C+v3vFMOa6wKP3PymXE7hHc1DrxHuAAXUF6+sfkF/0oheVIhasT17qBQHgILua9fWPTn7BC15QCoFe59d6Wsf4JMbX94r0ec97XtG5CktnMMfR6yRfFblC1THPfOYzS6GbOGoDWwc6TiyuMo855pgC2IThEZOrGOUqJ7n6tETsJi6+FXpip9f5OlxevhIWLzYGp22413px8+/KlN4kSK+j6Z2kan3Yu4L151qKhR6vPvb6xMPVrK+wTG7ix0H8Q+x9zeVrTCeyY489dpA9lnLG3hWwQfSMZzxjLXt/euDTEOydUMfYY4C9K/YTTjhhLXsTEJb2Y+OkZJuYan3N3p8IaO/FL35xYU8/xN6nFNgbvC984QvXsvfJh69uTXbY04yx95WhrzEt8vAZq3uTo6+nfeJggvNQY/S1qSt6hr1PYPWrE+A69r5ex0jsTgB97MVBb3LDXgzYm6CxGWLvEzB6x2NvLhmre3H7UzkTLfb80Lcsw96nrdg7makdGvqaJcNGG9j70zdcjj766LV1nz9Hmsren5qpH/OZ/h1jj5m698kY9k4AQ+zVvROROsYu7Nu6Z+krcxn28qbHnr6uY/7VpHyNV+wtgLDnZ4w9Lv5MUdzPf/7zyz7xD7H3Zwce5uLnPve5JQ56McTMIfTY861/zTfY41KzD0uxey125yzszWu0jonR8IuN7ereYuDEE08s9TPG3oIQeyywtKAYq/uwx5Y+89YQe59eqh1+TzrppLXszQdq03jFnq857NUQPo6LhT2m2JvXnvWsZ5Xz7Rh7bWJvvXHccceV8/kU9pjK1bwp1/bc2cfeHKI++9hnDvFpMfY40du2jr34jSfxiHOMvfMg9s5TU9ib651vLfie85znrGVvPnM+n8LetwFi90n58ccfXxadfezpsTQXYWMeH2LPMocYH9hrZwp731bpW7mo+3Xsrc/U/VT21n/OhxbYao2vPvZ8yyHsXRhhL+4h9uZx7K1jjREXOOvYWyfIWR24QOpjn7oPezzkaq02xt6FDfZ8YO/ipmXPymuPW3Py3jHJ0bPczNOet+VnTk10IIDBArYNjgEcvQAYSIDUC4EYvQLRKV5LgNYxdSEx+8SQArHPNrE4Rie1eh0SPcMgHdcWEr0OoRUT41PRYWh/a/Ril7O2M+Cx6dPTRc/o+Hdca/y17MURlq3RG5xT2IuNpo+9Rzso7RND9PbZtkn2YqCfwp6pl+j7DBt6x/FX91VrYUk/lX3YhD2tXLeLfVjaV7Ocyj51PMReLHJmc9hrOyzXsRcXw1yuc9jz37Jk3mOp7rFk6+o+bLbKPvo57MXUsvR+q+yj3wr7sGxNLnPY40dfsw+bvvl7O+u+r47nsGdY0s5hL1fP4sGE/746ZlthP2X+ZlthL1fx2GdbWM5l31f3YZn5e8q5c6vsmRyH2Ist51p6/rabfV3HbC776PvYqxf++9gP1T3fLXs59+nDJudOMURvf2utPizXsd9U3bdzSPR97NVx9PbZFpZDdU/rGPu2yl4d07f++9jzP1T30atjvsbYrzP+Md62C4QYaBxqAACPMaP30CYA9H1t86eT4z/6tiNi0esU/rxXFEO52c8v/44TB73tQywSj2exeIxZ/PM3R8/Es05P6yHH6IdytR2bOSz5jn4dywNln3jG9PFPO8aGPrFP7avo2Rz22or/vthj0cuR1nOf8TeXfc1yrn672bPEzqay3IpebPQefdbHMrn2WfRyncpyrl4cU9mz+J/Cnn++Pdh2sozFv5jH9GET//RioV/H0n7vsfTcZ7V+Ckt6ccQ/ffwP6RM7/1PY803Pou/zHQtLx9IOsYzVerGvY5n4p+pb9mMs57Bnicdz2AwZ/+krFv9DRh/2XqfWxqxmSTuVfXx77rOwoRXPVP1U9qxmuQn2yZWtY8+SK6OdwnKu3mMqy/iPnv91dWx/7X9Izy//NXvbhyzx8DeFZfyzufrkuhVLbtt+gdDCWefnQPRTYpyjvz1jZwezfp2WzdHv5FzZTtKv07I5+p2cK9tJ+nVaNke/k3NlO0m/Tsvm6Hdyrmwn6ddp2Rz9Ts6V7ST9Oi2bo9/JubKdpF+nZXP0Oy3XIeNnIxcIiy222GKLLbbYYostttjBZxu7QHBcjtWIx5jN0Uc3Rx8tm6OPbo5+TMsOZn10c/TRsjn66Obox7TsYNZHN0dfa+vnPjtQ/ZiWHcz66Oboa2393GcHqh/Tsp2kj26T+lpbP/dZqx/TsoNZH90cfbRsjj66OfoxLTuY9dHN0UfL5uijm6Mf07KDWR/dHH20bI4+ujn6MS3btH7IHLetFwj0nPoPEfkPI/7TRP7jT2vR1/8BxH9A8fdfQ3pxiZHe33LR+3urIb2/v6L3LEl6z0N6fum1wy+9dob0/jZQvvTiprd9SI8Lvf240LNWT8to8x9MsPQY8m272MXkPd9jLOfqw54eQ//RZozlgbLPf/wZ0t9e7L2fUsctS3qxtdbqp9Rx2GM0hWXNfkodH0jdyxOf5NWa7bc3+6l1f7Cyp7d/E+z5dgyj3W72me83xT7/QXDT7KfMOaljpp88WKunZTuNPT2mm6h7cWOjnSksby/23tNuJ/u6jqewr1luou5r9vTrzrXtHILPmP5QZO85dbmddT+VvW2sZk/PP+vzP2b08s4Fwm3upFwa7B6e20drtknYT4v5H+KO58v/oGYpkBg9oH4OC1wGnP/RDa7EaqO3nz7Je8+/zga6Nno6P/kkDvF4Lza+HVObNsUhfnHRKxLb6AGqjV6sfkJQ3vR8a0Ou9tcmHlz9TBitNvI/79PhrfGtjVrvOR0ec2wfe8eyPvb209fssZzKXtzaGmNP7zjxjLGnt69lb5vYW/b0fezFlMFZG30fe7G1LGMte6+11cfe/rBn/G6SvWd63PtY9rGnn1P3HnPZ09/e7Ou6Z1PYYyM/NoW9OUR+bAr7es5ZV8f21ez1xVbYD9U97pnPp7KXX/Reex6qeyzbOnbsdrCXF5Z0fGIr/iH2/GI5h714wnIdez8VOKfuw55NYS/2mn3GwNS6dywbYo8lhix6efbN31thj2XNHk/9OsQeS3mG5VbYr6t7to49fy17r7U1VPfbxR4fbcbo5YVlzZ5+u9jzJf667rUxpMceT3qPdez1k2NY2IutZcO0P6fu57K3H5sDYa+tdezFRT+XPd/aEHsfy7CnDcsh9ow2/Nax57/vUZs2/Ly759tcIOzpEvx1F+DV3/3u6pcGXPf4eQfjmm6/2zHXADgWnGQBcC8Bd1/0+8wCBbfuEHo6HeG3n+kVlps02SahdAgtoAHrN8/97qzO8Pu6nvNpdvTa1HHa89vAfgOX+Y16MfpJsACmTyHx7050fgdXJ/hdWfvoY/R8ZIKjdYzfCxaHbZ5j2tFRuDout/D2m+3JsR4M/OtkxeRZrn4jXa7ysZ++Zol9itV9DTDFUn8q7iH2+gh7x+srxdfHPoPAb56Lh87v6w6xNyE6Tp7Yp9CG2KdvcfR78zX7miW9NsPePRncLdBvtTumjz2OBprjxCImsSeGIfaOwRJ7bPCTJz41S/3Kt5yx9Bv+fp9Z7EPs9YvfQZ7L3u+Mhz2WYh9i77fg1Zr97ouxru7dXyTs/YzcEHvx2qfusedbjnwMsdc29sbiGHtaYyXs3dcj7B3Tsk/dh717Ykyp+7DXd2HfspRPWPrNc3XPr3Hbx94+LLXXxx6bmr02U/d+c9vvzfuJOo+WveNS99pR937bW91jsq7u/f66u49ulb08+tjLwf0YsHRPDPqw96itrXvjbIx96tJvnqv7mn3L0j59JT73WTgQ9nzV873jnPTla1/YT6n7PvbaxzLmfdirR+x9i48N345p2asDeWFes1c3Y+z55R9755O+OtZm6t6dXrFXXzl39rFPX4W9OUxt0mNJF33Y8xn25pt17OXm/kfuJ+BcIkdt1nVMLzcPx2EvB7lq22OIvTawdG+AsbrHXg5hr/5T9+oh83cs7N1rA3u1EfZ8r2PvtbpXS2N17x4X+OCCvRjH6t69XfDHHvMx9o7jW/+qg9R9y15uYS92Y3eMvXpPGzV7vsfYm+fp5T7GPufOsNfP9OvYG69qx+sx9ql7NYmPGKwDh9hn3aLmW/b0sZb9xz72sf3s9S8mQ3UvR+yds7Bn2t/PvnvNftQx9LCe/0UX18+63Pd1sRmHMX73XyD87//tAuGG0mkC4DTPIFzfQT2qmxTv3AV2ZJeM7cyzpCUjqTe/+c0lQAXLsRtBOD7FRy9pySjWk08+uSw2TLoWhe4ep136tK+DJK6A6C1M6C3E3PCKAUavTYWqDQuSU089tcB10nZjGwnXxUdvktBJOu70008vxxmgbt4ijnrSFQ9GcnZzqXPPPbfoFaGbe/Gts1N82sCG/p3vfOfqHe94R1mkmmDomTbEwTdW9CbEt771reWmSOKXv5sohQ0bYo+N9t0YhL8UX81ecWMp5yyy3QAl/j2HPd9OLvR8GxC440/Tx16O2OPuta+qnFQNYgMp+rC3OA17E4ubFom7Hvjakquc3OgFezcowd7NfNaxv/jii4t/7OmTa8te/Oecc05pA3sMsG9Zipte35x22mnl5IiNeN1xcoi9iQhLk3QWG6l7+rDB3UN+Ye/hDoy53XofezGHvUfuZDnE3vir2cuV35a9uqd3o5fzzjuvsFcX69irefzVgROqm//Y37LPCeDss8/ez95krhboh9jLFXtsjFPsWz0/2Gv/TW960++xT9237PW7hfIpp5xStPoWeycZmpa9MWveE49cPdwYydjCMXNI2GNjwXnGGWf8Xt2bmzzCnoUl9ueff37Rmw+x56+PPUZvf/vbV+9617tKHRjzQ3Uf9medddZ+9vIRT1/dqwU85eoEho96kS99PUel7sPeydGcYy7GnrXsPVycq3vccXUzTez57Kt7OuMQd3zUgRP2EHtxn3nmmUXrhOpGeH3sM9+7mdMFF1xQ9C501HEfeywxuuiii1bvfve7SzzOdeb7IfbqE3vnFLk6foy9HLC3MMEeD+z5r/Vhb87DMuwtfNx0ibXs1b0PJNR9y56mPnfyrU7EkLo3Lzj3OJ/3sZeD8Yo9rbawpxtj/7a3va34d1Mz7OXXslf34rnwwgtXl1xySalj29axNwYtOuWqPTcPG2LvUbOnMce2+rC3oFX3PoShd7GIJ6vZm8vEohaxF4v49ZPFXh97MenP1H3YW3z2zd9y82GNWlPHU9i78Rae/PtQ0RzCX1gyMWGJvX669NJLS+x8DLHXL2oNewt4tWZ7H3t+1Q5/6jgX6mHPf63HEU/x0oc9juZw1sfeHBz25kzzUy7u++qeX+subFxYWO8OsddX1mfWFvTmN2ywN35TxyzzPY41e3XP+tjz79ygv8SOF/9Y7td32nJMt018v+3y9nz3bp6U3+Fd3DF650fx77nuhn2r6/f97jdTNepi4IHdQpDI6wd0i5L73VqosQBT8KA4oQqG03wKBTBd9AKyIJKQT7sBBdsJjx/tSSp6gVtgSthJhl4H+bTWdu+jDwyTpYWYk6L9JmgPxaQwar2TiHh0gEKhN6i9dlEhrzp+JzYLZAu3tOeEwQxmPKJnihIDBaEItO+bEO24mzJW9B5eW3hjYKJQOAqI3hUknrHoMaMJe+2LjdaJILF4Dnu8sXfFaCJbx16Bh71+wAfLPva20ypa+/WB17bLp9ZjbxCa9J2cxKNfvRanvOr4McDewtT7sMdhiD0G+Mld+ybFsGf0HnzwjQFNyz5X5Iw+dc+veMTC9IMFvGMSi+ewNxHJUa5ei58fC8majfbDXi2Hfere8bW+j73jhtg7gWOmfXHwp1+H2Kfu5cq0p27U9Bh7LMMeS+22dc9sw4DeGFnHXpvartmre+OnZc9XH3t1x486rNmIFTMTderea3zMLS177+ktxOjC3mt9xV/ioddey15cXptz+upeXvJj8pU3ruvY84Wn+US7bd0z2/RL2POLPR9D7D3rf7HYLh710cdeThYD+IW9+dbY124fe3Wbuk8/2N7HXp/wbazQ0w6xV2PGW83eXGgeVCNyr+PHwHg2rlnYy6uPfcZ+2Gsfe+3iU9e91zV7Wu07Vwyxz0VVH3tjNLF4DntjOnWvH9T9VPZeh732ar39GPNtbgp7/WB7FlXRY5C6xzvsnY/E2cfeeQwPrOiNAedkfWj8R8+wr+s+7M3p+UCL3iPs+VTr6p4/r52vh9g7TvxhoR+G2GNgHWFe0I5+UPfqrGWvfYydL7Nu8Yyn+p7Lvl23YICZePEWj1gsRMfYq3s5a99rfcpPWMZo++p+jD2fNXv+cW/Z24e912rXceIOe20kFs9ylxP25gVsvJ7L3hgYqnv+sbcW9V4f64ch9i5MxGvdSx/24qnr2HMY4KHuWvbtnIOv+sNb23R97GP37LY/sNt+l87vPbpzgnW+59auu37f6robblztOfKIw1Z3Pvx3V4936gL4VZfsV7qrzO93iYDw1S9/efWNrlEJajDmNeA+cXd7exMziG5fLxnJ1QYGvVuC+5RER0jIbb8Vmc6qYSk2ere91ik6TSHyD4BCrPV80R9zzDGleOh1jvdOkG3nOT7+HEfv06dnPvOZ5X07cOTDr3jl4sLDVbWrO/5tq81ANCkee+yxZWAqomc/+9n7P2WpWTLb5EmPuwnda4WksGpTKPQ+9X3605/eyz6xM7nQY6+/xI73FPbax8bEMcYeA/GarMPebcj56WNvMnYLdPvVAvbPeMYzip8+9gqeHmcnL9zxH2JvYhGvxQD2YtGG9vCL6Qd8DXC1QjvGXlva9AkMnmIRo9jkrO3EzsLeGPFJQ9jTr2MvByyxCnusa30fe3V39NFH97LXXtiLFXs1iT19H3uTOj1W8nVreZ9S0E9hLxcnOyzrutcPYS/esHfsEHttYv/Upz61xMLElhNPYmcte7nS0GMwxF6thL0+Eg/Gbd17H/Z09I5zvO381fqw508c4hHXOvb0TL7yln8fe7zCHkc81bSTnX113Ye9fgl7/eVYPvRjbWGv35/ylKeUWPigb9l7lgsGclNfcuVzCnv1G/bY9rFX9xae9vNHr2Yy57TsHc+f9sVqHPrU0hgO+xg9jfFM7718ac25fezlpv0h9rXl3Im9sTGFPR/mPI+avXlxCnvtycU83rI3R9ivDpw/sDSXhH0752BpLoq/sJcLP33sLXzotY2989AYe3HQO6/J13nOukE8dR2zlr3zJ/bOp/zXFva4OB9j7/ysLXW3jr3Yw956oGWfOraO0L81e+uNPvb8i1e9YWk8YW/7EHv7+VvHXnupe8eKB0fzCH1dx/Qte2sL86f+om/Zi1H74nEh5Js9r83p9tUW9ua8Zz3rWcW3dSWWQ+zpnW+c67FXK2E/NIfwjT026oV+iD19zZ5f723vY29BLj/P9GpsjL1xhKW2sDd/mD/p2zmEHgfxuojAxxgO+/rcyeq6dyEU9mL6Pfa3Hvf97iLrK//1X+W/Dvy4u4D68pe+VP7kqPV75J27C73u2uA2v2Kk873/dTfAHORhu2dXH21xpLgl4qtbSRh0zCCtLyoCmManB/68xORm4BugktNWbYCB4JMEf6uu052gTKb06YyY4vbwNZqHE6mJADyP2sTFtyLwdZ0rNROWDsoCPaadTBSexe6q3SRg8Jlk6OtcFbJcMfDVmMGTQuJfDrU+xSrO/E0nluLLJFbrbac3aHzt6WQpHtbHHkvxu4IVv0lIvvzS09QW9q708bG4xnOIPa1j8pWnfnLMGHs58+3TIXVgYhpiL1fH+fMo7E0CFgbR17nW7LERM/byx9KnWLU+dSxOdex4etvH2Bvw+nYqe5+C+DMX7E3Q6+p+Cnvt0Kv7sDeZGit97I1hvk1mfBv72Jsg+9hjQe84dWNSVJcWBn3s+ZXrHPZYygt7x/M/hT3/JmqTKGvZM3OOtn36h70aM0EP1X3mEJ+I+XraycwJVZ5Y1nrt0GojXzdbRFgUyseYr41eLHL0NbWY1rGnZ9gb6+p+CnsssbZg1n/r2JtzsMVeu/y37MNSDah7J13s7ePfSS161rI3tzrZD7FP3fsUzJ8eYO+EimMfe1ox+2rdn4fybWHSx76u+7C38DEWxUJf51qz9+d4znHYy1mu7fzNL5YYq0s5qvt17O2jX8c+dW/uw14NTGHv00t/YjSVvT+38KcWLp7U/Tr2/qTEMVPZi8U8OIW919j7dDzs6YfqPuzVv7qXE33LXtz0uBkndPyvq/uwd94Rv3mbfmj+NrfK1yIOn6FzZ/RqGE8LQo+++btmr5+MFfOZReEYe7mJxdpL7BbC8m9Z1uzlSqMuXZSEZYwmdS83LLFQ933smbrnX5/Smz/5d47XVnvuxJ5/3wioBRea5syp7HExJw+xz3wf9mpe7a9jb35yftavc9gbs9a9Q+zlKifs5YeN9cU69uZvhj1m/Nd1zHz4z4e4OgelHX8ldLeuPxif+sE49tz7M6ceHAQj917f1E1AfQYWwDqGj4Btg2Pe04MmCcUQsO2JnXlPl07hM/p2Qkxy0StEMOjl2KfXISkor+noAbe/Nu91CP8KXFvikOuQXgzxr21ax9D3Gf9Y0js+LNtBFtskezUQ/VT24hBPzZ6+j03LHhODYIx99GKr+6o1+rns6cOS3V7ssWyN/kDrHkuMWpYsfUU/te6nsme1XqziphdXn7Xsk6u8+6yPPX1fX42xH6t7Yzws439q3Q+x934rcw7fHlPrPnqxpi7XsfdwfPRj7MMS+7qvDpS993Q1e3o5j7HnHydMom9Zsq3UfdhgL25sNs2evmXDNsVe2+0cwmfq+EDZe3+gdb9p9mHTxz4saeWAxybZH0x1z2o9q9m3bNiBsMcv/luWLHpziGf9E/0Qy03XfXK9PdnLozX+5JNWZaZNcwnzWn6jFwhzjVOJa9xrUNf50viB6D2PWeKh9RgyfugKjK59cWynnkXPEs9QrvzTztEnV2bA3FHsba/ZeC+eMaOLfivs+yaIWPT4sCks+fZgU/Q7hX1MPPzRjbG3v2XJ/5BFH5Zz2U/Rb5W911thuV16++nmsjwQ/XaznKu/Pet+E3U8V7/JOp6r33Td828//Rh7Rse/502xr/WbZL/pOp6iT98m1zHjh3/P9HNZztHTegzF3rKcq1/Hnv72qPsp7Pk7EJbxP5YrvXjYFH3Nch37MYuvbb1AYBzHpvhY9MN2KOXKdqr+UMqV3dH6QylXtpP0h1KubCfpD6Vc2U7SH0q5sp2kP5RyZTtN32d8bOQCYbHFFltsscUWW2yxxRY7+GwjFwiOqY/TiMeQLfrp+k36ZoeaXo2PWa3fdCyHkn6dlvlaNTbHN1v0v2+1fp2WLew3o1+nZQv7zeg36Zst+t+3Wr9J32zR/77V+nXaMXPcrAuENsjW7Hdc/lOE9/5jiP/EMaT391HRmxz9BxGPIb2/v6L3LGi+/WeSPj1//jOH/9ihHX/HFX3f4rBP7z+faGcoHrw87PcfRPjv09PaVuvDRrtDernmP1ZFn3212VazZzjSt1pGv5PY80+PzVbZ5z/ytHpa26Jn4qDPvtqybavsvZ9a91iGvWOG9GHvOPqp7MWFoVwxHfJfsw/LTdQ92272YpbrTmBPL+657Ontp5vLnl5crZ7WtlovzzuSPZbRh+UU9p4xmcpeXGE5pe711RT2fNOzKezptcGm1j299+vYt3POuvkbE/8hMizH6l5O/NbsxS4H7bbG/1z2qUv+psw5m2Qvhui9D8sx/Vz20U9hjyW94w5F9uqe9enDUl1GP8a+nUOmsBfPpuve/uinsLc/LLeDfW32x6LzLK5cIOx9Y2eg+MkpO3NQDgXAg9UOmfeO9XOD6egMItt1Sm32Gyx+Ii+DjG8TGNOBtdnPL/+JIXqw2g6nB8pPAWa7duglq8hr48NPQdHHogdZR9bGv5+6w4ppQ3zyFYs2WuObP8fSp1Cw0X7Mfuzo5RA934oxgydmf8ueXlsY9emH2Duur6/4pc8gWcderHPY+6UAv28dm8seR6zmsJfTHPZi6mPTV/faWsfecYxO/qyv7sXax16e69h7hCWOLXt6dV+zz8lpjL1jvA5Lj+1gLzcsN8Vebljaz7bKXtz41Ebfx55/3IfY48mi539d3XsdluvqXky1Hiv6vrrHkib624s9/9qLiU1e/PfVfR97+9Rx/Exhn7p3DL18+1jS0zpGbGG5XXOO3OayxzLswwarPv0Qe/v62Gu7ZU9v33awV8Ope5Y5Zw57jz69/UN138dejti07DEeYy9mtp3sbeur+yH2tg2xH5pD6jmHrWOPZeINS4+WJbO/j7026G2LeS23vrofYi83LD2zrbCnt0++tdkW9mEZ9rj01fFc9nXdO2YK+766b9nTYjCVfSw6vB3vfa3Thp8O93ybCwQB+61UN1Iw4X/n299e/ayDDYDfW91TJcQpUAD5BuLiiy8uvx3ut4350QAI/MYkowP8Vvs73/nO8pv8fpdcoPXEwrdt6Ti/1+729UD7zXBt1h1CLw/+Hee3kN/73vcWnd/7BUw+AUxvG73j3G7d7e7F7b4GJpZa71kh4aQD3ALerct94g2mduoTJD1miklni93vgPsdZ8eIsS5u8cS3O/Nh6Td5/V5umLT6mv073vGOwh4b++TRsseyZu83eelpWvZ0mbD8Zrjb14sv7Ovipscwer9tjE/NXuy13jbxt+z9xnHbVzV7z/pVG37GzG8z8zHE3jHvete7ym8Q+91wV9Zj7P3WMvZ+V13s6sv+emLxPuzdv4He7yFPYe+38sXjTozq3ra2jm1Tl45v2WPTshdH6t5vIWOPidppWdKrbeOIBnf8xeC3vfmip2Nhr4bxdDt37N18xm8zi3WIvTbkKofcGKuPPd81e4zEHvb0Yel92Ltvibr3jA1r2XsOG37VvfGFvfyH2NOrGezFxz/9EHvHmQ/e//73l9dj7BP/FVdcUdgbd2GvPmOOM/Hj6Tnscce/j71YacUU9sZUmLfs9RH25gLs3TumrvuaPcuYdV8a+rCnrdl7X7M3nsQT9mKXd8s+87258tJLLy11lLoXyzr22hqa78PePnV/5ZVXlv43L9jWx76ue79LPsY+da8Ndea+PdjTyallb0yLKezNy1PYm+f5N/dgSTPG3nkEe4um1P0Ye/fbkG/NXg5D7K+66qrVZZddVo4dqns1Jl/71P2HPvShEm/Y09Oxlr06wN5cbw0yxN48JSZsrBfG2Kt77bofA/buXxL2/NVzCD2/uLnnAL17S4S9Y9SR17SY51zoPgXYez8059jGv+PDXv7WUVPZM+zVUz5tZvRhb9/ll19e2ONhLTI05+COP/buPTDEnn+6mr17x1hDpX6nsJ+yZnSvDXr3L5nC3n0KrLu8V8dy5Xuo7uUpX7yG5hzbMg5xxNN2N0Nr2Xuu2Zuf9Bd+Q+xx91DPzj3qwfrSWmeIvTaMbWywF4s8Wcv+J9386/m67pjvdjX8C3XX7eM/zMVxn65NN03e+z//1/96474b9nUN/e4CoQDogncL5p92Dd+/6+zfdkVzZBdc3RkgCVAyp5xySglOZ9vu5jZ0SYgeEMlbCNCbEJ2QJOFmZrU+cIFVGKeddlpZhJnsnEzdeITRO45eYWvDxHzGGWeUhbMTkxvEgEaT4vNa3ApJp5133nml8NwsQyxOBPUkyuSqkwxgA8EkISY3pZJDXUzaUBj0F1xwQSkkJ1ODwk1N6MQuDmzEkUI6/fTTy4RoMrLNjTgYPW3N3iPsxa69sE9xhD0+FqZhb8GkQN2Eq2VvwBsMYW9BYLIz6YY9/2GpX7VtQRL2/LsrKPbyrdmLW84G2fnnn19Yit+NkZyAh9gbwCZc/sWEPb997DHi2yKM1okYe+1nINfs1Rv2Joqwd4MVloFcszfRnXrqqfvrnp++uscRexfD9LTYuFAMe/7DJuzp3vzmN5fY1b1JVy2zlr2YLKrOPPPMwsa40k/6C5eM25q9BZLaDPvcrbE+gTF6/k1YHjV7Wvz72BtT2gh7N4YbYq/u5WpCxN7Y5J/VLGv2J598cqlJnBj2rI+9cafu5WlOMCHWdT/Gnn6IvTjVJfZnnXVWYalv3ThnjL0Fas3ezXnE1LIPSyc67C0KzSPqkrav7o117I0t8Rvz2OMxVPdydQPCMfbytM8JG0s1aR7hz42FWB9782rN3vh2E78h9mpXPPKkN39YEPDZx17cYe9YX487R9TsHRu9+SDszW9j7OnN9eZ87D2wNz8NsT/33HNXH/7wh/ezN+dov2bPr1rAR67qB3vvh+pe/BYzWOKCvfaNW9bHXo708gx7N/Fr2dOKXe2+5S1v2c/eohN71sfeXHn22WevZS9XeufBCy+8cD97Y9Y8aA7pY2/R4wOhsHcu7GNvPhD/Oeecs5+9i1H6Pvb8qzfnNh8EqE3v3dwzbBg9vy17uYZ9qzeX8WWerNlbU2DPava02jCesJen1xbNFqqsj701QtirBb5dcOGIEWvZX3TRRUXvIhN7XOq61wa9eHz44sMm8cgFS7qhuheLC3VrIjeUU/esj716cy60VsPHHIS9Oalmqe6d3yyAsVSf2MvPnDPEXv3qW2MKSxc4fez5FrvzyOnduV+u+gp7F4w09bol6xwf1Kg1c5t4zGcW8kPsXRzgiaOY5CqOlj02cn77299ejhGP/sIec8eIo9Yb6+Y/Hw5ij1XWjO187+7Jd+/O8Td0x9zUHW+Nf23Hy3OM/h5drXYHrfbs23fTat+Nt3ytxTQqaB12Yxfow7tFhoLgfG93oP3RCdgC0KQjKDrOnUAUtpNqjB44E4hnFyGCT8FYzLiqin/t8ZfJDGgTiQJQXE7u2qWL3iRvcU+jI+lTAPTaq/UZsAYcjf1iAVOHZ1AyzyY+iwSxM3q56jQLAh0dPTO5KjJs5Exn0jKI+cGK3kObmFlUuIBSlPqB3glSwdIweuwxw8BgTOGEPT8x+jH2Ym/Z84eN1/jU7LFp2VtYYqxuaMJesfexN5jEk8mIXixy0O4Qe/kx/kzYnsUvr+hZ2GOTSQ1X7LPYoPfw2raWvWOx5ydGH/ZyphEDH7iGfWLxzJecxOhE1se+ZoM9xjSpe1xNfGN1T5O6T03T81frTZZj7MVbx1+zlyd/2GsXh76691D3U9lrI+xxwjV+YvRhL+b0Px+pe34Si+ewF0fYq0m5Y68Oazb2Y5YFmXZwH2LvPfbR0Nd137LXnna1T6M97OXVx14t1ezpcQ17x0XP6rrHMexxGWNvnqHFybF8DLHXNvZyC3sxDrF3nBzD3mv1N4W9uURdY2y81Xrs6Wky5zjOuNFuzV48Ya99mrCXM30WAtFjr6aM67DHRhxD7D3Cnj/s+WnZG2u2GRM0Nfv4idHbJ3YxpO6Z2MbYa0eO2Bjr+GBvDqhZ2o8lTeaQsLddn/exV/M0YW9fH3tzXMveeMRJPH11j73akgN/6l67feydH83V+PEV9tYg/LTsrVvUg7rnWxz899V92NPV7MXfx17b5m9tZv4Oe2ymsne+HWOf/mnZq6U6Huwxq9mrG5xa9qxlzx+u1kstezmGPZZh7/UYewz45Ju/KezFI3bbxc/PGHv50ltA44qNHPrYR+O9Z+zNOd637PlP/4S9tm2v2dNjL06xeN+yV3fRMxwxU2e48IeluPnBL/q57H0j4C+A1KQLAMfefGtu9tW2b9+N3eOm1Z47H3HY6ojDb7kaZBy5mjisc/SN7irzB1dfvfpmd1Wig9ySuU5G47a7ij7ppJPKxA7Yy172stLRNSyWYnOb7KOPProUt0Re+tKXFpCSi96z4qA/5phjVk972tP2d7K2gK4L23NOiCeccEK5OqZ3pfb85z+/bK87w7PjTfYvetGLykDX6W5BnltVizcWvYJMvOI/7rjjyidKrZ7JRyfg4bXB+ZKXvKQUkvet8aEIXv7yl5f38vfaiaTVY0+P/YknnljYm0jEpmBqlizs5ecW9GLXR+IxWFuW2ta3xx57bPkkAEtxh33LMuzFIqawP/7448t2/lq9waZ9+WH/zGc+s9xWnL5lL5+wN7EbnHyHPR610WOPn9cGp2MzgbZmm8lPX7Ep7NXYC17wgjK5qKMx9rZhLz/sTYZj7Pl/3vOet5+9SWyIvePpa/a44KPdlj192JtEwv5Zz3pW8WNiikXvpIGNiUq+xpT+pR+q+5q9Y02I9K3Z5iRArz35eS22Vh/22jbOxSIm/s0lfezp3d4+7MX24he/uBzXspc7H8a1T2GwdKLA3ngYqnv7ffsV9o4fYq9d7cvPAktc+PPT1j195kh9Jl95h31b97aFvdjCXm3b15pt2PNPqz3H8tHqwzJzatg7Vn3ULFlOcHLzkKuc1Z1cWpY1ewyxzPzGTx9746Fmr8/MWfqqj73xhr3xpxawVxv81yzpxWI8y8/4lq/xbty3emab/PDWNsNyjL35KOy1l7r3urawxwV78595EEvz4hB7Yxp7Y9xc5lyHfa33HL05wzcYLftWX7M3N9Gbq8xZQ+wTr/MO9s6z5kT+h9hj6bxm8SwW3/a0ekYvP/zWsXcsvbjF49wZ9up+jL3aDHv9NsZebckPe+sLdaeO+uqeXr+GvRozzm0fq3v1Q+8bQnVPz1+tr9ljir01gHUYfR97fRT2+GDvE/tWz8KePvOX19Yy9K3ZZk5Vi3yrF+yNySH2xrXaEruL6j72nsMytYW9OLSFfatXK/SZU8PeOLe9j7017gtf+MJyPqO3NrVGpe9jb62IvTlS/Na+jqEPL0Yf9njoY3WvrTH2aoueL/uH2O/p9t2nY/ez7uLj29/85urb3/pWeX2vrjZ+32vn94jDu8dh/b9i5HFj9/oaX9t1k6ILA19LCCDJswAATEf7Ksdrk3WuhvmM0Qta0bnq8nWRTlbkTh46s/VPr2NdUfnaHwzFyDd9a4pNDP6kwdctFrVOsNqTZ2u0jvFVjj9DMCk66UVfd4j8dZpO8TWRK1rF5Hh6E0f0Yld8/HuWq/1PfOITSxHRY1TrFR82XvuaS3v8Y0iPca3Hnt6JC3uvx9iLG0tXkOLBRZH3sWfpK1f32Cs6Jy/aMfb+lMZXvCZgg0Is2qhNHlg6xteBjpnK3leSrsKnsMfaV4AYYc/POvZYOm6MvTj4D3tcsfd+rO7D3kRtYbYp9iZgY2sqeydeC4ch9nyrN1/F++QMSzHKR84Hyp6eYel48Yyxx0acxom45TvEvq37deyj9wmXfC0ysOe7jz2W4vd1M55T2edPUNS9HMRX1zEbYi9G/sfqXq5Y09PQD9U9Zth7j70PM+j75hxssKc3XsfYp459gqYW1rFPHYc9rUUb30PsPczdNXt1o42apdcte7nKZ13dG4P6J+zp+9jL1XHqEsOwH6r7mr12xIN5H/u67uld7JhjxUFfs4xebmoGewswPHGkby3sfQJpjqV1DP1Y3fsTCOdP85/FW1jWJo+wd1726f4Qe7GrX7li5M9naLDEyGv1VuuH2DO5tuz5ETsdlliFPf+297FXU/zX7LEZqvuwV8PmcMf3sY8eF2sL52ULRdp2DmE1e2s3dT+FvT8tMrbkqr2WPUvdY6/uxYAlxl4PsbfNnIOFcyebwl7u5sB1dR/2Lnas64bqPiytEdTOVtire2xa9uLKOMEdf3XvIsD80LL0mlYbLft18726UVtT2WNjG73nlj3zTYE/KfpVNx93O8qxR3a1kW8SHGfsYeB58GdOPe//2qE7yIEerdkmGdAUoU6XFJ9e9xk9LWiKodbXyTDvo1coEo6+jjfmPV30KSJg2/i9B0Ec9AYEv/w7rjV6HcKvTnSsAvJoO5pFHzb2J/a6o2sTQ+JxfPRtRzP7xRL9FPb04pnCnoUlvZij13Zrjo/e8xT2dFjKu2bZZ3VfeV2zbI3/ln3897GnV2dz2G+y7tlW2GdyoaMfY59ccaIfYk9PM4d9Xcdiq/V9LOnD0vvox+qe3mMK++insA/L6KewT65hH5at3vuavbzje07dj9VxH3v6sTqO3vvo6xN1bbV+DnuPev4eYs+/OnacHM0hfSwZPd0m6p45YYu7Zp++6mM5NN/LuzV6MYeN97W+9c9qfc1+qK9a9mE5xl7sGNFhw3/LktGH5SbYb1fdY9MavZij9x6bMZY1+3VzCOtjTz913cK/55Ylo0/s8q71rQ2xp8eyNfq++X4d++Rqf/R9dUxfs8eDNn3V6tmBsh/Tez+VfVhGX7OfWvfyFEtfX7Fab/4Jm+1gz/jsdtzypjse/1jiXXuBMMc41WhpuDOdYNuQrwRB7zX9mEXPn9d1Qn1W+6cdKqLa4n+unnaMm1hqNrR3tH4r7Onje8xa/Xay59u+hf2w0Wo//odiifHP1untty/6KbnOZbNp/VZYblIvHvHSHox1Lx6vxZMY+8y+sI9+zGq9OMbYxGhp4n+dfg57vuOfdhMst6qfw9LrOXpxTGFJSxP/6/RbYc/mspmrF4ttc/RjRj+HPYv/xL7OaMUb/0Oxx8TD1untty/6uSw3oU/dsE2x559eLOtsKstY4qddl6t9m2I/Znxpd1svEGKcs6k+NqmPlm1SvxNyZZvUR8t2kn4TubKdpI+W7ST9JnJlm9RvNVe2Sf0mcmUHsz5atkn9TsiVbVIfLdtJ+k3kyg5mfbRsk/qdkCvbSfpo2Rz9wZjrkPGxsQuExRZbbLHFFltsscUWW+zgsvYC4ZbvJA7QXFTk6w2v8xiyev86Lbs99fmaaczm6O2Lpn49ZNHUr+fox7Ss1uw0/bpc2Ry9fdHUr4fsQPVjWlZrNqmvH2NWa+bqN81yqj6vx7Ss1uw0/bpc2Ry9fVthOVef12NathV9NDtNvymWc/V5PaZlW9FHs9P0c1iyOfr22D6LJq/HtGwr+mh2mn4OSzZH3x7bZ9G1r4dsN+m3m+UcO+BvEOj9pxH/ASf/KcJ/KPGfxgTqiqQ2++nqXwrIf8joM/vzn0ASX/5DRuub2S8fevu951sbQ/r8pw4m5vyHt77Ybav/05z/dBK9+Gqjt40+/xkoes99/jGp9fz6n+ZDLFv2/vMM/4m1Ntu2wp5/eYhhHfv8hxr7vZ/CXn/x74p10+yx1E6f/7DHiPnPP1PYe2abYs+X91PZp6/EIqYhferefkzkKue+2G1r2Ue/3eztn1L3WHr2fi77sOwz++WJD/1W6n6MPUvd279V9p779FthH5b2bzd7cYhnDnt6vmp965vZP6fuWd1XmNDPmXPWsccmc8hc9mHZx9621PFc9uLy3pwzhX1Ybjf7TdY9lvSpe30qniH2GNJ7ZtEPsQ/LrbBnOJrvWy2j38q6JSzFR3+wsK/rnq1jP6fu6es6ZuvYt3U8te7tpxdL3xwSq9ljSD/GXq5Yek1Hvx3s1xm94/INwt43dga6n6GzU4N5sDz3mX06zk8xCtIDYIF6AFwbPUh+slRbmURtE0OfHlg/J8oCIIPI4KmNHlg/b8XobQNPJ7aDxz5aPzfF4p8PndHX4WJJ+2L2zD+tY2qzT67ywyWMFJbYdUBMLPzRiyMsbXM8vRxi9DX7xGJgOH4qe7E4vtVraw57ehz9rBujn8redvEz7A2IKezxmcPeMXPYY+R4bMbYe629rbDXTh97ec2pe+M3Y5h/26bWfdjTY+/RWh9771v2fNsnVzymssdS3LTJYQp7x9Jry/Y+NtvFnvHfskzd205vGx/y7GNPq87ZHPbincIemwNl73j6lr38/FRfzfL2YO94+pbl3LrHfk7diz3xTmUvbiy3wt6xePbVfdgnFjaVfVhuZ90Psd+uuh9iz3fLEr+afY7BoE/fsqd3rMdQ3dPHLxti71hxi5+FZXLp0w+tW9g69vEf9mqzNvoDYR8+28UeM3VMS0dv29w5x7F9LMU5lz0+LOxT9+Kvzb4+9nwMsdevWNOL2bP37RwSa9l7bIV9y5I5Zp05xk/Jei4XCDfeuK8DdEvCHGjE76L6mdNs6zPbTSgCc6vq888/v/yubW6yY7/n2q/kvXeL9re97W3lt2Hd20DiHiBEz2/0V155ZblVtfsb+F1yvuripgdJPIrI7dnf/e53l46kt60GTA+i/TrDLd3dVpzOb+by5YozgD3rVA8dLna37Ne+3yuOPkbvRKQNMZ933nnl9tx+99nvFevEWi8eRcqP34l2u/7Pfe5z5T4CrtwxqE+Q9DV7/v0GcW6yY38fe89u0e5299qRaymEAfb0H/jABwofvxvut7Ftq4ubXty44Pee97ynsJd/2IulZo+5/Qqfb7cVx0QttCdIzwYg9nK+4IILVh/60IdKDEPs9WvYYylnv9nu94rlVp8gxZPY1eNb3/rWwt59IsJe/LWF/Re/+MVS936zGHsx8TfE/uMf/3ipHb/Zjo39LXsc+K/Z+43m1P0Qe8/YX3rppYWXvm3rHpuavTF12WWXlVzcXwT7tu5r9nLFnk98+B9i77fp1eUU9nL2G9T6yu33/V7+EPuw/MIXvnAb9tofYm/8qXu/2R72ODquj/0VV1xR2PtdeHUvdnnX7PEKe9xb9nXd1+zxdDv9Kez1k5NA6p5PfMbYuydD6t5vtpvwx9j73fuwN6Z8AjXG/vOf/3xh73fGxW4ebNlrj977j370o4W9b6rXsXdc2Mubfoi9OdPzJZdcUmofV/ox9phif/nll5e21U7mkJp9xkjYX3XVVYXfUN0nlrB3jsN9HXv3ezBOMPX762PsbTc3icdv1A+x10fi9v4jH/nIfvbqmOFYnztr9rhgrz16+8bYm+uxxyrnzpa9fXh6XHTRRaV/p7JXZ9jTOB+Osfe79Nh/6lOfKvON2seiZS9XeWFIbx5X9/EblrHMCZ/97GdLPI5zrsKknb/p0lfilq+aUJcM95q9fNQC9uaDd73rXeV4+jH2xjn21jpqe6jua/bqwDmFn3XsLcrVpfpRk33s+THn8KO+6D/96U+XNY57u/SxT67WK9hbv6j76Gr2nrHg5zOf+Uype+NFncmxZc9v2H/4wx/ez14d2zbG3hrkne98Z+nrdXWPvX7C3mu1wJccapY4mm8wCnvb5dunD3vnHHWGvfOge7uMsXdOwxKjIfZMno7zCLPWxHGf+9y729etC/+f//k/33jD9ftKYA7Y28H4RQfs111Sd+2K4vvdSd5N0nSE/TGOAQQHsJNPPrncfEagILqzn4YAjl6CjjGITzvttLKAsCDTYe4gyKJ3LN/aVEhnnnlmKVgD04TrZhN8pjii9+ykqFDFZfFgEtXh9Dkh0ekIzyZEna1QFJ+bjpgs5JziYPTM5KmjFZL43eXPAojvDExtGLTyPeecc8qg0ekGkTtb0opd+7VeZ5966qklbnwUuzt9ioNeDjV7MZ9yyillwenheOzDhnndsrdwtiCjGWPv5hvYm6gtBky6bmrC6Fv2FsDYi4vewBlib1smRHp9646BFj/y7WNvQevCDBcXONgbDH3sDYazzz67DBrs5Y7lEHs5YC9u7PUvfSYh8Xrwq8YxwV7NY4+vu4nyG5Y1e32PvQstCzIa7GmidyzfYnKxXbM38PFh9GEpds8WwCaVsHfC8OA/7L1O3ZvcLKzoxaNfLX766t6xJlsL1LCXqwvePvbyxd4JFXuTdF334qj1HliqAezF5E6Y/DphMMeEvRhq9rb31b3xIBaat7zlLfvZ8+nOmdpv2TMLhrPOOquwNxadHN0Qh/WxtwB28kod4672xRD2LHrsXUzU7LXRV/eOdXJxwgt7uTpxiCXsnRDCXt1YSLqwxDPs5d2y14a6N/fpp7AXR8seT/Mw9urZnK/doTnHPvGGvTac5HITqywGavYu/LCXqzpWk+Zk1sfeIsxFd9ibb8z59rXsxYW9BW3Yu6mTseU81Nax+LHXhnjkK1cLpiH2Z5xxRrnQGmIfluYbFzRYigN7J/yhuseeT31lLhOLOM2BNLWeVkzmeOwdF/bqntXsxeI4cRu3clX35uIx9moSn7D3pwlj7NU8/vRiUwfOKS371L0xZZEU9u7+a9HDd8tevWHvQkutOcdhz3fLnj7sxYGnhRz/Yq9Z6lM8+cReP4W9OZD1sden2Jv/sDde++o+7M2V1grOO9hbg7gZm3197M3F5uSwd8NZH87iImd6hiUf5nqL4HXs+Re/c4lzijnQ/NnHPnrs5Wrshr27eGcO0b5H6h5r7K2fWvb1HII93zV784l9qftaH/Z4qAXsvbZGyM3b+thbI2CPDfY4uhlb/EePpdx9YO1DBnp9u469CzlrnawZjUHr2L66r9mba9exlzP2zlm4G+upe7Frv/unHPPDbr9tv+7a+W1X//fouCTWmDzvfo+jbnl9U7fvpkYgQJM1eALwnEVLzGud70RoEqHJiU0RZHuMXnImEFf19BLQFgPYJJ02bDeZ6SSTsfbpFYt2DByLcm0xzxYrJjPtgEbvGRB6ftIevQ7iHxB+6bXDjzhTSMyzE3iuRPmhl4dBZru44p/JP58k6iT76Q1827Ub//abWBUZ5orAfvFke+nozrQR9k6e0TMDah17Ph2PgX1j7D2H5Rz2ecYwfdjHXk5iTl+tY5+YxSFvcfexxzhX9drAh96V+1z2jhlirz9r9mKxPaaNsDdJ1ez5xF79JJaavQkhLFOfGLfs+bU9DMPe8X3staddOXqfOuZnXd17hL1PNfrY44W9GOSoHXp8s3iIeU3bsnds+iSWtrWp7bC3XR76RKwx2419ucqNPuy1gY36SexhTz+XPb81e37aOcdz2OPieMepCX5tb9mrJXnRJn959LHns2WPDz2OuWCJtey9t9+xtvMV04a2avbeT2Xf1j32WHjPwt52DGqWYc9P9J4xw5hffUSvnfjxPMTeWHVczV68Yc+wly8twxKnjIfkz/jES82KGcuave1h75iwd0zq3n55jLFXrzV7+4xZMSUWzxi2c448tCvXlr063Qp7cWd80PexF0/YM8eLRx7OR+LUXuJnzl9qqmVf1330uIUxn2FP71PyPvbOARjTr2Mvt5q99/zYZ/sQe+cy7On51i42cq7Zu3Co2YclJtjz08cegz725q6avbjnsFf3+LTsMxd5H33NXq72efA/xl7/8ikWFvbtuiXs1U/Yy80+sauHxOJZ7nKt2afuMZNz2IS97cZ+zRIT2/vYY1yz1076sGUvPnF6bTu9PKx/ptR9+sp6po99GNO07D3kXdu+Lubruv3XukDo+NPKo7UbuwsDaez9v/+///PG1c03rfInRhwC9Ivuit1VnT81+tU115QHWL5hqA1YA0QjrkoV0T/+4z+WT9v4sT0F4tkgkKxPSnz6p/P/+Z//uSQDNDDRiyV6V0Wujlx5/cM//EMBTK/TogeHHmRXpT51cBX713/91/tP+LVeZxlUOtFVnU8UTjjhhNVrX/va0jH8pzM860wTpYerUrG+/OUvX734xS8uGvpY9ApSGz4J4/Mv/uIvVkcffXQpFvHURm8g0PGv6P7u7/6ufGIVlkz8HmFvn/ixx9KkMsQeG1e9Pv1ToPQGeM1e7GGJvat3D592//3f/33JaYy9q/wp7J2UTF5h/4IXvGD1mte8ZpS9AYoNX3/+538+yB6bsPeJgPb+6q/+avXc5z635DnEXh75xEGd+ZQCx5o9kyv2BphPNOT9T//0T4W9WGr2dR1jr+5NJvTr2Kt57J/0pCeVeOQ/xl6/+pTiOc95TsnX9pY9vmpLvsasieLEE09cvepVrxpkr93UPV+vfOUrVy960YvK/po9S93rd3XvvTp49rOfXY5t2esr41kePo0JeznTeiR2z6l7cfskDyd1bELvY09Pg4t5Iext039hM8Tep4TqXlx97OVp7GGvf43vv/zLvyx+6I316MNevthrP+z5atmr25q9bbQnnXRSed1Xx9hrG3u5Y28s9tW9/epAfD7x1Jb521iv2efBr1xT9xZTWDop0w6xNx+YF/TRFPZXX311mfPNfdhj1scy7I0p3xgfc8wxhb12h9in7rX/whe+sNSyWPvY4+68hyV79atfXeYp++lj3mtTv3qml8vf/u3fDrK3XyxM3TtW3TvH9bHnV67qHnvnzLAXS83ec1hir+6dk+nNEy17bGr2Pnl92tOeVs4/c9mrwVof/6l7dWa/ufsVr3hFYS9XOuaZj7BX98x52fmZ35o962P/N3/zN+WTVFw8arPfuUdb4nGsuvepel3HedDL1XnKnBP2zqFj7H0CrO5980tv3qIfq3vsfWKMvXNkzZKFPV/YW0sde+yxqze84Q297NXxEHsa72Nhbw5xTNi/7nWvWx1//PFlf61nQ3Xvm7A+9vxjL0bj0BjAxl+F1OyZ55a9BTG9taM6zrmz1oc9nr6dpbfOE3t7rhU3vX5yjL8aEP8Q+6wZxeIvb4477rjC3r62jrFXw3ga4/a/9KUvLetGPvvYm4Oxx5Lm9a9/fWGvZhxfGz32nvWV3NWN+sFxv/7W+K3pnaOux6Hb/4vunGiN76+EYsbj/e933y6fnvsg2CmQGyrHAuf+iA5kQLEAABJoxapwwTaJ6VCamNcSkbzXvjoBDmxaX6/URqPzAAZSjCY3E4dExd0aQPzbrzgMZDFFX8fP7KO3eFAcrm51NL02a73XisMxtAamqzpxil9n1Hoso/dVs/25Mue/Lmw+tIslRnJ1fC6c+Nc/MfqaPZbawh5HD5qY12HPj75SWAbqEHss+Rd3zZ5e/7Z2e7D3sHAwMKewFxP2Bgv/nuVaT0J81OyxwXQOe69z8l7Hnt6kOMSeqXt63Jzc9atxEJatZZzgYmE7lb3Fg6+QscRMPHPY81+zZPzgISbs1blPh6ay9z4XTlPZq02+17HnH3u1z3dbx/Sp45Z9n55FH/ZOYLaNsRezup/D3sUKDb052uuWJSYte3VvfNAPzTmYGuNhL24s17GXt7qfwp5ezeOPzRz2Q3U/lz2O4lf3HthgT9/OIWGvv9T9GHtW173FBt1U9uoSK+wzh/SxlysfWOIyxl4c/IuDf+dZdb+OvX3id/Hn/Tr2zoNq0xiXA31bxyxzjppX+2GPTV/di90x+lV+c9hjJ5457PONAn3L0n56Pqayl6t2p7DPnLAp9qn7sMeShn6o7j2wF5O+GppzsKSVszFr2xj7zCGOw8Zx8tUOlm3dt+ytQfCMnibmdcvehZRFt1j62Ld1bwxqb4h9+spFsXkBGzmtY2+NY3G+jj1t6n4Ke3qM1rFnjuerbOm2uzjwob/4mePN7S58Pff+zGkerdUdF+OQc50CNA1/QJVAGj/0komeht4j7bcWvYeEQQOArz6Lb3EBEn2faY9/HQK2uMXiuNa0ZyLi2wPA6NuOZvQ0tGJybHJtOy5Gn/gZbVi21sc+8YyxTzxz2WNCO8Y+LMVFF32faS+x1+zHWEaPJb3HOvYe9ifXMfbRO552HXtaMU2t++jFkHzH2NN7nsI+bNaxdzx+m2LP6nFiP98eQyzFEL330WPTmv01e++N8Tns+aY/GNjXLMOeXlybZD/E8kDrft383cee/z7TXvS3V93TD7Gv9Sz67ap7ufLvEfbR98VT91XNfkrd04nfs7Zba9nTRt+a48Pe+QGnsJnKntYx28VezNF7H5ZjdRw9TeLp07Mh9nz1Wc1+bt0nV8e1pr2WfXxvF3saWg+WeObW/RB7OYpdTGHvMVbHtB5huY591i30271mnMs+bOyPfoh9W/fR97F3fF+b4ZL2Ry8Q5hqnjgPCa48x24qe1jFer4vzQPS03o/pmf2b0GefeBj9mNV6rz3G7ED1c1jO1W83yxj/bJ0++2r9mNV6rz3GbCv6sPF6Dsu5+qks7Z+izz7+2e2hHzP6rbLZtH5drjH7p+izr2YzVz9mtd5rjzFr9XPYbFq/jk3M/jl6/tk6ffZtRe+1x5i1+jls5uqnsrF/E/rs2wpLNkfvtceYtXr+h3wzmrDctH5drjH7p+izj3+2Ff2Y1Xqvp+Q6Vx82m9bTej+mZ/RsK/qtmna2/QIhNiWJ2hb99tmhxmaufo4damx2kv5QypVtWj/HDjU2m9bPsUONzab1m7RDjeVc/SbtUGM5V3+gpr36AuGWS45tsrmJLPrts0ONzVz9HDvU2Owk/aGUK9u0fo4damw2rZ9jhxqbTes3aYcay7n6TdqhxnKufrttWy8QFltsscUWW2yxxRZbbLGD25YLhMUWW2yxxRZbbLHFFltsv+3/Pwh+IulA/w/CYosttthiiy222GKLLXZwWf4PgntM7P9Pyr/97W9WX//a18sdlZcLhMUWW2yxxRZbbLHFFjt0zAXCYd2FweOf8IRbLhCuv2HfzW628fUv/7e9/lfErdLFFltsscUWW2yxxRZbbLdbuUA47LDVE/74ieVeD+UC4ZprXCB8uexcvkFYbLHFFltsscUWW2yxQ8fqC4TDDj98tefww/auPBZbbLHFFltsscUWW2yxQ9eOOPyw1RHddUH5FSN/WbTYYosttthiiy222GKLHbrmmwS2/MzpYosttthiiy222GKLLbbflguExRZbbLHFFltsscUWW2y/LRcIiy222GKLLbbYYosttth+Wy4QFltsscUWW2yxxRZbbLH9tlwgLLbYYosttthiiy222GL7bblAWGyxxRZbbLHFFltsscX2251u7sydlP/7S19abpS22GKLLbbYYosttthih5jlRml/8uQnrw4//PBbLhB+8+tfr7761a8uFwiLLbbYYosttthiiy12iFm5QNi7d/UHf/SHq717D1vd6brr99183XXXrr7//atXN99003KBsNhiiy222GKLLbbYYoeQuUDY010gPOShDysXCne6Yd+NN1937bWr733vu6ublguExRZbbLHFFltsscUWO6TMBcLe7sLg4Y94ZHnec9jePavDDlv+r/Jiiy222GKLLbbYYosdynZ4d03g2qBcGXQXDYsttthiiy222GKLLbbYIWy5Jli+OlhsscUWW2yxxRZbbLHF9ttygbDYYosttthiiy222GKL7bflAmGxxRZbbLHFFltsscUW22/bdoHg14/27NlTnqf8ElKtn2IHs55mrp52rn6Klh1Kepq5etq5es9z9VPsYNZHu2n9FC07lPTRblo/RcsOJX20m9ZP0bJDSR/tXL3nufopdijpo52r9zxXP8UOJX20c/xPsXKjtGuvvXb17W9/e8s/c+qYffv2lYfX7sAmUD+Z1Get/ogjjijPfXrb2Q033LC68cYbi99yh7c1+uuvv77k46ea6NmQ3nb+a/1Y7Pbx79ld5zzG9Pzyz2i1MaaXJ73XU/Rz2Yel19vN3vawpOefTdFvkj0N3/S29Zl4caR37CbZT2HJ5uhtb1myOfo+LaOvWc5hz6Kfyn4dS/to57BPX01hyfgP+3V1zDY558xlL2650vA9l72YhvQ0YRn9OvY1S3rb+vS2sznsbW9Zsjn6Pi2jP1D22hjS97Ffx/L2ZL9Ob3vLko3pM3/vFPYejH4nsd9k3U9huVX2jHYde77nsKzZb/e6hWX+PtjYizdsWPR8zDVtyOfRj350ed6WC4Rf/epXq9/85jf7C4Kfe97znqsjjzyyN6lf/vKXK21KQgdqk16ntHrvf/GLXxRY/KfD73Wve90GGj/2//znPy/P0dPxn/hi/CgKetvtB/nOd75z0bfG/3XXXVfiz3v+73KXu6zucY97lG212f/b3/52dc0115S2GP3d7na31d3vfvfb5Er/61//uvAUC6Pn+653vett9Kxl73HUUUdtjL1n+gNlT88v/+olenGMsaf3Ou3JU76t2d/HHnf821zpt4O92NVPn75mn8Hbx14s9h8oe5MWNokvRs9vXff0U9lnQppb93PYy59+HfuwpJnKXizioseo1otlLnss6KPzzC+9dlq9OYfedvp1c464xe/1VPb0YSmeOXOO/PnWRqtn+lUbU9nLVf1Er80x9upSjmHpeSew9+B/jL2axKdmif1Q3eOOf62fwp7efo917OUcNmN1bz/9HPb6SszRz2U/Nn/3sTcfqOPW7G/Z04/NObcH+9S9WLbC3jon7cXox9jbX5v3Yc8yh2w3ezz5ZvRT2dvvMcZeLGKqWch1zpoxesxiya09d3q+I9jbn/nbsYlvTt2Li3bo3Dlm9PzkAmHvGzsTsIDsTFB5CNj2PNdmm44WnM748pe/XN7raJ0JQoJm/GlHYdj/X//1X+U4iQzpdYR92vjv//7vst2ANPAUkxhq++lPf1p8ev7qV79aBqeHTqKP8Q3kT37yk9IBP/zhD1df//rX92tsa/U48eu473znO+WhI2iZ+GP0YvzZz35W9N/4xjdWP/jBDwob8Ym7nli8VxgpVLE7lp4fBegR62OPq3j6WNIrUhrtYLmOvfa1rc/4ZzV7mtqwrNmLF3vbWpZyDHtcavZ4DbGn/+53v1seJh9a+8UV816M6Su+w14dTGVvAGNjUpFHjB53D/7WsRdP6r6PvVz5jNEPsdee41rrY88nbn3sf/zjHxc2uKjNKezt80FC2Ntu/zr2xhaWtuPYsjfBhf1XvvKV8jpzSMue/9Q9Flg6XjxD7NU9jQd9mOiLKextE8cQe7lirw/CXgxD7Omw+f73v7/65je/Oco+fYpX2KuzdezpN8Xeo2YvHiy3g73Y+XYc9vYPsZcHlnyGPe0c9nzy4yH+GH3Yp+6/973v7Z/vxdXHXu3w9bWvfW31ox/9aP+cI6Y+9vIUK/ZeT2GvHWwwTN3LdYi9ece5Vtx00bfsxd6yF7P2+thjI3ZziXxr9i3L9BGWV1999Wz2jknd97GXk/jp1b2Ywh5HsbXs1XrYG+tT2atjurH5nm/9gz29uOj62LOwd5x47BeHbXUdM3mk7vvY130llpq9Gm7Z8x829DX7b33rW4U9NmEvj1of9upLLGKq55x23YIJ3gfCfmy+x9A+x0xhL1c5hz1/Yl7H3viWr1rkcx17czeeWbf0sdfmHPZqTNz0YU/fx57d6dbcPVu98eFRm3bufe97l+fbXCDY+Ntu8Li7slsug6qhX3aTxmG3nvgYp4JSGI6/8MILV+eff/7qM5/5TCmOhz70oWV/ANPrBJMPn2efffbq4osvXv3rv/7r6kEPetDq/ve/f9EFmDgkKS7HvPnNb15deumlq3//939fPepRjypt0GTS9TqTIainnHLK6rLLLisnjSc84QlFB1YmCnqLDG3QvOlNb1pdeeWVZQD90R/90X7fKVbvxaIDv/CFL6xOPvnk1VVXXVU6hz6Tb81H3Nh85CMfWZ122mmrj33sY6U98USfzhFTBtl73/ve1VlnnbX6xCc+UeKVr+0pvrDPBP22t71tdcEFFxT2rnof8pCHDLJXUGH/+c9/fvXgBz+4sNd+yx4f+Yn9Pe95z+o//uM/fo99itVr7D2wx+byyy8vBfv4xz9+kD2WTkQte/G27MUuB/Wib7G37Q//8A/351qzFzdmdGoHe8eHfT2QxYSl7WoMn09+8pP72WNsULOwT91j74G9QRX2mYDDXjz46Newp73vfe9b/NbsjQ98tCF27L/0pS+tHvOYx5STkjzrulfzfOMX9k6ScpVDHi17k2fYWzCNsZfrZz/72dWpp566n/0f//Ef72dJx8Ke/sMf/vDqLW95y+rjH/94ea8WPLfsU/eXXHLJ6pxzzinsxdBX997TY6rmPcR1n/vcp/CMvmYvVozOPPPM1Tvf+c4yfmnvd7/7Fb91HYe9epCrsfif//mfhb0a6GNvTPmwAMsrrriiXHBhr+aH6t6CLexdpKlj8dYnPPrUsfpK3ZuHMucMsf/Qhz60Ov3000vdq8d17N/97nev3vrWtxb2YljH3lxvzheXGjaP9NV92J9xxhmF/Re/+MXVwx72sP1137J3UndCrdk/9rGP7WWv5h1jAVmz/4M/+INe9pm/sTdOwh7LxFLPIan7T3/602UONI+LT1+FZcseow9+8IOFvbrH5HGPe9xt2GcOoX/Xu95V2H/qU58qmkc+8pGD7MV/3nnnFfbqXg33sacTv3ix10bYGyusZq+Gw16dve997yucsOfXfNDWPfYWMdh/4AMfKAvP1H3fnKMenEOwV58uXtexx0QtYK/NPvYs7MUR9kz8NUuGVRZhavLcc88tda/GHvGIR+xnycSivbCnveiiiwp7501rlz72ag1PsRhb2D/84Q8v5wjWx97iLuzNzerGeaGPvWPwxlLO+kHd0+Jez981e31lXra4Xccek9R92IdlH3vjT61hzw/2Q3Vvu/Mgnvp4CntjBPvPfe5zhf0DHvCAwiTnzpq9nJ17nM//7d/+rfi2NqJp2csND+zf//73lzXJGHt17/yKpbFu/hliLxbsxaCvzN/6GXs+W/aZv639sP/oRz9a5jn++9hnDrHWdX7D3v6+umfXdH27t9svpps71vu6Z+v9I7ocY47PBcKe667ft7ruhls+AWeuLBzw665gwf5pl0wJvAuE05jkPEAHzCQKDuCZ6NJx0fPjxGAScpIGx0C16PP1TDqi1isExW+yUkSuwlwkKA4dUeuBNmANLh1Ib/HvqvCBD3xgSbjWi9cEa/A6UYjZQkwbuWCJXuGKz+LYSVEBil+xGlA54dX++aPR2diJ12u+5Mvk6EHvyk8OTurZpsPFaWEY38xrnYh32CukDLaWPROj4pSvuPQD9vrQ+1qPFcYmITz5NBDwwaaPPcZO6E7S9Li7SOCnj70TlTpwogh7Fxj6JPkzvOSDvYk57L02APlp9drXX/gZcOL1moYfz2HPctGDvWc+wl6/eM8c54E93moh7PWDduVS65mcTELYywV7Fwn8tHUf9jim7o2Bobr3fivstY+9ePh2kdDHHmv1J1cnMu/VvddZbNT6sFfr2KemWcvea9u8DvtMkOLkq2WpTRO1eLTj9Tr28pSjXI2BsNdGdJ7D3vzhRMGnMaA2Me5jT28/Hb3jHD/EXrvaF0fYm3/EGR2Th3z4lJ885avuvZ7DXhw4s5Y9o6F1TC6O+epjr99T9+kH9aEu+tirK4sTueoHufMzxl79rmMvXnMR38ZH2BsDfexxwd6cF/ZO3GJq2Xu2v2YvXq+N9SH2NOYN77U/xJ5lLNDLLezFOcTe3GfsYe21WjA/tey1UbNXR/I0//Sxz/yd86X2cQx7+2u9eMPeeYHeeUJ/2d7H3nlG35v7sBWLOdF5KfUYfV33eIe9850+rI1e/YW99/xZXIkbH1azd/61gDJO5OL8PMZejM7zNXt1P8QeAx/Y4CcX49u5jp8h9rjjr31jwNxvPdPHXn1j74MJelpjQLvJkdHLSb5it94SL/b6oW/dom/EbC2Bd9hb5+nDaJnXfewzn+CTbUPsrTO1lXb72Fs4G7di1w/qnp+WPcPAGs75kE9jQL7Gg4vX6Dyr07ns+TFn69+wNwbCvtaLL+zl4L0xoB/4afXyD3sf0uLqNUbY10aPr5ywZ2EvzqwZC/db2f/y1ouzn3XtX9uNK3X/iy6u9E3suutv6B77VnsOP2xvua1ybcQuEH7WFZBvEn7QLdpu6AIEszbwfHrhk0TfGOg4ReRK0ydWmXSZQCXrk7s//dM/LZ1ucadQHO+Kx8BPZ3sGyiceT3rSk0qy/GvTe5+ymGBrPQ39k5/85DIo6BUIve3213od55My8TB6Ph0vH8em85iJ1ZWleHOlaqD+yZ/8ScmrLj6mYHyi4urPQDOpiBsfxZdJ1MNr2+h9Wukk7KSkPSwVcTqRHgdtPvGJTyzPYlFQQ+zxCHt5hL3j+9grZAxq9orO8UPsfUJCr5/p9V/Y15OuZ8Xu79ywY/T6g1672q9ZilmcrrzDHpOwF1sMp5q9Ewy9vvZezdbs6bG3D3v9hD2OfOjjegDV7Plq2Ys1to699rCo2aTu1WHYqy1ssDcp1HrvfUJiP13YO54fr2t92ItHfOKxzfs+9saqOsRenvzjlfyH2GOBPZ5D7FP3NXvHDLHXFh/6vWYvtiH2qWM1To+B49exV7NyVc/YYNzHvq17x42x1672vQ/7zDl9dS8vtSVP+jH2eIW9GjaP6GvbHEdTs+eDb5q27nPCi4W9tvmq2auPLDYY/5lD5CZHetvlrj3jvWYT9lh6Xdc9xi17c5Dx0Na999pt2ev/sDf+xINv9GqlZm8ObdnL3/w/xJ4eCxzx1J7axov1sTc2+Fb3uA+xN4eIXTtyNQ9ib14cYi837OnH2KvZ9FXYq2fvh9i3c465aqjusRen2gl7MTteXtqq2ffVfeZcz/XCDSfngrbux9jzgZ0c9JPzc9hn4RaTX81eLNirg7G6lxtO2DBziL7uY585x5qDXi2GZbtuqeseB3r94z09H7V+iL14+tjXdW89Ry8f+Q6xr+see+1hOTbnqCu+U/d81HVPH/ZiDXuL2qwZ1Uli8Sz31DHONfu+usc2c84c9vzV7Om1W68ZW/YW5uLHd4i9/HFQt2qSf3FkzsEv+pq9NnD30A94Zs1Y+5fJT7qLcl8C/LzzbY0f3rUd3s03rg32/p//88Y3pmg4isN8W3B4l4D9d+6K/u4dCAHWRguQhOx7znOes/qrv/qrMkh0vGP5rAMFyOAF+IUvfOHqVa96VdlHD2qt9wBSMYH5yle+cvWiF72oTBqK1/5Wb9CDaZL6i7/4i9UxxxxTYNPXlmNTaB5/93d/t3rKU55SYtGG/dEyMYNvUIvrn/7pn0ouBgZmtd5DsWHjWcf98z//c+m4Pj1TYCYuLBXdP/zDP5SipFdg0TPH2Bf2z33uc1d/+Zd/WTjRj7GnD3vM+9gzOSpQPl/96levTjrppP3sY9F7mABNCvhgf/TRRxf2jqmN1nHYG0RhL+c+9mJzksTeoDUYsTfowzKWWDA3EZlkHIe9SWaIvXrBXh8/9alPXf393/99qe0+9sxkw6/txx57bMlXW0N1r23x8v/iF7949YpXvKLsw6ev7uVYs9dfbd0zrx2PvdrCRx0Yi1PYO1nI1STZx95DzOosJ7M57B2HvclvjD29ugx7eYinZh+9useePuzVRx97D22H/Ute8pLCHrMh9nLEXx6vec1rVieeeOJ+9rFaz7f+FbP579nPfvZa9hZuxqNcLT6w6WMvLwwxMg9i6SQl15Y9C3t1E/ba6WPvUbN/+tOfXsahfqYPy+iZuFP3z3ve81avf/3re9nj6hhc1CbNS1/60tWf//mfF90U9q997WtXL3jBC27DnkUf9sbqX//1X4+yl6N5WA5qwvzq5CtXiz5xROuR+sXIeSXswzJGy8RsDpGrZ+PE+KJv69gD57D/sz/7s9Xf/u3fDrL3ELcFge3Pf/7zV6973etKTfexZ2FP87KXvWz18pe/vOjo+av13mNvznf+5vuEE04oHPGsjZbxjWPYP/OZzxyte+zNm2GPkViG2Ksz50TtYC++sIxFn7rHXp/SO6+sY2/7M57xjLXs+RK/vjr++ONL3Xs9xN5crFbEgzv+4sCHv1ZvbNfstbGu7nHEE3s5hGVttPo/7NXEP/7jPxb2ch2re7Fgr46NySH2dDl3WgzTO7cMsTdPhv2znvWs1d/8zd+Ufq7Ze0TPV9irSfNC2NdzSFhagxiv8jDfmHeM13XsxfCGN7xhddxxxxVtH3vHWUMZ13iK3bwpFv1lf4weE2PWOUtNYKOux+o+7PWxOhbbEPusGbXjPMK/eYL/mj3D9oZu2xFdG7YbxXfrxi4fMVzvc597d/729P+KUR6tBWZtdBIxsAwEJmnJtJMEozfZekiIaX8MbvQCZzquhcvowaWVsH220fbBss9JNHomx+jrSSIWvZwZjVxTeK2ZtLBxHBND9K1pK3p5MDmKpS1URi9u8YQ9hvw7rjV6Wo+affQtGz7jP+zDpl5osK2yl2tYjrGnDxvPjM/Ugv2t8SueqeyjD3s50h8oe7HhTS/+sFzHPizpbYv+9mbPosfevky2Hn3zwpy6Z+Jw0qjnELFsB/vUscfUuufbwz7bUmd3NHvGJ62Y+GttqO7l3KcXN/9T2KvFsJzCfmz+xrI2+juCfeqyr47vCPb0mLYml+Tasvfc5rrVOWer7PGLfgp7tR6WU9mPseSXfur8nb6Kfh17edKHPb/in8o+bLaDPTZhz24P9tHz19pW2NPPqXuPev4WzxD76A+EvXiGWNJuiv3QuXM76j48auMzfj3jlw/TDvhnTjnUKMge3kvIo8+il4wAtEkLWp9FD5ZnegD6TqSMnl/+5+j5t59eEY2xoJcr/8l1TB829tOKR7utPtvChombvs/CZqvsvQ+bIavjocdmu9izmmVyXcfSMXPZs/gXZ6vPtp3G/kDqXl/ZPmTR8zeVvYf9m2Y/hWX8ez+mZ7V/+jH28b+T2NPLlf/kuhPYi4H/dfqp7Fn0YTmFfebvOtchm8s+udq/Kfb03s9lTzvEMvrUsfebYB99neuQHSj7IZax6FkdT6vPtpY9fZ9v++UY/9vNvtXPZU8/Zc4RO/1W2HtM0bPoxdPqs21T7Fn8yzksPfcZ/y3LTbCn528T7JMri148Q/ohS27bdoEQa+Gs87NJfatlc/R3ZOzsYNYfSrmynaQ/lHJlO0l/KOXKdpL+UMqVbVLfatkc/cGUKzuY9YdSrmyT+lbL5ugPplzHjJ+NXCAstthiiy222GKLLbbYYgefbewCwXE5ViMeYzZX76uc2Dp97ZvN0a/TskNNfyDs1dSYzY3lUNMv7Idt0/qF/bBtWr+wH7ZN6xf2w7Zp/cJ+2Dapr7VsDkt2sLEfMsdt+wWCY/wNVv6GzN/R5W/LWrPfdnp/J+W9/5QhmDG9/4xCT0dvIA3p5UHvmb7+O8DW6P1NGL398Z92W7NdHPmbM3nmP/IM6XGhZ/5WTDx9WtbqaR0zpt8N7OnDMu22ZnvLnv91ev7ZHPZe0+8E9hhhOJf9OpZ13U9lWbPnn/XpxUnrwaawr1ku7H9ntoc9/7jw36dl9Kljtp3s7WdiD8sp7KMPy02wp09dxk9rth9I3YclG9JvlT2jvSPZYymency+T8voa/ZjLBn9wn4z7Kfoby/2mY/XsRQPfdhMYe95znxPHzZDeu2Gpf1z2Y+xXGeOkc/aC4TcijnmwKEG/VYrH+kwMPzsmf9Z3R7jvRtGSKbW+7ko/yu81otFh+VOfQIWI42fcdIprR4od5djQNMzP5PVQqPXafx7TZ926D23ev/73E/CFnjde3p+6VuzP79NG7185Oknr/osvwOPDaPHEc86lthc9rmLYXLDRyxD7Olp6MMS+7Zg6fUpliwsPWOT+GL0u4G9HBLrHPapY3XvVwhqfWI9EPb0tg+xVzPi93oqe3xovacXh/i9r8377WDvV4086lhicsW+rnu+/bpEq8eCfi5728OSbZI9Hf/e10bTV/fioO8z3P2KxVT2fPtFjanssWnn7z72ibVl7yH2Pvbmb3qa6BmW7fyNVeaQvN8E+7ru5SFutdOa/bSbZC/XKXWvbfv0leewpBmq+yH2U+teO56H2MsT+7BZxx5HPGu9c/4Qeyz1V80eF3Nyn4mlPXeuq3uM+I9eLH3nTvu2wt52LMK+r+7pseff662wxyZziPe18WMOqdmvq/uw1zYLe7VZxxKr697+g4n90LoFyyH28qVNfPz2sfde3eMf/VbZD9U9v7UlXyZ2ueQCYe8bO+NQI3ZqkIPruqR++IMflDuuKUb3QWgd02ZClJC77blDpd/cdgwIHjF6YAHWge4Q5zi/L2wbCIKqLYXhbnjuXOg1UH168bs7oITdVdDd68Ss6OhBiwV89O7Ambvc8qudVi8nd8DTwe5i6A56OkEMfDg2Rp9ByZe7KLqzraILZ5NdTJwZlCYtuboboN/aFac26gsix6cwHIOl2LAcYo9lcqDXb2Ps6bSNvb712oAXn1xTD3xjQo+Du2m66yF/2GtziL18sHdH03Xsxc8/7Rz27lzorqBhL27thGUfe3dJnMNebPTiNPFmsDL6sJdz7g4qHu31safXtjtLiwff1H3LXv6p45q9C5Ux9vTufrqOvTaNW8e5g6Rj1IEYMHFcjL5mL5ap7B0nVzlj6Xgc2zoOe89YrmMvdvvMTS17ebfsU/dqYB37uu7lKV/tD7GXU/RhT6O+tNnqxSg/7dAaK2LpY29buGhbLOphHXsP7LEx1texpw17bDPnjLF3x1x6+YzVfcsep8w52Ayxd/dT41y8dOJv54Savfkjdxiey96+7WCv5rF3nFzdbXeMvTGVsWXOwXbdnMNXzV5feR6re+cdd6oVK/ZDdZ85JOzFsI49n+5wi70x4pgh9vLTjvMy9llQrWPvvO/8L1fxDbF3/nMcNu4yPYe9Z3ps1M8Qe375pxP/EHss5erOyNgz5zd6bIbYW1NMZU8f9s7LcuSr1Y+xZ0Ps5Sh2HzZj43j723Nn5hz8scydzIfYi0VMU9nLNezp6cbm+7AXt9phQ+zVali687J1nRj4HWPPv7tqe0xhrx2+tTHGHkO1PMS+rnvGzy+62vxRx+aars+YtX1tjsPL820uEGwsk0Q3wHyLcGSXwK90fhf4PbrJIqYhQegswZ111lmr97znPQWwoNxIAsQM/MDSjoROPfXU1RVXXFEmUgm5AYr2AUscYAGgo9/0pjetrrrqqlKwbmrhBiF8BgC9QnWMCetf/uVfyq28DQg32MhiMsVKr0jTESeffHKZpB3rJisGXD3p0otdzm7hfvrpp5cOsZhxcwqx1MVXOqJjQ//e97539da3vrWw4cONRMRQF5/39OK58MILV29/+9uL3vFumoFliqllf+aZZ5Y2xEMzxB537WP/gQ98oEwsY+zxtGDA/iMf+Ug5Sa5jb8LC3m3rnYTdIMSAwBHP6MNeDKecckph79iwrwe+tsJeHGHvhLqOvZo899xzC0v5Yx+WYe89PUYXXHDB6h3veEfRi9UNTYbYyzfs6fF25W3/EHu5Yq/uTYpuPtPHXt3X7NW9m+7oL5q6jrFXB24XT1+zV/cte7FgLwa1gL3F7Tr2xt8ZZ5yxn727QdqvDvrYX3rppavzzjuvsJHPVti3LMPeyVos73vf+0oeFhtu6NP2lQWDfE26cv3gBz9Yas7Ngtx8htV1zC+eFqhYGuvq3k13+tjLC3snUXXvhGThL3YxtezDEsOwt5jB3kljiP2HP/zhUmvY1HVfs9cGvb695JJLVueff/5+9vyHjeOY9zkZ0V588cVFz9ROy5IudX96Nwaxp1dj69ibX6+88srC3s2Cwp6+ZW+BiuXHPvaxckHKd05YLXtt4K2vavZqZog95qeddtp+9uqStmUvVzmJO+ydi9Q9a9mn7t/97ncXnvpYPi17D+9T98bIO9/5zuJfnGPsMcL+/e9/f6n7IfZq0hxroYr9hz70oXKecwMpNxFl7fzNtwVqH3t51uz5Frt5JuyNgdxUbog93Rz2xiv2cnWho+7ZEHsc3/a2txX26tQNpPip5xDv1aT4nRve9a53Ffb8hX2tD3uM3vKWt+xn7+LJnBy9OGr2FoY1e9xzV+cx9h//+MfLIt65xOJwiL3FJvYuQLB34zE1YB4ZY4+NtrDku2YZ9vTWZ9Z1cpULPZ/a4Jd5v1X255xzTpmn+Nf31ml97MWP0Zvf/ObVZZddVvS4mJP72JsXLPqxMW9OYa8Wa/ZuZOnDgCH2NPoWe4v4deydk8U/h/3ZZ59d6rJmL9eaPZb05m7s6c2J4qlZMsf9vJsPftzNYXftzk1dg+VOykd0+YVJdJlv91x7/b7VdTf87neXBfmrblJ3B+VHdgX64G4B84juWYdr2H7Gmdegc2SiSDAW5a7edWIa9UyXu/FZkJjccnJ10vBeUtGDrQhMDE7YBqQJz7EWqjqk1kvShKYDHENvQreIN5DTcSzwxOOiwImM3rE6xKJZ0dZ6+y2OxatIxGtRi4sTnvyi9wwyBgayItCewhKHBUp0Mb5pLEjkIn+TtHYsTmrfYc+wtxhh69grcJ9s8WlgWFTyM8YeP7nj4ljbsa/9G0TYu4INewuZsOcveu2IFzODS0zax17BY49X7Z8/C2q5mjRcdIhdP7Ts+cfAAMebL/FiKc6WPZZ8i6llr90h9tqxIHGc7djTDrE3WdTs5T7GXu2m7texx7hm7+LCg75lj13L3rEmpz72OIa9ySjs9UN7+/ewF0PNPlz72Kv79I9n486x69iLAXsxhb1Ya7325YS9k4BcnRQcK3bH1+yNzbDHTwxONo7tYy8n7O2nC3u138de+9rFXhze61fx9bFXS/KSnzzFa/7hC4d2zqnrHkfxYS/usI9haVutCXs++Kp9a0vd6Hf81IE41MUYe3WlvuRq7jdn8tPHHsvULpa+9cHWdnHW/sWLMX5hb77Rd7a3830fe77N/cbnEHv5OT7s7etjTysGdVyzN6fnQ5VoGfbGLt5y0f469ua7sNcP5h9js2WvfezNp2FvrMt9KntziWPN61kkRS9e52DszU1h75gh9piJ3dznvWPVwxB7DJw7mXjlylr2DHs+67r3oYrjsI/lGOsNMdbstYWj83YdS9g7z+OnHf0Q9nKvWYa9tYpzmv3Gt7qXq3qo9Zm/zfXmDTHg6Nh17LVRs7e9b76XL/bWW+K3hgr7to7D3pzDxOt15l7P0bOwV/eYpu6xxyeWY/jACG++te+1dofYizvs86GAfm3ZZ85Rkz5oCHtrvHXszRvYew77ds5xPP/4GVv8a8c8hb28oteOeLE3b9TszT997OXfx54ONxY9w1f/4o29fLy2rWbPbuqOs7Z/QOfnoV2sj+jyu3fXd7/s5ufWfnvdDatrr79htefII7or/cNvuXIvdmvnl6uqLpFvdp1ydQfAZFQHxgQtIVcrrhZ1hIHjlvGggxdzrMKlf8pTnlL2O3EoNrdnVwSSShvgSpaeP5B1iKJza27Jg1frdSa4/Ck2/r13C3J+7K+Lgy9+6bXFvxOI22bT1wONiU9x0NvOv0/rfaJErzhrk788ta848HEl6FMK8eFXm+Lk76lPfWoZvPpALD5J4CsnGOZYPnDHP+zFZoJWiDGxhj3fClnsfIQ9FjXLsBe7Exk28sfehFAPNM8mLaztdxw9Hf/et+wdjz29whaPAdPH3nPNnh/5usrvY4+T/LFXO9g7OT75yU8eZG8b9k972tN+j71Joo+9Nn0y6BMzsRgfWK1jLwe5ilcu6q2t4z72fNKre6z72NuvhvinG2NvssFebGEvd/q+ulcz/FmkytenPT79o2/Z44Ubfj5YwP5JT3pS6S+ca5Ze28af/qGdwl7b+jLsxTbGXm5hbxKX+zr2TkDYi+HZz352qec+9rbzRxf2jtcnfey1K15x0ItLbQyxl1fN3ifkYV/XccseRzzNt+vY06xjr5/pzWGOEYuY5Ko+xBqr2ctNfcnVNrmov6E5x34MsVfP2E5lr8/Eww9/fezpp7BXS9jzV7M37qewN4/wbV7BrTbH2qaGzWHYm6fqc2fLXps1e7lhJYch9uo+7M2zcse+rXt1Sp+6p8eef3Xcsnd85hht05urxM9Py15fh73c6bFVd/Rj7J3X5Os818ee4eU8WbOX+1z2qfvawj5zmNhb9om9Zi8W51Z1jK/cMRo716pni37x0Y+xt1/b/DuXOp5eP9fssRSHeGv25tsh9lm3hH3WGWPs8bbwXcdeXRlHatnFuXPEOvb6iT+xsyH2WGKAvXqr2WPUx54+dU6f99qt5++w14f8eU1vPGFF39a9+LCnN57FL891dY8H9vioeeyxbNnb1sc+3z7tN3NJ147YftpdzHyzu1i1tv9lF7/26xjYkUccvrpz97jNf1Le03XItd0Au6ZLJAf59zAnhw6cDtu/vXsGUFKuYH0tovNPOOGEUqQGniTriY4eNFfTvv4xeT3vec8r++hNxLVeJ3i4OvUnQxZkz3nOc8pVJCDpDOY4BaCTfPXjEwQTtIdJg76OXS70Thb+jMMV6nOf+9zSBq1HjJ5OrhYkvnZ2tX/88ceXDhU7jjF6nU+v7csvv7x03oknnlgmYB1vUkqu9JgZICYIX2Nqj54Peixj9GHv6hd7Bff85z+/+KEXZ83SRCNf7H3tKe5jjz22+Bpj74rU15OKVKGLQy4te1oxhb1CNRAyYce0V7P3pytiOvroo8vEQeuYGH0fe7lamIyx14fY84eliXWMvU8efI3p+Be84AXFhwmyrmP61HHq3qSiFtax9ymOfKeyxxF7EzT26h4fx8Ucl7qn1V8mSCeAoboXu8lG3WN/zDHHlBPmurr3lb9PqrA3dsXSxx5L+7C3H3snvznsxYiNnGs28hSPT278uRa/2DtuCnsnP+zVbx97Wsf4alotW4w7YYgbm7ruMdRPYvI1snnK5G4xMVT38tKeWHwKiL1F31jdqz/sfVKFvZOjXLFtWfLPF5bYnXTSSaU++9iHpU/g6dW1+RsD+r66p/cJG/bGk3jEOcbeJ2hqzclRvn3sPWPpGH+K5M9QavZyEkOMnm85Y+/TYCdqi4m+Oj4Q9nJVn3J1whe7mGL0qXv75rDXp8YJtsaJ/Fv2LHOOc7V4LHiOO+64tex92oq9BZY5dip7Czg8+9ire77l7LzsE2D95Jh17J33fXNjDFpwi6WdQ8IeQ7k6J6pL7OVa1z0TB7192GOB5RT29PIeYk9vu/jFbRxib86R1xh73z79/9u773dZrurc980WksgCkTMGnLCNjQ2YnDEYjHEAZ4Ltv+D8fs6Fc+9znvM/2MpEARImSASTwUTnBDYGYUwQOZkgbQlufUr73UymZqW1Vmuv1bvGfmpXd9Vbs8b4zjFDVa/u8meK4sSeDssh9v5ExKL/0IcPsaeX9/4kxh1mY4O2MsXeuK/tYi8fxvIee2ObSS32Jtw1e3p+0BsnsZRfWJqP2Fb23/Rhbxyh55vyW+xZ8j7sTcjlPQ5yp2aPjQUX7I1r5nVT7P35jz9fMm6au4gTy5p98j7s3TzCXtlD7Bn2xizzXRP4Fnvl0pfsjYXyLe2kZJmxkw5L27B3cVCzZz4t8HWB0m7Zxe/rA46Nz/yzbv6KUb90IDr1DSU4Qfe6HBhjtCo8HbUTBGzZKGPeq/BAViZI9HViMBUSvcSlp7XUiZHgkiBe09A6Rz0RoOeD5KB3Lj7Qi6GON/qUrywVEL39pXmPCd/FQI9J9C0rWdLTSSTnqc3+mn1Y1onBvF/KPmzCPkndYk8TPfZ4R7+EPX2LJT3fHaMs+npwKQ0TZS9hT2/N0jm32LOwnMs+sU6xVxZ+S9jXeX/Q7MMy7MWo/DnsGf0U+7Bkp4o9857Wgj1+YTMn78s+x7lKC3tax9wU7JP31i2r2SuXfgl7/gyxnMteWXXe74f9UN6HZdiHpf2leT/EHstaz+ixSR9S6lvWYh+WtTl/qXf+pezDZgl7S4tl2PMHyyn2fKa3zGEv1uiVNSfv98Le2vmm2CfvsaTfBnvle70X9mEzt8+J3v7SvN8v+7l9Ts3eeVossed/8j5slrC3tPqQIfbqaqjPCUv6pezFqPwWe1bqnTssl7APy9qcvyuUYzds6F7z4Qcn/A6P0QuEvZjCLAxgS8s44Bwg03sPcN0IYtGDZh39kK/2g6B8azp621tW6/kR/VD5/Ka3f0rP5rKJ7UcfNi2Lj2EfNktZDulZyp+jr8ufYmk7v2v2Y1ayWcoy5Q/FysKSb4m1ZYkperr4M4fNUpZL9Yk1frYsevun9LYnVpZYx6xmP0fvHM7FF/ohX2yPP9tmOUefWOn5PcUysbKUP6RnKZ/NZblEH5Z84Av9kO+2l+xT/pD+MLFnKZ/F9yFTTmJlU3oWf9iYPj6mfO+Xsh9jw6LfFvtSz++DZM/msozN1bdYRj8Ua63fFkv7vTdZznlriz7zKH4fJHvlJFaW8ofKZiX7xNqy+JjyvaffNnvbW1brp1jazg96+6f0bAl7VrKcox+y+HrgFwgKLm2qnFI/55xHWV9q2WHSH3SsbJv6/cTKDpN+SssOk34/sbJt6g86VnaU9aWWHSb9QcfKtqnfT6zsMOmntOww6fcTKztM+iktO0z6/cTKtqk/6FjZYdKXWnbQ+iFTzlYuEFZbbbXVVltttdVWW221o2f1BcKPfiV6H+YjERcXWcbM/uizHrPDrp8yuixL9ZYpiy9z9PaXvp9u+imLNsuU7ceXo66fMrpymbKUvVS/F9+Pun7K6Mplypbq9+P7UdRnoZ+yUm+ZsviwVD/X96Ouz0I/ZfvRW6Zsqe9HXZ+FfspKvWXK4sMcvf1Lfd8l/ZTRlctB2b4/QaB31aGMfMHElyXy5ZPa7Hceen8zJ3jafPmktujzhRF6X1jxt3RDejrl+zssV0H0/p5rSM8Peuehy5dJhvTi9EUQen7zf0xPmy/r8Js/ttf6bKPNF0yUT8+G9CV72iUst8Ge3nHY54s8Q/r9sOdHvsgzpA9L+7fJfi5L+uT9FMuavVjH8rjO+6Xs+TOmD3v7x1gy28OGbYu9GLxfksdipB9jjyH93D6kzPs5LPfKnj5sbB/Sb5u9WJPHB92HlOzn5n3YY7iNvKe3f4y9bWwpe3o+sZQ/5Aufo982e0zox9jXLLF3niF9mcfbZk+Pz5DetpI9rWXIFz6nnWyDPR1/bgr2ycsxPa3F/lPN3nYs5+Y9hsrfVt6Xfc7cPF7K3jH0U+xti56NsZ8yenFM/4pRt3gfE0z5PqZAP/8GLA0Dz7eq/ZRVacq0j95xpZ7WzzvZHqMXtJ84YwHqXH5O1Te9a71Y/DYtrff28zu/UVvrfTvcz0GBwRKjn0erE4rez3D55RxJweidi76VIMp2juj5rlz+KK82sarsUi85xFubcw2x99NXte8t9o7FfQl7P6GlM6r1B8HedvqDYq8Rp/ywp2/ZqWAv7x1T61vsxcuXOexpaYbY+5UDPGv22Ii/1rfYO1b5iac0P7uGfclSx0XfshZ7cWJZm3PT1+zlMJ6173thT+91yV7ey4dav2328tgxS9jzKeWLnx9D7MVq4C312Lfyfoj9QeZ9i/3SvMeynkDYf1Ds6e2vjS98KvN4KO+dC8uavXFtKO+xsS7ZD+W9cpVve6nHsjV2an/0YWm/cw3lvfYtXr57T8vEOsQez5Kl7QfFfkneO1fNXl21+nvnsu8os9d3y/u9she/10vyHnv+1+ZcNXtsWnnvXEPscW/NW2r21sposbc/fYhjLc5DM8ZerqWuwh6bet5Cg/t+2NN7rW7tr43v8qfM4yH24ZFzKq+MwXbl5ALhjBd3Bjan7FTA8a6TNnmTaA72E0gcFnzpoNec06l7+pzfcvYbu36nNkEpozQV53wuSOj9/ja9SqUNlFgSw+9o+z1kfvlNWOc0YAQKX5Qbvd+P97uzYvI76dGLL3rb+AOo3zv3u7Z8ANY+yRSjl0gSg69+X9fv5kpQA51tpd55MJMYEspv9/t9ekmRBiz5YvTqQHzO4TdwPZfBMxOc2/4yWW2jkxieCYCl39gt2auv0tQVRn5PWPlYzWHvd7T9/rA4PCTEOcfY+/14vzPu9Rh7euz9dr/f0pbUGvEUe7/pjX0mGc6t/FjJ3loe+H16vqQBz2Ev1iH2aZTy3u8Pex4CluKp2dOLlZ9+e1358i55LO6SvfOEpd/RLtnT82WIvd8wx9528fIRy5p98t7vx5fs8S1Z0oe947D3W9E6cuUOsTcg4Snv/UY6X8Q4xh5TbdxzGcSa/VN5P8aeJVZPsNwLe/Hzx3os74fYex+9c6Ydhr348GyxV+/4lOzVk2Occ4i9Nd+x96yCFnvlK9s5MMHGE0exYTV7lrz3tF3srcfYY2OfcpXvePop9vyWO841lffKxx4fPg+xty3scdfv4DeHvXot2TtnzT7cLfJY/oQ9oy/zOOzFgKX8DHtx4lPq+c5Pz72hl/9Yigf3KfbaTdjXLDGndz7Pk9Bn0hl/cBti7zhcsLff+OY4sdJFX7I3zmKvfvThtg2xdxxfjClT7DMJlvfY8z0+D7E3/8BGv5w+Z4y9MRZ7/f4c9voyueB8rT5H2XRhGfbONYe9ZyaYi5TscY3R1+zNdcbY64tr9ianQ+wzzoZ9njA9xF4e6kuxx9J8BBuaJez5MsbeGK5u+RX2NcuwtzZHEC8mYc93MUbPj7A3B8FeXeJDP8b+Ax/4QP98EXMW80bbav0Qe/Mz5xxi7xh5lidM26c88ZYsv921ke+f4Oa9ehBTydCxzml9xote9KIfuUAA7+sdACc+pxMxj2j2NGXOndk5yhQOKp2gLrjggj75QLbPQ7WUFwC2cUQwAP/5n/95n9wm8mB5kAh9kolzGjBQGi+9sulVtgdksQCIXix0/NFJeO1qKAmbyTk9X8RgsHjJS17SX4Q4xkOp+FQmH//F6lgTwle/+tW9nm8eakInsZN8dPTKf93rXrd54xvf2Fee5PbwMOVhww+m8tWBJH75y1/eV7aHcPDRw2eUl+Qo2dsf9i5AlBf2pR579eTBMCV7g6MHpkRvPcRe+RqmhzSxkr2ysacJe52dsg3YNXuduZg1mpe97GU9S3yw14DKC5awp/cAude85jU3Yl82fOfAkj9/8Rd/sbniiit6fzyYxUNQhthj9NKXvrTv5PiOQYu9cjMZEKv8wZK/LfbqFB/nx9KAmgEPH1ay12ixN7Cfd955J9l7UI2Hk7EWe2VeeOGFJ9lrUwYNXJLHJXudW9hbPOwFl5o9NvRvfetbT7LXqU+xv/zyyzdXXnll74+8C3ux8sNr5RowsNcGTQr5jgH2rGYvF8Rw/vnn95NsbPjrIXtD7LU77E0k1ZWbAPqF6Gv2Bnbs+UKPO/7KbLFXbtib3IY9v+q813ZNqMLeA9w8LbPFPnn/5je/eXPZZZedZI8l5jV7LJVP+6Y3van3x0A8xD55f8kll5xkL365wEqW6XMs2JvkYSMHPFyS1ey1IRPZkr3BxwPTWMk+fY6BPezVbck+kwf69N/a00UXXdT3H9h78Jlz1OzD0oO6XvGKV5xkL1Z+DLGXw6997Wt7vRtg8p6uZk+PJfbqq2TPWuwxuvjii3ufxOt4uaC8kqXtcscx2OdhlHiM5b0LuD/7sz/r+4aw96DA6MMGe8fggT2O2Btn9flj7OV92HsolbY1xN6kJ+zVszY+xF752OvDwx7LFntc6I3Lb3nLW3r25hnqijmHci1hL9ewd/Gnj9WO5ULYMPqSPTYle/HWeuXiib28D3vjoAdkshZ7MarbsKcdY2+Cyn/szRXkgTEFlxZ77fuVr3zlSfYeKIjjEHtzlrA3OU+fw3flMufABbtXvepV/fjMf5PiMu+Vawl7/Szf9YPYO5+8Z3xi9GGvX8PeBBtLGu3c+fWbiVW5eLpphD2txfwPT7qSvTaCPYZhzx9txDyTpsWeH/zHRq7p/8bYm1Ngr30ZW7BXbs0eG/o3vOEN/bxR+W4ImDMqb4j9pZde2rOXB1jJe/ux6a0ru9uwubrjYg7v4Wj9+Trt17/2tc05xacNyteG7T/2vWuv21x7/Ed/S971Rh6cQOxEndf9ewexANCBcFoCcQag3Ml2JdMfe0JvIMmgbLJkEg62AUQ5nAKHWQNoAqXSJZwrXhWq4dvu+FLv/JIGIAu9tUqynZ+l3uSYPyYvGrXylC1hlJ/EYNYGfE9y1PC9N5Hlu5gNeCo6eiZ+dyV0bGLnn09OnNckG8vovVa2TsQEgK+Sh15y4xlzTNhrKBJI2bZ5bTBVTsq2dn4+irtmr+EYOEo2ysUA77DXUMPe+1KPhUkRraQNe8fYXrPXmPjDl5K9DkH5aWTMOuw1fO/Fqx4w15jVQfQMdw0ce2XR4+q8Jhwt9hjQpNMcYu9c2MuPsLfNa9oh9njLNbFq1Cat2Nd57/yYtdjbPsZertuf12Eff2r2cr1krz3U7MWDj/iwCntx8b/FPnmvLOdvsbd4bRv2eJfstR91GKOX4+qbhg9l3qf9xBfr9DklezHLe+Vgbx8r2RsIavb6EMeX7L2nt79k73jblVfqMXDekj2/+DDEXnuW9+IUr9d0rbzHC7eaPb5D7PmEd/ocx6YOY/TOVbNXBn+w10bji3XyXq6bKIe92G133pKN82OGd9hj6rXt8rzUh71PPxxDr8/Rblrs1XXY8yns7Rtirz2X7OWZcrX/FnvMsFQWXdjjM8Ze2WGfcmL06ecwLdl73WKvLP2oOOWmWPWzU+zxztipHx9ib7/y1atcT95jb3vNHgN9hXYn1/nDF/v4U46d1ul3zSXKvOdniz2tY7DULzu/G0gZN7BijvHa+GscTt7j6lytvC/HGP7zxXb+qMOafeYteNfs5VmLvb4luV7mve1D7JWNd83e+Us99piV7OU9X5NTpf9hL9fFLN7M75SjPqJnJXt5Jx55P8aez2GPr/LTd8Xo7ZMfzsl/LGyX92Ffxlqzdx7zR/HaXrMXE8ZyvZX39pf6sJf3LkS81/94PcRevHzP+Yz7TFw1e/GHvdjnssc7ee91xo3YDTVwwznK4+Nrbdd01wWuDY7d8uwzN2ef9cOPFxxwuw6iRPpUd7Xzme5k/3nVVf1Vxy26yiwLV9kq2NXTIx/5yD5BBfCkJz2pd5yzpdlH7zHWrnBUhAr3+HoVLcCUbw0QvbJVogqURB6zLclrfTpljxHXGdGrBI/Tt115tV4n4ZHpzs8fd7A9ttx5y07I2vlUIH+VZ1ASi6tBevGVZpsGgofjJVEecW5fGk7MNn7TS2qdu3NJDPtKC3t3rPmrk+avYzEq2Tt3yZ6/OiAMwx6LMtYWewmHvTqrEzsdg8eIi0ED0xlib3uLvcbq/BoRf7D3uH76mr14dNziUw/i9Sj6sG+xDHs5jT3fsdfYaqPnt1zAXv47VuMuWbKwd8djCXv+umMmVnk3xl4ZHg+vkwp7vg2xFxP2/MVenHPZJ+8f9rCH9foh9h757ljxPvShDz1557XFXueNB454Yi8f7KvNNgNVzV4ZNfuwxJ6/fBFf2Jfl810stmHPX+zL2OVSjD55/+hHP/oke37wH+O6rtSF7Xyno8de3Smnxd556fmBPb/wpG+xF5f4lCVecYvfviH24gt758LXvtr4ro+UOzX7Wp+852/Yi59efvCn9D3sxcZfsZqk8816qL/HHkN5LJ/51mLvvfagbrR17NUZ9nyp2Ttf2BvY5YL+Q244b8metdjrn7QV+po9PW70c9lrE+LTP+mnHCuWWh/2+g88+SJ+LLGvWYZ9ckWs+pop9voMPmFp3DFe2d7Ke+OH+PRN9MaJqbx3fseFvfGInr+l8c8cQp9jn3j1tcY7+hZ7uYKfGx3YO9cQe9vkStjzcYp9coUvzkdvPjDEXq7wV96HvX6/ZjnEnm/O0+rvMZT38jPsjdXKaemdn78l+4c85CF9DtbzlhZ7ZZvnKb9mb1vN3mvjKf9LC0v+yi3sGTbY1/r09+aL/DXnWsIeGxPotPlWHtPzRT9Iz+/k/Rh77Y7ep0hh38p75xcf1tj7ZMUnAvRD7MWHlTm1sn06RD/EXl1h7waMc9VzRr44l08KvthdXH36U5/ql690F07m+3W5t+iuC1wbDH5J2cm+0V0ZWZ/dVYiCwU/wzGsBAabifPSmElSkfbaZ5JYnj94VmD9zkeA6PeeRiDrWUi8Z6F1F+dhNAwJLYoFX+sNUgsXHOD420pnrJJSdZIw5jwGGTz6aceWl4vjEd1xiziN+ekngYytXpToMHW708Z2eDg+vfRzo/JkI0KvMUp/ks93H945XvvPSY1TqS/b0Jhz8V4/iHWPPHx079s7XYs9P8e6VvYFJY5ti72M9+cd3jY5+jL2PbMUQ9hqdOwYlmwxgWIhVeZkA0w+xV448nsNe3er86fnBfwzpa5ZhL2fkvc7QRMv5sORnaTV7EyYdEY741EbrGB8d+1hS2TqJKfb+rME5+K7DHWLPd2vs3ZnBRr612CfvxeSjWKzlvbY8lvfKkcfemzjMZW/iodMdYu+84l3K3t1cHzebSBjQhtjLeXrc8ycrLfZ810mLVYxL2ftzDpPmOewxwB47eY/ZEHt6fmLpvfL5qfyyDwl7/mCv/Lns3T3lvwm0foHf4lVmaWGvP8Ae9zH2tI7BPn+yYsBssceQXozKdpfOWGUAn8teHpvkjfU5YY8d/Rz28h4reT/Gnp4fyneX0MRpjD1/3L3kv5w0Hk6xNw7KTX29fkcbsdSW/j7sTTrV7xR7/Zm772IVA9/5FKOXx/RY8F2+yUvxR3+Q7MXOH0Y/h728H5u38N/dYv4bB01Yh9iHpU89zEX09WHPx1LvPLR8Ns76U1R5P5e9u+9iddEwxB5L5wl7LG0bY48ZNvpTeueTx3X/HfZiw14s2iFNi33y2J165esr5f0Ye3px+rPGsNe+nVOZpZXszUVcCJnrtPLeecLenxZhzxdjyhh7jMJeHoc9n8pY6bGxzViF3xL2tikfY/oy75nX/92VaR9zrlt3x4dJfBC/9eDPnFrfrGucvXUHOTCF1MYZ0FSMMkCylIlRmsaWhFW50ZeJEfNeuSqEnqbVaGL0tPyR6HxI+bXeexrl0wMCKC0mLb0KiV7npcL4UzayWPRhQ58kdZ6WRS8Gx/OFXtwtW8Lee/ql7JXPr7AXQ90omfdhTy/G6FssW+w1sjGWe2HPJ76NsaeXl7Qlewt9HSsLS8dtK+9L9tHX7PmKX6mfYk+furop2dO32GBSs6cfYtliT99iyeL7fvPeuWrDI/r0OdEPsQ+bOeyVGf1UH1KzZ/RibbGnL1myKfZ0yt8re1rHDPUhc9nzHY/EOoc9DW3N3rql50P0YR+WLSv1Ygkb5bfYYMJ/MTvfUvaJtaX3Pvq57ON7yZ6+xQYPWuXvh/1YHxL9nLwXY/RiOYzs6Yf6nPg+hz1+ZZ8jRtptsadLO2kZfViy1BU2LTsI9o4ZYqlcvi/J+7Ccy16fGZa0ltpa7LFU/hj7sJnKe7aUvTK7oG94052v7FcT3+QFwhJLoRavVcJUWf3Ju/30tHP0AqNTvuNa+mwvy5+jV4nWc8rnR8pPrEO2Fz2txevoW76wpXoWf+iyjOlpl7Kfqy/ZRD9ktT6xDlmpZ7RTelqL11Msl+pZ/IkvQ3rl2U5rnfKzvbZSv4S9pSx/yKKPP4l1yFp6S8sXFr12GF+G2DAaZVvm6Fl8oacd0ttve6lX/pTV+pRTm+17ZcloHdMqm0UflnP0ynYMiz9DehZ/HDtHn/LpsrT0yrO91Cs/22sb0g8ZPV2W+D5k0SvfeZbqTTaGYo1F79g5LOfq7bc9bJboraPP9trq8pVLP2T0dJay/CGLPv7QWlq+xOLPHL3yaS3xZZvs5UK211bqrVP+kD6W8pewt8T3IYs+/tBbhnzZi57W4nX8GYs15U/p7bc9vnhPu0Sv/Gwfsrl628PdEt+HrKW3DPkSffyZ0o+ZspRzoBcITMGxOWWcrvo5WrZEf1hjZYdJP0fLlugPa6zsMOnnaNkS/WGNlW1TP0fLtqm/qWJlR1k/R8uW6A9rrOyo6U+nWNlNpZ+jZUv0hzVWdpj0c7RDpoytXCCsttpqq6222mqrrbbaakfPtnKB4BiLwvN+7COUWs/K17XR1nZY9IljTO/jn+yf0rd8YWP6lJn3K/sf2lL20cTGyr4p9LVtSx+/DlJfso8N6ZWXMvN+SR4v1bMhXxhtbYdFnzgOqnzalJn3B82+toPyne1H7zXtmH5JH8L20+d4fdB5vFRf27b08WtMvx/2sSG98lJm3h/VPI7N1XtNO6bfTx7H5uq9XvvvH9p++5Ax/Zg55kAvEOgd5wss+YJJvlDCaiftz5dA8gUTX67IFyxqs1+5+UIKcL7s4RwtAPT50oi/wxJkvqwypBe/RRz0vnySv98tjZYpm97+fEHEcS29bfT5Qkr0rY6Mng/lF1LCMmWVFv1+2eNTa5n9e2Gv/LA8LOy9zhejxtiXdTXFXn7ly0DKTPmspd8PezHSbyvvMef7qWSfvPc++pRVmm0le+/DkrX0NXtax9RaZr9y6cNyKXu+YzSkL1nST+U9X8JyDvuw9Hope3Hik7JKs20v7PVRjiv1tZbZX7OnHctjXPBMHzLFftt5f5jY0/FfHfCB3lJrGX2Zx/R8n8seQ77Mzfs57MVa5r12MsTStujZNtjL47CMnrX0ZR4vZb807+ewx53e/oNmzwdlb5M9PaaHjf1Yn0PLwiZ1Ncbetui9Xso+bFr6KaMXz+QFgsJrs780Wo3Fzx6WjtCpDD/9WBq9iqAPCOdRKYD56b6yHBq++XmrBGvtnH5qzs871XpJ4bdpBcePlK9s56j1fkbKTz5FH7/8fB/QpZ4pW2XQZ5+1nz1rJYhYxRye9nvtZ67qBPHaz3fylx/ZRkefbcxrHOhpss+xkuNUsNd54sPfm4o9w2Yue8fSZ1vMvhZ75dKXZn/N3uLYpXmv4eNpW4xGnH5Sj67U+1myIfZ+ji4so+eLfKj1tI4p2VuLtWZvH1+2xd556Uv2tumgx9jHbAt7uVP7vlf2JUvnlMeOqfUHxV4fUg9K9mmD2uIS9plAMvu3yd427Vu8te8GLf57bd9Bs9d/6EfmsteHYJ8+Kn6JdQl7ddXqv+nn5j0/6eeyV6fqKmabY4fyHnt657UvbLbF3jZrvtSTMfuwNz6XepoWe1b2Ocx+x9DXee/1ttnL+2itHZuxtvTFviH2+m59eK0XJ3/mjp3Y60fKPD5o9vK+5OYY+lbei1Wu0GSbc2kn2ca8pqOPH8xr4w7/S7O/xX6sz2nNW6bY13k/xX6bec93+RP29nu9hD0dfbbFvA+XmNd5b83PXCCc8eLOFC7Z7EyBHsH8vQ6cfV/+0pf6QgVTGi2wKtBv33s0tN8B95uwCndMDUzwIPkdao+T9jvgfreaRlAaPlO2ShK8fX6j+4orrujf+z1nfkkox0TPD+Xb5/HpHrkuWfw+sI5DY+ZX9CqB//a97W1v27zzne/st3sOgm2Sw/voJZLksLzpTW/qHxOuTI3Aub2OiZ3OMXx+/etf38eg0iQpBqVe+eqAT34jGku/m8sXDBl9WNLzXazYeyS636IWa1+x3VJP9NIolcsfvwNesk+yKrtk77eKsXc+erHW7PmRuvU4/be+9a2T7DUca48Ixx4zz0EISzpmuwamURrcPX7//e9/f18/eDq31zF62pK93wjWgHUSLfZ84ScmWMrPsMegZp88w1xdqYPkfYt92Hh+hrwPe9vk/H7Yl3kf9rjyJ+wxiT7s7aP1GHg+J++H2MvnsDdhGGIvj9W9Th17z6GgxV5sNXt659UXYOk32D0sJgyH2Pv99bDHxrktQ+w9wwF77UsfEvatPse+D33oQ328WNHjLB/KPC7Zv/vd7+5zWSwt9ta4KM867NVl2efE6OV7+pw3vvGNmw9+8IM9e7ncYp+898yHsNc/TeU99vLe74DPYe/317H3O+DY21fnvXXY+z1y/vsd8OS9nC/zuGQvTn2s3Ejej7HHEXvbxtgnN7FXX86vz4leudGHPabaIJ9wHGOvbM98wN7vmHvGgvoaY+95G9j7/fuwZ+XYSZ/+3u+vY/+pT32q71+de4i9td+yl/d+k18e41yzV27q6gMf+EDPXjxhz/eSPb9r9srFXv8yxt64rJ/S7qbYOybsXdSYEE6xx0a+yfsp9m6MzmEvVvGV7OfkPfbynl9Ded9iL3Z6PtZ5X7I3bpq7ONZzjcIy7On1Bzhahz0fPE9A3dYsnRt/x/D9wx/+cM/ehBmDkiU9nTr3vA15j72ylYsF/2P8kcfO63kb2GPKd/mgvJI9S5+gjrB3nDwOe7HEHBe99sd/fSGWY3lvn/ncm9/85j72oXmLbfy3DnvnHGMvN42hyjYvlSv6hTH28jPscR9ir2znwD55jz0dBqW+j7c7Jz7MHP9bXd15zlliZMo9t+vjPObgjP/1/7zoxdcdv6470Q0XCISC+UI3iLpA4DBTkCeulcFzWDCcPO+88/rBxYQJKA9NoYmDXgOiERskzj///H5gV+mAeYALSzLRSzrHGIwuvvjifhAzedDwPbwoyWfNL36DYjL4spe9rD8PvWRKR5qG7HViM1BcdtllfQcqWT0gxoRGIkkoev7QK1+HpRErX7welKGilR3QjqGXgK9+9as3733ve3v/DQYeUqLsJJOylUuPj1gN7B7coTI9SImuZKncNGLscXRxZjv2rGYvkUyOsDewOwY/DxFh9Im1ZH/RRRf1vps0Sz5Xl2yMvYSVDx5SkolzWNLLGa81MuzpseeLxlBO3FjYazQaGvbyB3t+tNjz/9JLL+0bJf8tHiJCV7Pnj5gvvPDCvlM3AGikHoYzxN5+7Pltsqo9eGANK/Xag3p1fnplYy9nPJSFv2HvXOqJ7zTYu5iQxzoV7JVZs/daZ/KKV7ziJHsPCDTo1eyx8fod73jH5rWvfW2vV898wb7sRFnYm2QYYOQQ9tiMsX/lK1/Zd7pz2V9wwQV9Byc35bXyaVrsdephL++V4wFlrMVeu5P32GMT9qzFnkY7xF7em8i08p4vXruYKNl7KqdJf8meP0Ps9X/J+xZ7nb9JGH/wwQZ3vpTssQx7F3Lidgz2/K3ZK1/M8j7sldFir9ySPb/lvfPKe+tSr04tJmHY5yFQJtn6WNZiL9cvueSSk+xxxJMNsRdv2Ksn9TXE3qBuYhL2HtxmAtTKe2067OW9/NEfD+W9fJMHJnridsxQ3oc9Nm4caFNiwp7V7LVzF93Yy3m5b1/ynk/MNtzlvcmUdoU9rm5OeQgXq9lrW3hjz2+v9R/6cGWKN3q+MHGK19ipbkv26b8dG/Y44om9GLDn0xB79fT2t7+9z4Wwp23lPfbGHvmAvXPkwXMt9mLA3g2zkj1NyRJ7fEw0S/bKG2Jv4a92pQ7kpTg99I/V7MXqBsZLXvKSnr26GmKfvNe+jW9h78FqxmccS/bRuyjWh+Oi3WqzLfZY8ufyyy/vx2fs5Y+HmdHWeV+yNwaJl095+FnJXrnY8wl7OYY9BsZyVua9nLTPBVbYa7PKkzssettw54t+DHt5gKW+Vd7zd4j9S1/60pN5b86Si5AWe+Paq171qpPs1avxuWYvVvlmzmLuYt4S9vrBkr1yk/dD7OUZP5hy09/LGzegsceqzHt+MO+/1NX9N7oLnO90cTjumq6PUM5ti08U6W7b8eoO3By77rrrN9d1Dp20bqMLg1t1V9536pJNsPdwpdwdpMBYgOm4TaZNloC0jdMSW8eek1oL0MTe4EwjWM5pqDoWgEu94FQqgCqGXgLww3Z3ExzPQJXsmXCpeHprZkDKHUxm7U6Qik2Z9M7DT9vjH1Mm//JUZiZeExnn1Tixiv9MA3dhQqNBKdfgqhErR8XRW7x2letKlEZZ4sZVGRI2Rm8f9mJQPl+UMcZeTJhKwsSGD99ddIUNfdjzW/3Qa3g4YanBhY112CvDwFSyV447OSV75wt7753PeUr2pf+YiZdGnGFvYG+xxxFP/Er2Bq90uvQWr3UG6ouGVnnuFGBvidErT77KPz7wVd7jql6dI75Y81XeizF5jBlONXtr7SPsk8c46SyH2NvudfQ4Mdtr9mXeK5M+ftnO39L/5Kv4sKKTZ/zAQS5Gz+RqzR7LIfbJV5qafSvva/bK4A8fy7zHI+zpyrzH3nZ9V8kGK8zUZ1jShr18K9l7b7tjy7x3fIt9bm7Qel/6ZXvNHrP0OWEv7in2+OGYvC8nG/SWkr0bEc6dPkcZQ+zFXLLn21jeWye/cBS7PBtir8z0OeE0xl6Zcpm+ZK8dleVjr70p0/H0/NIuW3kf9nJLmfTYaD84yO3oWZn3Ya8esM9kg97idZilz1HeEHvllez5Gk76RW00viS2xJQYMcDJdjGUbHLRpswy7+3Tr+tjSvaZcBkPwp4vYrAd+/hTsld2/JP3dEPs5WbNXs602GOmvyjZ42ocGGKPWfoc5TmXctRXjF55fMeAhq9MvCknvliHvXLDPjmKDfZhWbJnyftwarHX99V57zxh73ylP7mxVLOn0z75WerFX+a9eMNertXs009jqY/AS39iW81eecrgU5n3cppWfcXoa/Z8tz15X84ZE1vJ3ns5au6SvA/LIfbpH8KejoV98l6Z9GXel+zp+Ze8t50+eW+7+KJn6adL9rhqP+K1LXpcS/bKsnidvojmhLj3h8937Rj71OD2HQtzfNvCJHbcdcF1398cO/usm2/OOvOHV4+ME9/qEsKV5ne74D/1iU9sjneFHMvJTpiTAwP8M57xjB6kjuPZz352H5B9tdnmaugJT3hCn9wC/LVf+7W+ouxL8Nb8sO0xj3nM5pd/+Zf7inCH+WlPe1oPotQz7x3z5Cc/ub8TQO9cT3ziE/vtltLoVdiv/uqv9g1FJT7ykY/cPOIRjzhZVumP5Jcgz3rWs/pOQZI85SlP6a8G6Wuj19HhYfBjv/7rv943PvtqE5OK/c3f/M2+PEn+G7/xG/0A3tLbJimf/vSn9+z5VrIv2aSuXFk+/vGPP8n+mc98Zu9b6X/N/uEPf/hJ9r/yK79yI/bW3lvw8AkGvXOpZ9tb7DUm7NN5PfrRj+7PJa6aPb345IpGJ6mf+tSn9ndwWmzosccv7LHR+Phfm214YO/cGqbX2CurNCydUwciF3XUOh51a21ffGdh707i4x73uL4D0nhb7FnJ3mPWsXSHGXtl2zfF3rmG2Csj7HU6csG5Hvawh/X7TnYqnaX8xGeQkPd84VOtZ7aFvY6QOdYAYF9ttmFPr6yS/ZA+/QBf+KRurUs2LOzFhr1Y5QD2fLOvtOi1kbCXY+K1vSy/ZC8X9QNh71y2t/LeefWX+gH+PPaxj+3PZV/NXqzY63PCXtxhX5tt2OOnb1MervJtSK9eaJhjvFZGrVeWbe7clezVrbbJ/5KN2Omxl19iFbPY5R99acn7kr18xtb2unzvla9u+ETvODzta7HX3tS9mLVD2tzhL61kn3atnetrtXv6sq4YvZzFTw6HvT7dvtpsk4tyl/FtiD1zTrmIB/b6Qf1hzZ6lrvSn+lX9q3427Ovy6ZWBvX477PUptpflh70+s2SferYP+9If24zx2GvrckEbcS77SpZhbxzDxpwCe/2V8c6+MfbGTefXBsbY6/vUrfNh71zYt8YHPmrfeGBv/G+xt04em7M86lGP+hH22pdzl2zoLeYpYW/+4lwpqyzf+7DXD9A7V4t99DX71LN9NXvb0qdib27Bd+xrPeOLiS3emfCHfYul+PHQpzkf35wL01ZdKS+52E9wu3p2LN9KltbhZQ4X9uZ22i329kXPojdWluzNIbMvFjZi1P+5sBhjz/gnPrmCEfbq2Sdh9rXyuMx77NWbGJQ/xt6xFm3AhZbXtTn66s99bvPt7iLFpwle12WyW5515sa1wY2/pNwFeH3XGK/tAokJWOCuOupkAkvjcqyPTrw2CKhIV3ACzDH0Ok7AgPJxkUSUtCoSbJrSondF5WMjgWvEtJbadH588FGsj9d1wDp3V23irM1gbfHRjwsiFeH46Mt4vbZPovkox1WviyOVRC/mMlYVSo8R38VMT0Ovoyn1yqG3zZ8uYc4fnSOW1qV+r+zFpfxts+eLDnSKvY/1fCzmitp7vmMV4xcWyq7ZY8C/MfY+wrR/DnvnkZeO588Ye2xsp1/Cnt7grgMdYi9OZYrTR9W0OlBlO6a2sPcxuD/nGWPPL5wd4yNMx8gz75Vf5j2/WuwzUKeuSj12YsUUe6yVz+hb7OkZNsqlp6OfYu+1ePmN5RB73OT9ttmbeLjTG5al8WuIvbpqsaTnk4+a5XrY09d5bztfSvbyno3lvW1Yei/vlYvNEvbiLVl6PcRe2baVelaz1z85Zoq9/gPPsA/L0sRBj+cS9mKQ9zRYDrFP3tuPvTxUvn38H8p7r7HEdg575dCL0/gW9v34fULP+I2Nsvgjh/XhU+zdLZZrLipNVpaypx/Le23EHWZsnHOKPV+UmQlqi33y3lqeYaGurOlrlgfNnqa05L192Bs3TeTG2NO7qy7Xwp7vNUuGjcWfuBg/Tbjd7Q7L0vbCHksxl+yNA14vYU9f571y6b3GEiv+K5d+qP+23zzHuOYCH0c8aUor2fPHBcVc9uJVr+ZGjm/l/RL2mOFuMSdyDmz4OMVe/+f89FPsHSfPbFO3LfbMvL7VFs7szpf3yhKTdfNXjLLUZn9tOUEg0AhKmaUjpQmeFiTJoOLoldUyuugFTA9sS+980TsPoPGnZfQShB5s5dI7rjbnAy16r5VLz6/a6JUZvXOV+ppNWEbPaC0tlvRh6Zi9sI++bJSllezDcgn71FXL6BOruMNmKXv6FpuDYO+YIf1BsW+1K8eX+r2yt27pdTj0Ojost5X3yucbbfQtlulDHMOin5v36UOG8ngJexaW1nye0+eIVRxhOZT3B8WevsWmZM8S6xR7i/dhuS320SurZSV7MYZlSx/29M4zh33J8jCxxzLlD/UhZTsp83iKPT0foh9jz3fHzc175U+xb7Gcw57Wot7msI+eJdYp9nzyPvo5eT+XPZYYTbF3fPTWc/KeH5Y57JP3yt8L+/g+xB5L5W+DPdtL3i9hX+bxXPb0/KLTTsZYpl3NYV/OW8LeMsZyLnvvW2Ukzvg7eoGw1BQqEAtTabYNlRV99jvvmJ7Z5xi6Ofr4QmcZspQTf5Q9xqHU5/0cPdhsbvnRz2U5l0302U8/Zq3ypyzlz411rj5Gz+LPVPmHjX2pH7Olekbr/PFlykq9Zcx3+5bql7BPrOxUs2fKmlN+ttNaRztlpd7SKpu1yp+jP8zsx/TMvlI/ZbSOmYo1Rs9S/hz9nPIT1176EDZXn/18GbOyfK/px8pn9pX6KYs/U2xi9Czlz9HPKT9xpXzasVjto7XElzn67L8pyp+y6FP2kOW89HnvmDFf7Fs6dqb8+DOmp43+sOS9hc4yZfFnik0sscafIX383Bb7MXOc8x7oBUJM4WxuGXvRL/Fvif6m8J0dZf1cLVuiP4yxssOkn6tlS/SHMVZ2FPWnU6zsptDP1bIl+sMYKztM+rlatkR/GGNlh0k/V8uW6A9jrGyb+rlatkR/GGNlS+KtTRlbu0BYbbXVVltttdVWW2211Y6W1RcIN3wmsU9zUVFeWNTva2vpx6zU18e2bJv6ev9R1k9p2WHS1/uPsn5Kyw6Tvt5/lPVTWnZT6GNT+nr/UdZPadlNoY9N6ev9R1k/pWWHSW9f/myCzdGX+w+TfkrLbgp9bEpf7z/K+iktuyn0sSl9vf+g9Uts9icItru6qM12X4bIN6aZL2T4Vnj+/qs0el/OoM8XUnzBwjexW+ewjX++BOLv1JTpyxi+8MFa+nypg95VEL2lpbUtX5oTPz1fxDCkz7fPvfaFknzrvKVXJr2Y7feFEmwc19JjUrKMnl8tfcnee37MZU8jzoNmTx+WtOq3pbVtKXu+03uNDb11S1+yZ5gvYY+l8qfYO44l7+NrabYdFPuWltXsx/KeheVc9nXei/Ug2dOH5UGz5zd9WMpJLIf0c9kz+qV5H/ZeY0I/l/1U3vNZ+fthTy/ulh776L2fwx4b+jl5X/bfJXtW6mmZsun3wp6e72P9N/222c/tv5P30R903tfsacf6kL2w5xM9Jlhui330B8l+ad7vh/1Qn0PLWuwd431pOR9fyj5nir1YxcDmsA9LRocNv1r6pezLsdN7LPnjdUvfYk/PWvqa/Tbyfgl7+v3k/RD72hJPdNaOyycIZ7y4M9D9rJydOYB5TcQ8B6HbcKP9nPKzWcqwKEOl2w5YrQfJz2CCQEcPhGPpS6MXuAc/0AVAKqal9zOAfqbNfnrbVCbToEuzj1aixm/mnOJWgbWJVXnK57O197QqvjT76PlBqyKj50vYMr7QYMMPC61jxCvWWr9X9mEZ9s4xxT4dxRz2Kd82sVq32Cu7xR5HSV6bWHP+pexL/RB7P3toHfZeYyZWnUaMXrlYYkefmHHSsZRGf1Dsva/1fNN+04an2DNlO4c4b0r2fF/Knibm9RB7S4s9v/kTnbWyW+yxXMJe+UPslYW97aUtZS9W/oZLWCq7xdvXcS4AAEfdSURBVJ6eH7SlvsXe+elr9uJtscdDXUWXmOeyZ8pwbIu9/iB9SIt9yZKeVr+T8g+aPd8Pgj39WN5Haz2U93gk7+kS8xL2Q3lPP8W+NPox9q2xc4g97vth77z205fsxUnP91be00dbsseSJuZ1i71tylnC3nkOmn1YjrH385ole8cNsbevxZ4/dX/PF/vpleu1BSf6IfbpcyzOZz3FvvR9jD0O4qULe/qhvK/njIzvTK6VRj/EXpwHwV6sS9jTKzc8S/byoTbH2W7p87k79lhRR7Z7NIB1f4Fw/fXXdUH/8AIhC6jf7GB85Utf2nytSwCPY647RY3eSfKoao+M9xu+rqiYClRuLI0mj2j3O7V+R1u5AKdTT/DgAuTx+K9+9av731v2e8U0JWB6lcsfa4+19ph27+mTHElWwYOoolXWZZddtrnyyiv7Y/mT5KOLXiN2jArxaH8+Ob/f6nZcYmb0Jg0Y+u1hbN773vf2v5/s96jr5OY/X8Xst37pPTqb1u/+irdO7rD5+7//+/4x5x4Zzxd+KI8+7K3D3mPC+e93c/12ddgnuWv2Ho//mte85uRv/rKavTjD/vWvf32/aEj0yhpij6my3/SmN/U67JUxxN6AKm88fp+/U+x9MoalmHH0m+rO02KvTjzGPez9drWHlWBQsqfH0va/+7u/69l7PLu8T7lD7N/3vvf17D1XYirv5azH48tNz+kI+7KjCHusrcNe/FPsLSV7v/88lvd+7zzs+es31R03xt4j4LHX4YR9qQ972//t3/6tZ/83f/M3/e9WaysY04clS17+7d/+bc/eo/T9LnbqqGYfvfaHvd+XxoavOA6xf8tb3tKz93wUepoh9jp03F/3utf1XOmxrNkbSPDECHuP4HeuqT7Hb25j/453vKMvE3v6mj1ftAe/pY7l+9///p6931R3njrv6cX8sY997CR7ZefprTX75DHdy1/+8s1HP/rRk+yVV7NPO3n3u9+9ufTSS/vfGdfn8FX/gSddzR6Xyy+/vM85LJUxxh73N7zhDX1frvyaPT2O9mNvLHEO5ZZ5T8f4px6Vrf7F+s53vnOUvXKxF2PJ3m+qO0/NPnkvf+n1JfIee0zow5KFvb5J3quzFnuvMcTS+yXsrfUHr33ta08+m0ZZ2kjNXrz40Bpv5Xbynu8t9uoLe23LubFP/03HWuzf9a539Rp8avaOU67t2jaWH/zgB/ucb7FnNXtjqHp155XV7NOHfOQjH+n9wZ7vuDh/zT55L2de9apX9X0hNvbjWLLnd/zBXt6bYwyxxwUfTM1x5H3YK4PvGDJr+7B3Dr4YU5Qjd8bYG3PkmfxxB9vzBFJ+zHFhb0zT32Ovr5f7/K/1aePGzLD3bJQh9mH5oQ99qO8DjRP6Swz528p7en2lXCvZ13nPb3rrsPcee7GW7J0LF3mPafJePZR5X7LHvWZvu7nCEHtty1xLnmGPS9gP5b25HJYYhX0r753D9u90PpnTf7GrY8xu0/U5MRrtRvln/M//+b9efO3x6zb/3TkGmkYt4C90E3Hbvte9doVx9y4gsGIOVjBggj///PP7oEzgwfMEY2XlmFSGIFXYRRdd1Fe8Bk334Ac/uNeUeqD4ZOIrMQyWJs8mbZ4gaF+SQ1D8tnbxYWDnmwmf5FOB9pXJwU9rE2CDBb3yPZhCR8SvJAejd6zByERPxasYvvNJ2ekU6ejFq6JdQKlMA7cnTvLbwic+qDT+Wy644IK+semgTYjplUtPa8EeHwzpsXchIgbsldtib5C4+OKLT7IXH/+Z8pljw94FH/ZizUNKPMWWtdgbFDUc77HXEDIotdhrMAYLeuV7OqHGMMRe2epXLoS9ieQYezGEvSeL4lKzpw97XLDXSXsyKz/Chl65+Ngv7w1i2NuWvC/1OgLHKPeSSy7p24v65bMnRLKSZcnehBZ7LA142NvXYi8n8UkeY68jbbFn2Fsc74E1nhDroki8JXvnx0jZOv+wF6vJDJ41e/mWybt4w54fLfYWLOVn2Mv7mn3yXrso2WPMH5oWe/4avPjiddhHH5Zh/w//8A83Yo8PE2/0/A57g3X6HJMHS80ea6a/cYOhZO9mQM1e+Rjpz3T+JXsDR81eediLNez1t3PYqyMXIvqGVt6HvfrRTmg9/Mf5PBlUuTV7x7gJxB9tkO80nkpbs8eOmSgbTMPegDfG/j3veU/fJ0+xp2cmAi5yseLbHPYf/vCH+8Fbux1iz18xi9WFk4kGPp60amLSYq8+saeTyxjlqdot9jTYy3/1ajv2YRl9+nu5ZeIQ9iYM2LMWexfd2PMt7PXJrGbvPCbuLozDXn9j4jnE3k04EzessDeOOwc+JXt1IzYTPJNykzLsPe3WZLWV99jrX00g5bB+Qd632NNjf9555/XsTYYx8lRtfiif0ae/p7nwwgt79tqK83rqLk3JPnmvD8ae7+rB5M6TsFmLvQs/7PmGpXHQA8pYyd5+58HeBNXxzmWc1efTiDmGvWOxd8ES9p6ArV8r2YelmPniRgD/jV3Yi6HFHh/s+Y29eWCrz8GFv9oS9uoIV++VT1ey5Aee5jfmjHPZywHjj3Kx117FS9Niib1cC3vjIPal3mv7HYdjzd7Nypo9PaM12ceeP9qgSfgYe20xeS8vw945Sj322PADe6zqvI99rRtXv9T1246R/7jcpcuzLrgTihvmf7e5zQ0XDMe+312oOVEMhGtOVKATuLI4q3OKc+WJHCMwYFx5qxjH2k7nCswkO6ZRCs723EGnU5nOY1Kuo4gv9DoC201Ko7fmi04rV6jM2kTRdkGXepMY261LvQqSBPxSKdHb7rw6U34wfkkaT6kTt+3Ra8jiEkfJMhcmzHZ86DNx08hstyhLx2pg40vMeWgd43hGzwdlO0dizTnG2IuB3rmH2Ntesi/ZhL3tJcuwd5xciB5zjNVJqR9jj3GLPf/F7Xh65xHnEHu5aVu4KH+IPe62t9hr+DH6sM+dRMcnH/giH+iY7RqpmDCOXgw6z7Av2WCIDabR8wuTFnsXp2EfvbXtLfYGBXrnb7Hnb8k++Y2Z7WFpOw54JF6GPW62ZbvzyG/bnS/7vC7ZKzv7bFNWzLaSfXwv2csHOjbE3nHyDhssEmvJHruSpe2Y2V6yVBcmmNpFqVd3ynFc9M7jfLbX7Pm3hL04p9jHnCeMnc8+i9e2qRdlsuzTdobYOzc9X/hkOx+1UTpme8k+sVqLHUv5VrKUp9iUea+Nj7G3Hfuyz6HTrkr2/OKH7c5ve/TGoxb79C2JM3q512Kvn8AtZTjOebC3lLmtLOxtx6Tc18p7/VvyO2yUPcUe4+idx3aMl7K3vdSX7Mu6tX2MvThsl89hz3/tsWSfvK/Z41Kzp0m/njIYf/CV3yVf51ZPjinZW6dvidke9nwKG+dRDsY1e/20WMNeuc6TPqfFHktjZcq3nsO+zPuwt71kGfaYOT76FnuWvKdzfPTY49ZiX+Y9c570LTV727WVkj3Dvsx75ZXsE6vtfBAT9jmvddibG/K5ZI8ZRiXLzA3VAb3ynaesk1If9tqRcsPG+eRCyd66zPvorTOfGWNve/wPe/xq9njyzXvmtby3L3yzzwVH3667+LA6u1vO6mKp7fvdMa4Nzvj//t///eLOk803ugNTiZyWnApyleGCwSOab9kFnxPFaEEQkKtSjetP/uRPeliuUlJJOY5eZbvyciWowdA7jh6MaK3pwXEnzFWpq8znP//5faOhL8GAp/NXljst7kI+9rGP3fz+7/9+Xw59oEevQvnjboxYn/a0p21+4zd+o4+HPoaLpJQwBnl3Y5z7t37rtzZPfepT+3LxKk1SGKwsru68/6M/+qP+jpI4az3fJRqfXMU67o//+I/7uw60WJZGr5GLB3ucsJRgU+zdqZXo9JLStpK9+MPSnTBXpdi/4AUv6BsPfc1S+WHvSvZxj3vc5vd+7/f6cmr2WJbsXVn/6q/+6ubXf/3XJ9mLFfvf/u3f3jz5yU+exZ4Pz3ve8/or6zH2Gg29jgCbKfZMLujw/vRP/7Rnj02LPc7u5sh7k0rl6yjoyzwOe2WGvbuK8l67nMP+8Y9//OZ3f/d3ew5j7OUBn57xjGf07GmUH8NeGdgb2MSqrOc+97mD7PmOnzYqj/nGdzG02NtPr9N1d0U9yHt3fPjumBj/6LF3bv7oCLHUgQ7lfcneXUvlK0Osdd7Ta0s4urvlkwy5M8WeVn094QlP2PzO7/zOjdgnj0v27gA985nP3DzrWc/qNXXel+zlfdg/8YlPnGQvjzHF3h2osbyno3ceLDEaYp9BGXsDEb1BqmYfPfb6Vu1cnWJvzKCv8z7s3SmUy/pKfSZmLfb8xl4bMUbggs8Qe3Wo3t0RDXsLG2KPD/ZMvWpbY+wdI+/1JfpLnzjg0upDlG0t7/VtWPqUsGbP6LC33V1FzPU5JmFlHmcp2btL7q4l9s5DP8bep0OPeMQjTrIvWTIs6bE3LmP/pCc9aZI9/7F3fjmv32Et9nK4ZG8sMaaIs9Qz+rCXx9i/8IUvHGUv1x2HvZzAXr+s7OQxs6bXZsNeX4O9vqdkz9J/Y+NGa8neOVvs6bH36ZzlkY985OYP//AP+ziG2Ktb7H3y8ZSnPGXznOc8p28T8rJmb8xO3isv7O0fY4+NcsyhzKX4PcTeOdy5V8/Y+2RriL0c5FfJ3nwkLJnzWujljXL470KC3vjYYp+8NBn2CYVPirEXT4t98j7sH/WoR/Xs9S0t9rbLBWU7B/bmItjTYxg9Nrjo7/iubp797Gdvnv70pzfZixV7POWxMrF/zGMeM8len2ONvU9XavZ8cmEghm93fcJ3u/HQXwjZfosuz2KY3PlO6mfoOQjdcuzE2p8XKcSfG53bVeqZXQACYdZJPmsdOtgagcHYUsKlDzDb6DVoQEwQ6WsDjB4cemXrsHR6/K7N+emB1NFJPmVEH19iKpve+XVyKp6GXmWWeq81WA2A1jEaqRjpVUb0YgWa1jF8kcjK55tYy8Smlwz0YtBB9xXV+c9v5yoTOyzph9jTxLzGgV4ZYW9Rdj4KK22/7DVqPtLXic3C0n6d3Bh75tz02IuPfog9lvQ1e+WKt2aPIX3NHhfnOgj22LCwl/d8r9nThyU/+aNDFQv9GHv7XBjzPezFXNsS9l5HbwLMX3pMsJxiTycX5EArj2v2jtehzmFvUu48Ov/kMU3M65I9vYtG76fyvmSvn6Cfw16sfDts7LGc6nPmsqeTx1PslUvvNf1Bs0//ray57OkN7Bb9N5vLnp5v9C2WYW+ioW8aY89PZYsZG++n2PNd30TvXHjSWkqjD8u57FNXYc8X2/bCXswlSxaWJs0Wecw35bfYi8/iQl159PJdrGN5X7NXfs0y7DEVq7VcW8LexEzZc9jTOt8Ye3oc+B/2WGJfsmFh79z4YIPBUvb0JUvmdYu9vOD/FHvbjD9T7JP3JXv6oTkj9vpvxy7J+7APy9puKvb6G5qwF+ucvNfn0NGP9TnymA2xZ17jiLF6/FbnEzO3V17KdBFmPfkzp97327rl+93JalOgClQpwCmDc8q0r7boaR1DLzEAaOlZqQdI2c4xZPHFcSDQK79lYote4tJFX7NgtkkeeqD5YakbGRMPDa3F/rApKzpGr1JonYMl1rqiGT2f40/YW7yurcU+5c9ln7oaspo9vXXLwtJSsp/SK38Oeyyjt592jH1YWtgUezFGP4c9NrSHhX304o7v22KfWA+KPb2y6UuWXrf0Jcul7MVIP5f9nDym16ljSR+WtfEvfYhYw175Y31I2DN6y7byfoplWVd8CMshfc0+/g/ZftlHX8fKaBJr2Fta+oNibxnL4+in2Nsm1ujDnn7IlI+NtRjpMRqysBTHttnHlzH2yTM2l71jvFe+5SDZJ4/n5H30c9nH97ns4ztO22Affxgujpkzb/Ge1jG41mY/JmF5GNjT13lv3WIZ9sqfynv+hWXYi9Myplc2vf3GffoW+9Lsu1lXflfISe4pb/YFwhxTaH+yE8d6P2a1fuq89EDReD1XH1ui99pyUPrsy/5t6+fEulS/V5bsVLJnS/TZl/1L9dtiT+P1tvR5bTlIPcv+KX32lfoxq/Ur+xtb9k/ps6/Uj1mt3xb72Db1Xse/IVuqZ9k/pc++veqXsvd+zOxf2c/TL2W/LZY0Xp9K9tmX/Uv122C5VH9YWMayf1v6ljnuwC8QVltttdVWW2211VZbbbWjafUFwg8vV1dbbbXVVltttdVWW221097WC4TVVltttdVWW2211VZb7aStFwirrbbaaqutttpqq6222klbLxBOQzvmb8uOHeuX/osoO/q9E3EltsSaLwrtook1MWbZVSvrVsy7nMfsR+r2NMjjrFO33Zt+2y5aWaenQx6zxLrLecxO57G2/4WcHTWxJn+z7KL1X1L2k0geILR+SXnHTd3+4Aebb37jG5vvfPvb/SY/jXXOHe7QJ7svqOyS+ZkvP83rSeB+f/g73XK7c87pHwqya7Fqt+L9xte+1v/Emfe3uvWtN7e93e1OKHbL8pNvfmbuG1//ev+8ltt3eXzzM3/0idq7YOJUp9/s4hS3tnrbLo/9/vWuxcr8DKCfGzQefb3LZ/Gec/vb94PwLtathxZ5zpD2K255XD5vaFdMPPLXmOPZSn4XXg7f5ra33cl6/UGXv/1Ye+K3+v0U5e26PN7ZsbaL189/+m19D+ESq5h3sW79dKq+6fiJnzb1ADJ5fNRNXcnPPM352LXHr9tYVtt98/C7r33lK5uvfPnLfVK7wtdJf/Hqq08odsckt4sgsXoK+Bc+97n+wSGf79at3xM+6qZhf+Hzn+8fgpM7N1/64hf7TsxdrF0yHZgHVxmITK6+9IUv9Hn8hS6Pd3Ewkq+f/+xn+4sEdWlwks8G4V3KY7GoPXnr6f1f7dqu/LXWb+1am9VHuTCQtyZX8tpvmKtrNzZ2rW77vO36KOur9ccnYtdP79wd2C5eDyr8ape3XovPAz6/fOJhVrtkyWNt1C9iqmNj7dVdHl/f1fWutVtjjPyVt8Za779oDOrqd1fy+Jprj/fXBV08N/z262qnhxmAPODjLne7W/9EP1f5BuNd/fSon2h0HdfZt7jF5v4PfODmzJvffCcnVupP3br7qF7Vr7s313TbdrF1uzungzaBvMMd77j5sQc8oJ9Am3zsWt26o+4O3Z3ufOfNXbt6vXO3dDv6C99d/BjfpCJ3Xu9173tv7nL3u2++0+XxLl78uZN+8+7CQJ3epWu3d7zTnbqB+Xhf37to7rhqs+ry/j/+4/1d1/6mxg612d66+NStT3E9CVfdenq+CXSfx7sWb2fidZEgZmOtmxni3bX+WNs0r7jDuef2Y+1du/7JJye7FKs4jC3Hbn7Gsc2Z3XI6WyrV2l2cXbkKrE3H5JHaJlJX/cd/bD7ZLf4k5Y7dxEPMuzYA+5j+jO6CwETDx9r9RVAXpz9D2SVTb/LWBFIHfdUnPrH55Mc/3serbq13ycTrTxPE5YJA3ZpUugjctbabWP2p2Oc+85m+zX7205++4U8zum0ulHbJ9MQmGP1g273Whvv1jrVZJn/7P53q2u6ntNmubt2JPLebeOzinxhpm/68091mf/bJjLkmVztnXVwu9tyMUq+f+uQn+7vqtvUX9TtWt/1TfLu4xOvGlPjVt3Fpl0yb9Get6tFfXhhrP33VVX2sLhh2Zaw968wz+uuCA3lQmmP6CWbedwuQRwUWPyWyyYY/WZDsu/h36kyc4vVnC0yym0SbYO2ayUudlklU8trV/15y/LCbmOSrO6/qWP66W9ft6D8x2rVcFq9PEMR169vetv8Own9/85v9J2J9X7RD8YpHXeqnXdyaYLnzql53ZUCKqVcxuRvpgs/NDJ+UuECS17uYx2JSv8YfEyw3cfp+a8dijalfPbAJszhv3V0Q7qqJte+bujbros8FoXrdubrt4vl+t8jnvs12fdXZXf+0i99BYPmET3tNf+z7jUe9P1ZX+tkDe5KywcsXQE2sJQnLSc51tbywvJvS+Kbx+pvPu9/73psvdGt3m8V093vdq++4jnqFlyZef7edu3PqyeLunC8qH+a6Wmpi0VGZNKrDPtZuu+9hiNVdK9t2xcQrj7VDF3x3u+c9N9/tXmNwzy63d+lPFrRPX0x2B0fcOmZ/WvXZrg+7133v21/07krdis/E8TP/+Z/e9ANuvvR4r/vcZ+fyWN36u3R/huJPMuSvyfOd73KX/k/Jdqk/9smBT3B950I9is2E45a3ulXfZncuj7ux9jNdG2Xq2Z9EWt/t7nfficlVaeL1t/gubN2M8z0p7dddZp/07lQen+iP/dmNsVVfJT591T26PLZ/1/L46q5u796NsT7VFZs+2qcKxqGjXLdiKS8Q9v15PGA6cA3AxNPrfukgZv9hN3/j6xdurO/3gAfc8HeR3cTyKPi+xMSjU/5SNwBbuzNnAJbw2b8rJhYNVV66wpePx7tYxbxLEyom1tx9vEd3YXuXbjLlS6zfOPFpwq6ZeF0Iaaf3vf/9+37nc93Fke271WJviNXddIOsv2MW9727CwOfHnjd/7nCjphYfZLpk6G73+Me/UXt7boJ1t26125C7Vq79cmmP7U5o6tDffBtbnOb/lOT2+/gp2DMjQuTRuOs/M2vrO3qXWZjjk9JzCXu1PXJclqb3cVPscXkAsEXdf0Fxo898IGb67v8/l43Ju1arC7s9VPqlRlz/cmn8XfnYj2x3rNJAh+b5erJgH3v+92vhwbWYW/4Blgf2/vbT9b/rWvn965VNFMX7l6oJ+v7dFeJ9+nqypcAj0JdLTEXBxqtL/8ZhMQpL91hNijv2oDkbmP/Z0XdoHTOuef2d+VcqO/iwCsid1nVsTuv7qS7EHKRpO3umumfTBhNHn35PN+h2bU+Sr2K8yzxdvWpj7rNOef0OWz7rpm4TI6Nme6gm0yy/JncLplY5au7rvfoFhcJ/gwlF0W72E/pm3xC5GZc/kbfJ9i7OLcQqzr1gyD9d/+69ivOXbqBweSp2M7t+qavf/Wr/Q1W3x9yk8qnJ7uWxwf2HQTHgnMUOza+56reRMtdZnc7LF1QJ1S7YUe9rvZifjLQhGPXTb0y9WqRx/4u1OC0ax0X02YzEIndHSyTjb30YYfdXPi5eaFexZov3u/Sn6HEXOipw3wx2Z25bsPO3mkWq3r1az5y2A0c73cxVqbNmkz6s5RdvkDQTjPWaqfuOu9qfyyexOsTMRcGxh8343axP+7HVxe53dIF3+fwLvTF/Nc+D+w7CLEcdxQBlTHz/yjHMsfEt6uxtex0ibfO29Mpj7226MN20cpYWSaQu1i3dd7W73fV1GkXbH9DY9dNnYo3E+hdtOQtE+Ou5/GN4tVH7Wh/zMRb1uku1KsYyguEA7uFfJQBxff4f5RjmWO7HFvLTpd467yt3++a1bHu6sUBq+txlydW4qrrdldjLU2dng4XB0x9+gRwl+s1eZsYy9e7aDeKd4f7YybOvs3ucF98evyNyWqrrbbaaqutttpqq602y/o/MfJFi89+9rP9lVD5MdFqq6222mqrrbbaaqutttvmkxDf17zffe/b/wngza659roffOu/v7n55L//+3qBsNpqq6222mqrrbbaaqeZuUDwZeuffNDPbs4868zNza67/vof+I3pT3z84+sFwmqrrbbaaqutttpqq51m5nsjfkb7px/0oO5CobtAyJ8YfeYzn1kvEFZbbbXVVltttdVWW+00M58g+PWi+93vfjf8iZELhOPHv7f58pdveDz2eoGw2mqrrbbaaqutttpqp4+5QDh27IzNXe/6gH7dXyBcffW1m1e96isbDyL1U8yrrbbaaqutttpqq6222ulhfmX5Vre62eYFL7hLtz7xCcJnPnPt5s/+7OsnLhDWTxBWW2211VZbbbXVVlvtdLHrr//B5ta3Prb5H//j3H69/onRaqutttpqq6222mqrncbWXQ7c+E+Mvve9723+67/+61BfIPDLIgDLlG1TT5f1XH2OmaNfaik/5c71Zy/6KS3btn6JKTfrOeXHF7ZEH9029VPavdiS8umy3pY+xyzRRzelX2pl+XPKXqLvZP5foN8uy6W2tPzoo1uin9KybeuXWMpmc8rfqz66JfopLVuqX2pLyo+WHSZ9dFP6pVaWP6fsbeqjZdvQL7WUn3Ln+jPXl8OmPxXGL19S/rEf+7F+fegvEOLPtddeu7nuuut6p88666yToGvL9uPHj/d6v+l65plnTuqV79Hv9MpnQ3qc6K2VbWEtvW+CK9cvRTFa52hp92L8Ead4veY7RnyrzX5Ga+EbvfVQrGw/7KdY2j6X/VILe+Urb4o9fdgwvtC3WDL+74W9Y6Kfw14MqSvbD4JNypnLnj55bz89nkO+8DdsaPbCHsshPX/msl9qymNz2Wf7XlhaL9VjOcaePnnPptgvNeUnj9nZZ589K4/pw3Kufm6fQx/24l2iH2O/1JS/hD198pjxZSrv007Cck6fE726CoPaop/LfqkpZ0ne8xdLY6f9B5339PtlP5THS03ZbC77bKefk8f0rT6EtfQlezbFkp7fc9kvtRb7qbwPS/qpvLdd2fT85v+UvmQ/R4/lHPan0viD65G4QOALn77+9a/3laciVIjtt7/97XvIJWDb7f/a177WHydA7yXIHe5wh/59rVeu8gNGgihX+Y6r9Sr5G9/4Rv/afsff4ha32Jxzzjn9tlr/3e9+d/PNb37zBtgnznerW91qc9vb3vZG+iWWY7/1rW/150hjFO/tbne7zS1vecsb+YIJX9S3GL2n4bsG1NIvYY8dfcnemn6MPcNyjP1SU/53vvOdnk/YKz/s67Lt9zyQb3/7272e0dPe+ta3vpHv3t9U7On5YnuL/VJTjs5NHrMp9vT85r/X0ct78dpW60v2DJsl7OlpHVOX7X1Yluyx5FNd/hJT/hL2ttu/JO+xT97b73gDHv+H2Ksr+yz8kmNz2Mc/HG9zm9ucUO3Nci7s5T0WYra02NPbx3f9ZvQ00Xsfo8cOmzC0tv2g2XudPB5iv9SUWee98vUfQ3lP65jo+T8378VsmWIv5uhpsBFzrXduej6Hpe3GzrSzvZpylrCn2Uve48NXxv+hPofpc/bD3ja+HESf49x13otZXdXs6bEzz7Gd3nu6JXlv3OF/i33mLWFPL84h9vpuPEuW8l6fU2qXWs41lz29/WKVL/R8sX2oD7E/c0Z6sY6xV67ybS/Zayctlvo+/rOwHGJ/qi0x5QLhjBd3xmEB2Cmgw2J8UXEAq5B/+qd/6itR0kkWDbn29ytf8WtM122+9KUvbf75n/+5rzidijLoS1MWvfVnP/vZzcc+9rFemyTxOpbE+OpXv9rrr7rqqs0nPvGJvpIZdpI1lsSI/t///d/7izBJp2z799OxSCyDi0ap8f/jP/5j35nqbLHR8ZaNwfns1/B1ivRe85+eL2ncjD7srbFX1hh7sYrti1/84uZf/uVfeo4awhh7jdMzOMbYL7WwT6Ov2WOHT4weE3z4w3cxaPAZXLGMleydBxvHKh8bMbfYO4eOFHvHDbFnfHfukr0Od4j9EsNEXYkVl3/7t3/ry1ya94mvzOOavbK1rTns7f/Xf/3Xvu1ir5wh9paw13eV7B2zHyvZqyuGvfNhU7NPHl999dV97vCXH8qoWYqRHi/s5Sb24lLGGPtPfvKTPf8x9hiU7LWtsJdjJfulVua982Djdfqcmj1/0ufQ0WNiEkY/lvdiVrdsiL24a/bis+A2xB6bT3/60z17ZbfYL7Wavf7sc5/73Gje6wvkrv18//KXv3wy7+XQUJ9Ts8e3xd6YaZ/jsMRkDnuM6JWRPqdmv8Qc12JvLLGvlffJAXr9zac+9ak+Vu/ZUN4rK+yxFHOLvT4He/vNE/g2xp5WfYW91+m/D6LPEStfwt459Qtz8l6ficecvP/P//zPzcc//vGT7G1zbMy2sHce7PU5YW9/i71c489HP/rRzec///mT7A+izwl7uYxNyb7OY/7wxT7HqSt+Zd6CjTJLC3vtr2QfvTJjJXtxzmGfPJbD2GuD9tXsD4uJX/1ZH9oLBH5oHPzS8C+66KLNO97xjr4x3+te9+oDYCqE34LJBEzncP7552/e97739YPkAx7wgF6nEWvM0aez1Vmdd955mw984AN9A/qpn/qpXqvS0/Dp+aLx/N3f/V3vz4c//OHNF77whc2DHvSgvswyWfmfSc973/vezUtf+tLNX//1X/ed9U//9E/3CZaJwVJTtuNxUf6rX/3qzetf//reLx36fe5znz75kqz0kjeT1Je85CWbt7zlLb3+zne+8+aud71r739Y1uwvvPDCnr1B7N73vnc/6NGkoxAD7so2GcT+r/7qr3quD3zgA09OPkv2meDR0GNv4GixX2phj9F73vOek+zVt/Jb7DO4XHHFFT3Pv/mbv+m3yx3bcWUle0xb7O0fYn/JJZds3vrWt27+/u//fnOXu9ylyV6OYa9jwf6d73xnz17ZNfulVrLXNrD/4Ac/2LOXl/K3HPDok8cYyvuPfOQj/QWUvE+elXmvg6Z/17vetXnZy17WHyf2n/zJn/wR9rRiCPs3vvGNm9e85jU9e/vuf//79+UPsb/00kv7Y/72b/+2HwDkpv30e2GjfFzwMQhccMEFfQxhb5Dkd533Bi789CHy/j/+4z82P/7jP97rTDTkcvTKVr8GUvoPfehD/YUCls7vmJJ9WGJ+8cUX932OgWyozwlLOfPyl7+8Z88/7JWz3z5HTvK/ZG+w1ierK+Xziz55r93J+7/8y7/c/MM//MPmbne7W9/vsLrPwUd8YW8Avu9979ufY4i9PhvL97///SfZy+Ex9vIeexdQ8r5mv9RK9vrKV7ziFX2dieknfuInevbyks7CJyxt139cdtllPUvnd/cueZyyvVc+/1/5ylf2/ZQ+R0622NNhj5G8edvb3tazv/vd7765053u1Jcb9tgYB/FxcY79u9/97p69BybV7JdayV6ZJXt5nLKTx96nz6FL3uNV9jl0rGT/9re/vWcv7+ewf93rXre5/PLLe/byZYi9dqg8berKK6/s9eYg97jHPX6E/VITgxxWT/rUsJej2JtMpk9OXWXeYsKZvHfzQBtPzucChz7szZ2wx9I4XfY5LfbGBe1WHuNLj0XNHkvb5ZjcxN75tMOwpFtqQ+zlfYs9vfMaOy3JexcJtHe84x1PxhuWmTOax2FvvuACUx7wW3tssXfRFPZey7Mx9i48wt78VJ/D9tPnbMv4nQuEY9+79rrNtcdv+FvSw2YcVLGuknX8ElNFqkAdXdlhWQOts1RhBg37Ddwaj+0qrtSreIOV8jRO5TuP8ynf+WNJREmmsiWg43V4ksBEj74sX+O2SGiDJf+8ti+d9F5NoitDAzLZFJtGpPyct/SFb3zU+HU+fBeDTkNMdQcX9pLZXQRscAn7NBpmrWFgjDXm2KsDdXHPe97zRuztb7FXv8pPh7UXU774NXAduc4Oe69xE29tGgSfdIY0yjBR5ZdJufqPhb1ysRc79l4bTIfY6+jCXj2U7Mvy6TEr2btbYUKvTkr2S81x4uQPX0wIlO/ORtg7f4weR3xy98b5TZq9dpETXkwcGJiwy8Wwx1K55557bq8rTdnKNLCkLK/5Vd41jGGvPZnwJO9L9rV+ick77A2gcpkP6sGFrO2ZcDLr5L3cNdGnN3DLfXUl9pKN/WFvIixuZWsDYV/qccQndy3p1YOBzSQbrxg9XuoL77DHcoj9EnMu9W3A44/YDZbYOy9fw14M9Nq4CYTc5buJhtzhOxZlXfEVYxPHsFcPchPLmr3y6LF3jLzGXj3Y3mLPf322C0DH80s91Hm/1Gr2+uWwt8Y+vjCvbZO/NPJOGY7VH9R5jyVmeIe9iaU2oH+q2YtFTGILe/WAPQYle/rkPXb67JJ9nfdLzXnC3vn5EfbqQY6k3UcvHgzkljidX9za+lDe44Zf4tGX46uPLX332rbUD636Mj6ov5o9c05+aHt80f6w1zZL9kuNL/yQ38bNsFcP8lrf0sp7ev2GOqLXXpL34omFPf+x1/5K9vqipexLo5d/zlGzd1yd90ssxzkn3sZLvusH+dNin7w3ruGjT9AGtHmxeh+98uUHlpmriEM9YO+G0xh740LYq4ch9sYrvhvzHa/vVw/yvuzvD5N979rj3XLd5thZNz+jS9C9T8a2ZeBmIvMLv/ALfTLoWFSA9xpOORmw1rhBf8hDHtK/ptdp/OIv/mK/vZyIWTteEtArl955lN9KJo3GVf3P//zP94NvKvnnfu7n+s6vHJCYstxB/9mf/dk+qU0QXZm6i02/1+RwjGOVoSw+KVtj5ou73s4do9cQxPTgBz+495nvOkXvHV92itZiD0v7sBGf9y322EbvNb06mGKPdYu9hhT9XkzHVLPHxV2Wmn0GX3o8XTi56HOVb5sGngGpZO+OSsneudz1brHHAGuxhb08Cvv4IubkfcleGd7rhPYzCXacibQ74liLRfl4tdhbJ+/5b3LIf52keOnLvMdJWVjjo2Mv2dOHvWWIvWPdgTKQl+zlSti7s8yXOu/jy1ITqw6dj1jghI1BAnsxlwOSdfocee5Yehr6Ou/5pczkvbj4L7/kAj328d/a4KvPCHvla39j7Ou8x9Edrv32OSV7MSjbhBX75H3pO258FJs6FisWYsmnAtHbXvY5c9hjazv2jq3Zq4+avbznD+OP/PKen/vpc7BXlhz8mZ/5mf5O4xB7S/oQ+y0mD8l79TeU98oOexM27OWHPAlL6xZ75j0GNXuswl7/giWm2Nbsl5rztNjzK+zriZh45JT45Jh4xS1+HPCIPuxxC3s89TfYOk/N3rbUDa1jsFd/NXttrGavLbbYL7WaPc7Y25axUx8T9tY06oReztLro6Nv5b32hrX3U+y147CXY+JVd2PsscRPDuOpL7dN37afPqdkb+wT6xB7MSfv9a/8EisfsRrKexcU2CXvbUsfUs9bsOeH/c5Fr0zvnVebqdkbO7G2nT/i0Qcqv2R/mOysjrtrgzP+9/9+8YtNVgzMHE3DONXGD/5YgNRwVeBv/uZvbp761Kf2iWtiUPoc0BqxBmGw/N3f/d3NIx/5yF6roykt5WsMGpxE+aM/+qM++UxsJGJtzpXEV/EveMEL+uMNxvS1LxJcY5HIJpz0EoTeRcZ+zDkkrIYpkR/3uMdtnvvc5/aTSf6rV/5YJCe9RqNT1Ok8/elP3zzrWc/q99FbRx822ItPomP/5Cc/eZC9RSO0YP97v/d7m0c84hF92UPs1Svuluc973knJzYt9nMtZeOAvc5TB/PCF76wr7eaPS3T2WKJ6UMf+tDNH/7hH/avo0+szDH2qVPsH//4x2+e85znzGLvuLCnG2KPCfb8D3sca/ZLLf4YUNWv3Jf3GIlV/dZlGxQMuGLgkzzWxlJX0cd3HLDkuzqlx95A3GKvYw37hz/84T17OYpNi72+AHuaJzzhCT17ba1kv9QcE/9L9r/927+9eeITn9izt9if8sMSC3mPz+///u9vHvawhzX7nNSzvMfeYCPvxc73mr2ysZc3+DlOHjvXEHuDDjYle37Veb/UUr6+IHmPCz58rPOeVryZjKmrZz7zmf1Ch0+Z92EpHzP4q1f122Iff7DX5+MT9mFZGi0r2T//+c/vYxnK+7kWX/QhysPIOIK9vrDFnh5D7Q6bX/7lX+79N0Gp8z5s1Kk+jf5JT3pSz94EjL5kGX/CXrvC/RnPeEaTffRh7zzYG1No99vn5Fh9jomUi1zsxVLnMaNPn4OfGLBUZ0N5n/4bexMw5Zvs0vvEsS4f+/Q55gjGK+zpyz4k7OUjfx2nL9Yn05Tsl5pj4r/YkvfG8SH20dPiqI7/4A/+oJ/k8r2V947F0NxDW8EG2xZ7pi+1Hz/H6XP0iWLFMhZfWuzF0WI/1xyDKyvz/ilPeUqTvSX+YCLXjBPG2ac97Wl9nPqQUp+6xdF8js+/8zu/s3nsYx/bc6/775SPvfqSy8YqFyR8cY7SaJ0n7PXb2OjPjYX76XO2ZfqTc8/1oz4nHpQGgo+n9prk2zJwdRIarUYsafko6ZKopb/0Jib0EsmxGjq9yh7Sa/D0wOiUVRx92UkweoMvvYVeQigfw1rPNBxaPtknIaJX3n5MeSZWfHce5fFb+a1ExYMeS3FjiWPd6Fn0S9jThGXJnr41yVvCfi82xF75LcOG3pqpI77XnQQbYk/f6qCH2POnxbJmjwe9pdYvtbDnu3ixV2bYDOV99PbJL3WFTd1v0Ifl3Lwv9fbT0dcsmfJa7OnrvF9qysKeL8qfYk+PJb/pk/fJ46G8X8I+eWyxL30Ofc2e1Xkflq08XmrKq9mHzUH0OXiHZdgn1hb7us/BO/oW+7r/HmO/1JQfNtZz2IuVL/SOH8p7+/gbfc2evo41fQh/avbqqsUydVWyp69Z7sX4ULNPH9JiX9aVfWLky1jeL2Ff1tVc9vT8GmO/1MJe+dinD+HLUN7Xfc5Y3rODYB+Wzl9bzZ4f2Ayxn2tj7PnTyuOhvKcf6kNa7B3T6kNKliV7+hbLpexPpYWfCyDrI/GgND6pRA7zUYWMgVUJ9NbRW7csQFSi8pRLb3vLbFe2JXoVPmbKp2f8mNIvNb47B9/CZshKlnP1yseSnu9D7O1PrNtgvxeLP3PrKmxY/Bmzw8J+qS1lbzvfl7A8TOyXWsk+eaz8IfZ0/I9erNYt/VL2rMWSfsif6Fn8OUgLG8Z3y5Avtqdu59RVqQ976yGr2af8lj97Yb/USvYpf8wSK5tiw+q8t8xlLw/G2GBY5/0Y+6WW8uewt53vYcmPqTxeyr7O46Xsp/RzbSl7+sRKn1jph3JhCXtWsgx7+qHy6ZXPlG05SKvZW4Z8sZ3v9GEp5pa+ZrmU/ZSeRR/2B90fH5QltiN1gcA4XtqUn6V+iZadav1SO2z+l/qVzY/atvVLbGUzbmX5c8peot8lNmyb/s/xfYl+l9iwbepXNj9qS/VLrSx/TtlL9LvEhm3T/zm+L9Fvm81BGT+P5AXCaqutttpqq6222mqrrXbwdmQvEHyUExOEZcjEUMaxVD/2UREr9VNls6X6pbZtfw4T+6VWlj/lCzts+iXsl1rpCzvVeb9t/VJb+5xh26Y/pZZtW7/rfc4283ip1eWvfc4PrSybTZVf65ewZLve5xzl/vtUGb+O1AUCfzjNR3/npdJ9EYbzLcj04qD3t1509I4b0tPRO87fieWLNkN6ftDb7+/ifEFnTO/vzfLFp+hb2qWmbKbsfFlH2c4x5Ivt9HzChF7MY/qwxzL6VoOgt1359HT0B8V+qSkn7JXnC05j7OlxzJct6fOlqNpoWViypeyn8tj2mv2QfqkpH3v+WC/N+7AZ0++H/RRLVrLn+1AeL7XENJc9fc2SfizvlUu/pM+JfkmfY/8U+yWmbIaNc3g/VVe2p67m9DllHzKHPT1/tsF+qSkn7Fnqaqhs+qV9Tsl+LO8TU/I47Pkk9trol7BfaspXR/yZw972Mo/5Tc+m9GyMJaOndQw7SPZLTXlL2NMvZbkk76NXvv248IcN6ZewX2LxMXXl/Rj76Mu8p5/qQ5ayp0+fs4T9VP99Ko0/4s4FwqF9kjILWL81m8TTkfoGuEoBujR6+z0AJI1ekvh2Oa1jSpM49itfRYvfe9/AT4KUpnxl+S1bFU2fb9LTK680er76XWBax+Sb9EmovZpjlec3ip3De+Uqn6Uxx+wXI9/Fx+gdy2+NubTosQx7a+XjUjd++pJ9WC5hz68h9kuNP/lN5in2eZ3f4KfnE711i2XJnoWlfQfBvs77sMfSUrJfaiV755lizx/1SE9r8Z5PWLbyfr/ssXHcEHsslclK9jXLpaYM5YW992PsxW4/veNY8p4vLZZDeT/EMuzFTc8XbW0Je/Vcs19qji3Zey/mvB7qQ/ievOc3PS5YlkbPT30IHRtjTx/2yeMp9vzgf8neMfKsZrnUlD+XfV7TOobRyWPH0pdG32I/lPe2iRFL8bHoh9gn7+ewX2rKx7rM4zH29M6tj43ee74N6fUhmcc4RqxT7GnYXtirN34cZJ/TYt8aO4fyfqj/XpL39FjQ01rG2DMsSvbeO9dB9jni836Mvf113vNbPDjS8zGW8kr2YUk7xZ5haaFvsVcW/5PH3itjiOWpNj75eVvrQ32BwIDlnyfV/dVf/VUP1m96q0Q/TVVWCP8lhorwdLsPfOADfTx+Q9dx+ckuZq1cesd5up2nKqo0P48lWehj9LZJDAnoKYOe5ud3dh1jG39i9JJGJyQBPWLb0wsD3jnprfdiylBnzmGNjScd+/1f55PY5SDAnzzgxVMG6fnmt8NtE0PdGLARl0+X6On8JjWWGv4Qe08h9Jh255zD3lMOsVcm9vwvWS61kj2fPa4fe76nQTpX2NumA7FovPLGkxWxFI848Sn1mNM6x/ve977+KcR+E5nvGVBjJXtPzKV3nPLTUdTs05l7qqPHuTs2eV+zX2It9p6AOcSeno/p4Dwd2VMh5+R92HvqJN/tY2PsxVqzLwcBZSg758ASU78x7Xy414PAUksbx17eYyJ30uckh/hCR5+8F6/9yXv6xG2tLHr+ebKpp7fSaB9D7OWO89Bi77fGxdhij6HcxEIb9CTcsLeU7Jea4zHHgU/Y60vU1RB7eSMu7YNePetzxNXK47CUA3JBrpZ9zhB7OYa98vAZY0+P4xj7pab8sHduvmAv1uyv894kx8TLIs/0s/JYXEN5jz2mYV/mfdnnsLA3LoR9+pwW+/T32OsDvTZe1eyXWs3e04j1I7hjXrOnT46pf/2TtuI36vWTyuBPrGYv77VFeZ/9Y+yx8STuJeyxKvO+Zr/UavZiDHts6rxP//2xj32sf2oxLvpk/rTmLem/sTd30dcrF9+SpfOEvfMYl40RU+zxdBz2nv4/lPdLLexxkD/aidiT9+qpHjvpxPX5z3++1/OPP/zjS5n3/KIXq6ew63Nsm8vevE7d+4nUIfbJe/PFsOcHH8u8Pywm3pMXCC960Yu6C4TD+aA0FaQB6+DOO++8Pvl07B7YYTJGk+QTjESQBC4O6HUsJv4+LpHgEiMTPXodps5JxV144YV95TnWA0JUXDlxo8dIgkiil770pf2j1l24eNCN/WXy8U1iS4K3vOUtm9e85jX9eSSXhxfxoUy+JaZsfqTTeslLXrJ529ve1pfPXw8IkZBJVnpxasSOEet73vOeXo+Lh3fwhz45gD2eYW/A07l4kA72rMVex0xv8NWAPGxqjD2GF1xwQb/G3sNQcGk1/LlWsn/zm9/cs+e7TrJmT+t9BiPaN7zhDT0bjdtDj2qW2NOH/dvf/vZez2cPYRpi7xjs3/ve955k7yFP8SdslCvvdXBhL++x1zEqM+yXmvL5wif5XrIXq3JL9vRYipnfL3vZy3rfPWYeS/uH8v7KK6/cXHbZZb0ee+2kZo8VLvzB/o1vfGOv914utNgn7y+55JKTeS+3wl75ezE+ufCQy+L78z//834AwN5DcWr29OpJWzFBPf/88/u8dzHKFxNVHMu8D3u6iy66qPc97OmG2Guv2MvjMfYZ2K+44orN5Zdf3pevDOzDxnFLTdnqVFkYYS/v5Q4ftPOSPb04tXMDJDYGa/4YrPFM3YZN2Jus0Yd9HgZVs1e2Nqqf0U5MOrHX/7XY67/FYFzAnu8mBR7wVLNfamGvfDn82te+to/VOdVVYuUHrfdYYnTppZf2bYXeduOPtYlEyg57fC6++OLNO97xjl6Pd9jTi7Vkb7wJe7kT9nSOLdlbXKRgadJpUp4H0JXsl1rJ3oST/yV73PFv5f073/nOzStf+co+VheZHj7HF7638l7fHfba2lSfo+w3velNk+zpsZc3fOK/+qzZL7WSvRsSJfs8eJGmzOOMnSbu6lbeuxjNA/FwxDR6HMSgPYW9c+lzavYs7OVY2LsJgz1LHsfolT/FfqmFvfLFbOx897vf3ZePt3kd9ulD6PUH+uQvf/nLPUtzNXp9t/GTlXlvHMHehRl9Loiwzw3Fmr1zqB9jZ9jn4bND7I3h+sywl/cuLGr2h8H4bW6C57Frjl+/uba7QDhsBjCAOigJYqKq0wccYNtViASJHmwTLloJ4i6etfe2lx1cEsvgo1NUrvJNynQGyldxpd4VusnxVVdd1TdQ7/kiYXS6OqzorV2FSTIJBDp/vZZAnuSpAvZqjlUGH12xK9s2E3TntJS+8I2PJjN8zt0GsSjH+5Jl2JvY4YelTt7gbTt2pR5bTyKs2evUx9jzRYMOe3Vte8l+qTkOewveYsfHJA77XFyWZgKCgcmGDoTOZMM2A2R8sXasi1TlluydC3eNq9Sre+x1RiV7AyRfdOphaY29DsrEKuxxwd72kv1Scxx/+aNTLNmr35o9vfPjYyKrs+Mv373W6YqvjDcM8FYWf7GUAzV7r8PexXzYO5ZfJXsW9s6JPV9Y7hiW7JeaWJ0bYxMruRv2bgTIe/6FvfN4L+/xcwy9wdSiHOXFH8fxF/vkvbhN+MfYYyDWHI+919iXfY5tYVCyT07nAmevhjn2zley95qPdd6nzzGxwk99agP857v3fGbWLfb6Yscm78vyxWQ7fvopenfV9Ttj7OW9SYHzO9agv98+Zw772uS9thiNdq+d8EsbChs+YY+ZbfpseWN72OvrSj32YpJjYZ+JEAZYRG8d9tjJXSwxDXv+7YcNf/lfslc2/1p5j2Py3nb+6n+8Tvsv9XjxGXsc+YurOmjlvW2lxvmxV4Z6DBvnaLH3mj/J++iXmvLT38vdsNf3y019Szl2WvNbX4Sf9kGvvWg3yfv4Y81fzLQ77Q97cx71IBdK9tYlexb2TDlYlvqwx8+5w1Vu58J+L6bssDfW8J8vXvNN2c6bWOnFIp/0p/iJVf+jv63znp6/5iclexz159iXee847zGey975MJM35l78MY6rh5r9YbJrjl/XLddvjp19ZnfFc+YPP3I5LJbK0/E9/OEP7xuECgH8MY95TN/AywEjlSdZH/WoR/X7dXDWj370o/vtGlqZHBLYhEV5ys2FgUfe0zt/yrfW0CSf8nXAJg6uHB/ykIf0+nKwtpYMkozeBYWLEFp3RsVVdnJLzDGOVYYr0Z//+Z/vG4SrfueS8BlAoucbvfPzme86JrFL1Fof9lhggqV4sNQwa/bYYmB/2GMb9i7eptjzW13X7PdiYe8R+mHvUfQ1+5xDp+iu7yMe8Yh+0NJ5em2bTqDs5Er2HitfsndO544pH2cxOb+7PGGPTTqt+GHdYs8HrGr2S81x2LsoVJ7XYf+whz3sRuyt+ccP8Ymd/+4+yTt+6uRKE7+7O+JzIYT9Qx/60JOP7i/Z41qz13l67e5cyZ4+7N2dCnvbnavO+6XmuLB3fm0de/4pfyrvDar0BgR5Z3urzwl7ZWEvZ+S987bYG3iwxwH7tHl67Tpmf5n32Jv8qldtvmS/1ByTPsSdREvY842PdR+SvFf36lKs+gGsMMKi1NtHz3eTAiydDyuTNv17WFrjZ3v2T7HHEnvnt48/8hQf5+Fv/FlqYa885zcZCHttvmRvSR77tEPdy3vHOLbOexb2ct4nEvJAOWLRNus+RCz0zh/2YqbHoNa32HsftliH5VJTvrpWN3Il7Pn1S7/0S72f9SRVLmnP/PVerolb3oVlDCe8SvZ46j+x135plGMJe/vwUU+O4Zsy1GPNHgvs9TvY29/K+6WGKR7KVx5G2GMudttbea+vsV9s9MYRsYur7kOwV6fqUj1jr78dY58+x/uwt7TY8yHs9d14ttjvxZL3v/ALv9D3e9g7/1Dep//WpvgkVrzELu+9jh5LPOhL9mFbs3ec440DNXvjhXKUV/rDv7DnG3+0eXMB5R/WC4Szu/7DtcGh/hUj4FQIyO7O+ugNXANOOoHSZ2t6leqjaR8tpUM14XMlmcqwlmjKVnE+WnIXUofhHMqmT9n0klXjYf5O0FWmipcgGgWOMXqdtPJd8foTAZrHP/7xfWKYNIlhr7yVLxn54+rVR286tsc+9rF90infecvydUT8cQXrI2eJq1FjyDeT3FKPY9j7eNIkQ6fSYs90RI7xUbbFJEaHij19LOzpw94dAZ2KQaNmv9TCHhuTJOyV+YQnPKFvxDV7en7Q4/Cud72r949ePPQuMkp92LvjpvxM4Fvs6cNSO/OxZzqVKfbuiMl7k2udyhD7ucYXeYw9Rsp2d2iIffTJe767YyLPdKhDeR/28lL9y3sdKv0Ue+ejx8A25ZT65DH2ylen2DuulfdLTR+CjztictNFpQvrFnvr9Dk+PvbRcwYzHC2xmr025c6SPDCYjbH3Gnt3urA32CWPYzRhb7u8xF4ey0/6kuVeTN5j726bPzkLe+1FXQ3lvTvH+kwTD7lGJ94678PeHUh/CuRCFM+wV2asZO/P5fxpgHpyzBh7bRR7dyT1f9jzvWS/1Er22gP2fMZev9zK+7A0AZP32oG8l991n8NK9srPxRFNi31Yhn1uwIyxt2DvT+DG2C+xmr0/t3BHF3s+8V2elr7TiVVby9+dP+5xj+tvPtFjXOpL9voEeR72dd7T1+y9x956iL3yfaIr7zOJpKGvWS61sPcpqj9b0X9gL56SvXXGTj7Rqi/jsn6Kts77zHNK9rm4mWLv+xYmwdibGE+xx1J+YW/bQfU5yjLfwl4O8F+ZQ3nPf+OaP0vXvuW9OqWvx056PPXd+pHcfBIPlspkYbmEffLeGnvjfy5uot8Pm4O2+IyZ9aG/QFAhBgCVqFLSuUnqMjFYgiv16dzEWDdieo2BPp1Xqa950GsM0TsXP1QyfW30On2+WMRCa3GegzAxpnz+pnyNoWV8z4JHWNYd4n7YYyPug2S/F1NXc9nzp2TJSn3LFwN5+MxlT+u4KfZY0mHDL5oh9kttKXv6kmXy3kJvf2nel3mvLFps6Fu+l3qWWOeyL1nux/ievA97AxzflX9QeZ9Ywz7lz2Ufli0r9cqK3nkOwrBXtpjDXvl1HsdST2Xe07dYngr20dfs92JL2YsxfPhHaxmaVJV5L76wqfM+LFNX1vil/P2yX2ot9pgr39r+0rxfkvf0Jcsp9vRlHntPaxnqQ0p92Ee/XzbiU37JPnnZqiv8op+T91imbp1rjD2LPuxp8Rxin/5b+Sz6obxfYmLBZA57viSP6R03lfdD7Pk/1IccFPuD6HMO0sLjSFwglKZSVLwAVPKUr9HT0Q+Z8pSjEq2jz/babAeuh9ftlxCWIVuq34spW6xM2WIYs/jDt/gzFKvt22LPUr71FPulthf2/I4+sY4Z7TbYx5ayX2LKqdkP2VKWpZ4pf0zPxMmfsDlo9nPN+cNG+fHdusWeni7+0E2xTKwl+5y3NtuXsFyq34slVqZsS8v3WPzhW2Ids7l5b3+L5ZjR82UO+6WmnMTK5rCnXcqy1DtHyxJTzdJ6zOay34vFH+vEOmR7YZm6ZUv18WcJ+yn9UivZm/xat8q3Pb5bi3Us76NXPlvCZmld0SdvDtLmsg+z+OP9krwPG+uDZj+H5ak0vorryF0gcDw2x8ejrl9iZdlsqvyVzbDdlPpTzYZt05/9sGFL9EeNDdumvtSyg+ZzlNmwpfolVpbNpsrfj/6osWHb9KfUsm3qjxobtk19qWUHzecos2FL9afC+Ni+QPjMZw71BcJqq6222mqrrbbaaqutdvB28gLhfvcrLhCuuWbz6c9/fr1AWG211VZbbbXVVltttdPMcoFw/3vd64cXCMevumrz3//3/3reuM8+TkhXW2211VZbbbXVVltttV03FwjHbn3rzTn/5/9sbubnfl0gXPO1r22+8P73b74/8KWP1VZbbbXVVltttdVWW203rb9AOPPMzT2f9KTNGWeffeJPjK69dvPpq69e/8RotdVWW2211VZbbbXVTjNzgXDGsWM3/IlRt77Z9dd//8SvGH16vUA40qbefvgt+dVuSlvZnzpb2Z86W9mfOjvd2K+5dupsZX+6WH+B4EvKP3b/G76D8N3vXfuD67sLg2u+990TkhtMSlx3vd+x/cHm5p1wKj3oj19//eZYd4HhymOO/prrru/K7vQ3m9az472+u6qZdRHzg07//c2ZN/e7udN6YMR75s1v+E3kMVMaZt211easTj8n1us6vXOcuYClOG8+k+VS9td2LM9Yyr5jebP+6CkL+2mWbGU/bttmf7xjf/ZMloeNfc/y2HL2xzr2c2xl37aTLFf2NzL6w8beWHvm7LHzBvazx87u33UL2H//Bx3L6+ezXNkP28p+3Po+ZFtzxu7f1tl3LM+ayfKg2EN1i1vcqn/R/4nRie03suu6YGAAeI6Bq/KOdcscu+b49ZuzzuyuUk68nzL6szv9XNumHjXJx/85ppF9v1tuSL5p6y/O+sqbR4cvrvhmylf2I7ayH7Y9se87rfnsdVr6kTlmwHAD43Rg36Hs+HT+zxyQVvbjdrqxPywsO5Sba7fM3rRm9rylY3/DDZ6VfW2Hjn3nuwl5d8gsO9rs3Th1QTGzD1FZB8p+s/n/AR0VwhRpIWqgAAAAAElFTkSuQmCC"
@@ -0,0 +1,101 @@
+# control.py
+# Client for the board simulator's privileged control channel
+# Author: Mark F. Russo, PhD
+# Copyright (c) 2023-2024
+#
+# Sets simulated inputs directly, without the GUI. The simulator must be started
+# with --control (or --control-token TOKEN).
+#
+#   ctl = BoardControl()
+#   ctl.set(fsr=1200, button=0)
+#   ctl.schedule([(0.0, {'tilt': [0, 0]}), (0.5, {'tilt': [0.5, 0]}), (1.0, {'heater': 40})])
+
+import socket, json, os, base64
+
+ADDR = '127.0.0.1'
+PORT = int(os.environ.get('BOARD_PORT', 9999))
+
+# Set by loopback.connect() to call a simulator in this process directly instead of over UDP
+loopback = None
+
+class BoardControl:
+    def __init__(self, addr=ADDR, port=PORT, token=None):
+        self.addr  = addr
+        self.port  = port
+        self.token = token
+        self.sock  = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((ADDR, 0))    # Bind to localhost at arbitrary available port.
+
+    # Apply inputs now: button, fsr, tilt=[ax, ay], ax, ay, ambient, heater,
+    # gyro_noise=[sigma, seed]
+    def set(self, **inputs):
+        return self._command('set', **inputs)
+
+    # Apply inputs at times relative to now. events is a list of (seconds, {inputs}).
+    # Long schedules are split across several messages, which the simulator merges.
+    def schedule(self, events, chunk=16):
+        events = [[t, inputs] for t, inputs in events]
+        pending, start = 0, None
+        for i in range(0, len(events), chunk):
+            kw = {} if start is None else {'start': start}
+            pending, start = self._command('schedule', events=events[i:i+chunk], **kw)
+        return pending
+
+    # Drop all pending scheduled inputs
+    def clear(self):
+        return self._command('clear')
+
+    # Snapshot all board state. Returns the snapshot bytes, or keeps it in the simulator as name.
+    def snapshot(self, name=None):
+        if name is not None:
+            self._command('snapshot', name=name)
+            return None
+        return base64.b64decode(self._command('snapshot'))
+
+    # Restore a snapshot from bytes or one kept in the simulator by name
+    def restore(self, data=None, name=None):
+        if name is not None:
+            return self._command('restore', name=name)
+        return self._command('restore', data=base64.b64encode(data).decode('ascii'))
+
+    # Number of scheduled inputs still pending
+    def status(self):
+        return self._command('status')
+
+    # Scheduler timing: events run and how far behind schedule they ran, for the
+    # board's simulation and for scheduled inputs
+    def timing(self):
+        return self._command('timing')
+
+    # Drive analog pin (28 FSR, 29 TMP36) from a waveform computed by the simulator,
+    # or go back to the slider or model with kind=None. See board.Waveform.
+    #   ctl.waveform(28, 'ramp', begin=0, end=3000, duration=2.0)
+    #   ctl.waveform(29, 'table', path='profile.csv', repeat=True)
+    def waveform(self, pin, kind=None, **params):
+        return self._command('waveform', pin=pin, kind=kind, params=params)
+
+    # Requests backlogged, served and dropped for the 32 most recently active clients of
+    # the simulator: {'total': clients known, 'evicted': idle clients forgotten, 'clients': {...}}
+    def clients(self):
+        return self._command('clients')
+
+    def _command(self, cmd, **kw):
+        msg = {'to':'control', 'msg':cmd, **kw}
+        if self.token is not None: msg['token'] = self.token
+        resp = self._send(msg)
+        if not resp['success']:
+            raise RuntimeError(f"Control command '{cmd}' failed: {resp['msg']}")
+        return resp['msg']
+
+    # Utility function to send a message dictionary and return a response
+    def _send(self, msg):
+        if loopback is not None: return loopback(msg)   # Simulator in this process
+        bytes = json.dumps(msg).encode('utf-8')              # Serialize and encode as bytes
+        self.sock.sendto(bytes, (self.addr, self.port))      # Send message to board simulator
+        bytes, addr = self.sock.recvfrom(65535)              # Wait for response
+        return json.loads(bytes.decode())                    # Decode and return
+
+# Opt-in profiling of simulator traffic (see proxyprof.py)
+if os.environ.get('BOARD_PROFILE'):
+    import proxyprof
+    proxyprof.instrument(BoardControl)
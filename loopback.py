@@ -0,0 +1,67 @@
+# loopback.py
+# In-process transport between the component proxies and a board simulator
+# Author: Mark F. Russo, PhD
+# Copyright (c) 2023-2024
+#
+# Runs a student script in the simulator's own process. Once connected, the
+# proxies (machine, ssd1306, control) hand each message dictionary
+# straight to board.dispatch(), which calls the component's process() handler:
+# no JSON, no sockets and no thread hop, just a function call. lsm6dsox talks
+# through machine.I2C, and time2 never talks to the simulator.
+#
+#   python loopback.py script.py [args...]
+# runs a script against a fresh headless board and prints the final OLED frame.
+
+import os, sys, runpy, functools, argparse
+
+import board
+
+# Proxy modules that can send to a simulator in this process
+PROXIES = ('machine', 'ssd1306', 'control')
+
+# Point every proxy module at brd, or back to UDP if brd is None
+def connect(brd):
+    send = None if brd is None else functools.partial(board.dispatch, brd)
+    for name in PROXIES:
+        __import__(name).loopback = send
+
+def disconnect():
+    connect(None)
+
+# Run a script as __main__ in a fresh module namespace. Modules the script
+# imports, other than the proxies, are dropped afterwards so the next script
+# gets fresh copies too.
+def run_script(script, args=()):
+    path  = os.path.abspath(script)
+    argv, syspath, modules = sys.argv, sys.path[:], set(sys.modules)
+    sys.argv = [path] + list(args)
+    sys.path.insert(0, os.path.dirname(path))
+    try:
+        return runpy.run_path(path, run_name='__main__')
+    finally:
+        sys.argv, sys.path[:] = argv, syspath
+        for name in set(sys.modules) - modules:
+            if name not in PROXIES: del sys.modules[name]
+
+# ----------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Run a script against a headless simulator in the same process")
+    parser.add_argument('--control', action='store_true', help="accept control messages from the script")
+    parser.add_argument('script')
+    parser.add_argument('args', nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    brd = board.Board()
+    brd.control.enabled = args.control
+    brd.control.sched.start(brd.master)     # No comms loop to apply scheduled inputs
+    connect(brd)
+    try:
+        run_script(args.script, args.args)
+    finally:
+        disconnect()
+        brd.master.destroy()
+        oled = brd.oled
+        for y in range(0, oled.height, 2):
+            print(''.join(' ▀▄█'[oled.get_pixel(x, y) | oled.get_pixel(x, y+1) << 1] for x in range(oled.width)))
+
+if __name__ == '__main__': main()
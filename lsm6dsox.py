@@ -7,25 +7,50 @@
 # References
 # https://github.com/openmv/openmv/blob/master/scripts/libraries/lsm6dsox.py
 
-import json, socket, random
-
-port = 9999
+import struct, os
 
 # LSM6DSOX Proxy
+# Talks to the simulated sensor through its registers over the I2C bus, as the
+# device driver does
+_CTRL1_XL  = 0x10
+_CTRL2_G   = 0x11
+_CTRL3_C   = 0x12
+_OUTX_L_G  = 0x22
+_OUTX_L_A  = 0x28
+_WHO_AM_I  = 0x0f
+
 class LSM6DSOX:
     _DEFAULT_ADDR = 0x6A
+    ODR         = (0, 12.5, 26, 52, 104, 208, 416, 833, 1660, 3330, 6660)
+    SCALE_ACCEL = {2: 0, 4: 2, 8: 3, 16: 1}             # g -> FS_XL bits
+    SCALE_GYRO  = {250: 0, 500: 1, 1000: 2, 2000: 3}    # dps -> FS_G bits
     
     def __init__(self, bus, 
                cs_pin=None, address=_DEFAULT_ADDR, gyro_odr=104, accel_odr=104, 
                gyro_scale=2000, accel_scale=4, ucf=None):
         self.bus     = bus
         self.address = address
-        
-        self.sock   = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.sock.bind(('127.0.0.1', 0))    # Bind to localhost at arbitrary available port.
+        self.buf     = bytearray(6)                     # Burst read buffer
+
+        if self._read_reg(_WHO_AM_I) != 0x6C:
+            raise OSError("No LSM6DSOX device was found at address 0x%x" % (self.address))
+        self.reset()
+
+        # Scale factors from raw readings
+        self.accel_scale = accel_scale / 32768
+        self.gyro_scale  = gyro_scale / 32768
+        self._write_reg(_CTRL1_XL, self.ODR.index(accel_odr) << 4 | self.SCALE_ACCEL[accel_scale] << 2)
+        self._write_reg(_CTRL2_G,  self.ODR.index(gyro_odr)  << 4 | self.SCALE_GYRO[gyro_scale] << 2)
+        self._write_reg(_CTRL3_C,  self._read_reg(_CTRL3_C) | 0x44)    # BDU and IF_INC
+
+    def _read_reg(self, reg):
+        return self.bus.readfrom_mem(self.address, reg, 1)[0]
+
+    def _write_reg(self, reg, val):
+        self.bus.writeto_mem(self.address, reg, bytes((val,)))
 
     def reset(self):
-        pass
+        self._write_reg(_CTRL3_C, self._read_reg(_CTRL3_C) | 0x01)  # SW_RESET, cleared when done
     
     def set_mem_bank(self, bank):
         pass
@@ -44,26 +69,19 @@ class LSM6DSOX:
     
     def read_gyro(self):
         """Returns gyroscope vector in degrees/sec."""
-        msg = {'to':'lsm6dsox', 'msg':'read_gyro'}
-        resp = self._send(msg)
-        if not resp['success']:
-            raise RuntimeError(f"Command 'read_gyro' failed for LSM6DSOX")
-        return resp['msg']
+        self.bus.readfrom_mem_into(self.address, _OUTX_L_G, self.buf)
+        return tuple(v * self.gyro_scale for v in struct.unpack('<hhh', self.buf))
     
     def accel(self):
         return self.read_accel()
     
     def read_accel(self):
         """Returns acceleration vector in gravity units (9.81m/s^2)."""
-        msg = {'to':'lsm6dsox', 'msg':'read_accel'}
-        resp = self._send(msg)
-        if not resp['success']:
-            raise RuntimeError(f"Command 'read_accel' failed for LSM6DSOX")
-        return resp['msg']
-    
-    # Helper
-    def _send(self, msg):
-        bytes = json.dumps(msg).encode('utf-8')         # Serialize and encode as bytes
-        self.sock.sendto(bytes, ('127.0.0.1', port))    # Send message to board simulator
-        bytes, addr = self.sock.recvfrom(1024)          # Wait for response
-        return json.loads(bytes.decode())               # Decode and return
+        self.bus.readfrom_mem_into(self.address, _OUTX_L_A, self.buf)
+        return tuple(v * self.accel_scale for v in struct.unpack('<hhh', self.buf))
+
+# Opt-in profiling of simulator traffic (see proxyprof.py). The sensor talks through
+# machine.I2C, so its frames are skipped to attribute traffic to the calling program.
+if os.environ.get('BOARD_PROFILE'):
+    import proxyprof
+    proxyprof.exclude(__file__)
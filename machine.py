@@ -4,13 +4,52 @@
 # Author: Mark F. Russo, PhD
 # Copyright (c) 2023-2024
 
-import socket, json, random
+import socket, json, random, os, base64
 
 # IP address on which board simulator is listening for UDP datagram packets
 ADDR = '127.0.0.1'
 
 # Board simulator port'
-PORT = 9999
+PORT = int(os.environ.get('BOARD_PORT', 9999))
+
+# Set by loopback.connect() to call a simulator in this process directly instead of over UDP
+loopback = None
+
+# Unacknowledged writes (opt-in, for output-heavy programs). Pin outputs and OLED
+# drawing calls are sent without waiting for a reply, numbered so the simulator
+# can count any it never received. Every WINDOW-th write waits for a reply,
+# which keeps this client's queue in the simulator from overflowing and brings
+# back a report of writes lost or failed since the last one. A write that would
+# repeat the proxy's previous write is not sent at all.
+#   machine.unacked()     or set BOARD_UNACKED=1
+UNACKED = bool(os.environ.get('BOARD_UNACKED'))
+WINDOW  = 32
+
+def unacked(enable=True, window=32):
+    global UNACKED, WINDOW
+    UNACKED, WINDOW = enable, window
+
+# Send an output write for proxy and return True. Raises RuntimeError with error
+# if it fails, or if the reply reports earlier unacknowledged writes that failed.
+def _write(proxy, msg, error, coalesce=True):
+    if UNACKED:
+        if coalesce and msg == proxy._last: return True     # Would change nothing
+        proxy._last = dict(msg) if coalesce else None
+        proxy._seq += 1
+        msg['seq'] = proxy._seq
+        if proxy._seq % WINDOW: msg['ack'] = False
+    resp = proxy._send(msg, msg.get('ack', True))
+    if resp is None: return True
+    if resp.get('lost'):
+        proxy.lost += resp['lost']
+        proxy._last = None          # The simulator may not have what was last sent
+    if resp.get('failed') or not resp['success']:
+        proxy._last = None
+    if resp.get('failed'):
+        raise RuntimeError(f"Unacknowledged writes failed: {'; '.join(resp['failed'])}")
+    if not resp['success']:
+        raise RuntimeError(f"{error}: {resp['msg']}")
+    return True
 
 # Pin Proxy
 # https://docs.micropython.org/en/latest/library/machine.Pin.html
@@ -35,22 +74,17 @@ class Pin:
         self.pull   = pull
         self.sock   = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.sock.bind((ADDR, 0))    # Bind to localhost at arbitrary available port.
+        self._seq   = 0         # Unacknowledged write sequence number
+        self._last  = None      # Last write sent, to skip repeating it
+        self.lost   = 0         # Unacknowledged writes the simulator reported missing
 
     # Turn pin on
     def on(self):
-        msg = {'to':'pin', 'num':self.num, 'msg':'on'}
-        resp = self._send(msg)
-        if not resp['success']:
-            raise RuntimeError(f"Command 'on' failed for pin {self.num}: {resp['msg']}")
-        return True
+        return _write(self, {'to':'pin', 'num':self.num, 'msg':'on'}, f"Command 'on' failed for pin {self.num}")
 
     # Turn pin off
     def off(self):
-        msg = {'to':'pin', 'num':self.num, 'msg':'off'}
-        resp = self._send(msg)
-        if not resp['success']:
-            raise RuntimeError(f"Command 'off' failed for pin {self.num}: {resp['msg']}")
-        return True
+        return _write(self, {'to':'pin', 'num':self.num, 'msg':'off'}, f"Command 'off' failed for pin {self.num}")
     
     # Query and return pin value
     def value(self):
@@ -63,21 +97,83 @@ class Pin:
         except Exception as e:
             raise
     
-    # Utility function to send a message dictionary and return a response
-    def _send(self, msg):
+    # Utility function to send a message dictionary and return a response (None if not ack)
+    def _send(self, msg, ack=True):
+        if loopback is not None: return loopback(msg)   # Simulator in this process
         bytes = json.dumps(msg).encode('utf-8')         # Serialize and encode as bytes
         self.sock.sendto(bytes, (ADDR, PORT))           # Send message to board simulator
+        if not ack: return None
         bytes, addr = self.sock.recvfrom(1024)          # Wait for response
         return json.loads(bytes.decode())               # Decode and return
 
 # I2C serial bus Object Proxy
 # https://docs.micropython.org/en/latest/library/machine.I2C.html
+# Each transaction is one message to the simulated bus, carrying the whole burst.
+# Buffers may be bytes, bytearray or memoryview; the *_into methods fill the
+# caller's buffer in place through a memoryview.
 class I2C:
     def __init__(self, chan, scl=Pin(13), sda=Pin(12), freq=400_000):
         self.chan = chan
         self.scl  = scl
         self.sda  = sda
         self.freq = freq
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((ADDR, 0))    # Bind to localhost at arbitrary available port.
+
+    # Return a list of the addresses of devices that respond
+    def scan(self):
+        return self._transfer('scan')
+
+    # Write the bytes of buf to the device at addr. Returns the number of bytes written.
+    def writeto(self, addr, buf, stop=True):
+        return self._transfer('writeto', addr=addr, data=_encode(buf))
+
+    # Write the buffers in vector to the device at addr as one transfer
+    def writevto(self, addr, vector, stop=True):
+        return self.writeto(addr, b''.join(vector), stop)
+
+    # Read nbytes from the device at addr
+    def readfrom(self, addr, nbytes, stop=True):
+        return _decode(self._transfer('readfrom', addr=addr, n=nbytes))
+
+    def readfrom_into(self, addr, buf, stop=True):
+        mv = memoryview(buf)
+        mv[:] = self.readfrom(addr, len(mv), stop)
+
+    # Write buf to the device at addr starting at register memaddr
+    def writeto_mem(self, addr, memaddr, buf, *, addrsize=8):
+        self._transfer('writeto_mem', addr=addr, mem=memaddr, addrsize=addrsize, data=_encode(buf))
+
+    # Read nbytes from the device at addr starting at register memaddr
+    def readfrom_mem(self, addr, memaddr, nbytes, *, addrsize=8):
+        return _decode(self._transfer('readfrom_mem', addr=addr, mem=memaddr, addrsize=addrsize, n=nbytes))
+
+    def readfrom_mem_into(self, addr, memaddr, buf, *, addrsize=8):
+        mv = memoryview(buf)
+        mv[:] = self.readfrom_mem(addr, memaddr, len(mv), addrsize=addrsize)
+
+    def _transfer(self, cmd, **kw):
+        msg  = {'to':'i2c', 'msg':cmd, 'freq':self.freq, **kw}
+        resp = self._send(msg)
+        if not resp['success']:
+            if 'errno' in resp: raise OSError(resp['errno'], resp['msg'])
+            raise RuntimeError(f"Command '{cmd}' failed for I2C: {resp['msg']}")
+        return resp['msg']
+
+    # Utility function to send a message dictionary and return a response
+    def _send(self, msg):
+        if loopback is not None: return loopback(msg)   # Simulator in this process
+        bytes = json.dumps(msg).encode('utf-8')         # Serialize and encode as bytes
+        self.sock.sendto(bytes, (ADDR, PORT))           # Send message to board simulator
+        bytes, addr = self.sock.recvfrom(65535)         # Wait for response; reads may be a full frame
+        return json.loads(bytes.decode())               # Decode and return
+
+# I2C data travels base64 encoded
+def _encode(buf):
+    return base64.b64encode(memoryview(buf)).decode('ascii')
+
+def _decode(data):
+    return base64.b64decode(data)
 
 # ADC Proxy
 # https://docs.micropython.org/en/latest/library/machine.ADC.html
@@ -106,6 +202,53 @@ class ADC:
     
     # Utility function to send a message dictionary and return a response
     def _send(self, msg):
+        if loopback is not None: return loopback(msg)   # Simulator in this process
+        bytes = json.dumps(msg).encode('utf-8')         # Serialize and encode as bytes
+        self.sock.sendto(bytes, (ADDR, PORT))           # Send message to board simulator
+        bytes, addr = self.sock.recvfrom(1024)          # Wait for response
+        return json.loads(bytes.decode())               # Decode and return
+
+# Whole-board readings (simulator only, not in MicroPython's machine module).
+# One request returns the button, FSR, TMP36 and IMU readings; poll() asks only
+# for what changed since the last reply and keeps state up to date.
+#   board = machine.Readings()
+#   state = board.read_all()     # {'button', 'fsr', 'tmp36', 'accel', 'gyro'}
+#   if 'fsr' in board.poll(): ...
+class Readings:
+    def __init__(self, freq=400_000):
+        self.freq    = freq     # I2C bus frequency the IMU is read at
+        self.version = None     # Version of state, None before the first reply
+        self.state   = {}
+        self.sock    = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((ADDR, 0))    # Bind to localhost at arbitrary available port.
+
+    # Every reading. Returns the whole state.
+    def read_all(self):
+        self._update(self._query({'to':'board', 'msg':'read_all', 'freq':self.freq}))
+        return self.state
+
+    # Readings changed since version (default: the last reply). Returns only the changed fields.
+    def changed_since(self, version=None):
+        version = self.version if version is None else version
+        return self._update(self._query({'to':'board', 'msg':'changed_since', 'version':version, 'freq':self.freq}))
+
+    def poll(self):
+        return self.changed_since()
+
+    def _update(self, reply):
+        self.version = reply['version']
+        self.state.update(reply['state'])
+        return reply['state']
+
+    def _query(self, msg):
+        resp = self._send(msg)
+        if not resp['success']:
+            raise RuntimeError(f"Command '{msg['msg']}' failed for board: {resp['msg']}")
+        return resp['msg']
+
+    # Utility function to send a message dictionary and return a response
+    def _send(self, msg):
+        if loopback is not None: return loopback(msg)   # Simulator in this process
         bytes = json.dumps(msg).encode('utf-8')         # Serialize and encode as bytes
         self.sock.sendto(bytes, (ADDR, PORT))           # Send message to board simulator
         bytes, addr = self.sock.recvfrom(1024)          # Wait for response
@@ -135,4 +278,9 @@ class PWM:
     
     def deinit(self):
         # turn off PWM on the pin
-        pass
\ No newline at end of file
+        pass
+
+# Opt-in profiling of simulator traffic (see proxyprof.py)
+if os.environ.get('BOARD_PROFILE'):
+    import proxyprof
+    proxyprof.instrument(Pin, ADC, I2C, Readings)
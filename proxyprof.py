@@ -0,0 +1,167 @@
+# proxyprof.py
+# Profiler for component proxy traffic to the board simulator
+# Author: Mark F. Russo, PhD
+# Copyright (c) 2023-2024
+#
+# Records every message a proxy (machine, ssd1306, control; lsm6dsox through
+# machine.I2C) sends to the simulator: call stack, command, payload sizes and
+# round-trip time. Samples go into a preallocated ring buffer. At exit they are
+# aggregated by call stack and written as
+#   <prefix>.folded  Collapsed stacks weighted by round-trip μs (flamegraph.pl, speedscope)
+#   <prefix>.txt     Summary table by call site and command
+#
+# Profiling is off unless requested, and then the proxies are left untouched.
+# Turn it on by running a script under the profiler:
+#   python proxyprof.py [-o prefix] script.py [args...]
+# or by setting BOARD_PROFILE=<prefix> in the environment.
+
+import os, sys, time, json, array, atexit, runpy, argparse
+
+# Files whose frames are left out of recorded stacks
+_SKIP = {os.path.abspath(__file__), runpy.__file__, '<frozen runpy>'}
+
+# Files of instrumented proxy modules. The call site of a sample is its innermost frame outside them.
+_PROXIES = set()
+
+class ProxyProfiler(object):
+    def __init__(self, prefix='proxyprof', capacity=1 << 16, depth=64):
+        self.prefix   = prefix
+        self.capacity = capacity
+        self.depth    = depth
+        self.count    = 0                               # Total calls recorded
+        self.rtt      = array.array('d', [0.0]) * capacity  # Round-trip time (s)
+        self.stack    = array.array('l', [0]) * capacity    # Interned stack id
+        self.cmd      = array.array('l', [0]) * capacity    # Interned command id
+        self.sent     = array.array('l', [0]) * capacity    # Request bytes
+        self.recv     = array.array('l', [0]) * capacity    # Reply bytes
+        self._stacks  = {}      # Tuple of (code, line) -> id
+        self._cmds    = {}      # Command name -> id
+
+    # Record one call. frame is the frame that called _send.
+    def record(self, msg, resp, rtt, frame):
+        key, n = [], 0
+        while frame is not None and n < self.depth:
+            code = frame.f_code
+            if code.co_filename not in _SKIP:
+                key.append((code, frame.f_lineno))
+            frame, n = frame.f_back, n + 1
+        key = tuple(key)
+        sid = self._stacks.get(key)
+        if sid is None: sid = self._stacks[key] = len(self._stacks)
+
+        name = msg['to'] if 'num' not in msg else f"{msg['to']}{msg['num']}"
+        name = f"{name}:{msg['msg']}"
+        cid = self._cmds.get(name)
+        if cid is None: cid = self._cmds[name] = len(self._cmds)
+
+        i = self.count % self.capacity
+        self.rtt[i], self.stack[i], self.cmd[i] = rtt, sid, cid
+        self.sent[i] = len(json.dumps(msg))
+        self.recv[i] = 0 if resp is None else len(json.dumps(resp))    # None: unacknowledged
+        self.count += 1
+
+    # Aggregate the buffer by (stack id, command id). Returns {key: [calls, seconds, sent, recv]}
+    def aggregate(self):
+        totals = {}
+        for i in range(min(self.count, self.capacity)):
+            t = totals.get((self.stack[i], self.cmd[i]))
+            if t is None: t = totals[(self.stack[i], self.cmd[i])] = [0, 0.0, 0, 0]
+            t[0] += 1
+            t[1] += self.rtt[i]
+            t[2] += self.sent[i]
+            t[3] += self.recv[i]
+        return totals
+
+    # Stack ids back to frame labels, outermost first
+    def _labels(self):
+        labels = {}
+        for key, sid in self._stacks.items():
+            labels[sid] = [_label(code, line) for code, line in reversed(key)]
+        return labels
+
+    # Stack ids to call site labels
+    def _sites(self):
+        sites = {}
+        for key, sid in self._stacks.items():
+            outside = [(code, line) for code, line in key if code.co_filename not in _PROXIES]
+            sites[sid] = _label(*(outside or key)[0]) if key else '?'
+        return sites
+
+    # Write collapsed stacks, one line per stack and command, weighted by round-trip μs
+    def write_folded(self, path):
+        labels = self._labels()
+        cmds   = {cid: name for name, cid in self._cmds.items()}
+        with open(path, 'w') as f:
+            for (sid, cid), (calls, secs, _, _) in sorted(self.aggregate().items()):
+                frames = ';'.join(labels[sid] + [cmds[cid]])
+                f.write(f"{frames} {max(1, round(secs*1e6))}\n")
+
+    # Write summary table by call site and command
+    def write_summary(self, path):
+        sites = self._sites()
+        cmds  = {cid: name for name, cid in self._cmds.items()}
+        rows  = {}
+        for (sid, cid), t in self.aggregate().items():
+            r = rows.setdefault((sites[sid], cmds[cid]), [0, 0.0, 0, 0])
+            for j in range(4): r[j] += t[j]
+
+        total = sum(r[1] for r in rows.values()) or 1.0
+        with open(path, 'w') as f:
+            recorded = min(self.count, self.capacity)
+            f.write(f"{self.count} proxy calls, {recorded} in buffer"
+                    f"{'' if recorded == self.count else f' ({self.count-recorded} oldest dropped)'}\n\n")
+            f.write(f"{'calls':>8} {'total ms':>10} {'%':>6} {'mean us':>9} {'bytes out':>10} {'bytes in':>10}  command  call site\n")
+            for (site, cmd), (calls, secs, sent, recv) in sorted(rows.items(), key=lambda kv: -kv[1][1]):
+                f.write(f"{calls:8d} {secs*1e3:10.2f} {100*secs/total:6.1f} {secs/calls*1e6:9.1f} "
+                        f"{sent:10d} {recv:10d}  {cmd}  {site}\n")
+
+    def write(self):
+        self.write_folded(self.prefix + '.folded')
+        self.write_summary(self.prefix + '.txt')
+
+def _label(code, line):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{line})"
+
+# The active profiler, created on first use
+profiler = None
+
+# Count a module that calls the proxies (lsm6dsox, through machine.I2C) as one
+# of them, so its samples are attributed to the program's call site
+def exclude(path):
+    _PROXIES.add(path)
+
+# Wrap the _send method of each proxy class to record into the profiler
+def instrument(*classes):
+    global profiler
+    if profiler is None:
+        profiler = ProxyProfiler(os.environ.get('BOARD_PROFILE') or 'proxyprof')
+        atexit.register(profiler.write)
+
+    for cls in classes:
+        _PROXIES.add(sys.modules[cls.__module__].__file__)
+        send = cls._send
+        if getattr(send, 'profiled', False): continue
+
+        def _send(self, msg, ack=True, send=send):
+            start = time.perf_counter()
+            resp  = send(self, msg, ack) if not ack else send(self, msg)   # Only write proxies take ack
+            profiler.record(msg, resp, time.perf_counter() - start, sys._getframe(1))
+            return resp
+        _send.profiled = True
+        cls._send = _send
+
+# ----------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Profile a script's traffic to the board simulator")
+    parser.add_argument('-o', '--out', default='proxyprof', help="output file prefix")
+    parser.add_argument('script')
+    parser.add_argument('args', nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    # Proxies instrument themselves on import when BOARD_PROFILE is set
+    os.environ['BOARD_PROFILE'] = args.out
+    sys.argv = [args.script] + args.args
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.script)))
+    runpy.run_path(args.script, run_name='__main__')
+
+if __name__ == '__main__': main()
@@ -0,0 +1,241 @@
+# runner.py
+# Parallel autograder runner for the Breadboard Simulator
+# Author: Mark F. Russo, PhD
+# Copyright (c) 2023-2024
+#
+# Runs every student script in a directory against its own headless simulator.
+# Scripts run across a pool of worker processes. Each run gets a fresh board
+# listening on a port allocated by the OS, which the proxies pick up from the
+# BOARD_PORT environment variable.
+#
+#   python runner.py submissions/ scenario.json -j 8 -o results/
+#
+# The scenario is a JSON file such as:
+#   {"timeout": 10, "args": [], "inputs": {"button": 1, "fsr": 0, "tilt": [0, 0]},
+#    "schedule": [[0.5, {"button": 0}], [0.7, {"button": 1, "heater": 40}]]}
+# inputs are applied before the script starts; schedule entries at the given
+# number of seconds after it starts. See Board.set_inputs for input names.
+# bus_cost (default true) estimates on-device time of I2C transfers and ADC
+# reads; bus_delay also slows replies to match it. profile records each
+# script's proxy traffic with proxyprof. loopback runs each script in the same
+# process as its board (see loopback.py), with no sockets between them.
+#
+# Results for each script (status, output, pin trace, OLED frames) are written
+# to results.json in the output directory, along with each run's OLED capture
+# and digital pin activity as a VCD file.
+
+import os, sys, io, json, time, heapq, argparse, itertools, threading, subprocess, traceback, multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import board
+
+# Directory holding board.py and the component proxies
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Default scenario settings
+DEFAULTS = {'timeout': 10.0, 'args': [], 'inputs': {}, 'schedule': [], 'max_trace': 100_000,
+            'bus_cost': True, 'bus_delay': False, 'profile': False, 'loopback': False}
+
+# The first limit records of the board's pin trace as (time, pin, command, result),
+# in time order: 'on'/'off' writes with result '', and 'value' reads with the level read
+def trace_records(brd, limit):
+    records = []
+    for num, ch in brd.trace.channels.items():
+        t, v, kind = ch.ordered()
+        records.append([(ti, num, 'value', vi) if ki == board.TRACE_READ else (ti, num, 'on' if vi else 'off', '')
+                        for ti, vi, ki in zip(t, v, kind)])
+    return list(itertools.islice(heapq.merge(*records), limit))
+
+# Create a headless board for a scenario. Returns the board and the start time.
+def make_board(name, scenario, outdir):
+    brd = board.Board()
+    brd.oled.capture = board.FrameCapture(os.path.join(outdir, name), brd.oled.width, brd.oled.height)
+    brd.set_inputs(scenario['inputs'])
+    brd.control.enabled = True      # Scripts may drive their own inputs
+    brd.cost.enabled    = scenario['bus_cost'] or scenario['bus_delay']
+    brd.cost.delay      = scenario['bus_delay']
+
+    brd.trace.clear()               # Trace times count from the start of the run
+    start = brd.trace.start
+
+    brd.control.schedule(scenario['schedule'], start)
+    return brd, start
+
+# Add the board's outputs to a result once the script is done
+def collect(brd, name, scenario, outdir, result, profile):
+    cap = brd.oled.capture
+    cap.close()
+    final = os.path.join(outdir, name + '.png')
+    board.write_png(final, brd.oled.to_gray(), brd.oled.width, brd.oled.height)
+    result['oled']  = {'capture': cap.path, 'shown': cap.shown, 'frames': cap.unique, 'final': final}
+    result['trace'] = trace_records(brd, scenario['max_trace'])
+    result['vcd']   = os.path.join(outdir, name + '.vcd')
+    brd.trace.write_vcd(result['vcd'])
+    if brd.cost.enabled:
+        result['device_time'] = brd.cost.summary()
+    if scenario['profile']:
+        result['profile'] = {'folded': profile + '.folded', 'summary': profile + '.txt'}
+    return result
+
+# Run one script against a fresh headless board. Executes in a worker process.
+def run_one(script, scenario, outdir):
+    if scenario['loopback']: return run_one_loopback(script, scenario, outdir)
+
+    name  = os.path.splitext(os.path.basename(script))[0]
+    brd, start = make_board(name, scenario, outdir)
+    rsock = board.open_comms(('127.0.0.1', 0))
+    port  = rsock.getsockname()[1]
+
+    running = threading.Event()
+    running.set()
+    thd = threading.Thread(target=board.do_comms, args=(brd, rsock, running))
+    thd.daemon = True
+    thd.start()
+
+    env = dict(os.environ, BOARD_PORT=str(port))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [HERE, env.get('PYTHONPATH')]))
+    profile = os.path.abspath(os.path.join(outdir, name))
+    if scenario['profile']:
+        env['BOARD_PROFILE'] = profile
+    result = {'script': script, 'port': port}
+    try:
+        proc = subprocess.run([sys.executable, os.path.abspath(script)] + scenario['args'],
+                              cwd=os.path.dirname(os.path.abspath(script)), env=env,
+                              capture_output=True, text=True, timeout=scenario['timeout'])
+        result['status']     = 'ok' if proc.returncode == 0 else 'error'
+        result['returncode'] = proc.returncode
+        result['stdout']     = proc.stdout
+        result['stderr']     = proc.stderr
+    except subprocess.TimeoutExpired as e:
+        result['status']     = 'timeout'
+        result['returncode'] = None
+        result['stdout']     = e.stdout.decode(errors='replace') if e.stdout else ''
+        result['stderr']     = e.stderr.decode(errors='replace') if e.stderr else ''
+    result['elapsed'] = time.monotonic() - start
+
+    # Shut down the simulator
+    running.clear()
+    thd.join()
+    rsock.close()
+    brd.master.destroy()
+    return collect(brd, name, scenario, outdir, result, profile)
+
+# Run one script in the same process as its board over the loopback transport.
+# The run happens in a child of the worker process, so a script that never
+# finishes can be left behind once its results are collected.
+def run_one_loopback(script, scenario, outdir):
+    recv, send = multiprocessing.Pipe(False)
+    proc = multiprocessing.Process(target=_loopback_child, args=(send, script, scenario, outdir))
+    proc.start()
+    send.close()
+    try:
+        if not recv.poll(scenario['timeout'] + 30): raise EOFError("timed out")
+        result = recv.recv()
+    except EOFError as e:
+        result = {'script': script, 'status': 'failed', 'msg': f"loopback run ended without a result ({e})"}
+    if proc.is_alive(): proc.kill()
+    proc.join()
+    return result
+
+def _loopback_child(conn, script, scenario, outdir):
+    path    = os.path.abspath(script)       # The run changes directory; results keep script as given
+    outdir  = os.path.abspath(outdir)
+    name    = os.path.splitext(os.path.basename(script))[0]
+    profile = os.path.abspath(os.path.join(outdir, name))
+    if scenario['profile']:
+        os.environ['BOARD_PROFILE'] = profile   # Proxies instrument themselves on import
+
+    import loopback
+    brd, start = make_board(name, scenario, outdir)
+    brd.control.sched.start(brd.master)         # No comms loop to apply scheduled inputs
+    loopback.connect(brd)
+
+    # Run the script on a thread so it can be abandoned on timeout
+    status = {}
+    stdout = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = io.StringIO(), io.StringIO()
+    def run():
+        try:
+            loopback.run_script(path, scenario['args'])
+            status['code'] = 0
+        except SystemExit as e:
+            status['code'] = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            if not isinstance(e.code, (int, type(None))): print(e.code, file=sys.stderr)
+        except BaseException:
+            traceback.print_exc()
+            status['code'] = 1
+    cwd = os.getcwd()
+    os.chdir(os.path.dirname(path))
+    thd = threading.Thread(target=run)
+    thd.daemon = True
+    thd.start()
+    thd.join(scenario['timeout'])
+    os.chdir(cwd)
+
+    result = {'script': script, 'port': None}
+    if thd.is_alive():
+        result['status']     = 'timeout'
+        result['returncode'] = None
+    else:
+        result['status']     = 'ok' if status['code'] == 0 else 'error'
+        result['returncode'] = status['code']
+    result['stdout']  = sys.stdout.getvalue()
+    result['stderr']  = sys.stderr.getvalue()
+    result['elapsed'] = time.monotonic() - start
+    sys.stdout, sys.stderr = stdout
+
+    brd.master.destroy()
+    if scenario['profile']:
+        import proxyprof
+        if proxyprof.profiler is not None: proxyprof.profiler.write()
+    conn.send(collect(brd, name, scenario, outdir, result, profile))
+    conn.close()
+
+# Run every .py script in a directory. Returns a list of results in script order.
+def run_all(scripts_dir, scenario, outdir, jobs=None, progress=None):
+    scenario = dict(DEFAULTS, **scenario)
+    scripts  = sorted(os.path.join(scripts_dir, f) for f in os.listdir(scripts_dir) if f.endswith('.py'))
+    os.makedirs(outdir, exist_ok=True)
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(run_one, s, scenario, outdir): s for s in scripts}
+        for fut in as_completed(futures):
+            script = futures[fut]
+            try:
+                results[script] = fut.result()
+            except Exception as e:
+                results[script] = {'script': script, 'status': 'failed', 'msg': str(e)}
+            if progress: progress(results[script])
+    return [results[s] for s in scripts]
+
+# ----------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Run student scripts against headless board simulators in parallel")
+    parser.add_argument('scripts', help="directory of student scripts (*.py)")
+    parser.add_argument('scenario', nargs='?', help="scenario JSON file")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument('-o', '--out', default='results', help="output directory")
+    parser.add_argument('--timeout', type=float, help="per-run timeout in seconds (overrides scenario)")
+    parser.add_argument('--loopback', action='store_true', help="run scripts in-process with their boards (overrides scenario)")
+    args = parser.parse_args()
+
+    scenario = {}
+    if args.scenario:
+        with open(args.scenario) as f:
+            scenario = json.load(f)
+    if args.timeout is not None:
+        scenario['timeout'] = args.timeout
+    if args.loopback:
+        scenario['loopback'] = True
+
+    def progress(r):
+        print(f"{r['status']:8s} {r.get('elapsed', 0):7.2f}s  {r['script']}")
+
+    start   = time.monotonic()
+    results = run_all(args.scripts, scenario, args.out, args.jobs, progress)
+    with open(os.path.join(args.out, 'results.json'), 'w') as f:
+        json.dump(results, f, indent=1)
+    print(f"{len(results)} scripts in {time.monotonic()-start:.2f}s")
+
+if __name__ == '__main__': main()
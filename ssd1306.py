@@ -12,9 +12,14 @@
 # https://github.com/adafruit/micropython-adafruit-framebuf/blob/master/framebuf.py
 
 # SSD1306_I2C OLED Proxy
-import json, socket
+import json, socket, os
 
-port = 9999
+import machine
+
+port = int(os.environ.get('BOARD_PORT', 9999))
+
+# Set by loopback.connect() to call a simulator in this process directly instead of over UDP
+loopback = None
 
 # register definitions
 SET_CONTRAST        = 0x81
@@ -77,74 +82,47 @@ class SSD1306:
     def fill(self, val):
         # Fill OLED pixels with val (0 clears)
         msg = {'to':'oled', 'msg':'fill', 'val':val}
-        resp = self._send(msg)
-        if not resp['success']:
-            raise RuntimeError(f"Command 'fill' failed for OLED (SSD1306_I2C)")
-        return True
+        return machine._write(self, msg, "Command 'fill' failed for OLED (SSD1306_I2C)")
     
     # Render text at pixel row, col with val
     def text(self, text, col, row, clr=1):
         msg = {'to':'oled', 'msg':'text', 'col':col, 'row':row, 'text':text, 'clr':clr}
-        resp = self._send(msg)
-        if not resp['success']:
-            raise RuntimeError(f"Command 'text' failed for OLED (SSD1306_I2C)")
-        return True
+        return machine._write(self, msg, "Command 'text' failed for OLED (SSD1306_I2C)")
     
     # Draw the text on the OLED
     def show(self):
-        msg = {'to':'oled', 'msg':'show'}
-        resp = self._send(msg)
-        if not resp['success']:
-            raise RuntimeError(f"Command 'show' failed for OLED (SSD1306_I2C): {resp['msg']}")
-        return True
+        msg = {'to':'oled', 'msg':'show', 'freq':self.freq}
+        return machine._write(self, msg, "Command 'show' failed for OLED (SSD1306_I2C)", coalesce=False)
 
     # Render pixel at x, y with clr
     def pixel(self, x, y, clr):
         msg = {'to':'oled', 'msg':'pixel', 'x':x, 'y':y, 'clr':clr}
-        resp = self._send(msg)
-        if not resp['success']:
-            raise RuntimeError(f"Command 'pixel' failed for OLED (SSD1306_I2C)")
-        return True
+        return machine._write(self, msg, "Command 'pixel' failed for OLED (SSD1306_I2C)")
 
     # Render rectangle at x0, y0 to x1, y1 with clr [0, 1]
     def rect(self, x, y, w, h, clr):
         msg = {'to':'oled', 'msg':'rect', 'x':x, 'y':y, 'w':w, 'h':h, 'clr':clr}
-        resp = self._send(msg)
-        if not resp['success']:
-            raise RuntimeError(f"Command 'rect' failed for OLED (SSD1306_I2C)")
-        return True
+        return machine._write(self, msg, "Command 'rect' failed for OLED (SSD1306_I2C)")
 
     # Render filled rectangle at x0, y0 to x1, y1 with clr [0, 1]
     def fill_rect(self, x, y, w, h, clr):
         msg = {'to':'oled', 'msg':'fill_rect', 'x':x, 'y':y, 'w':w, 'h':h, 'clr':clr}
-        resp = self._send(msg)
-        if not resp['success']:
-            raise RuntimeError(f"Command 'fill_rect' failed for OLED (SSD1306_I2C)")
-        return True
+        return machine._write(self, msg, "Command 'fill_rect' failed for OLED (SSD1306_I2C)")
     
     # Render line from x0, y0 to x1, y1 with clr [0, 1]
     def line(self, x0, y0, x1, y1, clr):
         msg = {'to':'oled', 'msg':'line', 'x0':x0, 'y0':y0, 'x1':x1, 'y1':y1, 'clr':clr}
-        resp = self._send(msg)
-        if not resp['success']:
-            raise RuntimeError(f"Command 'line' failed for OLED (SSD1306_I2C)")
-        return True
+        return machine._write(self, msg, "Command 'line' failed for OLED (SSD1306_I2C)")
     
     # Render horizontal line at x, y with width w and clr [0, 1]
     def hline(self, x, y, w, clr):
         msg = {'to':'oled', 'msg':'hline', 'x':x, 'y':y, 'w':w, 'clr':clr}
-        resp = self._send(msg)
-        if not resp['success']:
-            raise RuntimeError(f"Command 'hline' failed for OLED (SSD1306_I2C)")
-        return True
+        return machine._write(self, msg, "Command 'hline' failed for OLED (SSD1306_I2C)")
     
     # Render vertical line at x, y with height h and clr [0, 1]
     def vline(self, x, y, h, clr):
         msg = {'to':'oled', 'msg':'vline', 'x':x, 'y':y, 'h':h, 'clr':clr}
-        resp = self._send(msg)
-        if not resp['success']:
-            raise RuntimeError(f"Command 'vline' failed for OLED (SSD1306_I2C)")
-        return True
+        return machine._write(self, msg, "Command 'vline' failed for OLED (SSD1306_I2C)")
     
     def scroll(self, dx, dy):
         # self.framebuf.scroll(dx, dy)
@@ -160,10 +138,12 @@ class SSD1306:
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
         
-    # Helper
-    def _send(self, msg):
+    # Helper. Returns the response, or None when ack is False.
+    def _send(self, msg, ack=True):
+        if loopback is not None: return loopback(msg)   # Simulator in this process
         bytes = json.dumps(msg).encode('utf-8')         # Serialize and encode as bytes
         self.sock.sendto(bytes, ('127.0.0.1', port))    # Send message to board simulator
+        if not ack: return None
         bytes, addr = self.sock.recvfrom(1024)          # Wait for response
         return json.loads(bytes.decode())               # Decode and return
 
@@ -172,21 +152,29 @@ class SSD1306_I2C(SSD1306):
     def __init__(self, width, height, i2c, addr=0x3c, external_vcc=False):
         self.i2c  = i2c
         self.addr = addr
+        self.freq = getattr(i2c, 'freq', 400_000)   # Bus frequency, used to estimate transfer time
         self.temp = bytearray(2)
         super().__init__(width, height, external_vcc)
         
         self.sock   = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.sock.bind(('127.0.0.1', 0))    # Bind to localhost at arbitrary available port.
+        self._seq   = 0         # Unacknowledged writes (see machine.unacked)
+        self._last  = None
+        self.lost   = 0
 
+    # Commands and display data go over the simulated I2C bus, as on the device
+    # Both bypass machine._write, so the next drawing call must not be coalesced away
     def write_cmd(self, cmd):
+        self._last   = None
         self.temp[0] = 0x80 # Co=1, D/C#=0
         self.temp[1] = cmd
-        # self.i2c.writeto(self.addr, self.temp)
+        self.i2c.writeto(self.addr, self.temp)
 
     def write_data(self, buf):
-        self.temp[0] = self.addr << 1
-        self.temp[1] = 0x40 # Co=0, D/C#=1
-        # self.i2c.start()
-        # self.i2c.write(self.temp)
-        # self.i2c.write(buf)
-        # self.i2c.stop()
+        self._last = None
+        self.i2c.writevto(self.addr, [b'\x40', buf])   # Co=0, D/C#=1
+
+# Opt-in profiling of simulator traffic (see proxyprof.py)
+if os.environ.get('BOARD_PROFILE'):
+    import proxyprof
+    proxyprof.instrument(SSD1306)
@@ -1,6 +1,56 @@
 # time2.py
-from time import sleep, time
+# MicroPython time functions on a monotonic nanosecond clock.
+# Ticks wrap at TICKS_PERIOD like MicroPython's, so compare them only with
+# ticks_diff() and offset them only with ticks_add().
+from time import sleep, perf_counter_ns
+
+TICKS_PERIOD = 1 << 30
+TICKS_MAX    = TICKS_PERIOD - 1
+_HALF        = TICKS_PERIOD // 2
+
+# Sleeps end with a spin of up to SPIN_NS, since the OS may wake a sleeping
+# thread late by about that much. Longer waits sleep for all but the spin.
+SPIN_NS      = 200_000
 
 # Replace timer methods from micropython
-def sleep_ms(ms): sleep(ms/1000)
-def ticks_ms():   return int(time()*1000)
+def ticks_ms(): return (perf_counter_ns() // 1_000_000) & TICKS_MAX
+def ticks_us(): return (perf_counter_ns() // 1_000) & TICKS_MAX
+def ticks_ns(): return perf_counter_ns() & TICKS_MAX
+
+# Signed difference ticks1 - ticks2, correct across one wrap
+def ticks_diff(ticks1, ticks2):
+    return ((ticks1 - ticks2 + _HALF) & TICKS_MAX) - _HALF
+
+# Ticks delta after ticks, wrapped
+def ticks_add(ticks, delta):
+    return (ticks + delta) & TICKS_MAX
+
+# Sleep until perf_counter_ns() reaches deadline: sleep, then spin the last part
+def _sleep_until(deadline):
+    left = deadline - perf_counter_ns()
+    if left > SPIN_NS: sleep((left - SPIN_NS) / 1e9)
+    while perf_counter_ns() < deadline:
+        pass
+
+def sleep_us(us): _sleep_until(perf_counter_ns() + int(us * 1_000))
+def sleep_ms(ms): _sleep_until(perf_counter_ns() + int(ms * 1_000_000))
+
+# ----------------------------------------------------------------
+# Benchmark: timing error of sleep_us against time.sleep
+#   python time2.py
+if __name__ == '__main__':
+    def error_us(fn, us, n):
+        errs = []
+        for _ in range(n):
+            start = perf_counter_ns()
+            fn(us)
+            errs.append((perf_counter_ns() - start) / 1000 - us)
+        errs.sort()
+        return sum(errs)/n, errs[n//2], errs[int(n*0.99)], errs[-1]
+
+    print(f"{'requested us':>12} {'function':>10} {'mean':>9} {'median':>9} {'p99':>9} {'max':>9}  (error, us)")
+    for us in (10, 50, 100, 500, 1000, 5000):
+        n = max(20, 200_000 // (us + 100))
+        for name, fn in (('sleep_us', sleep_us), ('time.sleep', lambda us: sleep(us / 1e6))):
+            mean, med, p99, worst = error_us(fn, us, n)
+            print(f"{us:12d} {name:>10} {mean:9.1f} {med:9.1f} {p99:9.1f} {worst:9.1f}")
@@ -0,0 +1,95 @@
+# viewer.py
+# Remote viewer for board simulators publishing their state
+# Author: Mark F. Russo, PhD
+# Copyright (c) 2023-2024
+#
+# Watches one or more simulators started with --publish PORT. Each board is
+# drawn with the simulator's own components and follows the published state.
+#
+#   python viewer.py 9100 labserver:9101 labserver:9102
+
+import socket, threading, argparse
+import tkinter as tk
+
+import board
+
+# Receives state from one simulator on a background thread into a StateMerger,
+# so a viewer that falls behind only draws the newest state.
+class Subscription(object):
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.merger = board.StateMerger()
+        self.status = 'connecting'
+
+        thd = threading.Thread(target=self.receive)
+        thd.daemon = True
+        thd.start()
+
+    @property
+    def version(self):
+        return self.merger.version
+
+    # Read exactly n bytes
+    def _read(self, sock, n):
+        buf = bytearray()
+        while len(buf) < n:
+            data = sock.recv(n - len(buf))
+            if not data: raise ConnectionError("closed by simulator")
+            buf += data
+        return bytes(buf)
+
+    def receive(self):
+        try:
+            sock = socket.create_connection((self.host, self.port))
+            self.status = 'connected'
+            while True:
+                n, = board.STATE_LENGTH.unpack(self._read(sock, board.STATE_LENGTH.size))
+                self.merger.add(self._read(sock, n))
+        except OSError as e:
+            self.status = f"disconnected: {e}"
+
+    # Take the state received since the last call
+    def take(self):
+        return self.merger.take()
+
+# A display-only board for each subscription, stacked in one window
+class Viewer(object):
+    def __init__(self, master, targets, rate=30):
+        self.master = master
+        self.rate   = rate
+        self.views  = []
+        for host, port in targets:
+            frame = tk.Frame(master)
+            frame.pack()
+            brd   = board.Board(frame, run=False)
+            label = tk.Label(frame, anchor=tk.W, font=("Courier", 10))
+            label.pack(fill=tk.X)
+            self.views.append((Subscription(host, port), brd, label))
+        self.update()
+
+    # Draw whatever has changed
+    def update(self):
+        for sub, brd, label in self.views:
+            state = sub.take()
+            if state: brd.apply_state(state)
+            label.config(text=f"{sub.host}:{sub.port}  {sub.status}  v{sub.version}  "
+                              f"heater {brd.heater.tmp36.temperature:.1f}°C")
+        self.master.after(int(1000/self.rate), self.update)
+
+# ----------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="View board simulators publishing their state")
+    parser.add_argument('targets', nargs='+', metavar='[HOST:]PORT')
+    args = parser.parse_args()
+
+    targets = []
+    for t in args.targets:
+        host, _, port = t.rpartition(':')
+        targets.append((host or '127.0.0.1', int(port)))
+
+    root = tk.Tk()
+    root.title("TCNJ Engineering Breadboard Viewer")
+    Viewer(root, targets)
+    root.mainloop()
+
+if __name__ == '__main__': main()